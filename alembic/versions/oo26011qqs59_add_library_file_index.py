@@ -0,0 +1,42 @@
+"""Add library file fingerprint index.
+
+Revision ID: oo26011qqs59
+Revises: nn25010ppr58
+Create Date: 2025-12-01 10:00:00.000000
+
+Hey future me - library_file_index stores (size, mtime_ns, inode) per audio file and
+mtime_ns per directory. Incremental library scans compare the filesystem against this
+table one directory at a time, so a no-change rescan never opens a single audio file.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "oo26011qqs59"
+down_revision = "nn25010ppr58"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create library_file_index table."""
+    op.create_table(
+        "library_file_index",
+        sa.Column("path", sa.String(1024), primary_key=True),
+        sa.Column("directory", sa.String(1024), nullable=False),
+        sa.Column("is_directory", sa.Boolean(), nullable=False, server_default="0"),
+        sa.Column("size", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("mtime_ns", sa.BigInteger(), nullable=False),
+        sa.Column("inode", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("indexed_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_library_file_index_directory", "library_file_index", ["directory"]
+    )
+
+
+def downgrade() -> None:
+    """Drop library_file_index table."""
+    op.drop_index("ix_library_file_index_directory", table_name="library_file_index")
+    op.drop_table("library_file_index")
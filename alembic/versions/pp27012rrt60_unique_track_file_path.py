@@ -0,0 +1,44 @@
+"""Make soulspot_tracks.file_path unique for bulk upserts.
+
+Revision ID: pp27012rrt60
+Revises: oo26011qqs59
+Create Date: 2025-12-02 10:00:00.000000
+
+Hey future me - TrackRepository.bulk_upsert() uses INSERT ... ON CONFLICT (file_path), which
+needs a unique index on file_path. Old scans could have created the same path twice (race
+between scanner and auto-import), so duplicates are detached first: one row (lowest id) keeps the
+path, the others get file_path = NULL (they stay in the DB, nothing is deleted).
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "pp27012rrt60"
+down_revision = "oo26011qqs59"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Detach duplicate file paths and add unique index."""
+    op.execute(
+        """
+        UPDATE soulspot_tracks SET file_path = NULL
+        WHERE file_path IS NOT NULL
+          AND id NOT IN (
+            SELECT keep_id FROM (
+              SELECT MIN(id) AS keep_id FROM soulspot_tracks
+              WHERE file_path IS NOT NULL
+              GROUP BY file_path
+            ) AS keepers
+          )
+        """
+    )
+    op.create_index(
+        "uq_tracks_file_path", "soulspot_tracks", ["file_path"], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Drop unique file_path index."""
+    op.drop_index("uq_tracks_file_path", table_name="soulspot_tracks")
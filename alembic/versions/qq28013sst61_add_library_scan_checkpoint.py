@@ -0,0 +1,32 @@
+"""Add resumable checkpoint to library_scans.
+
+Revision ID: qq28013sst61
+Revises: pp27012rrt60
+Create Date: 2025-12-03 10:00:00.000000
+
+Hey future me - import scans (LibraryScannerService) now record a row in library_scans and
+write a checkpoint (last fully committed directory + partial stats + scan mode) at every batch
+commit. A scan that dies mid-way keeps its checkpoint, so the next LIBRARY_SCAN job skips the
+already-committed part of the tree. Completed scans clear the checkpoint (NULL = nothing to resume).
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "qq28013sst61"
+down_revision = "pp27012rrt60"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add checkpoint column."""
+    with op.batch_alter_table("library_scans") as batch_op:
+        batch_op.add_column(sa.Column("checkpoint", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop checkpoint column."""
+    with op.batch_alter_table("library_scans") as batch_op:
+        batch_op.drop_column("checkpoint")
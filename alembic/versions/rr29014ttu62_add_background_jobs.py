@@ -0,0 +1,57 @@
+"""Add background_jobs table for the durable job queue.
+
+Revision ID: rr29014ttu62
+Revises: qq28013sst61
+Create Date: 2025-12-04 10:00:00.000000
+
+Hey future me - background_jobs persists JobQueue jobs when download.queue_backend is
+"database", so queued downloads/enrichment jobs survive restarts. Workers claim rows
+atomically; the (status, priority, run_after) index serves that claim query.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "rr29014ttu62"
+down_revision = "qq28013sst61"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create background_jobs table."""
+    op.create_table(
+        "background_jobs",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("job_type", sa.String(50), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("retries", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_retries", sa.Integer(), nullable=False, server_default="3"),
+        sa.Column("run_after", sa.DateTime(), nullable=False),
+        sa.Column("claimed_by", sa.String(64), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_background_jobs_claim",
+        "background_jobs",
+        ["status", "priority", "run_after"],
+    )
+    op.create_index(
+        "ix_background_jobs_type_status", "background_jobs", ["job_type", "status"]
+    )
+    op.create_index("ix_background_jobs_created_at", "background_jobs", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop background_jobs table."""
+    op.drop_index("ix_background_jobs_created_at", table_name="background_jobs")
+    op.drop_index("ix_background_jobs_type_status", table_name="background_jobs")
+    op.drop_index("ix_background_jobs_claim", table_name="background_jobs")
+    op.drop_table("background_jobs")
@@ -0,0 +1,43 @@
+"""Add dedup_key to background_jobs.
+
+Revision ID: ss30015uuv63
+Revises: rr29014ttu62
+Create Date: 2025-12-05 10:00:00.000000
+
+Hey future me - enqueue() with a dedup_key (e.g. "download:<track_id>") returns the existing
+job instead of creating a second one while that job is pending or running. The PARTIAL unique
+index (only pending/running rows) makes this atomic across processes: a racing second insert
+fails and the caller falls back to the existing job. Finished rows don't block new jobs.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "ss30015uuv63"
+down_revision = "rr29014ttu62"
+branch_labels = None
+depends_on = None
+
+ACTIVE_CONDITION = sa.text("status IN ('pending', 'running')")
+
+
+def upgrade() -> None:
+    """Add dedup_key column and partial unique index."""
+    with op.batch_alter_table("background_jobs") as batch_op:
+        batch_op.add_column(sa.Column("dedup_key", sa.String(255), nullable=True))
+    op.create_index(
+        "ux_background_jobs_dedup_active",
+        "background_jobs",
+        ["dedup_key"],
+        unique=True,
+        sqlite_where=ACTIVE_CONDITION,
+        postgresql_where=ACTIVE_CONDITION,
+    )
+
+
+def downgrade() -> None:
+    """Drop dedup_key column and index."""
+    op.drop_index("ux_background_jobs_dedup_active", table_name="background_jobs")
+    with op.batch_alter_table("background_jobs") as batch_op:
+        batch_op.drop_column("dedup_key")
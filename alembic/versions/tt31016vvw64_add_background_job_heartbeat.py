@@ -0,0 +1,32 @@
+"""Add heartbeat_at to background_jobs.
+
+Revision ID: tt31016vvw64
+Revises: ss30015uuv63
+Create Date: 2025-12-06 10:00:00.000000
+
+Hey future me - with a separate worker process (python -m soulspot.worker), possibly several,
+recovery can no longer reset EVERY running row on start: another live worker owns some of them.
+Workers now refresh heartbeat_at of their running jobs; only rows whose heartbeat (or start time,
+for rows claimed before this column existed) is older than the lease timeout are requeued.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "tt31016vvw64"
+down_revision = "ss30015uuv63"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add heartbeat_at column."""
+    with op.batch_alter_table("background_jobs") as batch_op:
+        batch_op.add_column(sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop heartbeat_at column."""
+    with op.batch_alter_table("background_jobs") as batch_op:
+        batch_op.drop_column("heartbeat_at")
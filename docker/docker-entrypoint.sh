@@ -131,9 +131,12 @@ export STORAGE__MUSIC_PATH="${STORAGE__MUSIC_PATH:-/music}"
 export STORAGE__ARTWORK_PATH="${STORAGE__ARTWORK_PATH:-/config/artwork}"
 export STORAGE__TEMP_PATH="${STORAGE__TEMP_PATH:-/config/tmp}"
 
+# Persistent API response cache lives next to the database so it survives container recreation
+export CACHE__DISK_PATH="${CACHE__DISK_PATH:-/config/cache/metadata_cache.db}"
+
 # Ensure additional config directories exist
-mkdir -p /config/artwork /config/tmp
-chown -R $PUID:$PGID /config/artwork /config/tmp
+mkdir -p /config/artwork /config/tmp /config/cache
+chown -R $PUID:$PGID /config/artwork /config/tmp /config/cache
 
 echo ""
 echo "Initializing database..."
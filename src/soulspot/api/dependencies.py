@@ -6,6 +6,12 @@ from typing import TYPE_CHECKING, cast
 from fastapi import Cookie, Depends, Header, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from soulspot.application.cache import (
+    CachedLastfmClient,
+    CachedMusicBrainzClient,
+    CachedSpotifyClient,
+)
+from soulspot.application.services.event_bus import EventBus
 from soulspot.application.services.session_store import (
     DatabaseSessionStore,
 )
@@ -27,6 +33,8 @@ from soulspot.application.use_cases.search_and_download import (
 from soulspot.application.workers.download_worker import DownloadWorker
 from soulspot.application.workers.job_queue import JobQueue
 from soulspot.config import Settings, get_settings
+from soulspot.domain.ports import ILastfmClient, IMusicBrainzClient, ISpotifyClient
+from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
 from soulspot.infrastructure.integrations.lastfm_client import LastfmClient
 from soulspot.infrastructure.integrations.musicbrainz_client import MusicBrainzClient
 from soulspot.infrastructure.integrations.slskd_client import SlskdClient
@@ -86,12 +94,32 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
         yield session
 
 
-# Yo, creates NEW SpotifyClient on EVERY request! Not cached/singleton. This is fine because
-# SpotifyClient is stateless (httpx client inside is pooled). If SpotifyClient becomes expensive
-# to construct, add @lru_cache but watch out - settings changes won't take effect until restart!
-def get_spotify_client(settings: Settings = Depends(get_settings)) -> SpotifyClient:
-    """Get Spotify client instance."""
-    return SpotifyClient(settings.spotify)
+# Hey future me - the process-wide HttpClientRegistry (created in lifecycle.background_services).
+# Every API client built per request takes its pooled httpx client from here, so requests reuse
+# keep-alive connections instead of doing a fresh TCP + TLS handshake each time. None outside the
+# app lifespan (some tests) - the clients then fall back to their own throwaway httpx client.
+def get_http_clients(request: Request) -> HttpClientRegistry | None:
+    """Get the shared HTTP client registry from app state, if initialized."""
+    return cast(
+        "HttpClientRegistry | None", getattr(request.app.state, "http_clients", None)
+    )
+
+
+# Yo, creates NEW SpotifyClient on EVERY request! Not cached/singleton. This is fine because the
+# wrapper is cheap - the httpx connection pool behind it is the shared one from get_http_clients().
+# If SpotifyClient becomes expensive to construct, add @lru_cache but watch out - settings changes
+# won't take effect until restart!
+# The RESPONSES are cached though: the client is wrapped with the process-wide SpotifyCache from
+# app.state (created in lifecycle.background_services), shared with the background workers.
+def get_spotify_client(
+    request: Request, settings: Settings = Depends(get_settings)
+) -> ISpotifyClient:
+    """Get Spotify client instance (read-through cached if the cache is initialized)."""
+    client = SpotifyClient(settings.spotify, http=get_http_clients(request))
+    cache = getattr(request.app.state, "spotify_cache", None)
+    if cache is None:
+        return client
+    return CachedSpotifyClient(client, cache)
 
 
 # Hey future me, this is a helper to parse Bearer tokens consistently! We extract this logic
@@ -158,7 +186,7 @@ async def get_session_id(
 # are now MORE SENSITIVE - they can be copied/stolen! Require HTTPS in production!
 async def get_spotify_token_from_session(
     session_store: DatabaseSessionStore = Depends(get_session_store),
-    spotify_client: SpotifyClient = Depends(get_spotify_client),
+    spotify_client: ISpotifyClient = Depends(get_spotify_client),
     session_id: str | None = Depends(get_session_id),
 ) -> str:
     """Get valid Spotify access token from session with automatic refresh.
@@ -311,23 +339,30 @@ async def get_spotify_token_shared(request: Request) -> str:
 
 
 # Yo, creates NEW SlskdClient on every request - not cached! Slskd is your Soulseek downloader, this
-# client talks to its API. Like SpotifyClient, it's stateless so creating new instances is fine (httpx
-# pools connections internally). If slskd server is down, this won't fail until you actually USE the
-# client in an endpoint. Settings include API key, base URL - check config if requests fail!
-def get_slskd_client(settings: Settings = Depends(get_settings)) -> SlskdClient:
+# client talks to its API. Like SpotifyClient, it's stateless so creating new instances is fine (the
+# connections come from the shared pool). If slskd server is down, this won't fail until you actually
+# USE the client in an endpoint. Settings include API key, base URL - check config if requests fail!
+def get_slskd_client(
+    request: Request, settings: Settings = Depends(get_settings)
+) -> SlskdClient:
     """Get slskd client instance."""
-    return SlskdClient(settings.slskd)
+    return SlskdClient(settings.slskd, http=get_http_clients(request))
 
 
 # Hey, MusicBrainz is the metadata enrichment source - gets artist/album/track info from their public
-# database. Not cached, new client per request. MusicBrainz has RATE LIMITS (1 req/sec for anonymous,
-# higher if you set contact info in settings.musicbrainz.contact). If you hammer it too fast, you'll
-# get 503 errors! The client should handle rate limiting internally but watch out for that.
+# database. New client per request, but responses go through the shared MusicBrainzCache on app.state.
+# MusicBrainz has RATE LIMITS (1 req/sec for anonymous, higher if you set contact info in
+# settings.musicbrainz.contact) - every cache hit is a request we don't have to wait a second for.
 def get_musicbrainz_client(
+    request: Request,
     settings: Settings = Depends(get_settings),
-) -> MusicBrainzClient:
-    """Get MusicBrainz client instance."""
-    return MusicBrainzClient(settings.musicbrainz)
+) -> IMusicBrainzClient:
+    """Get MusicBrainz client instance (read-through cached if the cache is initialized)."""
+    client = MusicBrainzClient(settings.musicbrainz, http=get_http_clients(request))
+    cache = getattr(request.app.state, "musicbrainz_cache", None)
+    if cache is None:
+        return client
+    return CachedMusicBrainzClient(client, cache)
 
 
 # Listen up, Last.fm is OPTIONAL! Returns None if API key isn't configured. This is different from other
@@ -335,19 +370,24 @@ def get_musicbrainz_client(
 # etc for metadata enrichment. If you call methods on None you'll get AttributeError. The is_configured()
 # check probably verifies API key exists - check LastfmSettings if you're debugging why this returns None.
 def get_lastfm_client(
+    request: Request,
     settings: Settings = Depends(get_settings),
-) -> LastfmClient | None:
+) -> ILastfmClient | None:
     """Get Last.fm client instance if configured, None otherwise."""
     if not settings.lastfm.is_configured():
         return None
-    return LastfmClient(settings.lastfm)
+    client = LastfmClient(settings.lastfm, http=get_http_clients(request))
+    cache = getattr(request.app.state, "lastfm_cache", None)
+    if cache is None:
+        return client
+    return CachedLastfmClient(client, cache)
 
 
 # Yo, TokenManager handles OAuth token operations - exchange, refresh, validation. It wraps SpotifyClient
 # for token-specific logic. Created new per request. I think this might be redundant with the token
 # management already in get_spotify_token_from_session? Check if this is actually used - might be legacy.
 def get_token_manager(
-    spotify_client: SpotifyClient = Depends(get_spotify_client),
+    spotify_client: ISpotifyClient = Depends(get_spotify_client),
 ) -> TokenManager:
     """Get token manager instance."""
     return TokenManager(spotify_client)
@@ -420,7 +460,7 @@ def get_spotify_browse_repository(
 # logic that spans multiple repositories/services. Created fresh per request with all dependencies injected.
 # This is Clean Architecture - endpoint just calls use_case.execute(), the use case does the work!
 def get_import_playlist_use_case(
-    spotify_client: SpotifyClient = Depends(get_spotify_client),
+    spotify_client: ISpotifyClient = Depends(get_spotify_client),
     playlist_repository: PlaylistRepository = Depends(get_playlist_repository),
     track_repository: TrackRepository = Depends(get_track_repository),
     artist_repository: ArtistRepository = Depends(get_artist_repository),
@@ -458,7 +498,7 @@ def get_search_and_download_use_case(
 # Spotify/Last.fm/MusicBrainz). Probably legacy - check if this is still used or if multi-source version
 # replaced it. MusicBrainz-only enrichment is simpler but less comprehensive.
 def get_enrich_metadata_use_case(
-    musicbrainz_client: MusicBrainzClient = Depends(get_musicbrainz_client),
+    musicbrainz_client: IMusicBrainzClient = Depends(get_musicbrainz_client),
     track_repository: TrackRepository = Depends(get_track_repository),
     artist_repository: ArtistRepository = Depends(get_artist_repository),
     album_repository: AlbumRepository = Depends(get_album_repository),
@@ -497,6 +537,58 @@ def get_job_queue(request: Request) -> JobQueue:
     return cast(JobQueue, request.app.state.job_queue)
 
 
+# Listen up - runtime queue controls (pause/resume, scheduling PATCH) only change the JobQueue of
+# the process serving the request. With DOWNLOAD__EMBEDDED_WORKERS=false this process dispatches
+# nothing and the worker process never sees the change, so we answer 409 instead of a 200 that
+# looks like it worked. Change the env of the worker process and restart it instead.
+def get_local_job_queue(
+    request: Request, settings: Settings = Depends(get_settings)
+) -> JobQueue:
+    """Get the job queue for runtime controls that only affect this process.
+
+    Args:
+        request: FastAPI request
+        settings: Application settings
+
+    Returns:
+        JobQueue instance
+
+    Raises:
+        HTTPException: 409 if job handlers run in a separate worker process
+    """
+    if not settings.download.embedded_workers:
+        raise HTTPException(
+            status_code=409,
+            detail=(
+                "Job handlers run in a separate worker process "
+                "(DOWNLOAD__EMBEDDED_WORKERS=false) - change its settings and restart it"
+            ),
+        )
+    return get_job_queue(request)
+
+
+# Hey future me, the EventBus is a singleton in app.state too (created with the job queue in
+# lifecycle.background_services). SSE streams subscribe to it instead of polling the DB per client.
+def get_event_bus(request: Request) -> EventBus:
+    """Get event bus instance from app state.
+
+    Args:
+        request: FastAPI request
+
+    Returns:
+        EventBus instance
+
+    Raises:
+        HTTPException: If event bus not initialized
+    """
+    if not hasattr(request.app.state, "event_bus"):
+        raise HTTPException(
+            status_code=503,
+            detail="Event bus not initialized",
+        )
+    return cast(EventBus, request.app.state.event_bus)
+
+
 # Listen up, DownloadWorker is also a singleton in app.state! It's the background worker that processes
 # download jobs from the queue. Probably runs in a separate asyncio task continuously polling for work.
 # Like JobQueue, this lives for the whole app lifetime and is shared across all requests. If this fails,
@@ -549,7 +641,7 @@ def get_queue_playlist_downloads_use_case(
 # Requires both DB session and Spotify client for API calls + persistence.
 async def get_spotify_sync_service(
     session: AsyncSession = Depends(get_db_session),
-    spotify_client: SpotifyClient = Depends(get_spotify_client),
+    spotify_client: ISpotifyClient = Depends(get_spotify_client),
 ) -> AsyncGenerator:
     """Get Spotify sync service for auto-sync and browse.
 
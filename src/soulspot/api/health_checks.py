@@ -96,6 +96,10 @@ def register_health_endpoints(app: FastAPI, settings: Settings) -> None:
                         "musicbrainz": "CLOSED",
                         "slskd": "CLOSED"
                     }
+                },
+                "pools": {
+                    "database": {"pool_type": "sqlite", ...},
+                    "http": {"max_connections": 20, "upstreams": {...}}
                 }
             }
         """
@@ -175,9 +179,18 @@ def register_health_endpoints(app: FastAPI, settings: Settings) -> None:
             ):
                 overall_status = HealthStatus.DEGRADED
 
+        # Connection pool stats - DB engine pool next to the shared outbound HTTP pools, so
+        # leaks (checked_out stays high) and poor keep-alive reuse show up in one place
+        pools: dict[str, Any] = {}
+        if hasattr(app.state, "db"):
+            pools["database"] = app.state.db.get_pool_stats()
+        if hasattr(app.state, "http_clients"):
+            pools["http"] = app.state.http_clients.get_stats()
+
         return {
             "status": overall_status.value,
             "checks": checks,
+            "pools": pools,
         }
 
     # Listen, /live is the SIMPLEST liveness probe - literally just returns JSON if process is alive!
@@ -27,8 +27,8 @@ from soulspot.api.dependencies import (
     get_spotify_token_shared,
 )
 from soulspot.application.services.artist_songs_service import ArtistSongsService
+from soulspot.domain.ports import ISpotifyClient
 from soulspot.domain.value_objects import ArtistId, TrackId
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +104,7 @@ async def sync_artist_songs(
     artist_id: str,
     market: str = Query("US", description="ISO 3166-1 alpha-2 country code"),
     session: AsyncSession = Depends(get_db_session),
-    spotify_client: SpotifyClient = Depends(get_spotify_client),
+    spotify_client: ISpotifyClient = Depends(get_spotify_client),
     access_token: str = Depends(get_spotify_token_shared),
 ) -> SyncSongsResponse:
     """Sync songs (top tracks/singles) for a specific artist.
@@ -182,7 +182,7 @@ async def sync_all_artists_songs(
     market: str = Query("US", description="ISO 3166-1 alpha-2 country code"),
     limit: int = Query(100, ge=1, le=500, description="Max artists to process"),
     session: AsyncSession = Depends(get_db_session),
-    spotify_client: SpotifyClient = Depends(get_spotify_client),
+    spotify_client: ISpotifyClient = Depends(get_spotify_client),
     access_token: str = Depends(get_spotify_token_shared),
 ) -> SyncSongsResponse:
     """Sync songs for ALL followed artists in the database.
@@ -22,8 +22,8 @@ from soulspot.api.dependencies import (
 from soulspot.application.services.followed_artists_service import (
     FollowedArtistsService,
 )
+from soulspot.domain.ports import ISpotifyClient
 from soulspot.domain.value_objects import ArtistId
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 from soulspot.infrastructure.persistence.repositories import ArtistRepository
 
 logger = logging.getLogger(__name__)
@@ -98,7 +98,7 @@ def _artist_to_response(artist: Any) -> ArtistResponse:
 @router.post("/sync", response_model=SyncArtistsResponse)
 async def sync_followed_artists(
     session: AsyncSession = Depends(get_db_session),
-    spotify_client: SpotifyClient = Depends(get_spotify_client),
+    spotify_client: ISpotifyClient = Depends(get_spotify_client),
     access_token: str = Depends(get_spotify_token_shared),
 ) -> SyncArtistsResponse:
     """Sync followed artists from Spotify to the database.
@@ -6,11 +6,13 @@ from fastapi import APIRouter, Cookie, Depends, HTTPException, Query, Request, R
 from fastapi.responses import RedirectResponse
 
 from soulspot.api.dependencies import (
+    get_http_clients,
     get_session_id,
     get_session_store,
 )
 from soulspot.application.services.session_store import DatabaseSessionStore
 from soulspot.config import Settings, get_settings
+from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
 from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 
 if TYPE_CHECKING:
@@ -92,6 +94,7 @@ async def callback(
     state: str = Query(..., description="State parameter for CSRF protection"),
     redirect_to: str = Query("/", description="Redirect URL after success"),
     settings: Settings = Depends(get_settings),
+    http: HttpClientRegistry | None = Depends(get_http_clients),
     session_store: DatabaseSessionStore = Depends(get_session_store),
     session_id: str | None = Cookie(None, alias="session_id"),
 ) -> RedirectResponse | dict[str, Any]:
@@ -109,6 +112,7 @@ async def callback(
         redirect_to: URL to redirect to after successful authentication
         session_id: Session ID from cookie
         settings: Application settings
+        http: Shared HTTP client registry (pooled connections)
         session_store: Session store
 
     Returns:
@@ -143,7 +147,7 @@ async def callback(
             status_code=400, detail="Code verifier not found in session."
         )
 
-    spotify_client = SpotifyClient(settings.spotify)
+    spotify_client = SpotifyClient(settings.spotify, http=http)
 
     try:
         # Exchange code for tokens
@@ -197,6 +201,7 @@ async def callback(
 @router.post("/refresh")
 async def refresh_token(
     settings: Settings = Depends(get_settings),
+    http: HttpClientRegistry | None = Depends(get_http_clients),
     session_store: DatabaseSessionStore = Depends(get_session_store),
     session_id: str | None = Depends(get_session_id),
 ) -> dict[str, Any]:
@@ -207,6 +212,7 @@ async def refresh_token(
     Args:
         session_id: Session ID from cookie or Authorization header
         settings: Application settings
+        http: Shared HTTP client registry (pooled connections)
         session_store: Session store
 
     Returns:
@@ -229,7 +235,7 @@ async def refresh_token(
             detail="No refresh token in session. Please re-authenticate.",
         )
 
-    spotify_client = SpotifyClient(settings.spotify)
+    spotify_client = SpotifyClient(settings.spotify, http=http)
 
     try:
         token_data = await spotify_client.refresh_token(session.refresh_token)
@@ -7,12 +7,17 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from soulspot.api.dependencies import get_db_session, get_spotify_token_shared
+from soulspot.api.dependencies import (
+    get_db_session,
+    get_http_clients,
+    get_spotify_token_shared,
+)
 from soulspot.application.services.discography_service import DiscographyService
 from soulspot.application.services.quality_upgrade_service import QualityUpgradeService
 from soulspot.application.services.watchlist_service import WatchlistService
 from soulspot.config import Settings, get_settings
 from soulspot.domain.value_objects import ArtistId, WatchlistId
+from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
 from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 
 router = APIRouter(prefix="/automation", tags=["automation"])
@@ -241,6 +246,7 @@ async def check_watchlist_releases(
     access_token: str = Depends(get_spotify_token_shared),
     session: AsyncSession = Depends(get_db_session),
     settings: Settings = Depends(get_settings),
+    http: HttpClientRegistry | None = Depends(get_http_clients),
 ) -> dict[str, Any]:
     """Check for new releases for a watchlist.
 
@@ -249,13 +255,14 @@ async def check_watchlist_releases(
         access_token: Spotify access token
         session: Database session
         settings: Application settings
+        http: Shared HTTP client registry (pooled connections)
 
     Returns:
         New releases found
     """
     try:
         wid = WatchlistId.from_string(watchlist_id)
-        spotify_client = SpotifyClient(settings.spotify)
+        spotify_client = SpotifyClient(settings.spotify, http=http)
         service = WatchlistService(session, spotify_client)
         watchlist = await service.get_watchlist(wid)
 
@@ -327,6 +334,7 @@ async def check_discography(
     access_token: str = Depends(get_spotify_token_shared),
     session: AsyncSession = Depends(get_db_session),
     settings: Settings = Depends(get_settings),
+    http: HttpClientRegistry | None = Depends(get_http_clients),
 ) -> dict[str, Any]:
     """Check discography completeness for an artist.
 
@@ -335,13 +343,14 @@ async def check_discography(
         access_token: Spotify access token
         session: Database session
         settings: Application settings
+        http: Shared HTTP client registry (pooled connections)
 
     Returns:
         Discography information
     """
     try:
         artist_id = ArtistId.from_string(request.artist_id)
-        spotify_client = SpotifyClient(settings.spotify)
+        spotify_client = SpotifyClient(settings.spotify, http=http)
         service = DiscographyService(session, spotify_client)
         info = await service.check_discography(artist_id, access_token)
 
@@ -365,6 +374,7 @@ async def get_missing_albums(
     access_token: str = Depends(get_spotify_token_shared),
     session: AsyncSession = Depends(get_db_session),
     settings: Settings = Depends(get_settings),
+    http: HttpClientRegistry | None = Depends(get_http_clients),
 ) -> dict[str, Any]:
     """Get missing albums for all artists.
 
@@ -373,12 +383,13 @@ async def get_missing_albums(
         access_token: Spotify access token
         session: Database session
         settings: Application settings
+        http: Shared HTTP client registry (pooled connections)
 
     Returns:
         List of artists with missing albums
     """
     try:
-        spotify_client = SpotifyClient(settings.spotify)
+        spotify_client = SpotifyClient(settings.spotify, http=http)
         service = DiscographyService(session, spotify_client)
         infos = await service.get_missing_albums_for_all_artists(access_token, limit)
 
@@ -1156,6 +1167,7 @@ async def sync_followed_artists(
     access_token: str = Depends(get_spotify_token_shared),
     session: AsyncSession = Depends(get_db_session),
     settings: Settings = Depends(get_settings),
+    http: HttpClientRegistry | None = Depends(get_http_clients),
 ) -> Any:
     """Sync followed artists from Spotify to local database.
 
@@ -1167,6 +1179,7 @@ async def sync_followed_artists(
         access_token: Spotify OAuth access token (from session)
         session: Database session
         settings: Application settings
+        http: Shared HTTP client registry (pooled connections)
 
     Returns:
         HTML partial for HTMX requests, JSON for API requests
@@ -1187,7 +1200,7 @@ async def sync_followed_artists(
         _TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates"
         templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
 
-        spotify_client = SpotifyClient(settings.spotify)
+        spotify_client = SpotifyClient(settings.spotify, http=http)
         service = FollowedArtistsService(session, spotify_client)
 
         artists, stats = await service.sync_followed_artists(access_token)
@@ -1331,6 +1344,7 @@ async def preview_followed_artists(
     limit: int = 50,
     access_token: str = Depends(get_spotify_token_shared),
     settings: Settings = Depends(get_settings),
+    http: HttpClientRegistry | None = Depends(get_http_clients),
 ) -> dict[str, Any]:
     """Preview followed artists from Spotify without syncing to database.
 
@@ -1341,6 +1355,7 @@ async def preview_followed_artists(
         limit: Max artists to fetch (1-50, default 50)
         access_token: Spotify OAuth access token (from session)
         settings: Application settings
+        http: Shared HTTP client registry (pooled connections)
 
     Returns:
         Raw Spotify API response with artist data
@@ -1349,7 +1364,7 @@ async def preview_followed_artists(
         HTTPException: 401 if token invalid, 403 if missing user-follow-read scope
     """
     try:
-        spotify_client = SpotifyClient(settings.spotify)
+        spotify_client = SpotifyClient(settings.spotify, http=http)
         # Note: We don't need a session for preview (no DB writes)
         # Just call the client method directly
         response = await spotify_client.get_followed_artists(
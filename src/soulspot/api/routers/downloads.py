@@ -9,9 +9,10 @@ from soulspot.api.dependencies import (
     get_download_repository,
     get_download_worker,
     get_job_queue,
+    get_local_job_queue,
 )
 from soulspot.application.workers.download_worker import DownloadWorker
-from soulspot.application.workers.job_queue import JobQueue
+from soulspot.application.workers.job_queue import JobQueue, JobType
 from soulspot.domain.entities import DownloadStatus
 from soulspot.domain.value_objects import DownloadId, TrackId
 from soulspot.infrastructure.persistence.repositories import DownloadRepository
@@ -148,7 +149,7 @@ async def list_downloads(
 # (idempotent). No database changes here - just queue state.
 @router.post("/pause")
 async def pause_downloads(
-    job_queue: JobQueue = Depends(get_job_queue),
+    job_queue: JobQueue = Depends(get_local_job_queue),
 ) -> PauseResumeResponse:
     """Pause all download processing globally.
 
@@ -173,7 +174,7 @@ async def pause_downloads(
 # before resuming or downloads will just fail again!
 @router.post("/resume")
 async def resume_downloads(
-    job_queue: JobQueue = Depends(get_job_queue),
+    job_queue: JobQueue = Depends(get_local_job_queue),
 ) -> PauseResumeResponse:
     """Resume all download processing globally.
 
@@ -214,9 +215,13 @@ async def get_queue_status(
         Queue status information
     """
     stats = job_queue.get_stats()
+    # Downloads are capped by their own per-type limit, the global limit covers all job types
+    max_downloads = job_queue.get_type_limit(JobType.DOWNLOAD)
+    if max_downloads is None:
+        max_downloads = job_queue.get_max_concurrent_jobs()
     return {
         "paused": job_queue.is_paused(),
-        "max_concurrent_downloads": job_queue.get_max_concurrent_jobs(),
+        "max_concurrent_downloads": max_downloads,
         "active_downloads": stats.get("running", 0),
         "queued_downloads": stats.get("pending", 0),
         "total_jobs": stats.get("total_jobs", 0),
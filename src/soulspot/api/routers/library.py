@@ -7,11 +7,12 @@ from typing import Any
 from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from soulspot.api.dependencies import (
     get_db_session,
+    get_http_clients,
     get_job_queue,
     get_library_scanner_service,
 )
@@ -26,9 +27,17 @@ from soulspot.application.use_cases.scan_library import (
     GetBrokenFilesUseCase,
     GetDuplicatesUseCase,
     ScanLibraryUseCase,
+    VerifyFileHashesUseCase,
+)
+from soulspot.application.workers.job_queue import (
+    JobQueue,
+    JobStatus,
+    JobType,
+    make_dedup_key,
 )
-from soulspot.application.workers.job_queue import JobQueue, JobStatus, JobType
 from soulspot.config import Settings, get_settings
+from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
+from soulspot.infrastructure.persistence.repositories import LibraryScanRepository
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +93,13 @@ class ReDownloadRequest(BaseModel):
     max_files: int | None = None
 
 
+class VerifyHashesRequest(BaseModel):
+    """Request to compute full content hashes for tracks."""
+
+    track_ids: list[str] | None = None
+    limit: int = Field(default=100, ge=1, le=10000)
+
+
 # Hey future me, this kicks off a library scan! Validates scan_path and starts scanning for audio
 # files. The ValueError catch handles path validation errors (like trying to scan outside allowed
 # directories - security feature). Returns scan ID so you can poll for status later. Scan runs
@@ -217,6 +233,27 @@ async def get_broken_files(
     }
 
 
+# Hey future me - scans only store the QUICK fingerprint (LIBRARY__HASH_MODE=quick). This computes
+# the full SHA256 on demand: for the given track_ids, or for up to `limit` quick-tier tracks when
+# no ids are given. Reads every byte of every selected file - keep limit sane on big libraries!
+@router.post("/verify-hashes")
+async def verify_file_hashes(
+    request: VerifyHashesRequest,
+    session: AsyncSession = Depends(get_db_session),
+) -> dict[str, Any]:
+    """Compute and verify full content hashes.
+
+    Args:
+        request: Tracks to verify and limit
+        session: Database session
+
+    Returns:
+        Verification statistics
+    """
+    use_case = VerifyFileHashesUseCase(session)
+    return await use_case.execute(track_ids=request.track_ids, limit=request.limit)
+
+
 # Listen up! Library overview stats endpoint. Uses SQLAlchemy func.count() for efficient aggregation
 # instead of fetching all records. The .scalar() unwraps single value from result. The "or 0" handles
 # None from empty tables. is_broken check uses == True explicitly which looks weird but is necessary
@@ -460,6 +497,7 @@ class ImportScanResponse(BaseModel):
 @router.post("/import/scan", response_model=ImportScanResponse)
 async def start_import_scan(
     incremental: bool = Form(True),
+    resume: bool = Form(True),
     job_queue: JobQueue = Depends(get_job_queue),
 ) -> ImportScanResponse:
     """Start a library import scan as background job.
@@ -469,6 +507,7 @@ async def start_import_scan(
 
     Args:
         incremental: If True, only scan new/modified files (default: True)
+        resume: Continue an interrupted scan of the same mode from its checkpoint
         job_queue: Job queue for background processing
 
     Returns:
@@ -478,7 +517,7 @@ async def start_import_scan(
         # Queue the scan job
         job_id = await job_queue.enqueue(
             job_type=JobType.LIBRARY_SCAN,
-            payload={"incremental": incremental},
+            payload={"incremental": incremental, "resume": resume},
             max_retries=1,  # Don't retry full scans
             priority=5,  # Medium priority
         )
@@ -495,6 +534,70 @@ async def start_import_scan(
         ) from e
 
 
+class ResumeScanRequest(BaseModel):
+    """Request to resume an interrupted import scan."""
+
+    scan_id: str | None = None
+
+
+# Hey future me - this is the "resume" action for checkpointed import scans! Import scans write a
+# checkpoint into library_scans at every batch commit; if one died (restart, crash, failed job),
+# this queues a LIBRARY_SCAN job that continues after the last committed directory instead of
+# starting over. Without scan_id the most recent interrupted scan is used. 404 = nothing to resume.
+# Same dedup key as the startup resume, so a double click returns the already queued job.
+@router.post("/scan/resume", response_model=ImportScanResponse)
+async def resume_library_scan(
+    request: ResumeScanRequest | None = None,
+    session: AsyncSession = Depends(get_db_session),
+    job_queue: JobQueue = Depends(get_job_queue),
+    settings: Settings = Depends(get_settings),
+) -> ImportScanResponse:
+    """Resume an interrupted library import scan from its checkpoint.
+
+    Args:
+        request: Optional scan ID (default: most recent interrupted scan)
+        session: Database session
+        job_queue: Job queue for background processing
+        settings: Application settings
+
+    Returns:
+        Job ID for status polling
+    """
+    scan_repo = LibraryScanRepository(session)
+    scan_id = request.scan_id if request else None
+    scan = (
+        await scan_repo.get(scan_id)
+        if scan_id
+        else await scan_repo.get_resumable(str(settings.storage.music_path))
+    )
+    if (
+        scan is None
+        or scan.checkpoint is None
+        or scan.status not in LibraryScanRepository.RESUMABLE_STATUSES
+    ):
+        raise HTTPException(status_code=404, detail="No interrupted scan to resume")
+
+    incremental = scan.checkpoint.get("incremental", True)
+    try:
+        job_id = await job_queue.enqueue(
+            job_type=JobType.LIBRARY_SCAN,
+            payload={"incremental": incremental, "resume": True, "scan_id": scan.id},
+            max_retries=1,
+            priority=5,
+            dedup_key=make_dedup_key(JobType.LIBRARY_SCAN, scan.id),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to resume library scan: {str(e)}"
+        ) from e
+
+    return ImportScanResponse(
+        job_id=job_id,
+        status="pending",
+        message=f"Library scan {scan.id} queued for resume",
+    )
+
+
 @router.get("/import/status/{job_id}")
 async def get_import_scan_status(
     job_id: str,
@@ -1569,6 +1672,7 @@ async def apply_enrichment_candidate(
     candidate_id: str,
     db: AsyncSession = Depends(get_db_session),
     settings: Settings = Depends(get_settings),
+    http: HttpClientRegistry | None = Depends(get_http_clients),
 ) -> dict[str, Any]:
     """Apply a user-selected enrichment candidate.
 
@@ -1602,7 +1706,7 @@ async def apply_enrichment_candidate(
         raise HTTPException(status_code=400, detail="Candidate already processed")
 
     # Update entity with Spotify data
-    image_service = SpotifyImageService(settings)
+    image_service = SpotifyImageService(settings, http=http)
     image_downloaded = False
 
     if candidate.entity_type == "artist":
@@ -30,10 +30,8 @@ from soulspot.application.use_cases.enrich_metadata_multi_source import (
     EnrichMetadataMultiSourceUseCase,
 )
 from soulspot.domain.entities import Album, Artist, MetadataSource, Track
+from soulspot.domain.ports import ILastfmClient, IMusicBrainzClient, ISpotifyClient
 from soulspot.domain.value_objects import AlbumId, ArtistId, TrackId
-from soulspot.infrastructure.integrations.lastfm_client import LastfmClient
-from soulspot.infrastructure.integrations.musicbrainz_client import MusicBrainzClient
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 from soulspot.infrastructure.persistence.repositories import (
     AlbumRepository,
     ArtistRepository,
@@ -63,9 +61,9 @@ def get_enrich_use_case(
     track_repository: TrackRepository = Depends(get_track_repository),
     artist_repository: ArtistRepository = Depends(get_artist_repository),
     album_repository: AlbumRepository = Depends(get_album_repository),
-    musicbrainz_client: MusicBrainzClient = Depends(get_musicbrainz_client),
-    lastfm_client: LastfmClient | None = Depends(get_lastfm_client),
-    spotify_client: SpotifyClient = Depends(get_spotify_client),
+    musicbrainz_client: IMusicBrainzClient = Depends(get_musicbrainz_client),
+    lastfm_client: ILastfmClient | None = Depends(get_lastfm_client),
+    spotify_client: ISpotifyClient = Depends(get_spotify_client),
     metadata_merger: MetadataMerger = Depends(get_metadata_merger),
 ) -> EnrichMetadataMultiSourceUseCase:
     """Get metadata enrichment use case instance."""
@@ -25,8 +25,8 @@ from soulspot.application.use_cases.queue_playlist_downloads import (
 )
 from soulspot.domain.entities import Playlist, PlaylistSource
 from soulspot.domain.exceptions import ValidationException
+from soulspot.domain.ports import ISpotifyClient
 from soulspot.domain.value_objects import PlaylistId, SpotifyUri
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 from soulspot.infrastructure.persistence.repositories import (
     PlaylistRepository,
     TrackRepository,
@@ -219,7 +219,7 @@ async def queue_downloads(
 @router.post("/sync-library")
 async def sync_playlist_library(
     access_token: str = Depends(get_spotify_token_shared),
-    spotify_client: SpotifyClient = Depends(get_spotify_client),
+    spotify_client: ISpotifyClient = Depends(get_spotify_client),
     playlist_repository: PlaylistRepository = Depends(get_playlist_repository),
 ) -> dict[str, Any]:
     """Sync user's playlist library from Spotify (metadata only, no tracks).
@@ -7,9 +7,11 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from soulspot.api.dependencies import get_db_session
+from soulspot.api.dependencies import get_db_session, get_http_clients
 from soulspot.application.services.app_settings_service import AppSettingsService
+from soulspot.application.workers.job_queue import JobType
 from soulspot.config import get_settings
+from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -189,6 +191,7 @@ async def get_all_settings(
 @router.post("/")
 async def update_settings(
     settings_update: AllSettings,
+    request: Request,
     db: AsyncSession = Depends(get_db_session),
 ) -> dict[str, Any]:
     """Update application settings.
@@ -251,6 +254,13 @@ async def update_settings(
 
     await db.commit()
 
+    # The running queue picks up the new download limit on its next dispatch
+    job_queue = getattr(request.app.state, "job_queue", None)
+    if job_queue is not None:
+        job_queue.set_type_limit(
+            JobType.DOWNLOAD, settings_update.download.max_concurrent_downloads
+        )
+
     logger.info(
         "Settings updated: log_level=%s, debug=%s",
         settings_update.general.log_level,
@@ -753,6 +763,7 @@ class SyncTriggerResponse(BaseModel):
 async def trigger_manual_sync(
     sync_type: str,
     db: AsyncSession = Depends(get_db_session),
+    http: HttpClientRegistry | None = Depends(get_http_clients),
 ) -> SyncTriggerResponse:
     """Trigger a manual Spotify sync.
 
@@ -760,6 +771,7 @@ async def trigger_manual_sync(
 
     Args:
         sync_type: Type of sync - 'artists', 'playlists', 'liked', 'albums', or 'all'
+        http: Shared HTTP client registry (pooled connections)
 
     Returns:
         Success status and message
@@ -789,8 +801,8 @@ async def trigger_manual_sync(
             detail="Not authenticated with Spotify. Please connect your account first.",
         )
 
-    spotify_client = SpotifyClient(app_settings.spotify)
-    image_service = SpotifyImageService(app_settings)
+    spotify_client = SpotifyClient(app_settings.spotify, http=http)
+    image_service = SpotifyImageService(app_settings, http=http)
     settings_service = AppSettingsService(db)
 
     sync_service = SpotifySyncService(
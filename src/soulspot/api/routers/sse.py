@@ -16,10 +16,9 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from soulspot.api.dependencies import get_db_session, get_download_repository
-from soulspot.infrastructure.persistence.repositories import DownloadRepository
+from soulspot.api.dependencies import get_event_bus
+from soulspot.application.services.event_bus import EventBus
 
 logger = logging.getLogger(__name__)
 
@@ -86,26 +85,26 @@ class SSEEvent:
         return message
 
 
-# Hey future me, the main SSE event stream! This keeps connections alive and streams real-time updates
-# to clients. poll_interval defaults to 2 seconds which is reasonable - faster = more load, slower = lag.
-# Uses client_id = id(request) for logging which is just memory address - not very meaningful but works
-# for debugging. Heartbeat every 30 seconds (15 iterations * 2s) prevents connection timeout. The
-# "while True" loop runs forever until client disconnects or exception. await request.is_disconnected()
-# checks if client dropped connection - graceful handling. Downloads limited to 10 most recent, same as
-# widget. AsyncGenerator return type with explicit yield makes this a true stream. Exception handling logs
-# errors but keeps stream alive. CancelledError is expected when connection closes. IMPORTANT: infinite
-# loops can leak resources if not properly cleaned up! FastAPI handles this via async context manager.
+# Hey future me, the main SSE event stream! It does NOT query anything itself - it reads this
+# client's Subscription on the in-process EventBus, which a single DownloadBroadcastWorker (snapshots)
+# plus JobQueue / DownloadMonitorWorker / library scan (deltas) feed. So DB load stays the same no
+# matter how many tabs are open. Right after connecting, the client gets the retained
+# downloads_update snapshot (if one exists), then live job_update / download_progress / scan_progress
+# deltas. The subscription buffer is bounded: a client that can't keep up loses its oldest deltas and
+# gets the latest snapshot again. Heartbeat after heartbeat_interval seconds without events prevents
+# proxy/connection timeouts. Uses client_id = id(request) for logging which is just memory address.
+# CancelledError is expected when connection closes; the with-block always unsubscribes.
 async def event_generator(
     request: Request,
-    download_repository: DownloadRepository,
-    poll_interval: float = 2.0,
+    event_bus: EventBus,
+    heartbeat_interval: float = 30.0,
 ) -> AsyncGenerator[str, None]:
     """Generate SSE events for real-time updates.
 
     Args:
         request: FastAPI request object (to detect client disconnect)
-        download_repository: Repository for download data
-        poll_interval: Seconds between updates
+        event_bus: Bus the updates are published on
+        heartbeat_interval: Seconds without events before a heartbeat is sent
 
     Yields:
         SSE-formatted event strings
@@ -123,62 +122,26 @@ async def event_generator(
         id=str(client_id),
     ).encode()
 
-    # Heartbeat counter
-    heartbeat_counter = 0
-
     try:
-        while True:
-            # Check if client disconnected
-            if await request.is_disconnected():
-                logger.info(f"SSE client disconnected: client_id={client_id}")
-                break
+        with event_bus.subscribe() as subscription:
+            while True:
+                # Check if client disconnected
+                if await request.is_disconnected():
+                    logger.info(f"SSE client disconnected: client_id={client_id}")
+                    break
+
+                event = await subscription.get(timeout=heartbeat_interval)
+                if event is None:
+                    yield SSEEvent(
+                        data={"timestamp": datetime.now(UTC).isoformat()},
+                        event="heartbeat",
+                    ).encode()
+                    continue
 
-            # Send heartbeat every 30 seconds (15 iterations * 2s)
-            heartbeat_counter += 1
-            if heartbeat_counter >= 15:
                 yield SSEEvent(
-                    data={"timestamp": datetime.now(UTC).isoformat()},
-                    event="heartbeat",
-                ).encode()
-                heartbeat_counter = 0
-
-            # Get active downloads
-            try:
-                downloads = await download_repository.list_active()
-
-                # Prepare download data
-                downloads_data = [
-                    {
-                        "id": str(download.id.value),
-                        "track_id": str(download.track_id.value),
-                        "status": download.status.value,
-                        "progress_percent": download.progress_percent or 0,
-                        "priority": download.priority,
-                        "created_at": download.created_at.isoformat(),
-                    }
-                    for download in downloads[:10]  # Limit to 10 most recent
-                ]
-
-                # Send download update event
-                yield SSEEvent(
-                    data={
-                        "downloads": downloads_data,
-                        "total_count": len(downloads),
-                        "timestamp": datetime.now(UTC).isoformat(),
-                    },
-                    event="downloads_update",
+                    data=event.data, event=event.type, id=str(event.id)
                 ).encode()
 
-            except Exception as e:
-                logger.exception(f"Error generating SSE event: {e}")
-                yield SSEEvent(
-                    data={"error": str(e), "timestamp": datetime.now(UTC).isoformat()},
-                    event="error",
-                ).encode()
-
-            # Wait before next update
-            await asyncio.sleep(poll_interval)
-
     except asyncio.CancelledError:
         logger.info(f"SSE connection cancelled: client_id={client_id}")
     except Exception as e:
@@ -190,21 +153,22 @@ async def event_generator(
 # Listen up! The SSE endpoint that clients connect to. Sets critical headers for SSE: Cache-Control
 # no-cache prevents browsers from caching, Connection keep-alive maintains long-lived HTTP connection,
 # X-Accel-Buffering no tells nginx to not buffer (otherwise events get delayed). StreamingResponse with
-# text/event-stream media type is SSE standard. The _session param is unused but dependency is required
-# to maintain session lifecycle. Docstring has good JavaScript example showing client-side usage. Each
-# client gets their own event stream - memory usage scales with number of connected clients! EventSource
+# text/event-stream media type is SSE standard. No DB session here on purpose - a stream lives for
+# hours and must not pin a pooled connection. Docstring has good JavaScript example showing client-side
+# usage. Each client only costs its bounded subscription buffer on the shared EventBus! EventSource
 # API on client side auto-reconnects on disconnect which is nice. No authentication here - anyone can
 # connect and see download status! Should require auth if data is sensitive.
 @router.get("/stream")
 async def event_stream(
     request: Request,
-    _session: AsyncSession = Depends(get_db_session),
-    download_repository: DownloadRepository = Depends(get_download_repository),
+    event_bus: EventBus = Depends(get_event_bus),
 ) -> StreamingResponse:
     """Server-Sent Events endpoint for real-time updates.
 
     This endpoint establishes an SSE connection and streams events to the client.
-    Events include download status updates, job completions, and heartbeats.
+    Events: downloads_update (snapshot of active downloads), job_update (job state
+    changes), download_progress (slskd progress), scan_progress (library scans)
+    and heartbeat.
 
     Example client-side usage:
     ```javascript
@@ -215,6 +179,11 @@ async def event_stream(
         console.log('Downloads:', data.downloads);
     });
 
+    eventSource.addEventListener('job_update', (event) => {
+        const job = JSON.parse(event.data);
+        console.log('Job', job.id, job.status);
+    });
+
     eventSource.addEventListener('heartbeat', (event) => {
         console.log('Heartbeat received');
     });
@@ -229,7 +198,7 @@ async def event_stream(
         StreamingResponse with text/event-stream content type
     """
     return StreamingResponse(
-        event_generator(request, download_repository),
+        event_generator(request, event_bus),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
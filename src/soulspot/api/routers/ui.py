@@ -1,7 +1,10 @@
 """UI routes for serving HTML templates."""
 
+import asyncio
 import json
 import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -1149,6 +1152,55 @@ async def library_incomplete_albums_page(request: Request) -> Any:
 # =============================================================================
 
 
+# Hey future me - stale-while-revalidate for these pages! When the synced rows are past their
+# cooldown but still inside SpotifySyncService.STALE_SYNC_GRACE, the page renders them right away
+# and the sync runs HERE in a task with its OWN session (the request's session is closed once the
+# response is sent). One background sync per key - reloading the page while it runs doesn't
+# start another. The next page load shows the refreshed rows. Never synced or too old -> the page
+# still waits for the sync, so nobody gets a day-old page after a long break.
+_background_syncs: dict[str, asyncio.Task[Any]] = {}
+
+
+def _sync_in_background(
+    request: Request,
+    key: str,
+    sync_service: SpotifySyncService,
+    sync: Callable[[SpotifySyncService], Awaitable[Any]],
+) -> dict[str, Any]:
+    """Run a Spotify sync in the background with its own database session.
+
+    Args:
+        request: FastAPI request (for the app's database)
+        key: Identity of the sync (type + Spotify ID), one running task per key
+        sync_service: Request-scoped sync service (its Spotify client is reused)
+        sync: Coroutine function running the sync on a fresh service
+
+    Returns:
+        Sync stats for the template, marked as revalidating
+    """
+    if key not in _background_syncs:
+        db = request.app.state.db
+        spotify_client = sync_service.spotify_client
+
+        async def run() -> None:
+            async with db.session_scope() as session:
+                await sync(
+                    SpotifySyncService(session=session, spotify_client=spotify_client)
+                )
+
+        task = asyncio.create_task(run())
+        _background_syncs[key] = task
+        task.add_done_callback(partial(_background_sync_done, key))
+    return {"synced": False, "revalidating": True, "skipped_cooldown": False}
+
+
+def _background_sync_done(key: str, task: asyncio.Task[Any]) -> None:
+    """Forget a finished background sync and log its failure."""
+    _background_syncs.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background Spotify sync {key} failed: {task.exception()}")
+
+
 @router.get("/spotify/artists", response_class=HTMLResponse)
 async def spotify_artists_page(
     request: Request,
@@ -1183,8 +1235,17 @@ async def spotify_artists_page(
             access_token = await db_token_manager.get_token_for_background()
 
         if access_token:
-            # Auto-sync (respects cooldown) - updates DB and commits
-            sync_stats = await sync_service.sync_followed_artists(access_token)
+            if await sync_service.is_sync_stale("followed_artists"):
+                # Past cooldown but recent enough to show - refresh without waiting
+                sync_stats = _sync_in_background(
+                    request,
+                    "followed_artists",
+                    sync_service,
+                    lambda service: service.sync_followed_artists(access_token),
+                )
+            else:
+                # Auto-sync (respects cooldown) - updates DB and commits
+                sync_stats = await sync_service.sync_followed_artists(access_token)
     except Exception as sync_error:
         # Sync failed (token invalid, API error, etc.) - log but don't block
         # We'll still load existing data from DB below
@@ -1295,8 +1356,18 @@ async def spotify_artist_detail_page(
         }
 
         if access_token:
-            # Auto-sync albums (respects cooldown)
-            sync_stats = await sync_service.sync_artist_albums(access_token, artist_id)
+            if await sync_service.is_sync_stale("artist_albums", artist_id):
+                sync_stats = _sync_in_background(
+                    request,
+                    f"artist_albums:{artist_id}",
+                    sync_service,
+                    lambda service: service.sync_artist_albums(access_token, artist_id),
+                )
+            else:
+                # Auto-sync albums (respects cooldown)
+                sync_stats = await sync_service.sync_artist_albums(
+                    access_token, artist_id
+                )
 
         # Get albums from DB
         album_models = await sync_service.get_artist_albums(artist_id, limit=200)
@@ -1400,8 +1471,18 @@ async def spotify_album_detail_page(
         }
 
         if access_token:
-            # Auto-sync tracks (respects cooldown)
-            sync_stats = await sync_service.sync_album_tracks(access_token, album_id)
+            if await sync_service.is_sync_stale("album_tracks", album_id):
+                sync_stats = _sync_in_background(
+                    request,
+                    f"album_tracks:{album_id}",
+                    sync_service,
+                    lambda service: service.sync_album_tracks(access_token, album_id),
+                )
+            else:
+                # Auto-sync tracks (respects cooldown)
+                sync_stats = await sync_service.sync_album_tracks(
+                    access_token, album_id
+                )
 
         # Get tracks from DB
         track_models = await sync_service.get_album_tracks(album_id, limit=100)
@@ -18,10 +18,13 @@
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel, Field
 
+from soulspot.api.dependencies import get_job_queue, get_local_job_queue
+from soulspot.application.workers.job_queue import JobQueue, JobType
+
 router = APIRouter()
 
 
@@ -46,6 +49,30 @@ class AllWorkersStatus(BaseModel):
     )
 
 
+class JobTypeSchedulingUpdate(BaseModel):
+    """Scheduling change for one job type (omitted fields stay unchanged)."""
+
+    max_concurrent: int | None = Field(
+        default=None,
+        ge=0,
+        description="Max concurrent jobs of this type (0 = hold, null = global limit only)",
+    )
+    weight: float | None = Field(
+        default=None, gt=0, description="Fair-share weight of this type"
+    )
+
+
+class JobQueueSchedulingUpdate(BaseModel):
+    """Runtime change of job queue concurrency and fair-share weights."""
+
+    max_concurrent_jobs: int | None = Field(
+        default=None, ge=1, description="Max concurrent jobs of all types"
+    )
+    job_types: dict[JobType, JobTypeSchedulingUpdate] = Field(
+        default_factory=dict, description="Per job type changes"
+    )
+
+
 def _format_time_ago(dt: datetime | None) -> str:
     """Format a datetime as a relative time string (e.g., 'vor 5 min').
 
@@ -525,3 +552,55 @@ async def get_workers_status_html(request: Request) -> HTMLResponse:
 """
 
     return HTMLResponse(content=html)
+
+
+# Hey future me – Scheduling des Job-Queues zur Laufzeit ändern (kein Restart nötig)!
+# max_concurrent_jobs = globales Limit über alle Job-Types, pro Type gibt's ein eigenes Limit
+# (0 = Type anhalten, null = nur globales Limit) und ein Gewicht für die faire Verteilung.
+# Änderungen gelten ab dem nächsten Dispatch, laufende Jobs werden NICHT abgebrochen.
+# Achtung: nur im Speicher - nach einem Restart gelten wieder die Werte aus den Settings.
+# Mit DOWNLOAD__EMBEDDED_WORKERS=false gibt PATCH 409 zurück (der Worker-Prozess sieht es nie).
+# dispatch_latency = Zeit von "Job ist lauffähig" bis "Worker hat ihn", bei freien Workern << 1 ms.
+@router.get("/job-queue/scheduling")
+async def get_job_queue_scheduling(
+    job_queue: JobQueue = Depends(get_job_queue),
+) -> dict[str, Any]:
+    """Get global and per-job-type concurrency limits, weights and load.
+
+    Returns:
+        max_concurrent_jobs, running, dispatch_latency (enqueue-to-start
+        percentiles in ms) and one entry per job type with max_concurrent,
+        weight, running and pending
+    """
+    return job_queue.get_scheduling_stats()
+
+
+@router.patch("/job-queue/scheduling")
+async def update_job_queue_scheduling(
+    update: JobQueueSchedulingUpdate,
+    job_queue: JobQueue = Depends(get_local_job_queue),
+) -> dict[str, Any]:
+    """Change job queue concurrency limits and weights at runtime.
+
+    Only fields present in the request are changed. Sending
+    ``"max_concurrent": null`` for a job type removes its own limit.
+
+    Args:
+        update: Global and per-job-type changes
+        job_queue: Job queue dependency
+
+    Returns:
+        Scheduling state after the change
+    """
+    try:
+        if update.max_concurrent_jobs is not None:
+            job_queue.set_max_concurrent_jobs(update.max_concurrent_jobs)
+        for job_type, change in update.job_types.items():
+            if "max_concurrent" in change.model_fields_set:
+                job_queue.set_type_limit(job_type, change.max_concurrent)
+            if change.weight is not None:
+                job_queue.set_type_weight(job_type, change.weight)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return job_queue.get_scheduling_stats()
@@ -1,13 +1,33 @@
 """Caching layer - Cache implementations for reducing API calls."""
 
 from soulspot.application.cache.base_cache import BaseCache
+from soulspot.application.cache.bounded_cache import BoundedCache
+from soulspot.application.cache.cached_clients import (
+    CachedLastfmClient,
+    CachedMusicBrainzClient,
+    CachedSpotifyClient,
+)
+from soulspot.application.cache.disk_cache import DiskCache
+from soulspot.application.cache.lastfm_cache import LastfmCache
+from soulspot.application.cache.lyrics_cache import LyricsCache
 from soulspot.application.cache.musicbrainz_cache import MusicBrainzCache
+from soulspot.application.cache.response_cache import ResponseCache
+from soulspot.application.cache.single_flight import SingleFlight
 from soulspot.application.cache.spotify_cache import SpotifyCache
 from soulspot.application.cache.track_file_cache import TrackFileCache
 
 __all__ = [
     "BaseCache",
+    "BoundedCache",
+    "CachedLastfmClient",
+    "CachedMusicBrainzClient",
+    "CachedSpotifyClient",
+    "DiskCache",
+    "LastfmCache",
+    "LyricsCache",
     "MusicBrainzCache",
+    "ResponseCache",
+    "SingleFlight",
     "SpotifyCache",
     "TrackFileCache",
 ]
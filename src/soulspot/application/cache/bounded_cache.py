@@ -0,0 +1,330 @@
+"""Memory-bounded cache with byte accounting and heap-based TTL expiry."""
+
+import heapq
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from soulspot.application.cache.base_cache import BaseCache
+from soulspot.application.cache.enhanced_cache import CacheMetrics
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+MB = 1024 * 1024
+
+# Rough per-entry bookkeeping cost (dict slot, entry object, heap tuple) on top of key + value
+ENTRY_OVERHEAD = 200
+
+
+# Hey future me, this is an ESTIMATE, not exact accounting! It walks dicts/lists/tuples/sets and
+# object __dict__s adding sys.getsizeof() of everything it meets - good enough to tell a 3 MB
+# playlist payload from a 2 KB track. Shared objects are counted once per value (seen set), but
+# an object shared BETWEEN entries is counted for each of them - so we over-estimate, never under.
+# Cost is O(size of value) and only paid on set(), never on get().
+def estimate_size(value: Any) -> int:
+    """Estimate the memory used by a value and everything it references.
+
+    Args:
+        value: Value to measure (JSON-like data, dataclasses, plain objects)
+
+    Returns:
+        Approximate size in bytes
+    """
+    size = 0
+    seen: set[int] = set()
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.append(vars(obj))
+    return size
+
+
+@dataclass(slots=True)
+class _Entry[V]:
+    """Stored value with its accounted size and expiry."""
+
+    value: V
+    size: int
+    expires_at: float
+    seq: int  # Matches the live heap item; older heap items for the key are stale
+
+
+class BoundedCache(BaseCache[K, V]):
+    """In-memory cache bounded by an approximate byte budget.
+
+    Features:
+    - Byte-size accounting per entry (estimate_size) against max_bytes
+    - Optional entry count limit
+    - LRU eviction once a budget is exceeded (expired entries go first)
+    - TTL expiry heap: expired entries are removed in O(log n) each,
+      without scanning the whole cache
+    - Lock-free reads and writes (no await inside any operation)
+    - Hit/miss/eviction/expiration metrics
+    """
+
+    # Listen up future me - NO asyncio.Lock here on purpose! Every method body is plain sync code
+    # between two awaits, and the event loop never switches tasks in the middle of sync code, so
+    # nobody can see a half-updated entry. That's why get() is just a dict lookup + move_to_end
+    # instead of queueing behind writers. The day you add an await inside one of these methods (or
+    # touch the cache from another THREAD), that guarantee is gone - don't.
+    # The expiry heap holds (expires_at, seq, key). Overwriting/deleting a key leaves its old heap
+    # item behind (lazy deletion, skipped via seq); _compact() rebuilds the heap once stale items
+    # outnumber live ones, so the heap can't grow without bound on churn.
+    def __init__(
+        self,
+        max_bytes: int = 64 * MB,
+        max_entries: int | None = None,
+        name: str = "cache",
+        sizer: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        """Initialize bounded cache.
+
+        Args:
+            max_bytes: Memory budget in bytes (approximate)
+            max_entries: Maximum number of entries (None = only the byte budget)
+            name: Namespace shown in stats (e.g. "spotify")
+            sizer: Function estimating a value's size in bytes
+
+        Raises:
+            ValueError: If max_bytes or max_entries is < 1
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.name = name
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._sizer = sizer
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._expiry: list[tuple[float, int, K]] = []
+        self._stale = 0
+        self._seq = 0
+        self._bytes = 0
+        self._rejected = 0
+        self._metrics = CacheMetrics()
+
+    async def get(self, key: K) -> V | None:
+        """Get value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        entry = self._lookup(key)
+        return None if entry is None else entry.value
+
+    async def get_with_expiry(self, key: K) -> tuple[V, float] | None:
+        """Get value from cache together with its expiry timestamp.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, expires_at) if found and not expired, None otherwise
+        """
+        entry = self._lookup(key)
+        return None if entry is None else (entry.value, entry.expires_at)
+
+    def _lookup(self, key: K) -> _Entry[V] | None:
+        """Find a live entry, dropping it if expired, and count the hit or miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._metrics.misses += 1
+            return None
+        if entry.expires_at <= time.time():
+            self._remove(key)
+            self._metrics.expirations += 1
+            self._metrics.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._metrics.hits += 1
+        return entry
+
+    # Hey future me - a single value bigger than the WHOLE budget is not cached at all (it would
+    # evict everything else and then itself). It still replaces an older value for the key, so
+    # get() never returns something stale after a set(). Watch "rejected" in the stats - if it
+    # climbs, the namespace budget is too small for what's being cached.
+    async def set(self, key: K, value: V, ttl_seconds: int = 3600) -> None:
+        """Set value in cache, evicting expired and then least recently used entries.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Time to live in seconds
+        """
+        now = time.time()
+        self._remove(key)
+        size = self._sizer(value) + sys.getsizeof(key) + ENTRY_OVERHEAD
+        if size > self._max_bytes:
+            self._rejected += 1
+            return
+
+        self._expire(now)
+        self._seq += 1
+        entry = _Entry(
+            value=value, size=size, expires_at=now + ttl_seconds, seq=self._seq
+        )
+        self._entries[key] = entry
+        self._bytes += size
+        heapq.heappush(self._expiry, (entry.expires_at, entry.seq, key))
+        self._metrics.writes += 1
+        self._evict()
+
+    async def delete(self, key: K) -> bool:
+        """Delete value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if deleted, False if not found
+        """
+        return self._remove(key)
+
+    # Yo, this is a full O(n) scan - meant for invalidation hooks ("drop everything cached for
+    # artist X"), not for the hot path. Keys are collected first so the dict isn't mutated mid-loop.
+    async def delete_where(self, predicate: Callable[[K], bool]) -> int:
+        """Delete all entries whose key matches a predicate.
+
+        Args:
+            predicate: Function returning True for keys to delete
+
+        Returns:
+            Number of entries deleted
+        """
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    async def clear(self) -> None:
+        """Clear all entries from cache."""
+        self._entries.clear()
+        self._expiry.clear()
+        self._stale = 0
+        self._bytes = 0
+
+    async def exists(self, key: K) -> bool:
+        """Check if key exists in cache (does not count as a hit or miss).
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if key exists and not expired
+        """
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires_at > time.time()
+
+    async def cleanup_expired(self) -> int:
+        """Remove expired entries from cache.
+
+        Returns:
+            Number of entries removed
+        """
+        return self._expire(time.time())
+
+    def _remove(self, key: K) -> bool:
+        """Drop a key's entry, leaving its heap item stale."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        self._stale += 1
+        if self._stale > 64 and self._stale > len(self._entries):
+            self._compact()
+        return True
+
+    def _expire(self, now: float) -> int:
+        """Pop due items off the expiry heap and drop their entries."""
+        removed = 0
+        while self._expiry and self._expiry[0][0] <= now:
+            _, seq, key = heapq.heappop(self._expiry)
+            entry = self._entries.get(key)
+            if entry is None or entry.seq != seq:
+                self._stale -= 1
+                continue
+            del self._entries[key]
+            self._bytes -= entry.size
+            removed += 1
+        self._metrics.expirations += removed
+        return removed
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until both budgets are met."""
+        while self._entries and (
+            self._bytes > self._max_bytes
+            or (
+                self._max_entries is not None and len(self._entries) > self._max_entries
+            )
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._stale += 1
+            self._metrics.evictions += 1
+        if self._stale > 64 and self._stale > len(self._entries):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuild the expiry heap from live entries only."""
+        self._expiry = [
+            (entry.expires_at, entry.seq, key) for key, entry in self._entries.items()
+        ]
+        heapq.heapify(self._expiry)
+        self._stale = 0
+
+    def get_metrics(self) -> CacheMetrics:
+        """Get cache performance metrics.
+
+        Returns:
+            CacheMetrics object with current metrics
+        """
+        return self._metrics
+
+    # Yo, get_stats() drops due entries first (cheap - heap pops only), so active_entries is exact
+    # and expired_entries is always 0 afterwards. Key names match InMemoryCache.get_stats() so the
+    # Spotify/MusicBrainz/track-file cache stats look the same as before, plus the byte budget.
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry counts, byte usage against the budget and metrics
+        """
+        self._expire(time.time())
+        total_entries = len(self._entries)
+        return {
+            "name": self.name,
+            "total_entries": total_entries,
+            "active_entries": total_entries,
+            "expired_entries": 0,
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "max_entries": self._max_entries,
+            "utilization_percent": (self._bytes / self._max_bytes) * 100,
+            "metrics": {
+                "hits": self._metrics.hits,
+                "misses": self._metrics.misses,
+                "hit_rate": self._metrics.hit_rate,
+                "evictions": self._metrics.evictions,
+                "expirations": self._metrics.expirations,
+                "writes": self._metrics.writes,
+                "rejected": self._rejected,
+            },
+        }
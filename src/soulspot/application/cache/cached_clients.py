@@ -0,0 +1,392 @@
+"""Read-through caching wrappers for external metadata clients."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from soulspot.application.cache.lastfm_cache import LastfmCache
+from soulspot.application.cache.musicbrainz_cache import MusicBrainzCache
+from soulspot.application.cache.spotify_cache import SpotifyCache
+from soulspot.domain.ports import ILastfmClient, IMusicBrainzClient, ISpotifyClient
+
+# Hey future me, these are DECORATOR wrappers like the circuit breaker ones in
+# infrastructure/integrations/circuit_breaker_wrapper.py - same port in, same port out, so any
+# service taking ISpotifyClient/IMusicBrainzClient/ILastfmClient gets caching for free.
+# The wrappers are cheap and created per request/job; the CACHES are the long-lived part
+# (one per process, on app.state / worker state) so enrichment, completeness checks, watchlist
+# runs and API requests all reuse each other's responses.
+# What is NOT cached:
+# - OAuth calls and anything user-specific (playlists, followed artists, saved tracks) - those
+#   must always be fresh and differ per user.
+# - None / empty "not found" answers, EXCEPT for endpoints in the cache's NEGATIVE_ENDPOINTS
+#   (MusicBrainz recording/release/artist/cover art): those misses are stored as NOT_FOUND for
+#   NEGATIVE_TTL, short enough that an entry added upstream shows up soon.
+# - Exceptions - an error is never cached, the next call simply tries again.
+# Concurrent misses for the same request are coalesced (ResponseCache.get_or_fetch) - they share
+# one in-flight call and its result OR error. Batch calls (get_albums, get_several_artists) are
+# coalesced per ID, so two playlist imports sharing artists don't fetch them twice.
+# Invalidation hooks live on the caches (SpotifyCache.invalidate_album() etc.), reachable via
+# `.cache` on the wrapper or directly from app.state.
+# GOTCHA: a hit returns the SAME dict that is stored in the cache - treat responses as read-only!
+
+
+class CachedSpotifyClient(ISpotifyClient):
+    """Spotify client with read-through caching of catalog endpoints."""
+
+    def __init__(self, client: ISpotifyClient, cache: SpotifyCache) -> None:
+        """Initialize caching wrapper for Spotify client.
+
+        Args:
+            client: Underlying Spotify client implementation
+            cache: Shared Spotify response cache
+        """
+        self._client = client
+        self.cache = cache
+
+    # Listen up - Spotify catalog responses don't depend on WHICH user's token fetched them, so
+    # the access_token is deliberately not part of any key. Only search results can be
+    # market-specific (token's country), which is fine for a single-user app.
+    async def _read_through(
+        self,
+        endpoint: str,
+        key: str,
+        fetch: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Return the cached response or fetch it (once for concurrent callers)."""
+        return await self.cache.get_or_fetch(
+            endpoint, key, lambda: fetch(*args, **kwargs)
+        )
+
+    # Yo, everything the port doesn't define (get_saved_tracks, generate_code_verifier, settings,
+    # ...) goes straight to the real client, so the wrapper is a drop-in for SpotifyClient.
+    def __getattr__(self, name: str) -> Any:
+        if name == "_client":  # not set yet (copy/pickle) - don't recurse
+            raise AttributeError(name)
+        return getattr(self._client, name)
+
+    async def get_authorization_url(self, state: str, code_verifier: str) -> str:
+        """Generate Spotify OAuth authorization URL."""
+        return await self._client.get_authorization_url(state, code_verifier)
+
+    async def exchange_code(self, code: str, code_verifier: str) -> dict[str, Any]:
+        """Exchange authorization code for access token."""
+        return await self._client.exchange_code(code, code_verifier)
+
+    async def refresh_token(self, refresh_token: str) -> dict[str, Any]:
+        """Refresh access token."""
+        return await self._client.refresh_token(refresh_token)
+
+    async def get_playlist(self, playlist_id: str, access_token: str) -> dict[str, Any]:
+        """Get playlist details (not cached - playlist sync needs the live state)."""
+        return await self._client.get_playlist(playlist_id, access_token)
+
+    async def get_user_playlists(
+        self, access_token: str, limit: int = 50, offset: int = 0
+    ) -> dict[str, Any]:
+        """Get current user's playlists (not cached - user-specific)."""
+        return await self._client.get_user_playlists(access_token, limit, offset)
+
+    async def get_followed_artists(
+        self, access_token: str, limit: int = 50, after: str | None = None
+    ) -> dict[str, Any]:
+        """Get current user's followed artists (not cached - user-specific)."""
+        return await self._client.get_followed_artists(access_token, limit, after)
+
+    async def get_saved_tracks(
+        self, access_token: str, limit: int = 50, offset: int = 0
+    ) -> dict[str, Any]:
+        """Get current user's Liked Songs (not cached - user-specific)."""
+        return await self._client.get_saved_tracks(access_token, limit, offset)
+
+    async def get_saved_albums(
+        self, access_token: str, limit: int = 50, offset: int = 0
+    ) -> dict[str, Any]:
+        """Get current user's saved albums (not cached - user-specific)."""
+        return await self._client.get_saved_albums(access_token, limit, offset)
+
+    async def get_track(self, track_id: str, access_token: str) -> dict[str, Any]:
+        """Get track details."""
+        result: dict[str, Any] = await self._read_through(
+            "track", track_id, self._client.get_track, track_id, access_token
+        )
+        return result
+
+    async def search_track(
+        self, query: str, access_token: str, limit: int = 20
+    ) -> dict[str, Any]:
+        """Search for tracks."""
+        result: dict[str, Any] = await self._read_through(
+            "search",
+            f"{query}:{limit}",
+            self._client.search_track,
+            query,
+            access_token,
+            limit=limit,
+        )
+        return result
+
+    async def get_album(self, album_id: str, access_token: str) -> dict[str, Any]:
+        """Get single album by ID."""
+        result: dict[str, Any] = await self._read_through(
+            "album", album_id, self._client.get_album, album_id, access_token
+        )
+        return result
+
+    # Hey future me - batch endpoints are cached PER ITEM, not per batch: a batch of 20 where 15
+    # are cached only asks Spotify for the other 5, and the single get_album() shares the entries.
+    # Order of the returned list follows album_ids (missing/unknown IDs are skipped, as before).
+    async def get_albums(
+        self, album_ids: list[str], access_token: str
+    ) -> list[dict[str, Any]]:
+        """Batch fetch up to 20 albums by IDs."""
+
+        async def fetch(ids: list[str]) -> dict[str, Any]:
+            albums = await self._client.get_albums(ids, access_token)
+            return {album["id"]: album for album in albums}
+
+        found = await self.cache.get_or_fetch_many("album", album_ids, fetch)
+        return [found[album_id] for album_id in album_ids if album_id in found]
+
+    async def get_album_tracks(
+        self, album_id: str, access_token: str, limit: int = 50, offset: int = 0
+    ) -> dict[str, Any]:
+        """Get album tracks with pagination."""
+        result: dict[str, Any] = await self._read_through(
+            "album_tracks",
+            f"{album_id}:{limit}:{offset}",
+            self._client.get_album_tracks,
+            album_id,
+            access_token,
+            limit=limit,
+            offset=offset,
+        )
+        return result
+
+    async def get_artist(self, artist_id: str, access_token: str) -> dict[str, Any]:
+        """Get detailed artist information including popularity and followers."""
+        result: dict[str, Any] = await self._read_through(
+            "artist", artist_id, self._client.get_artist, artist_id, access_token
+        )
+        return result
+
+    async def get_several_artists(
+        self, artist_ids: list[str], access_token: str
+    ) -> list[dict[str, Any]]:
+        """Get details for multiple artists in a single request (up to 50)."""
+
+        async def fetch(ids: list[str]) -> dict[str, Any]:
+            artists = await self._client.get_several_artists(ids, access_token)
+            return {artist["id"]: artist for artist in artists}
+
+        found = await self.cache.get_or_fetch_many("artist", artist_ids, fetch)
+        return [found[artist_id] for artist_id in artist_ids if artist_id in found]
+
+    async def get_artist_albums(
+        self, artist_id: str, access_token: str, limit: int = 50
+    ) -> list[dict[str, Any]]:
+        """Get albums for an artist."""
+        result: list[dict[str, Any]] = await self._read_through(
+            "artist_albums",
+            f"{artist_id}:{limit}",
+            self._client.get_artist_albums,
+            artist_id,
+            access_token,
+            limit=limit,
+        )
+        return result
+
+    async def get_artist_top_tracks(
+        self, artist_id: str, access_token: str, market: str = "US"
+    ) -> list[dict[str, Any]]:
+        """Get artist's top 10 tracks by popularity."""
+        result: list[dict[str, Any]] = await self._read_through(
+            "artist_top_tracks",
+            f"{artist_id}:{market}",
+            self._client.get_artist_top_tracks,
+            artist_id,
+            access_token,
+            market=market,
+        )
+        return result
+
+    async def get_related_artists(
+        self, artist_id: str, access_token: str
+    ) -> list[dict[str, Any]]:
+        """Get up to 20 artists similar to the given artist."""
+        result: list[dict[str, Any]] = await self._read_through(
+            "related_artists",
+            artist_id,
+            self._client.get_related_artists,
+            artist_id,
+            access_token,
+        )
+        return result
+
+    async def search_artist(
+        self, query: str, access_token: str, limit: int = 20
+    ) -> dict[str, Any]:
+        """Search for artists on Spotify."""
+        result: dict[str, Any] = await self._read_through(
+            "search_artist",
+            f"{query}:{limit}",
+            self._client.search_artist,
+            query,
+            access_token,
+            limit=limit,
+        )
+        return result
+
+    async def close(self) -> None:
+        """Close the underlying client."""
+        if hasattr(self._client, "close"):
+            await self._client.close()
+
+    async def __aenter__(self) -> "CachedSpotifyClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+
+class CachedMusicBrainzClient(IMusicBrainzClient):
+    """MusicBrainz client with read-through caching."""
+
+    # Hey future me - this is where caching pays off MOST: MusicBrainz allows 1 req/s, so every
+    # cache hit is a full second the enrichment run doesn't wait.
+    def __init__(self, client: IMusicBrainzClient, cache: MusicBrainzCache) -> None:
+        """Initialize caching wrapper for MusicBrainz client.
+
+        Args:
+            client: Underlying MusicBrainz client implementation
+            cache: Shared MusicBrainz response cache
+        """
+        self._client = client
+        self.cache = cache
+
+    async def lookup_recording_by_isrc(self, isrc: str) -> dict[str, Any] | None:
+        """Lookup a recording by ISRC code."""
+        recording: dict[str, Any] | None = await self.cache.get_or_fetch(
+            "recording",
+            f"isrc:{isrc}",
+            lambda: self._client.lookup_recording_by_isrc(isrc),
+        )
+        return recording
+
+    async def search_recording(
+        self, artist: str, title: str, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """Search for recordings by artist and title."""
+        results: list[dict[str, Any]] = await self.cache.get_or_fetch(
+            "search_recording",
+            f"{artist}:{title}:{limit}",
+            lambda: self._client.search_recording(artist, title, limit),
+        )
+        return list(results)
+
+    async def lookup_release(self, release_id: str) -> dict[str, Any] | None:
+        """Lookup a release (album) by MusicBrainz ID."""
+        release: dict[str, Any] | None = await self.cache.get_or_fetch(
+            "release", release_id, lambda: self._client.lookup_release(release_id)
+        )
+        return release
+
+    async def lookup_artist(self, artist_id: str) -> dict[str, Any] | None:
+        """Lookup an artist by MusicBrainz ID."""
+        artist: dict[str, Any] | None = await self.cache.get_or_fetch(
+            "artist", artist_id, lambda: self._client.lookup_artist(artist_id)
+        )
+        return artist
+
+    async def close(self) -> None:
+        """Close the underlying client."""
+        if hasattr(self._client, "close"):
+            await self._client.close()
+
+    async def __aenter__(self) -> "CachedMusicBrainzClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+
+class CachedLastfmClient(ILastfmClient):
+    """Last.fm client with read-through caching."""
+
+    def __init__(self, client: ILastfmClient, cache: LastfmCache) -> None:
+        """Initialize caching wrapper for Last.fm client.
+
+        Args:
+            client: Underlying Last.fm client implementation
+            cache: Shared Last.fm response cache
+        """
+        self._client = client
+        self.cache = cache
+
+    async def _read_through(
+        self,
+        endpoint: str,
+        key: str,
+        fetch: Callable[..., Awaitable[dict[str, Any] | None]],
+        *args: Any,
+    ) -> dict[str, Any] | None:
+        """Return the cached response or fetch it (once for concurrent callers)."""
+        result: dict[str, Any] | None = await self.cache.get_or_fetch(
+            endpoint, key, lambda: fetch(*args)
+        )
+        return result
+
+    async def get_track_info(
+        self, artist: str, track: str, mbid: str | None = None
+    ) -> dict[str, Any] | None:
+        """Get track information including tags."""
+        return await self._read_through(
+            "track_info",
+            f"{artist}:{track}:{mbid or ''}",
+            self._client.get_track_info,
+            artist,
+            track,
+            mbid,
+        )
+
+    async def get_artist_info(
+        self, artist: str, mbid: str | None = None
+    ) -> dict[str, Any] | None:
+        """Get artist information including tags."""
+        return await self._read_through(
+            "artist_info",
+            f"{artist}:{mbid or ''}",
+            self._client.get_artist_info,
+            artist,
+            mbid,
+        )
+
+    async def get_album_info(
+        self, artist: str, album: str, mbid: str | None = None
+    ) -> dict[str, Any] | None:
+        """Get album information including tags."""
+        return await self._read_through(
+            "album_info",
+            f"{artist}:{album}:{mbid or ''}",
+            self._client.get_album_info,
+            artist,
+            album,
+            mbid,
+        )
+
+    async def close(self) -> None:
+        """Close the underlying client."""
+        if hasattr(self._client, "close"):
+            await self._client.close()
+
+    async def __aenter__(self) -> "CachedLastfmClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
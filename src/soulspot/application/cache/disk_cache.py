@@ -0,0 +1,350 @@
+"""Persistent SQLite-backed cache tier shared across restarts and processes."""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from soulspot.application.cache.bounded_cache import MB
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at ON cache_entries (expires_at);
+CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at ON cache_entries (accessed_at);
+"""
+
+
+# Hey future me - this is the SECOND tier behind the in-memory ResponseCaches. Memory is gone on
+# every restart, and re-fetching a whole library's albums from Spotify (or ISRCs from MusicBrainz
+# at 1 req/s!) after each deploy is exactly the traffic we cache to avoid. So every cached response
+# is also written here, and memory misses fall back to this file before hitting the API.
+# Why stdlib sqlite3 and not aiosqlite/SQLAlchemy? It's ONE file with ONE table, no ORM needed, and
+# asyncio.to_thread keeps the event loop free the same way the image service does file I/O.
+# One connection guarded by a threading.Lock - to_thread may run us on any pool thread.
+# Sharing between processes (web + `python -m soulspot.worker`) works through SQLite itself:
+# WAL mode lets readers run while one process writes, and the busy timeout makes a writer wait
+# for the other process's write instead of failing with "database is locked".
+# Errors are NEVER raised to callers - a broken cache file means a miss, not a failed request.
+class DiskCache:
+    """SQLite file cache for JSON-serializable values, partitioned by namespace.
+
+    Features:
+    - Compact payloads (compact JSON, zlib-compressed)
+    - Lazy TTL expiry on read, plus periodic purge of expired rows
+    - Size cap on the compressed payloads with least-recently-accessed eviction
+    - warm() to preload the most recently used entries into memory on startup
+    - Safe to share between processes on the same host (WAL + busy timeout)
+    """
+
+    # Writes between two maintenance passes (expired purge + size cap). Checking the cap on every
+    # write would mean a SUM() over the table per cached response.
+    MAINTENANCE_INTERVAL = 100
+    # accessed_at is only rewritten when older than this - LRU order doesn't need to be exact,
+    # and it saves a write per hit for hot entries
+    TOUCH_INTERVAL = 60.0
+
+    def __init__(self, path: Path, max_bytes: int = 256 * MB) -> None:
+        """Initialize disk cache (the file is opened on first use).
+
+        Args:
+            path: SQLite file path (parent directories are created)
+            max_bytes: Cap for the stored (compressed) payloads in bytes
+
+        Raises:
+            ValueError: If max_bytes is < 1
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.path = path
+        self._max_bytes = max_bytes
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._writes_since_maintenance = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection and create the schema (caller holds the lock)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=5.0, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            # A cache can lose its last writes on power loss - NORMAL skips the fsync per commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, fn: Callable[[sqlite3.Connection], T], default: T) -> T:
+        """Run fn with the connection in a worker thread, returning default on errors."""
+
+        def call() -> T:
+            with self._lock:
+                return fn(self._connect())
+
+        try:
+            return await asyncio.to_thread(call)
+        except (sqlite3.Error, OSError, zlib.error, ValueError) as e:
+            self.errors += 1
+            logger.warning(f"Disk cache {self.path} unavailable: {e}")
+            return default
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Serialize a value to compressed compact JSON."""
+        return zlib.compress(
+            json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+        )
+
+    @staticmethod
+    def _decode(payload: bytes) -> Any:
+        """Deserialize a payload written by _encode()."""
+        return json.loads(zlib.decompress(payload))
+
+    async def get(self, namespace: str, key: str) -> tuple[Any, float] | None:
+        """Get a value and its expiry time.
+
+        Args:
+            namespace: Cache namespace (e.g. "spotify")
+            key: Cache key within the namespace
+
+        Returns:
+            Tuple of (value, expires_at timestamp), or None if missing or expired
+        """
+
+        def get(conn: sqlite3.Connection) -> tuple[Any, float] | None:
+            now = time.time()
+            row = conn.execute(
+                "SELECT value, expires_at, accessed_at FROM cache_entries "
+                "WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            payload, expires_at, accessed_at = row
+            if expires_at <= now:
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                )
+                self.expirations += 1
+                self.misses += 1
+                return None
+            if now - accessed_at > self.TOUCH_INTERVAL:
+                conn.execute(
+                    "UPDATE cache_entries SET accessed_at = ? "
+                    "WHERE namespace = ? AND key = ?",
+                    (now, namespace, key),
+                )
+            self.hits += 1
+            return self._decode(payload), expires_at
+
+        return await self._run(get, None)
+
+    # Yo, values must be JSON-serializable (API responses are). Anything else is skipped with a
+    # debug log - the memory tier still holds it, it just won't survive a restart.
+    async def set(self, namespace: str, key: str, value: Any, ttl_seconds: int) -> None:
+        """Store a value, running maintenance every MAINTENANCE_INTERVAL writes.
+
+        Args:
+            namespace: Cache namespace (e.g. "spotify")
+            key: Cache key within the namespace
+            value: JSON-serializable value
+            ttl_seconds: Time to live in seconds
+        """
+
+        def put(conn: sqlite3.Connection) -> None:
+            try:
+                payload = self._encode(value)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Not caching {namespace}:{key} on disk: {e}")
+                return
+            if len(payload) > self._max_bytes:
+                return
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, payload, len(payload), now + ttl_seconds, now),
+            )
+            self.writes += 1
+            self._writes_since_maintenance += 1
+            if self._writes_since_maintenance >= self.MAINTENANCE_INTERVAL:
+                self._maintain(conn, now)
+
+        await self._run(put, None)
+
+    # Listen up - eviction keeps the most recently accessed rows whose running size total fits
+    # the cap and deletes the rest in ONE statement (window function, SQLite >= 3.25). Other
+    # processes' rows count against the same cap, since they share the file.
+    def _maintain(self, conn: sqlite3.Connection, now: float) -> int:
+        """Purge expired rows and evict the least recently accessed over the cap."""
+        self._writes_since_maintenance = 0
+        expired = conn.execute(
+            "DELETE FROM cache_entries WHERE expires_at <= ?", (now,)
+        ).rowcount
+        evicted = conn.execute(
+            "DELETE FROM cache_entries WHERE (namespace, key) IN ("
+            " SELECT namespace, key FROM ("
+            "  SELECT namespace, key,"
+            "   SUM(size) OVER (ORDER BY accessed_at DESC, key) AS running"
+            "  FROM cache_entries)"
+            " WHERE running > ?)",
+            (self._max_bytes,),
+        ).rowcount
+        self.expirations += expired
+        self.evictions += evicted
+        if evicted:
+            logger.debug(f"Disk cache over {self._max_bytes} bytes, evicted {evicted}")
+        return expired
+
+    async def delete(self, namespace: str, key: str) -> bool:
+        """Delete a value.
+
+        Args:
+            namespace: Cache namespace
+            key: Cache key within the namespace
+
+        Returns:
+            True if deleted, False if not found
+        """
+        return await self._run(
+            lambda conn: (
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).rowcount
+                > 0
+            ),
+            False,
+        )
+
+    async def delete_prefix(self, namespace: str, prefix: str) -> int:
+        """Delete all values whose key starts with a prefix.
+
+        Args:
+            namespace: Cache namespace
+            prefix: Key prefix ("" = whole namespace)
+
+        Returns:
+            Number of values deleted
+        """
+        return await self._run(
+            lambda conn: (
+                conn.execute(
+                    "DELETE FROM cache_entries "
+                    "WHERE namespace = ? AND substr(key, 1, ?) = ?",
+                    (namespace, len(prefix), prefix),
+                ).rowcount
+            ),
+            0,
+        )
+
+    async def clear(self, namespace: str | None = None) -> None:
+        """Delete all values of a namespace (None = everything).
+
+        Args:
+            namespace: Cache namespace to clear
+        """
+        if namespace is None:
+            await self._run(
+                lambda conn: conn.execute("DELETE FROM cache_entries"), None
+            )
+        else:
+            await self._run(
+                lambda conn: conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ?", (namespace,)
+                ),
+                None,
+            )
+
+    async def cleanup_expired(self) -> int:
+        """Purge expired values and enforce the size cap.
+
+        Returns:
+            Number of expired values removed
+        """
+        return await self._run(lambda conn: self._maintain(conn, time.time()), 0)
+
+    # Hey future me - warm() is for STARTUP: the newest entries come back oldest-first, so when
+    # the caller inserts them into an LRU cache in order, the most recently used end up hottest.
+    async def warm(self, namespace: str, limit: int) -> list[tuple[str, Any, float]]:
+        """Load the most recently accessed unexpired values of a namespace.
+
+        Args:
+            namespace: Cache namespace
+            limit: Maximum number of values to load
+
+        Returns:
+            List of (key, value, expires_at), least recently accessed first
+        """
+
+        def load(conn: sqlite3.Connection) -> list[tuple[str, Any, float]]:
+            rows = conn.execute(
+                "SELECT key, value, expires_at FROM cache_entries "
+                "WHERE namespace = ? AND expires_at > ? "
+                "ORDER BY accessed_at DESC LIMIT ?",
+                (namespace, time.time(), limit),
+            ).fetchall()
+            return [
+                (key, self._decode(payload), expires_at)
+                for key, payload, expires_at in reversed(rows)
+            ]
+
+        return await self._run(load, [])
+
+    async def close(self) -> None:
+        """Close the connection (reopened automatically on next use)."""
+
+        def close() -> None:
+            with self._lock:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+        await asyncio.to_thread(close)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get this process's disk cache statistics.
+
+        Returns:
+            Dictionary with path, size cap and hit/miss/write/eviction counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) * 100 if lookups else 0.0,
+            "writes": self.writes,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
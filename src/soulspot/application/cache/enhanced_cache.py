@@ -25,6 +25,7 @@ class CacheMetrics:
     misses: int = 0
     evictions: int = 0
     writes: int = 0
+    expirations: int = 0
 
     # Hey future me, this calculates hit rate as a percentage (0-100). Division by zero guard is
     # CRITICAL - if cache is brand new (no hits or misses), total is 0 and we return 0.0 instead
@@ -47,6 +48,7 @@ class CacheMetrics:
         self.misses = 0
         self.evictions = 0
         self.writes = 0
+        self.expirations = 0
 
 
 @dataclass
@@ -0,0 +1,56 @@
+"""Last.fm response cache."""
+
+from soulspot.application.cache.bounded_cache import MB
+from soulspot.application.cache.disk_cache import DiskCache
+from soulspot.application.cache.response_cache import ResponseCache
+
+
+class LastfmCache(ResponseCache):
+    """Cache for Last.fm API responses.
+
+    This cache stores:
+    - Track info (tags, play counts)
+    - Artist info
+    - Album info
+
+    Cache keys are "<artist>:<name>:<mbid>" so a lookup with and without
+    MusicBrainz ID are cached separately (they can match different items).
+    """
+
+    # Hey future me - Last.fm data is crowd-sourced TAGS and listener counts. Tags settle after
+    # release and counts only matter roughly for us, so a day is plenty fresh. Artist info changes
+    # least (bio, top tags) - a week is fine.
+    TRACK_TTL = 86400  # 24 hours
+    ALBUM_TTL = 86400  # 24 hours
+    ARTIST_TTL = 604800  # 7 days
+
+    ENDPOINTS = {
+        "track_info": "TRACK_TTL",
+        "album_info": "ALBUM_TTL",
+        "artist_info": "ARTIST_TTL",
+    }
+
+    def __init__(self, max_bytes: int = 8 * MB, disk: DiskCache | None = None) -> None:
+        """Initialize Last.fm cache.
+
+        Args:
+            max_bytes: Memory budget in bytes (approximate)
+            disk: Optional persistent second tier
+        """
+        super().__init__(max_bytes=max_bytes, name="lastfm", disk=disk)
+
+    # Yo, artist names are the only stable handle Last.fm gives us, so invalidating an artist drops
+    # its artist info AND every track/album lookup under that name (all mbid variants).
+    async def invalidate_artist(self, artist: str) -> int:
+        """Invalidate all cached responses for an artist name.
+
+        Args:
+            artist: Artist name as passed to the client
+
+        Returns:
+            Number of entries invalidated
+        """
+        removed = 0
+        for endpoint in self.ENDPOINTS:
+            removed += await self.invalidate_endpoint(endpoint, f"{artist}:")
+        return removed
@@ -0,0 +1,46 @@
+"""Lyrics lookup cache."""
+
+from soulspot.application.cache.bounded_cache import MB
+from soulspot.application.cache.disk_cache import DiskCache
+from soulspot.application.cache.response_cache import ResponseCache
+
+
+class LyricsCache(ResponseCache):
+    """Cache for lyrics found by LyricsService.
+
+    This cache stores:
+    - Lyrics text with its synced flag, per track
+
+    Cache keys are "<artist>:<title>:<album>:<duration_s>" (lowercased),
+    the same inputs the LRClib lookup matches on.
+    """
+
+    # Hey future me - lyrics of a released song don't change. The long TTL only exists so a wrong
+    # match (radio edit lyrics for the album version) eventually gets a second chance. Re-imports of
+    # the same files are the main customer here, so this cache is worth most WITH the disk tier.
+    LYRICS_TTL = 2592000  # 30 days
+
+    ENDPOINTS = {
+        "lyrics": "LYRICS_TTL",
+    }
+
+    # LyricsService only hands back None when every source answered "nothing" - a source error
+    # makes it return an empty result instead, which is never cached
+    NEGATIVE_ENDPOINTS = frozenset({"lyrics"})
+
+    def __init__(
+        self,
+        max_bytes: int = 4 * MB,
+        disk: DiskCache | None = None,
+        negative_ttl: int | None = None,
+    ) -> None:
+        """Initialize lyrics cache.
+
+        Args:
+            max_bytes: Memory budget in bytes (approximate)
+            disk: Optional persistent second tier
+            negative_ttl: TTL in seconds for "not found" results (None = NEGATIVE_TTL)
+        """
+        super().__init__(
+            max_bytes=max_bytes, name="lyrics", disk=disk, negative_ttl=negative_ttl
+        )
@@ -2,10 +2,12 @@
 
 from typing import Any
 
-from soulspot.application.cache.base_cache import InMemoryCache
+from soulspot.application.cache.bounded_cache import MB
+from soulspot.application.cache.disk_cache import DiskCache
+from soulspot.application.cache.response_cache import ResponseCache
 
 
-class MusicBrainzCache:
+class MusicBrainzCache(ResponseCache):
     """Cache for MusicBrainz API responses.
 
     This cache stores:
@@ -28,9 +30,43 @@ class MusicBrainzCache:
     ARTIST_TTL = 604800  # 7 days
     SEARCH_TTL = 3600  # 1 hour (searches may change)
 
-    def __init__(self) -> None:
-        """Initialize MusicBrainz cache."""
-        self._cache: InMemoryCache[str, Any] = InMemoryCache()
+    # "recording" keys are "isrc:<isrc>", "search" keys "<artist>:<title>" (the typed helpers below),
+    # "search_recording" keys "<artist>:<title>:<limit>" (read-through client - limit changes results)
+    ENDPOINTS = {
+        "recording": "RECORDING_TTL",
+        "search": "SEARCH_TTL",
+        "search_recording": "SEARCH_TTL",
+        "release": "RELEASE_TTL",
+        "artist": "ARTIST_TTL",
+        "cover_art": "RELEASE_TTL",
+    }
+
+    # Yo, obscure Soulseek rips mostly have NO MusicBrainz recording and NO Cover Art Archive
+    # front (keyed by release MBID, so it lives here - only its "not found" is ever cached, the
+    # images go to the artwork dir). The lookup clients raise on errors, so None is a real miss.
+    NEGATIVE_ENDPOINTS = frozenset({"recording", "release", "artist", "cover_art"})
+
+    # Hey future me - bounded by BYTES (CACHE__MUSICBRAINZ_MAX_MB); search results with many
+    # recordings are much bigger than a single ISRC lookup, an entry count can't capture that.
+    def __init__(
+        self,
+        max_bytes: int = 16 * MB,
+        disk: DiskCache | None = None,
+        negative_ttl: int | None = None,
+    ) -> None:
+        """Initialize MusicBrainz cache.
+
+        Args:
+            max_bytes: Memory budget in bytes (approximate)
+            disk: Optional persistent second tier
+            negative_ttl: TTL in seconds for "not found" results (None = NEGATIVE_TTL)
+        """
+        super().__init__(
+            max_bytes=max_bytes,
+            name="musicbrainz",
+            disk=disk,
+            negative_ttl=negative_ttl,
+        )
 
     # Hey future me: These key builders use prefixes to avoid collisions
     # "recording:isrc:USRC17607839" vs "search:Beatles:Yesterday" can't clash because different prefixes
@@ -64,8 +100,7 @@ class MusicBrainzCache:
         Returns:
             Cached recording data or None
         """
-        key = self._make_recording_key(isrc)
-        return await self._cache.get(key)
+        return await self.get_response("recording", f"isrc:{isrc}")
 
     async def cache_recording_by_isrc(
         self, isrc: str, recording: dict[str, Any]
@@ -76,8 +111,7 @@ class MusicBrainzCache:
             isrc: ISRC code
             recording: Recording data from MusicBrainz
         """
-        key = self._make_recording_key(isrc)
-        await self._cache.set(key, recording, self.RECORDING_TTL)
+        await self.cache_response("recording", f"isrc:{isrc}", recording)
 
     # Yo, search results are SHORT-lived (1h TTL) because MB database grows constantly
     # New albums released → new recordings added → yesterday's search is incomplete today
@@ -95,8 +129,7 @@ class MusicBrainzCache:
         Returns:
             Cached search results or None
         """
-        key = self._make_search_key(artist, title)
-        return await self._cache.get(key)
+        return await self.get_response("search", f"{artist}:{title}")
 
     async def cache_search_results(
         self,
@@ -111,8 +144,7 @@ class MusicBrainzCache:
             title: Track title
             results: Search results from MusicBrainz
         """
-        key = self._make_search_key(artist, title)
-        await self._cache.set(key, results, self.SEARCH_TTL)
+        await self.cache_response("search", f"{artist}:{title}", results)
 
     async def get_release(self, mbid: str) -> dict[str, Any] | None:
         """Get cached release.
@@ -123,8 +155,7 @@ class MusicBrainzCache:
         Returns:
             Cached release data or None
         """
-        key = self._make_release_key(mbid)
-        return await self._cache.get(key)
+        return await self.get_response("release", mbid)
 
     async def cache_release(self, mbid: str, release: dict[str, Any]) -> None:
         """Cache release lookup.
@@ -133,8 +164,7 @@ class MusicBrainzCache:
             mbid: MusicBrainz release ID
             release: Release data from MusicBrainz
         """
-        key = self._make_release_key(mbid)
-        await self._cache.set(key, release, self.RELEASE_TTL)
+        await self.cache_response("release", mbid, release)
 
     async def get_artist(self, mbid: str) -> dict[str, Any] | None:
         """Get cached artist.
@@ -145,8 +175,7 @@ class MusicBrainzCache:
         Returns:
             Cached artist data or None
         """
-        key = self._make_artist_key(mbid)
-        return await self._cache.get(key)
+        return await self.get_response("artist", mbid)
 
     async def cache_artist(self, mbid: str, artist: dict[str, Any]) -> None:
         """Cache artist lookup.
@@ -155,8 +184,7 @@ class MusicBrainzCache:
             mbid: MusicBrainz artist ID
             artist: Artist data from MusicBrainz
         """
-        key = self._make_artist_key(mbid)
-        await self._cache.set(key, artist, self.ARTIST_TTL)
+        await self.cache_response("artist", mbid, artist)
 
     # Listen up future me: Manual invalidation is for when you KNOW cached data is wrong
     # Example: MB editor fixes typo in track title, your cache has old version
@@ -171,8 +199,7 @@ class MusicBrainzCache:
         Returns:
             True if invalidated, False if not found
         """
-        key = self._make_recording_key(isrc)
-        return await self._cache.delete(key)
+        return await self.invalidate_response("recording", f"isrc:{isrc}")
 
     async def invalidate_search(self, artist: str, title: str) -> bool:
         """Invalidate cached search results.
@@ -184,21 +211,26 @@ class MusicBrainzCache:
         Returns:
             True if invalidated, False if not found
         """
-        key = self._make_search_key(artist, title)
-        return await self._cache.delete(key)
+        return await self.invalidate_response("search", f"{artist}:{title}")
 
-    async def clear(self) -> None:
-        """Clear all cached data."""
-        await self._cache.clear()
+    async def invalidate_release(self, mbid: str) -> bool:
+        """Invalidate cached release.
 
-    async def cleanup_expired(self) -> int:
-        """Remove expired entries.
+        Args:
+            mbid: MusicBrainz release ID
 
         Returns:
-            Number of entries removed
+            True if invalidated, False if not found
         """
-        return await self._cache.cleanup_expired()
+        return await self.invalidate_response("release", mbid)
 
-    def get_stats(self) -> dict[str, Any]:
-        """Get cache statistics."""
-        return self._cache.get_stats()
+    async def invalidate_artist(self, mbid: str) -> bool:
+        """Invalidate cached artist.
+
+        Args:
+            mbid: MusicBrainz artist ID
+
+        Returns:
+            True if invalidated, False if not found
+        """
+        return await self.invalidate_response("artist", mbid)
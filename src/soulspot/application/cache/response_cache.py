@@ -0,0 +1,437 @@
+"""Shared base for API response caches with per-endpoint TTLs."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any, ClassVar
+
+from soulspot.application.cache.bounded_cache import BoundedCache
+from soulspot.application.cache.disk_cache import DiskCache
+from soulspot.application.cache.enhanced_cache import CacheMetrics
+from soulspot.application.cache.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Marker stored instead of a response for "the provider has nothing for this request". A plain
+# string so it survives the JSON round trip through the disk tier; never returned to callers.
+NOT_FOUND = "__soulspot_not_found__"
+
+
+class ResponseCache:
+    """Byte-bounded cache for external API responses, keyed by endpoint.
+
+    Subclasses declare ENDPOINTS ({endpoint: name of its TTL attribute});
+    entries are stored under "<endpoint>:<key>" so one namespace holds every
+    endpoint of an API. Hits and misses are counted per endpoint, and
+    concurrent misses for the same request share one fetch (single-flight).
+    With a DiskCache, responses are also written to disk and memory misses
+    fall back to it, so cached responses survive restarts.
+    For endpoints in NEGATIVE_ENDPOINTS, "not found" results are remembered
+    too (for NEGATIVE_TTL), so misses don't hit the provider again.
+    For endpoints in STALE_ENDPOINTS, get_or_fetch() keeps serving a response
+    for STALE_TTL past its TTL while one background refresh replaces it.
+    """
+
+    # Endpoint -> TTL attribute NAME (not the value), resolved on every write so overriding
+    # e.g. cache.TRACK_TTL on an instance (tests, tuning) applies to the typed helpers AND
+    # the read-through clients alike.
+    ENDPOINTS: ClassVar[dict[str, str]] = {}
+
+    # Hey future me - negative caching is OPT-IN per endpoint, and only for endpoints whose
+    # client returns None for a real "not found" and RAISES on failures (MusicBrainz lookups do).
+    # Remembering a timeout as "not found" would hide data for hours. The TTL is deliberately
+    # shorter than the positive ones (capped at the endpoint's TTL): a missing recording or
+    # cover can be added upstream any day, and retrying a few times a day is cheap.
+    NEGATIVE_ENDPOINTS: ClassVar[frozenset[str]] = frozenset()
+    NEGATIVE_TTL = 21600  # 6 hours
+
+    # Listen up - stale-while-revalidate is OPT-IN per endpoint too. The endpoint TTL becomes the
+    # SOFT ttl: entries are stored for TTL + STALE_TTL (the HARD ttl), and a get_or_fetch() hit
+    # between the two returns the old response right away and starts ONE background refresh
+    # (joined via single-flight, so a page hammered by reloads still refreshes once). Past the
+    # hard ttl the entry is gone and the caller blocks on the fetch as usual. Only the
+    # read-through path revalidates - get_response() treats a stale entry as a miss, because its
+    # callers have no way to refresh it. STALE_TTL = 0 switches it off.
+    STALE_ENDPOINTS: ClassVar[frozenset[str]] = frozenset()
+    STALE_TTL = 0
+
+    def __init__(
+        self,
+        max_bytes: int,
+        name: str,
+        disk: DiskCache | None = None,
+        negative_ttl: int | None = None,
+        stale_ttl: int | None = None,
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            max_bytes: Memory budget in bytes (approximate)
+            name: Namespace shown in stats and on disk (e.g. "spotify")
+            disk: Optional persistent second tier
+            negative_ttl: TTL in seconds for "not found" results (None = NEGATIVE_TTL)
+            stale_ttl: Seconds a STALE_ENDPOINTS response is served past its TTL
+                while it is refreshed (None = STALE_TTL)
+        """
+        self.name = name
+        if negative_ttl is not None:
+            self.NEGATIVE_TTL = negative_ttl
+        if stale_ttl is not None:
+            self.STALE_TTL = stale_ttl
+        self._disk = disk
+        self._cache: BoundedCache[str, Any] = BoundedCache(
+            max_bytes=max_bytes, name=name
+        )
+        self._endpoint_metrics: dict[str, CacheMetrics] = {}
+        self._flights = SingleFlight()
+        self._coalesced: dict[str, int] = {}
+        self._disk_hits: dict[str, int] = {}
+        self._negative_hits: dict[str, int] = {}
+        self._negative_writes: dict[str, int] = {}
+        self._stale_hits: dict[str, int] = {}
+        self._refreshes: dict[str, int] = {}
+        self._refresh_tasks: dict[str, asyncio.Future[Any]] = {}
+
+    # Hey future me - the key format is "<endpoint>:<key>" on purpose: SpotifyCache.get_track()
+    # builds "track:<id>" the same way, so the typed helpers and the read-through clients share
+    # the same entries. Keep new typed helpers on that format or they silently stop sharing!
+    def _make_key(self, endpoint: str, key: str) -> str:
+        """Make cache key for an endpoint response."""
+        return f"{endpoint}:{key}"
+
+    async def get_response(self, endpoint: str, key: str) -> Any | None:
+        """Get a cached endpoint response.
+
+        Args:
+            endpoint: Endpoint name (must be in ENDPOINTS)
+            key: Request key within the endpoint (IDs and parameters)
+
+        Returns:
+            Cached response or None (also for a cached "not found" or a stale response)
+        """
+        value = await self._get(endpoint, key)
+        return None if value == NOT_FOUND else value
+
+    async def is_not_found(self, endpoint: str, key: str) -> bool:
+        """Check whether a request is cached as "not found".
+
+        Args:
+            endpoint: Endpoint name (must be in NEGATIVE_ENDPOINTS)
+            key: Request key within the endpoint
+
+        Returns:
+            True if the provider had nothing for it recently
+        """
+        return bool(await self._get(endpoint, key) == NOT_FOUND)
+
+    async def _get(self, endpoint: str, key: str) -> Any | None:
+        """Look up a fresh response, counting a stale one as a miss (may return NOT_FOUND)."""
+        found = await self._lookup(endpoint, key, allow_stale=False)
+        return None if found is None else found[0]
+
+    async def _lookup(
+        self, endpoint: str, key: str, allow_stale: bool
+    ) -> tuple[Any, bool] | None:
+        """Look up memory then disk, counting hits/misses.
+
+        Returns:
+            (value, is_stale) - value may be NOT_FOUND - or None on a miss
+        """
+        cache_key = self._make_key(endpoint, key)
+        stored = await self._cache.get_with_expiry(cache_key)
+        # Memory miss -> try disk and promote the hit back into memory with its REMAINING ttl,
+        # so an entry doesn't live longer just because it took a detour through the file
+        if stored is None and self._disk is not None:
+            stored = await self._disk.get(self.name, cache_key)
+            if stored is not None:
+                await self._cache.set(
+                    cache_key, stored[0], max(1, int(stored[1] - time.time()))
+                )
+                self._disk_hits[endpoint] = self._disk_hits.get(endpoint, 0) + 1
+        metrics = self._endpoint_metrics.setdefault(endpoint, CacheMetrics())
+        if stored is None:
+            metrics.misses += 1
+            return None
+        value, expires_at = stored
+        if value == NOT_FOUND:
+            self._negative_hits[endpoint] = self._negative_hits.get(endpoint, 0) + 1
+            return value, False
+        # The soft expiry is derived from the stored (hard) expiry, so changing STALE_TTL also
+        # moves it for entries written before the change - harmless, they just refresh earlier/later
+        is_stale = (
+            endpoint in self.STALE_ENDPOINTS
+            and time.time() >= expires_at - self.STALE_TTL
+        )
+        if not is_stale:
+            metrics.hits += 1
+        elif allow_stale:
+            self._stale_hits[endpoint] = self._stale_hits.get(endpoint, 0) + 1
+        else:
+            metrics.misses += 1
+            return None
+        return value, is_stale
+
+    async def cache_response(self, endpoint: str, key: str, value: Any) -> None:
+        """Cache an endpoint response with the endpoint's TTL.
+
+        Args:
+            endpoint: Endpoint name (must be in ENDPOINTS)
+            key: Request key within the endpoint (IDs and parameters)
+            value: Response to cache
+        """
+        ttl_seconds: int = getattr(self, self.ENDPOINTS[endpoint])
+        if endpoint in self.STALE_ENDPOINTS:
+            ttl_seconds += self.STALE_TTL
+        cache_key = self._make_key(endpoint, key)
+        await self._cache.set(cache_key, value, ttl_seconds)
+        if self._disk is not None:
+            await self._disk.set(self.name, cache_key, value, ttl_seconds)
+        self._endpoint_metrics.setdefault(endpoint, CacheMetrics()).writes += 1
+
+    async def cache_not_found(self, endpoint: str, key: str) -> None:
+        """Remember that the provider has nothing for a request.
+
+        Args:
+            endpoint: Endpoint name (must be in ENDPOINTS)
+            key: Request key within the endpoint
+        """
+        ttl_seconds = min(self.NEGATIVE_TTL, getattr(self, self.ENDPOINTS[endpoint]))
+        cache_key = self._make_key(endpoint, key)
+        await self._cache.set(cache_key, NOT_FOUND, ttl_seconds)
+        if self._disk is not None:
+            await self._disk.set(self.name, cache_key, NOT_FOUND, ttl_seconds)
+        self._endpoint_metrics.setdefault(endpoint, CacheMetrics())
+        self._negative_writes[endpoint] = self._negative_writes.get(endpoint, 0) + 1
+
+    # Listen up - this is THE read-through path the Cached*Client wrappers use. The flight key is
+    # the cache key, and the cache is per API (spotify/musicbrainz/lastfm), so concurrent callers
+    # are coalesced per (client, endpoint, params). The leader stores the result before the
+    # flight ends, so a caller arriving right after gets a cache hit instead of a new flight.
+    # Empty/None results are shared with the waiters but NOT cached - except None from a
+    # NEGATIVE_ENDPOINTS endpoint, which is cached as NOT_FOUND with the negative TTL.
+    # A stale hit (STALE_ENDPOINTS, past the soft TTL) returns at once and refreshes in the
+    # background; if that refresh fails or comes back empty, the stale entry simply stays.
+    async def get_or_fetch(
+        self, endpoint: str, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Get a cached response, or fetch it once for all concurrent callers.
+
+        Args:
+            endpoint: Endpoint name (must be in ENDPOINTS)
+            key: Request key within the endpoint (IDs and parameters)
+            fetch: Zero-argument coroutine function calling the API
+
+        Returns:
+            Cached (possibly stale) or freshly fetched response
+
+        Raises:
+            Exception: Whatever fetch raised (shared by all coalesced callers)
+        """
+
+        async def load() -> Any:
+            result = await fetch()
+            if result:
+                await self.cache_response(endpoint, key, result)
+            elif result is None and endpoint in self.NEGATIVE_ENDPOINTS:
+                await self.cache_not_found(endpoint, key)
+            return result
+
+        flight_key = self._make_key(endpoint, key)
+        found = await self._lookup(endpoint, key, allow_stale=True)
+        if found is not None:
+            cached, is_stale = found
+            if is_stale:
+                self._revalidate(endpoint, flight_key, load)
+            return None if cached == NOT_FOUND else cached
+
+        if self._flights.in_flight(flight_key):
+            self._coalesced[endpoint] = self._coalesced.get(endpoint, 0) + 1
+        return await self._flights.do(flight_key, load)
+
+    def _revalidate(
+        self, endpoint: str, flight_key: str, load: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Start a background refresh of a stale response unless one is running."""
+        # Checked against our own task map too: the flight only registers once its task
+        # starts, so two stale hits in the same loop tick would otherwise both start one
+        if flight_key in self._refresh_tasks or self._flights.in_flight(flight_key):
+            return
+        # Keep a reference - the event loop only holds weak ones to running tasks
+        task = asyncio.ensure_future(self._flights.do(flight_key, load))
+        self._refresh_tasks[flight_key] = task
+        task.add_done_callback(partial(self._refresh_done, flight_key))
+        self._refreshes[endpoint] = self._refreshes.get(endpoint, 0) + 1
+
+    def _refresh_done(self, flight_key: str, task: asyncio.Future[Any]) -> None:
+        """Forget a finished background refresh and log its failure."""
+        del self._refresh_tasks[flight_key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                f"Background refresh of {self.name} {flight_key} failed "
+                f"(keeping stale entry): {task.exception()}"
+            )
+
+    # Same for batch endpoints: cached keys are served from the cache, keys another caller is
+    # already fetching are joined, and only the rest go out in ONE fetch_many() call. Stale
+    # entries count as missing here - they are re-fetched with the batch instead of one by one.
+    async def get_or_fetch_many(
+        self,
+        endpoint: str,
+        keys: list[str],
+        fetch_many: Callable[[list[str]], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Get cached responses for many keys, fetching the missing ones in one call.
+
+        Args:
+            endpoint: Endpoint name (must be in ENDPOINTS)
+            keys: Request keys within the endpoint (e.g. IDs)
+            fetch_many: Coroutine function fetching a list of keys, returning {key: response}
+
+        Returns:
+            Dict of key -> response for every key found (cached or fetched)
+
+        Raises:
+            Exception: Whatever fetch_many raised (shared by all coalesced callers)
+        """
+        found: dict[str, Any] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            cached = await self._get(endpoint, key)
+            if cached == NOT_FOUND:
+                continue
+            if cached is not None:
+                found[key] = cached
+            else:
+                missing.append(key)
+        if not missing:
+            return found
+
+        prefix = self._make_key(endpoint, "")
+
+        async def load(flight_keys: list[Any]) -> dict[Any, Any]:
+            batch = [flight_key.removeprefix(prefix) for flight_key in flight_keys]
+            results = await fetch_many(batch)
+            for key, result in results.items():
+                if result:
+                    await self.cache_response(endpoint, key, result)
+            return {
+                self._make_key(endpoint, key): value for key, value in results.items()
+            }
+
+        flight_keys: list[Any] = [self._make_key(endpoint, key) for key in missing]
+        joined = sum(
+            1 for flight_key in flight_keys if self._flights.in_flight(flight_key)
+        )
+        if joined:
+            self._coalesced[endpoint] = self._coalesced.get(endpoint, 0) + joined
+        fetched = await self._flights.do_many(flight_keys, load)
+        for key, flight_key in zip(missing, flight_keys, strict=True):
+            if fetched[flight_key] is not None:
+                found[key] = fetched[flight_key]
+        return found
+
+    async def invalidate_response(self, endpoint: str, key: str) -> bool:
+        """Invalidate one cached endpoint response.
+
+        Args:
+            endpoint: Endpoint name
+            key: Request key within the endpoint
+
+        Returns:
+            True if invalidated, False if not found
+        """
+        cache_key = self._make_key(endpoint, key)
+        deleted = await self._cache.delete(cache_key)
+        if self._disk is not None:
+            deleted = await self._disk.delete(self.name, cache_key) or deleted
+        return deleted
+
+    async def invalidate_endpoint(self, endpoint: str, key_prefix: str = "") -> int:
+        """Invalidate all cached responses of an endpoint starting with a key prefix.
+
+        Args:
+            endpoint: Endpoint name
+            key_prefix: Request key prefix (e.g. an ID, "" = whole endpoint)
+
+        Returns:
+            Number of entries invalidated
+        """
+        prefix = self._make_key(endpoint, key_prefix)
+        removed = await self._cache.delete_where(lambda key: key.startswith(prefix))
+        if self._disk is not None:
+            # Most entries live in both tiers - count each one once
+            removed = max(removed, await self._disk.delete_prefix(self.name, prefix))
+        return removed
+
+    async def clear(self) -> None:
+        """Clear all cached data (memory and disk)."""
+        await self._cache.clear()
+        if self._disk is not None:
+            await self._disk.clear(self.name)
+
+    # Hey future me - called once at startup (lifecycle.background_services). Without it the disk
+    # tier still works, but the first lookup of every entry pays a thread hop + SQLite read.
+    # Loading more than fits is harmless: the memory budget evicts LRU, and disk entries come
+    # back least recently used first, so the hottest ones are the ones that stay.
+    async def warm(self, limit: int = 5000) -> int:
+        """Preload the most recently used disk entries into memory.
+
+        Args:
+            limit: Maximum number of entries to load
+
+        Returns:
+            Number of entries loaded
+        """
+        if self._disk is None:
+            return 0
+        entries = await self._disk.warm(self.name, limit)
+        now = time.time()
+        for cache_key, value, expires_at in entries:
+            await self._cache.set(cache_key, value, max(1, int(expires_at - now)))
+        return len(entries)
+
+    async def cleanup_expired(self) -> int:
+        """Remove expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        return await self._cache.cleanup_expired()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics, including per-endpoint and single-flight metrics."""
+        stats = self._cache.get_stats()
+        stats["endpoints"] = {
+            endpoint: {
+                "hits": metrics.hits,
+                "misses": metrics.misses,
+                "hit_rate": metrics.hit_rate,
+                "writes": metrics.writes,
+                "coalesced": self._coalesced.get(endpoint, 0),
+                "disk_hits": self._disk_hits.get(endpoint, 0),
+                "negative_hits": self._negative_hits.get(endpoint, 0),
+                "negative_writes": self._negative_writes.get(endpoint, 0),
+                "stale_hits": self._stale_hits.get(endpoint, 0),
+                "refreshes": self._refreshes.get(endpoint, 0),
+            }
+            for endpoint, metrics in sorted(self._endpoint_metrics.items())
+        }
+        # negative.hits = provider calls answered by a remembered "not found" (= requests saved)
+        stats["negative"] = {
+            "ttl": self.NEGATIVE_TTL,
+            "hits": sum(self._negative_hits.values()),
+            "writes": sum(self._negative_writes.values()),
+        }
+        # stale.hits = callers answered at once from a stale entry instead of waiting on the API
+        stats["stale"] = {
+            "ttl": self.STALE_TTL,
+            "hits": sum(self._stale_hits.values()),
+            "refreshes": sum(self._refreshes.values()),
+            "refreshing": len(self._refresh_tasks),
+        }
+        stats["single_flight"] = self._flights.get_stats()
+        if self._disk is not None:
+            stats["disk"] = self._disk.get_stats()
+        return stats
@@ -0,0 +1,137 @@
+"""Single-flight coalescing of concurrent identical async calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from functools import partial
+from typing import Any
+
+
+# Hey future me - single-flight means: while a call for key X is running, every other caller
+# asking for X waits for THAT call instead of starting its own, and they all get the same
+# result (or the same exception). Ten enrichment jobs for tracks of one album -> ONE
+# lookup_release, not ten requests queued behind the MusicBrainz 1 req/s lock.
+# The call runs as its own task and waiters await it through asyncio.shield(): if the first
+# caller is cancelled (client disconnected, job cancelled), the request keeps going for the
+# others instead of failing all of them with CancelledError.
+# Nothing is remembered after the call finishes - that's the cache's job. Single-flight only
+# covers the window while the request is in the air.
+class SingleFlight:
+    """Share one in-flight call per key between concurrent callers.
+
+    Usage:
+        flights = SingleFlight()
+        release = await flights.do(mbid, lambda: client.lookup_release(mbid))
+    """
+
+    def __init__(self) -> None:
+        """Initialize single-flight group."""
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Check whether a call for a key is currently running."""
+        return key in self._inflight
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn for key, or join the call already running for it.
+
+        Args:
+            key: Identity of the call (endpoint + parameters)
+            fn: Zero-argument coroutine function performing the call
+
+        Returns:
+            Result of the (shared) call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(partial(self._finish, key))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    # Hey future me - do_many() is single-flight for BATCH endpoints (get_several_artists with 50
+    # IDs). Keys already in flight (from single calls or other batches) are joined; the rest go
+    # out in ONE batch call, and each of those keys becomes its own in-flight entry resolved from
+    # the batch result - so a single lookup arriving meanwhile joins the batch too. A key missing
+    # from the batch result resolves to None. If the batch fails, every key gets the error.
+    async def do_many(
+        self,
+        keys: list[Hashable],
+        fn: Callable[[list[Hashable]], Awaitable[dict[Hashable, Any]]],
+    ) -> dict[Hashable, Any]:
+        """Run fn for the keys not in flight, joining the ones that are.
+
+        Args:
+            keys: Identities of the calls (duplicates are fine)
+            fn: Coroutine function fetching a list of keys, returning {key: result}
+
+        Returns:
+            Dict of key -> result (None for keys the batch didn't return)
+
+        Raises:
+            Exception: Whatever a shared call raised
+        """
+        unique = list(dict.fromkeys(keys))
+        futures = {key: self._inflight[key] for key in unique if key in self._inflight}
+        self.coalesced += len(futures)
+        todo = [key for key in unique if key not in futures]
+        if todo:
+            loop = asyncio.get_running_loop()
+            pending: dict[Hashable, asyncio.Future[Any]] = {}
+            for key in todo:
+                future: asyncio.Future[Any] = loop.create_future()
+                future.add_done_callback(partial(self._finish, key))
+                self._inflight[key] = pending[key] = future
+            batch = asyncio.ensure_future(fn(todo))
+            batch.add_done_callback(partial(self._resolve, pending=pending))
+            futures.update(pending)
+            self.calls += 1
+        results = await asyncio.shield(
+            asyncio.gather(*(futures[key] for key in unique))
+        )
+        return dict(zip(unique, results, strict=True))
+
+    @staticmethod
+    def _resolve(
+        batch: asyncio.Future[dict[Hashable, Any]],
+        pending: dict[Hashable, asyncio.Future[Any]],
+    ) -> None:
+        """Hand a finished batch's per-key results (or its error) to the key futures."""
+        if batch.cancelled():
+            for future in pending.values():
+                future.cancel()
+            return
+        error = batch.exception()
+        for key, future in pending.items():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(batch.result().get(key))
+
+    def _finish(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        """Forget a finished call (and mark its exception as retrieved)."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # All waiters may have been cancelled - retrieve the exception so asyncio doesn't log
+        # "exception was never retrieved" for a failure nobody is waiting for anymore
+        if not future.cancelled():
+            future.exception()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get single-flight statistics.
+
+        Returns:
+            Dict with started calls, coalesced callers and calls in flight
+        """
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
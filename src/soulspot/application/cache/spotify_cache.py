@@ -2,14 +2,16 @@
 
 from typing import Any
 
-from soulspot.application.cache.base_cache import InMemoryCache
+from soulspot.application.cache.bounded_cache import MB
+from soulspot.application.cache.disk_cache import DiskCache
+from soulspot.application.cache.response_cache import ResponseCache
 
 
-class SpotifyCache:
+class SpotifyCache(ResponseCache):
     """Cache for Spotify API responses.
 
     This cache stores:
-    - Track metadata
+    - Track, album and artist metadata
     - Playlist metadata
     - Search results
 
@@ -25,10 +27,65 @@ class SpotifyCache:
     TRACK_TTL = 86400  # 24 hours
     PLAYLIST_TTL = 3600  # 1 hour (playlists change frequently)
     SEARCH_TTL = 1800  # 30 minutes
+    ALBUM_TTL = 86400  # 24 hours (track lists of released albums don't change)
+    ARTIST_TTL = 86400  # 24 hours (popularity/followers drift slowly)
+    # Listen up - artist_albums is what the watchlist/discography workers diff for NEW releases.
+    # 1h matches the watchlist interval: one run per hour still sees a release within the hour,
+    # and everything else asking for the same discography inside that hour (completeness checks,
+    # artist pages, discography worker) reuses the response instead of re-fetching.
+    ARTIST_ALBUMS_TTL = 3600  # 1 hour
+    TOP_TRACKS_TTL = 21600  # 6 hours
+
+    ENDPOINTS = {
+        "track": "TRACK_TTL",
+        "playlist": "PLAYLIST_TTL",
+        "search": "SEARCH_TTL",
+        "search_artist": "SEARCH_TTL",
+        "album": "ALBUM_TTL",
+        "album_tracks": "ALBUM_TTL",
+        "artist": "ARTIST_TTL",
+        "artist_albums": "ARTIST_ALBUMS_TTL",
+        "artist_top_tracks": "TOP_TRACKS_TTL",
+        "related_artists": "ARTIST_TTL",
+    }
+
+    # Hey future me - the browse endpoints (artist/album pages, discography) are served
+    # stale-while-revalidate: for a day past their TTL the old response comes back instantly
+    # and one background refresh replaces it. A page then never waits on Spotify for data it
+    # has already seen, but still converges to fresh within one refresh. Search and tracks
+    # stay plain TTL - a stale search result is the one thing users notice.
+    STALE_ENDPOINTS = frozenset(
+        {
+            "album",
+            "album_tracks",
+            "artist",
+            "artist_albums",
+            "artist_top_tracks",
+            "related_artists",
+        }
+    )
+    STALE_TTL = 86400  # 24 hours past the TTL, then lookups block again
+
+    # Hey future me - playlist payloads can be MEGABYTES each (hundreds of full track objects), so
+    # this cache is bounded by BYTES (CACHE__SPOTIFY_MAX_MB), not entry count. Over budget, expired
+    # entries go first, then the least recently used.
+    def __init__(
+        self,
+        max_bytes: int = 64 * MB,
+        disk: DiskCache | None = None,
+        stale_ttl: int | None = None,
+    ) -> None:
+        """Initialize Spotify cache.
 
-    def __init__(self) -> None:
-        """Initialize Spotify cache."""
-        self._cache: InMemoryCache[str, Any] = InMemoryCache()
+        Args:
+            max_bytes: Memory budget in bytes (approximate)
+            disk: Optional persistent second tier
+            stale_ttl: Seconds browse responses are served past their TTL
+                while refreshed in the background (None = STALE_TTL)
+        """
+        super().__init__(
+            max_bytes=max_bytes, name="spotify", disk=disk, stale_ttl=stale_ttl
+        )
 
     # Yo, these key builders use Spotify IDs which are unique and stable
     # "track:3n3Ppam7vgaVa1iaRUc9Lp" won't collide with "playlist:37i9dQZF1DXcBWIGoYBM5M"
@@ -58,8 +115,7 @@ class SpotifyCache:
         Returns:
             Cached track data or None
         """
-        key = self._make_track_key(track_id)
-        return await self._cache.get(key)
+        return await self.get_response("track", track_id)
 
     async def cache_track(self, track_id: str, track: dict[str, Any]) -> None:
         """Cache track metadata.
@@ -68,8 +124,7 @@ class SpotifyCache:
             track_id: Spotify track ID
             track: Track data from Spotify
         """
-        key = self._make_track_key(track_id)
-        await self._cache.set(key, track, self.TRACK_TTL)
+        await self.cache_response("track", track_id, track)
 
     # Listen, playlists have SHORT TTL (1h) because they're living documents
     # User adds 5 tracks → sync immediately → cache still shows old version = confusion
@@ -84,8 +139,7 @@ class SpotifyCache:
         Returns:
             Cached playlist data or None
         """
-        key = self._make_playlist_key(playlist_id)
-        return await self._cache.get(key)
+        return await self.get_response("playlist", playlist_id)
 
     async def cache_playlist(self, playlist_id: str, playlist: dict[str, Any]) -> None:
         """Cache playlist metadata.
@@ -94,8 +148,7 @@ class SpotifyCache:
             playlist_id: Spotify playlist ID
             playlist: Playlist data from Spotify
         """
-        key = self._make_playlist_key(playlist_id)
-        await self._cache.set(key, playlist, self.PLAYLIST_TTL)
+        await self.cache_response("playlist", playlist_id, playlist)
 
     async def get_search_results(
         self, query: str, limit: int = 10
@@ -109,8 +162,7 @@ class SpotifyCache:
         Returns:
             Cached search results or None
         """
-        key = self._make_search_key(query, limit)
-        return await self._cache.get(key)
+        return await self.get_response("search", f"{query}:{limit}")
 
     async def cache_search_results(
         self,
@@ -125,8 +177,7 @@ class SpotifyCache:
             results: Search results from Spotify
             limit: Number of results
         """
-        key = self._make_search_key(query, limit)
-        await self._cache.set(key, results, self.SEARCH_TTL)
+        await self.cache_response("search", f"{query}:{limit}", results)
 
     async def invalidate_track(self, track_id: str) -> bool:
         """Invalidate cached track.
@@ -137,8 +188,7 @@ class SpotifyCache:
         Returns:
             True if invalidated, False if not found
         """
-        key = self._make_track_key(track_id)
-        return await self._cache.delete(key)
+        return await self.invalidate_response("track", track_id)
 
     # Yo, invalidate playlist when you KNOW it changed (user just edited it)
     # Don't spam this - every invalidation = next request hits Spotify API (rate limits!)
@@ -152,8 +202,7 @@ class SpotifyCache:
         Returns:
             True if invalidated, False if not found
         """
-        key = self._make_playlist_key(playlist_id)
-        return await self._cache.delete(key)
+        return await self.invalidate_response("playlist", playlist_id)
 
     async def invalidate_search(self, query: str, limit: int = 10) -> bool:
         """Invalidate cached search results.
@@ -165,21 +214,35 @@ class SpotifyCache:
         Returns:
             True if invalidated, False if not found
         """
-        key = self._make_search_key(query, limit)
-        return await self._cache.delete(key)
+        return await self.invalidate_response("search", f"{query}:{limit}")
 
-    async def clear(self) -> None:
-        """Clear all cached data."""
-        await self._cache.clear()
+    # Hey future me - these are the invalidation hooks for "this album/artist changed on Spotify"
+    # (e.g. a manual refresh in the UI). They drop every cached endpoint response for the ID,
+    # including all limit/offset variants. Returns how many entries were dropped.
+    async def invalidate_album(self, album_id: str) -> int:
+        """Invalidate all cached responses for an album.
 
-    async def cleanup_expired(self) -> int:
-        """Remove expired entries.
+        Args:
+            album_id: Spotify album ID
 
         Returns:
-            Number of entries removed
+            Number of entries invalidated
         """
-        return await self._cache.cleanup_expired()
+        removed = int(await self.invalidate_response("album", album_id))
+        removed += await self.invalidate_endpoint("album_tracks", f"{album_id}:")
+        return removed
 
-    def get_stats(self) -> dict[str, Any]:
-        """Get cache statistics."""
-        return self._cache.get_stats()
+    async def invalidate_artist(self, artist_id: str) -> int:
+        """Invalidate all cached responses for an artist.
+
+        Args:
+            artist_id: Spotify artist ID
+
+        Returns:
+            Number of entries invalidated
+        """
+        removed = int(await self.invalidate_response("artist", artist_id))
+        removed += int(await self.invalidate_response("related_artists", artist_id))
+        removed += await self.invalidate_endpoint("artist_albums", f"{artist_id}:")
+        removed += await self.invalidate_endpoint("artist_top_tracks", f"{artist_id}:")
+        return removed
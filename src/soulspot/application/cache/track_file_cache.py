@@ -4,7 +4,7 @@ import hashlib
 from pathlib import Path
 from typing import Any
 
-from soulspot.application.cache.base_cache import InMemoryCache
+from soulspot.application.cache.bounded_cache import MB, BoundedCache
 from soulspot.domain.value_objects import FilePath, TrackId
 
 
@@ -28,9 +28,17 @@ class TrackFileCache:
     FILE_PATH_TTL = 604800  # 7 days
     CHECKSUM_TTL = 86400  # 24 hours
 
-    def __init__(self) -> None:
-        """Initialize track file cache."""
-        self._cache: InMemoryCache[str, Any] = InMemoryCache()
+    # Hey future me - entries here are tiny (paths, checksums), but one per track adds up on big
+    # libraries - bounded by BYTES (CACHE__TRACK_FILE_MAX_MB), least recently used go first.
+    def __init__(self, max_bytes: int = 8 * MB) -> None:
+        """Initialize track file cache.
+
+        Args:
+            max_bytes: Memory budget in bytes (approximate)
+        """
+        self._cache: BoundedCache[str, Any] = BoundedCache(
+            max_bytes=max_bytes, name="track_file"
+        )
 
     # Yo, these key builders separate concerns - track location vs file integrity
     # "file_path:{track_id}" stores WHERE file is
@@ -3,8 +3,7 @@
 import logging
 from typing import Any
 
-from soulspot.infrastructure.integrations.musicbrainz_client import MusicBrainzClient
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
+from soulspot.domain.ports import IMusicBrainzClient, ISpotifyClient
 
 logger = logging.getLogger(__name__)
 
@@ -82,8 +81,8 @@ class AlbumCompletenessService:
     # anonymous (no auth). Good separation of concerns - service doesn't know HOW to authenticate!
     def __init__(
         self,
-        spotify_client: SpotifyClient | None = None,
-        musicbrainz_client: MusicBrainzClient | None = None,
+        spotify_client: ISpotifyClient | None = None,
+        musicbrainz_client: IMusicBrainzClient | None = None,
     ) -> None:
         """Initialize album completeness service.
 
@@ -118,15 +117,9 @@ class AlbumCompletenessService:
             # Handles both URI format (spotify:album:XXXX) and ID string
             album_id = spotify_uri.split(":")[-1] if ":" in spotify_uri else spotify_uri
 
-            # Get album details from Spotify API
-            client = await self.spotify_client._get_client()
-            response = await client.get(
-                f"{self.spotify_client.API_BASE_URL}/albums/{album_id}",
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            response.raise_for_status()
-
-            album_data = response.json()
+            # Get album details from Spotify API (through the client so the
+            # shared response cache is used when the client is a cached one)
+            album_data = await self.spotify_client.get_album(album_id, access_token)
             total_tracks: int = album_data.get("total_tracks", 0)
 
             logger.info(
@@ -24,8 +24,8 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from soulspot.domain.entities import Track
+from soulspot.domain.ports import ISpotifyClient
 from soulspot.domain.value_objects import ArtistId, SpotifyUri, TrackId
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 from soulspot.infrastructure.persistence.repositories import (
     ArtistRepository,
     TrackRepository,
@@ -49,7 +49,7 @@ class ArtistSongsService:
     def __init__(
         self,
         session: AsyncSession,
-        spotify_client: SpotifyClient | None = None,
+        spotify_client: ISpotifyClient | None = None,
     ) -> None:
         """Initialize artist songs service.
 
@@ -63,11 +63,11 @@ class ArtistSongsService:
         self._spotify_client = spotify_client
 
     @property
-    def spotify_client(self) -> SpotifyClient:
+    def spotify_client(self) -> ISpotifyClient:
         """Get Spotify client, raising error if not configured.
 
         Returns:
-            SpotifyClient instance
+            Spotify client instance
 
         Raises:
             ValueError: If spotify_client was not provided during initialization
@@ -4,9 +4,11 @@ import asyncio
 import logging
 import shutil
 import time
+from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from soulspot.application.services.fuzzy_resolver import FuzzyNameResolver
 from soulspot.application.services.postprocessing.pipeline import (
     PostProcessingPipeline,
 )
@@ -17,9 +19,20 @@ from soulspot.domain.value_objects import FilePath
 
 if TYPE_CHECKING:
     from soulspot.application.services.app_settings_service import AppSettingsService
+    from soulspot.application.services.file_watcher import (
+        ChangeBatch,
+        FilesystemWatcher,
+    )
 
 logger = logging.getLogger(__name__)
 
+# Same threshold the library scanner uses for artist matching
+ARTIST_MATCH_THRESHOLD = 85
+ARTIST_INDEX_PAGE_SIZE = 1000
+
+# A file counts as complete once it hasn't been modified for this many seconds
+FILE_SETTLE_SECONDS = 5
+
 
 class AutoImportService:
     """Service for automatically importing completed downloads to music library.
@@ -42,6 +55,7 @@ class AutoImportService:
         poll_interval: int = 60,
         post_processing_pipeline: PostProcessingPipeline | None = None,
         app_settings_service: "AppSettingsService | None" = None,
+        file_watcher: "FilesystemWatcher | None" = None,
     ) -> None:
         """Initialize auto-import service.
 
@@ -53,6 +67,9 @@ class AutoImportService:
             poll_interval: Seconds between directory scans (default: 60)
             post_processing_pipeline: Optional post-processing pipeline
             app_settings_service: Optional app settings service for dynamic naming templates
+            file_watcher: Optional filesystem watcher - if given, new downloads are picked
+                up from change events instead of re-scanning the tree every poll_interval
+                (must be started by the caller after construction)
         """
         self._settings = settings
         self._track_repository = track_repository
@@ -63,6 +80,17 @@ class AutoImportService:
         self._music_path = settings.storage.music_path
         self._running = False
 
+        # Fuzzy artist index (name -> canonical DB name), built lazily once per poll cycle
+        self._artist_resolver: FuzzyNameResolver[str] | None = None
+
+        # Event-driven mode: files reported by the watcher that still wait for import
+        # (incomplete ones stay here and are re-checked after FILE_SETTLE_SECONDS)
+        self._file_watcher = file_watcher
+        self._pending_files: set[Path] = set()
+        self._changes_event = asyncio.Event()
+        if file_watcher is not None:
+            file_watcher.subscribe(self._download_path, self.handle_changes)
+
         # Initialize post-processing pipeline if not provided
         if post_processing_pipeline:
             self._pipeline = post_processing_pipeline
@@ -129,6 +157,8 @@ class AutoImportService:
         """Stop the auto-import service."""
         logger.info("Stopping auto-import service")
         self._running = False
+        # Wake the event-driven loop so it sees _running=False right away
+        self._changes_event.set()
 
     # Listen, the main monitoring loop - runs forever until _running=False
     # WHY broad Exception catch? Monitor shouldn't crash from one bad file - log and continue
@@ -136,6 +166,10 @@ class AutoImportService:
     # poll_interval is configurable (default 60s) - trade-off between responsiveness and CPU usage
     async def _monitor_loop(self) -> None:
         """Monitor downloads directory and process completed files."""
+        if self._file_watcher is not None:
+            await self._watch_loop()
+            return
+
         while self._running:
             try:
                 await self._process_downloads()
@@ -145,6 +179,73 @@ class AutoImportService:
             # Wait before next check
             await asyncio.sleep(self._poll_interval)
 
+    # Hey future me - EVENT-DRIVEN mode (file_watcher given)! No rglob per poll anymore:
+    # 1. One catch-up sweep at startup - files that landed while we were down produce no events.
+    # 2. Then we sleep until handle_changes() reports files. Files that are still being written
+    #    (see _is_file_complete) stay in _pending_files and are re-checked every
+    #    FILE_SETTLE_SECONDS - slskd stops touching a finished file, so no further event comes.
+    # With nothing pending we wait indefinitely - zero disk I/O while downloads are idle.
+    async def _watch_loop(self) -> None:
+        """Process downloads reported by the filesystem watcher."""
+        try:
+            await self._process_downloads()
+        except Exception as e:
+            logger.exception("Error in auto-import startup sweep: %s", e)
+
+        while self._running:
+            timeout = FILE_SETTLE_SECONDS if self._pending_files else None
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._changes_event.wait(), timeout=timeout)
+            self._changes_event.clear()
+            if not self._running:
+                break
+
+            try:
+                await self._process_pending_files()
+            except Exception as e:
+                logger.exception("Error in auto-import monitor loop: %s", e)
+
+    async def handle_changes(self, batch: "ChangeBatch") -> None:
+        """Queue audio files from a watcher change batch for import.
+
+        Args:
+            batch: Coalesced changes below the downloads directory
+        """
+        for path in batch.deleted:
+            self._pending_files.discard(path)
+        for path in batch.updated:
+            if path.is_dir():
+                # Whole folder moved in - inotify only reports the folder itself
+                self._pending_files.update(
+                    await asyncio.to_thread(self._list_audio_files, path)
+                )
+            elif path.suffix.lower() in self._audio_extensions:
+                self._pending_files.add(path)
+        if self._pending_files:
+            self._changes_event.set()
+
+    async def _process_pending_files(self) -> None:
+        """Import pending watcher-reported files that finished downloading."""
+        # New cycle - artists may have been added since, rebuild the index on first use
+        self._artist_resolver = None
+        ready = []
+        for file_path in sorted(self._pending_files):
+            if not file_path.exists():
+                self._pending_files.discard(file_path)
+            elif self._is_file_complete(file_path):
+                self._pending_files.discard(file_path)
+                ready.append(file_path)
+            else:
+                logger.debug("Waiting for incomplete file: %s", file_path)
+
+        if ready:
+            logger.info("Found %d audio file(s) to process", len(ready))
+        for file_path in ready:
+            try:
+                await self._import_file(file_path)
+            except Exception as e:
+                logger.exception("Error importing file %s: %s", file_path, e)
+
     # Yo this discovers and processes all audio files in downloads dir
     # WHY per-file exception handling? One corrupt file shouldn't stop processing others
     # WHY debug log for no files? Normal case, not an error - don't spam logs
@@ -152,6 +253,8 @@ class AutoImportService:
     # Consider parallel processing with asyncio.gather() but watch for race conditions on file moves
     async def _process_downloads(self) -> None:
         """Process all files in the downloads directory."""
+        # New cycle - artists may have been added since, rebuild the index on first use
+        self._artist_resolver = None
         try:
             # Get all audio files in downloads directory
             audio_files = self._get_audio_files(self._download_path)
@@ -176,9 +279,9 @@ class AutoImportService:
     # WHY suffix.lower()? File extensions might be ".MP3" or ".Mp3" - normalize for comparison
     # WHY skip incomplete files? slskd might be actively writing - we check is_file_complete
     # GOTCHA: This scans ENTIRE tree on every poll - slow for huge download dirs (10k+ files)
-    # Consider caching or watching filesystem events instead of polling
+    # That's why it only runs once at startup when a file_watcher is configured (see _watch_loop)
     def _get_audio_files(self, directory: Path) -> list[Path]:
-        """Get all audio files from directory recursively.
+        """Get all completely downloaded audio files from directory recursively.
 
         Args:
             directory: Directory to scan
@@ -187,20 +290,25 @@ class AutoImportService:
             List of audio file paths
         """
         audio_files = []
+        for item in self._list_audio_files(directory):
+            # Check if file is not being written (size stable)
+            if self._is_file_complete(item):
+                audio_files.append(item)
+            else:
+                logger.debug("Skipping incomplete file: %s", item)
+        return audio_files
 
+    def _list_audio_files(self, directory: Path) -> list[Path]:
+        """List audio files below directory recursively (no completeness check)."""
         try:
-            for item in directory.rglob("*"):
-                if item.is_file() and item.suffix.lower() in self._audio_extensions:
-                    # Check if file is not being written (size stable)
-                    if self._is_file_complete(item):
-                        audio_files.append(item)
-                    else:
-                        logger.debug("Skipping incomplete file: %s", item)
-
+            return [
+                item
+                for item in directory.rglob("*")
+                if item.is_file() and item.suffix.lower() in self._audio_extensions
+            ]
         except Exception as e:
             logger.exception("Error scanning directory %s: %s", directory, e)
-
-        return audio_files
+            return []
 
     # Hey future me: File completeness check - prevents moving files that are still being written
     # WHY check modification time? slskd writes files incrementally, we need to wait for it to finish
@@ -230,10 +338,10 @@ class AutoImportService:
             if size == 0:
                 return False
 
-            # Check if file was modified recently (within last 5 seconds)
+            # Check if file was modified recently (within last FILE_SETTLE_SECONDS)
             mtime = file_path.stat().st_mtime
             age = time.time() - mtime
-            return age >= 5
+            return age >= FILE_SETTLE_SECONDS
 
         except Exception as e:
             logger.warning("Error checking file completeness for %s: %s", file_path, e)
@@ -390,6 +498,16 @@ class AutoImportService:
                     artist_name=artist,
                     limit=1
                 )
+                if not matches and artist:
+                    # Tag spelling differs from the DB ("Beatles" vs "The Beatles")? Retry
+                    # with the fuzzy-resolved canonical artist name.
+                    canonical = await self._resolve_artist_name(artist)
+                    if canonical and canonical != artist:
+                        matches = await self._track_repository.search_by_title_artist(
+                            title=title,
+                            artist_name=canonical,
+                            limit=1
+                        )
                 if matches:
                     track = matches[0]
                     logger.info(
@@ -411,6 +529,42 @@ class AutoImportService:
             logger.warning("Error matching track for %s: %s", file_path, e)
             return None
 
+    # Hey future me: fuzzy artist fallback for tag/DB spelling differences. Uses the same indexed
+    # FuzzyNameResolver as the library scanner (trigram blocking + one rapidfuzz call) so a miss
+    # doesn't cost a ratio() call per artist. The index is built from the artist repo in pages on
+    # first use per poll cycle and dropped at the start of the next one.
+    async def _resolve_artist_name(self, artist: str) -> str | None:
+        """Resolve an artist tag to the closest known artist name.
+
+        Args:
+            artist: Artist name from file tags
+
+        Returns:
+            Canonical artist name from the DB, or None if nothing is close enough
+        """
+        if self._artist_resolver is None:
+            resolver = FuzzyNameResolver[str](threshold=ARTIST_MATCH_THRESHOLD)
+            offset = 0
+            while True:
+                page = await self._artist_repository.list_all(
+                    limit=ARTIST_INDEX_PAGE_SIZE, offset=offset
+                )
+                resolver.add_many((a.name, a.name) for a in page)
+                if len(page) < ARTIST_INDEX_PAGE_SIZE:
+                    break
+                offset += ARTIST_INDEX_PAGE_SIZE
+            self._artist_resolver = resolver
+
+        match = self._artist_resolver.resolve(artist)
+        if match and not match.exact:
+            logger.debug(
+                "Fuzzy matched artist tag '%s' to '%s' (score: %.1f)",
+                artist,
+                match.key,
+                match.score,
+            )
+        return match.key if match else None
+
     # Listen future me: Recursive empty directory cleanup - keeps downloads dir tidy
     # WHY recursive? After moving "Artist/Album/track.mp3", both "Album" and "Artist" might be empty
     # WHY stop at downloads root? Don't want to delete the downloads directory itself!
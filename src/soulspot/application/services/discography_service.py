@@ -6,8 +6,8 @@ from typing import Any
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from soulspot.domain.ports import ISpotifyClient
 from soulspot.domain.value_objects import ArtistId
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 from soulspot.infrastructure.persistence.models import AlbumModel, ArtistModel
 
 logger = logging.getLogger(__name__)
@@ -62,7 +62,7 @@ class DiscographyService:
     def __init__(
         self,
         session: AsyncSession,
-        spotify_client: SpotifyClient | None = None,
+        spotify_client: ISpotifyClient | None = None,
     ) -> None:
         """Initialize discography service.
 
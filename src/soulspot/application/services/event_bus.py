@@ -0,0 +1,203 @@
+"""In-process event bus for live UI updates (SSE)."""
+
+# Hey future me - this is the ONE place live updates flow through! Producers (JobQueue state
+# transitions, DownloadMonitorWorker progress, library scan progress callbacks) call publish(),
+# every connected SSE client reads its own Subscription. publish() is sync and never blocks or
+# touches the DB, so producers don't care how many browsers are open.
+# Each subscriber has a BOUNDED buffer: a slow/stalled tab drops its oldest events instead of
+# growing memory forever. When that happens it's "lagged" and gets the retained snapshots
+# (e.g. the latest downloads_update) again before the next delta, so it can catch up.
+# GOTCHA: in-process only! With DOWNLOAD__EMBEDDED_WORKERS=false the jobs run in another
+# process, so job deltas from there never reach this bus - the snapshot refresh covers that.
+
+import asyncio
+import itertools
+import logging
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Event:
+    """A published event."""
+
+    id: int
+    type: str
+    data: dict[str, Any]
+
+
+class Subscription:
+    """One subscriber's bounded event buffer.
+
+    Use as a context manager so it is removed from the bus when the client leaves.
+    """
+
+    def __init__(self, bus: "EventBus", max_buffer: int) -> None:
+        """Initialize subscription.
+
+        Args:
+            bus: Bus the subscription belongs to
+            max_buffer: Maximum buffered events before the oldest are dropped
+        """
+        self._bus = bus
+        self._buffer: deque[Event] = deque(maxlen=max_buffer)
+        self._replay: list[Event] = []
+        self._ready = asyncio.Event()
+        self._lagged = False
+        self.dropped = 0
+
+    def _put(self, event: Event) -> None:
+        """Buffer an event, dropping the oldest one if the buffer is full."""
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+            self._lagged = True
+        self._buffer.append(event)
+        self._ready.set()
+
+    async def get(self, timeout: float | None = None) -> Event | None:
+        """Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            Next event, or None if the timeout passed without one
+        """
+        if not self._buffer and not self._replay:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except TimeoutError:
+                return None
+        if self._lagged:
+            # Deltas were lost - replay current state first, then continue with the buffer
+            self._lagged = False
+            self._replay = [
+                event for event in self._bus.retained() if event.id < self._buffer[0].id
+            ]
+        if self._replay:
+            return self._replay.pop(0)
+        return self._buffer.popleft()
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self._bus.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class EventBus:
+    """Fan out published events to all subscribers.
+
+    Usage:
+        bus = EventBus()
+        with bus.subscribe() as subscription:
+            event = await subscription.get(timeout=30)
+        bus.publish("job_update", {"id": job.id, "status": "running"})
+    """
+
+    def __init__(self, max_buffer: int = 100) -> None:
+        """Initialize event bus.
+
+        Args:
+            max_buffer: Default per-subscriber buffer size
+        """
+        self._max_buffer = max_buffer
+        self._subscriptions: set[Subscription] = set()
+        self._listeners: list[Callable[[Event], None]] = []
+        self._retained: dict[str, Event] = {}
+        self._ids = itertools.count(1)
+        self._has_subscribers = asyncio.Event()
+        self._published = 0
+
+    def subscribe(self, max_buffer: int | None = None) -> Subscription:
+        """Add a subscriber, pre-filled with the retained events.
+
+        Args:
+            max_buffer: Buffer size for this subscriber (default: bus default)
+
+        Returns:
+            New subscription
+        """
+        subscription = Subscription(self, max_buffer or self._max_buffer)
+        for event in self.retained():
+            subscription._put(event)
+        self._subscriptions.add(subscription)
+        self._has_subscribers.set()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber (no-op if already removed)."""
+        self._subscriptions.discard(subscription)
+        if not self._subscriptions:
+            self._has_subscribers.clear()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected subscribers."""
+        return len(self._subscriptions)
+
+    async def wait_for_subscribers(self) -> None:
+        """Wait until at least one subscriber is connected."""
+        await self._has_subscribers.wait()
+
+    def add_listener(self, listener: Callable[[Event], None]) -> None:
+        """Call a function for every published event (in publish(), keep it cheap).
+
+        Args:
+            listener: Sync callback receiving the event
+        """
+        self._listeners.append(listener)
+
+    def retained(self) -> list[Event]:
+        """Get the retained events (latest per type), oldest first."""
+        return sorted(self._retained.values(), key=lambda event: event.id)
+
+    # Listen up - retain=True is for SNAPSHOTS (full state, e.g. downloads_update): the latest one
+    # is handed to every new subscriber, so a fresh tab renders immediately without a DB query.
+    # Deltas (job_update, download_progress) are NOT retained - they only matter to live clients.
+    def publish(
+        self, event_type: str, data: dict[str, Any], retain: bool = False
+    ) -> Event:
+        """Publish an event to all subscribers.
+
+        Args:
+            event_type: Event name (SSE "event:" field)
+            data: JSON-serializable payload
+            retain: Keep as the latest snapshot of this type for new subscribers
+
+        Returns:
+            Published event
+        """
+        event = Event(id=next(self._ids), type=event_type, data=data)
+        self._published += 1
+        if retain:
+            self._retained[event_type] = event
+        for subscription in self._subscriptions:
+            subscription._put(event)
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning("Event listener failed for %s: %s", event_type, e)
+        return event
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get bus statistics.
+
+        Returns:
+            Dict with subscriber count, published and dropped event counts
+        """
+        return {
+            "subscribers": len(self._subscriptions),
+            "published": self._published,
+            "dropped": sum(sub.dropped for sub in self._subscriptions),
+        }
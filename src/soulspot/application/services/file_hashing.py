@@ -0,0 +1,128 @@
+# Hey future me - this is the TWO-TIER content hashing used by both library scanners!
+# Tier 1 "quick": size + three sampled blocks (head/middle/tail) through BLAKE2b. That's 3 reads
+# per file no matter if it's a 3 MB MP3 or a 300 MB FLAC - on a FLAC library the old full SHA256
+# read the entire collection on every scan and completely dominated scan I/O.
+# Tier 2 "full": the real cryptographic hash of every byte, computed LAZILY - only when two quick
+# fingerprints collide (possible duplicate) or when the user explicitly asks to verify files.
+# Whatever tier produced a value is stored in file_hash_algorithm ("quick-blake2b" vs "sha256"),
+# so NEVER compare hashes across tiers - a quick value and a sha256 value never match anyway.
+"""Tiered file content hashing (quick fingerprint + lazy full hash)."""
+
+import hashlib
+import io
+import os
+from pathlib import Path
+from typing import BinaryIO, Literal, cast
+
+HashMode = Literal["quick", "full"]
+
+# Stored in file_hash_algorithm for quick-tier values (must fit String(20))
+QUICK_HASH_ALGORITHM = "quick-blake2b"
+
+# Size of each sampled block. Tags live at the head (ID3v2/FLAC metadata) and tail (ID3v1/APE),
+# audio frames in the middle - sampling all three catches re-tags and re-encodes alike.
+QUICK_BLOCK_SIZE = 64 * 1024
+
+
+def is_quick_algorithm(algorithm: str | None) -> bool:
+    """Check whether a stored file_hash_algorithm is the quick tier."""
+    return algorithm == QUICK_HASH_ALGORITHM
+
+
+def compute_quick_hash(
+    file_path: Path, size: int | None = None, block_size: int = QUICK_BLOCK_SIZE
+) -> str:
+    """Compute the quick fingerprint of a file.
+
+    Files up to three blocks are hashed completely, larger files are sampled
+    at head, middle and tail. The file size is always part of the digest.
+
+    Args:
+        file_path: Path to file
+        size: File size if already known (skips a stat() call)
+        block_size: Size of each sampled block in bytes
+
+    Returns:
+        32 character hex digest
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        return quick_hash_fileobj(f, size=size, block_size=block_size)
+
+
+def quick_hash_fileobj(
+    f: BinaryIO, size: int | None = None, block_size: int = QUICK_BLOCK_SIZE
+) -> str:
+    """Quick fingerprint of an already open binary file (see compute_quick_hash)."""
+    digest = hashlib.blake2b(digest_size=16)
+    if size is None:
+        size = os.fstat(f.fileno()).st_size
+    digest.update(size.to_bytes(8, "little"))
+
+    if size <= block_size * 3:
+        offsets = [0]
+        block_size = size
+    else:
+        offsets = [0, (size - block_size) // 2, size - block_size]
+
+    for offset in offsets:
+        f.seek(offset)
+        digest.update(f.read(block_size))
+    return digest.hexdigest()
+
+
+def compute_full_hash(file_path: Path, algorithm: str = "sha256") -> str:
+    """Compute the full cryptographic hash of a file.
+
+    Args:
+        file_path: Path to file
+        algorithm: hashlib algorithm name (md5, sha1, sha256)
+
+    Returns:
+        Hex digest
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        return full_hash_fileobj(f, algorithm)
+
+
+def full_hash_fileobj(f: BinaryIO, algorithm: str = "sha256") -> str:
+    """Full hash of an already open binary file, read from the start."""
+    # file_digest() reads with a 256 KiB buffer (vs the old 8 KiB loop) and skips Python-level
+    # buffering entirely on unbuffered binary files. typing.BinaryIO doesn't declare readinto(),
+    # which file_digest() needs - every real binary file object (FileIO, BufferedReader) has it.
+    f.seek(0)
+    return hashlib.file_digest(
+        cast(io.BufferedReader, f), lambda: hashlib.new(algorithm)
+    ).hexdigest()
+
+
+def hash_fileobj(
+    f: BinaryIO,
+    mode: HashMode = "quick",
+    algorithm: str = "sha256",
+    size: int | None = None,
+) -> tuple[str, str]:
+    """Hash an already open binary file with the given tier (see compute_hash)."""
+    if mode == "quick":
+        return quick_hash_fileobj(f, size=size), QUICK_HASH_ALGORITHM
+    return full_hash_fileobj(f, algorithm), algorithm
+
+
+def compute_hash(
+    file_path: Path,
+    mode: HashMode = "quick",
+    algorithm: str = "sha256",
+    size: int | None = None,
+) -> tuple[str, str]:
+    """Hash a file with the given tier.
+
+    Args:
+        file_path: Path to file
+        mode: "quick" for the sampled fingerprint, "full" for the full hash
+        algorithm: Algorithm used for the full tier
+        size: File size if already known
+
+    Returns:
+        Tuple of (hash_value, hash_algorithm) - store both!
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        return hash_fileobj(f, mode, algorithm, size)
@@ -0,0 +1,237 @@
+# Hey future me - this is the FILESYSTEM WATCHER that replaces tree-walking polls!
+# Before: auto-import did rglob("*") over the whole downloads tree every poll interval, and keeping
+# the library current needed a full scan_library job. On a 10k+ file NAS that's constant disk churn
+# for (usually) zero changes.
+# Now: ONE watcher (watchfiles -> Rust notify -> inotify on Linux) over all subscribed roots turns
+# filesystem events into DEBOUNCED CHANGE BATCHES. Each batch is routed to the subscriber(s) whose
+# root contains the changed paths (downloads -> AutoImportService, music -> incremental indexing).
+# Modes:
+# - "inotify": native OS events only (fails loudly if the watch can't be set up)
+# - "polling": stat-polls the trees every poll_interval_ms - use this for SMB/NFS mounts, where
+#   inotify never fires for changes made by OTHER machines
+# - "auto": native first, and if setting it up fails (inotify watch limit, unsupported FS) we fall
+#   back to polling instead of silently not watching at all
+# Events are COALESCED per path by looking at the disk after the debounce window: a file that was
+# created, written 50 times and renamed shows up ONCE, as whatever it is now (exists -> added or
+# modified, gone -> deleted). Subscribers must still treat batches as hints, not truth - a crash
+# loses in-flight events, which is why consumers do one catch-up sweep on startup.
+"""Debounced filesystem change batches (inotify with polling fallback)."""
+
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable, Collection, Iterable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from watchfiles import Change, DefaultFilter, awatch
+
+logger = logging.getLogger(__name__)
+
+WatchMode = Literal["auto", "inotify", "polling"]
+ChangeKind = Literal["added", "modified", "deleted"]
+
+# Seconds to wait before restarting a watcher that died mid-run
+WATCH_RESTART_DELAY = 5.0
+
+
+@dataclass
+class ChangeBatch:
+    """Coalesced changes below one watched root."""
+
+    root: Path
+    changes: dict[Path, ChangeKind] = field(default_factory=dict)
+
+    @property
+    def updated(self) -> list[Path]:
+        """Paths that exist after the batch (added or modified), sorted."""
+        return sorted(p for p, kind in self.changes.items() if kind != "deleted")
+
+    @property
+    def deleted(self) -> list[Path]:
+        """Paths that no longer exist, sorted."""
+        return sorted(p for p, kind in self.changes.items() if kind == "deleted")
+
+
+ChangeCallback = Callable[[ChangeBatch], Awaitable[None]]
+
+
+def coalesce_changes(
+    raw_changes: Iterable[tuple[Change, str]],
+    extensions: Collection[str] | None = None,
+) -> dict[Path, ChangeKind]:
+    """Collapse raw watcher events into one change per path.
+
+    The final kind is decided by the current state of the disk, so the order
+    of events inside the debounce window does not matter.
+
+    Args:
+        raw_changes: (Change, path) pairs as yielded by watchfiles
+        extensions: Lowercase file extensions to keep (directories and
+            deletions are always kept, a deleted path may have been a directory)
+
+    Returns:
+        Dict of path -> "added" | "modified" | "deleted"
+    """
+    seen: dict[str, set[Change]] = {}
+    for change, path in raw_changes:
+        seen.setdefault(path, set()).add(change)
+
+    coalesced: dict[Path, ChangeKind] = {}
+    for path, changes in seen.items():
+        if not os.path.lexists(path):
+            coalesced[Path(path)] = "deleted"
+            continue
+        if (
+            extensions is not None
+            and os.path.splitext(path)[1].lower() not in extensions
+            and not os.path.isdir(path)
+        ):
+            continue
+        coalesced[Path(path)] = "added" if Change.added in changes else "modified"
+    return coalesced
+
+
+class FilesystemWatcher:
+    """Watches directory trees and delivers debounced change batches.
+
+    Usage:
+        watcher = FilesystemWatcher(mode="auto")
+        watcher.subscribe(settings.storage.download_path, auto_import.handle_changes)
+        await watcher.start()
+        ...
+        await watcher.stop()
+    """
+
+    def __init__(
+        self,
+        mode: WatchMode = "auto",
+        debounce_ms: int = 2000,
+        poll_interval_ms: int = 5000,
+        extensions: Collection[str] | None = None,
+    ) -> None:
+        """Initialize watcher.
+
+        Args:
+            mode: "inotify", "polling", or "auto" (inotify with polling fallback)
+            debounce_ms: Max time to collect events into one batch
+            poll_interval_ms: Interval between tree polls in polling mode
+            extensions: Lowercase file extensions to report (None = all files)
+        """
+        self.mode = mode
+        self.debounce_ms = debounce_ms
+        self.poll_interval_ms = poll_interval_ms
+        self.extensions = frozenset(extensions) if extensions is not None else None
+
+        self._subscribers: list[tuple[Path, ChangeCallback]] = []
+        self._stop_event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._active_mode: Literal["inotify", "polling"] | None = None
+
+    @property
+    def active_mode(self) -> Literal["inotify", "polling"] | None:
+        """Backend actually in use (None while not running)."""
+        return self._active_mode
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watch task is alive."""
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, root: Path, callback: ChangeCallback) -> None:
+        """Register a callback for changes below root (call before start()).
+
+        Args:
+            root: Directory tree to watch
+            callback: Awaited with a ChangeBatch for every debounced batch
+        """
+        if self.is_running:
+            raise RuntimeError("Cannot subscribe while the watcher is running")
+        self._subscribers.append((Path(root), callback))
+
+    async def start(self) -> None:
+        """Start watching all subscribed roots in a background task."""
+        if self.is_running:
+            logger.warning("Filesystem watcher is already running")
+            return
+        roots = [root for root, _ in self._subscribers if root.exists()]
+        if not roots:
+            logger.warning("Filesystem watcher has no existing roots to watch")
+            return
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run(roots))
+
+    async def stop(self) -> None:
+        """Stop watching and wait for the watch task to exit."""
+        self._stop_event.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=5.0)
+            except TimeoutError:
+                self._task.cancel()
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._active_mode = None
+
+    # Listen up - the auto fallback only triggers when the NATIVE watcher fails before delivering
+    # anything (that's where inotify limits / unsupported filesystems show up). A watcher that dies
+    # later is restarted with the same backend after WATCH_RESTART_DELAY, never busy-looped.
+    async def _run(self, roots: list[Path]) -> None:
+        """Watch loop with inotify -> polling fallback and restart on errors."""
+        force_polling = self.mode == "polling"
+        while not self._stop_event.is_set():
+            self._active_mode = "polling" if force_polling else "inotify"
+            logger.info(
+                f"Watching {', '.join(str(r) for r in roots)} ({self._active_mode})"
+            )
+            delivered = False
+            try:
+                async for raw_changes in awatch(
+                    *roots,
+                    watch_filter=DefaultFilter(),
+                    debounce=self.debounce_ms,
+                    stop_event=self._stop_event,
+                    force_polling=force_polling,
+                    poll_delay_ms=self.poll_interval_ms,
+                    ignore_permission_denied=True,
+                ):
+                    delivered = True
+                    await self._dispatch(raw_changes)
+            except Exception as e:
+                if not force_polling and not delivered and self.mode == "auto":
+                    logger.warning(
+                        f"Native filesystem events unavailable ({e}), falling back to polling"
+                    )
+                    force_polling = True
+                    continue
+                logger.error(f"Filesystem watcher failed: {e}")
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._stop_event.wait(), timeout=WATCH_RESTART_DELAY
+                    )
+
+    async def _dispatch(self, raw_changes: set[tuple[Change, str]]) -> None:
+        """Coalesce raw events and hand one batch to each matching subscriber."""
+        changes = await asyncio.to_thread(
+            coalesce_changes, raw_changes, self.extensions
+        )
+        for root, callback in self._subscribers:
+            # The root's own mtime change (polling backend) only means one of its
+            # children changed, and those are reported themselves
+            batch = ChangeBatch(
+                root=root,
+                changes={
+                    path: kind
+                    for path, kind in changes.items()
+                    if path.is_relative_to(root) and (path != root or kind == "deleted")
+                },
+            )
+            if not batch.changes:
+                continue
+            try:
+                await callback(batch)
+            except Exception as e:
+                logger.exception(f"Error handling filesystem changes in {root}: {e}")
@@ -7,8 +7,8 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from soulspot.domain.entities import Artist
+from soulspot.domain.ports import ISpotifyClient
 from soulspot.domain.value_objects import ArtistId, SpotifyUri
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 from soulspot.infrastructure.persistence.repositories import ArtistRepository
 
 logger = logging.getLogger(__name__)
@@ -30,7 +30,7 @@ class FollowedArtistsService:
     def __init__(
         self,
         session: AsyncSession,
-        spotify_client: SpotifyClient,
+        spotify_client: ISpotifyClient,
     ) -> None:
         """Initialize followed artists service.
 
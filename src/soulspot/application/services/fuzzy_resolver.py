@@ -0,0 +1,229 @@
+# Hey future me - this is the shared fuzzy NAME RESOLVER (artists, albums, anything with a name)!
+# The old scanner code did `for cached_name in cache: fuzz.ratio(name, cached_name)` for EVERY
+# imported file -> O(files x artists) Python-level calls. On a 150k-track / 8k-artist library that's
+# over a billion ratio() calls. Now:
+# 1. Names are NORMALIZED once (casefold, whitespace collapsed) and exact hits are a dict lookup.
+# 2. Misses go through CANDIDATE BLOCKING: every name is indexed under its character trigrams, and
+#    only entries sharing enough trigrams (and with a compatible length) are scored at all.
+# 3. The remaining candidates are scored in ONE rapidfuzz call (process.extractOne, C loop) with
+#    score_cutoff so rapidfuzz can bail out early on hopeless pairs.
+# The index is incrementally updatable - add() right after creating an artist/album, no rebuild.
+# Scopes partition the index (e.g. albums are only matched within the same artist).
+# NOT thread-safe - it's meant to live inside one service / one scan.
+"""Indexed fuzzy name resolver shared by scanner, auto-import and enrichment."""
+
+import logging
+import math
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from rapidfuzz import fuzz, process
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a name for matching (casefold + collapsed whitespace)."""
+    return " ".join(name.casefold().split())
+
+
+def _ngrams(normalized: str) -> set[str]:
+    """Character trigrams of a normalized name (padded so short names get grams)."""
+    padded = f"  {normalized}  "
+    return {padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+def score_names(
+    query: str,
+    choices: Iterable[str],
+    scorer: Callable[..., float] = fuzz.ratio,
+) -> list[float]:
+    """Score one query against many names in a single batched rapidfuzz call.
+
+    Names are compared normalized (casefold). Use this instead of calling
+    ``fuzz.ratio`` in a Python loop.
+
+    Args:
+        query: Name to compare
+        choices: Candidate names
+        scorer: rapidfuzz scorer (0-100)
+
+    Returns:
+        Scores (0-100) in the same order as ``choices``
+    """
+    choice_list = list(choices)
+    if not choice_list:
+        return []
+    scores = [0.0] * len(choice_list)
+    for _choice, score, index in process.extract(
+        query,
+        choice_list,
+        scorer=scorer,
+        processor=normalize_name,
+        limit=None,
+    ):
+        scores[index] = score
+    return scores
+
+
+@dataclass(frozen=True)
+class ResolvedName[K: Hashable]:
+    """Result of a resolver lookup."""
+
+    key: K
+    name: str
+    score: float
+    exact: bool
+
+
+class FuzzyNameResolver[K: Hashable]:
+    """Normalized-name index with trigram blocking and batched fuzzy scoring.
+
+    Usage:
+        resolver = FuzzyNameResolver[ArtistId](threshold=85)
+        resolver.add("Pink Floyd", artist_id)
+        match = resolver.resolve("Pink Floy")  # -> ResolvedName(exact=False)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 85.0,
+        scorer: Callable[..., float] = fuzz.ratio,
+    ) -> None:
+        """Initialize resolver.
+
+        Args:
+            threshold: Minimum score (0-100) for a fuzzy match
+            scorer: rapidfuzz scorer; blocking bounds assume an Indel-style
+                ratio (fuzz.ratio), other scorers still work but block less
+        """
+        self.threshold = threshold
+        self.scorer = scorer
+
+        self._exact: dict[tuple[Hashable, str], K] = {}
+        self._names: dict[int, str] = {}
+        self._keys: dict[int, K] = {}
+        self._grams: dict[tuple[Hashable, str], set[int]] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str, key: K, scope: Hashable = None) -> None:
+        """Index a name (no-op if the normalized name already exists in scope).
+
+        Args:
+            name: Display name
+            key: Value returned on match (e.g. ArtistId)
+            scope: Optional partition (e.g. artist id for albums)
+        """
+        normalized = normalize_name(name)
+        if not normalized or (scope, normalized) in self._exact:
+            return
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._exact[(scope, normalized)] = key
+        self._names[entry_id] = normalized
+        self._keys[entry_id] = key
+        for gram in _ngrams(normalized):
+            self._grams.setdefault((scope, gram), set()).add(entry_id)
+
+    def add_many(
+        self, entries: Iterable[tuple[str, K]], scope: Hashable = None
+    ) -> None:
+        """Index many (name, key) pairs."""
+        for name, key in entries:
+            self.add(name, key, scope=scope)
+
+    def get_exact(self, name: str, scope: Hashable = None) -> K | None:
+        """Exact (normalized) lookup without fuzzy matching."""
+        return self._exact.get((scope, normalize_name(name)))
+
+    # Yo, the blocking bound: fuzz.ratio = 2*M / (len_a + len_b) * 100 where M <= min(len_a, len_b).
+    # So a candidate can only reach the threshold if its length is within a factor of the query's,
+    # and it must share a proportional number of trigrams (each edit destroys at most 3 trigrams).
+    # Those bounds are conservative on purpose - blocking must never drop a real match above cutoff.
+    def resolve(self, name: str, scope: Hashable = None) -> ResolvedName[K] | None:
+        """Find the best match for a name.
+
+        Args:
+            name: Name to resolve
+            scope: Optional partition to search in
+
+        Returns:
+            ResolvedName for exact or fuzzy matches >= threshold, else None
+        """
+        normalized = normalize_name(name)
+        if not normalized:
+            return None
+
+        key = self._exact.get((scope, normalized))
+        if key is not None:
+            return ResolvedName(key=key, name=normalized, score=100.0, exact=True)
+
+        candidates = self._candidates(normalized, scope)
+        if not candidates:
+            return None
+
+        match = process.extractOne(
+            normalized,
+            candidates,
+            scorer=self.scorer,
+            score_cutoff=self.threshold,
+        )
+        if match is None:
+            return None
+
+        matched_name, score, entry_id = match
+        return ResolvedName(
+            key=self._keys[entry_id], name=matched_name, score=score, exact=False
+        )
+
+    def _candidates(self, normalized: str, scope: Hashable) -> dict[int, str]:
+        """Blocked candidate set {entry_id: normalized_name} for a query."""
+        query_grams = _ngrams(normalized)
+        shared: Counter[int] = Counter()
+        for gram in query_grams:
+            bucket = self._grams.get((scope, gram))
+            if bucket:
+                shared.update(bucket)
+        if not shared:
+            return {}
+
+        ratio = self.threshold / 100.0
+        query_len = len(normalized)
+        # Length window implied by ratio >= threshold (see bound above)
+        min_len = math.floor(query_len * ratio / (2 - ratio))
+        max_len = math.ceil(query_len * (2 - ratio) / ratio) if ratio > 0 else math.inf
+
+        candidates: dict[int, str] = {}
+        for entry_id, count in shared.items():
+            candidate = self._names[entry_id]
+            candidate_len = len(candidate)
+            if not min_len <= candidate_len <= max_len:
+                continue
+            # Max indel edits to stay above threshold; each edit kills <= NGRAM_SIZE grams.
+            # Edits are whole numbers - floor with a tiny epsilon so 0.2 * 5 doesn't become 0.999..
+            max_edits = math.floor((query_len + candidate_len) * (1 - ratio) + 1e-9)
+            if count < len(query_grams) - NGRAM_SIZE * max_edits:
+                continue
+            candidates[entry_id] = candidate
+        return candidates
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[tuple[str, K]],
+        threshold: float = 85.0,
+        **kwargs: Any,
+    ) -> "FuzzyNameResolver[K]":
+        """Build a resolver from (name, key) rows."""
+        resolver = cls(threshold=threshold, **kwargs)
+        resolver.add_many(rows)
+        logger.debug(f"Built fuzzy name index with {len(resolver)} entries")
+        return resolver
@@ -0,0 +1,358 @@
+# Hey future me - this is the STREAMING discovery stage of the library scan!
+# The old approach was os.walk() -> full path list -> Path.stat() every file AGAIN -> compare
+# against last_scanned_at for EVERY track loaded in one giant query. On a 150k-track NAS that's
+# 300k stat calls and a 150k-entry dict before the first file is even read.
+# Now: os.scandir() one directory at a time, stat each entry ONCE (DirEntry.stat() caches), and
+# compare against the persisted (size, mtime_ns, inode) fingerprints of just that directory.
+# Directories whose mtime hasn't moved are not even stat'ed file-by-file - only their
+# subdirectories get visited. Memory stays constant: one directory listing + the DFS stack.
+"""Streaming library discovery backed by the persisted file fingerprint index."""
+
+import asyncio
+import logging
+import os
+import stat
+from collections.abc import AsyncIterator, Collection, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from soulspot.infrastructure.persistence.repositories import (
+    LibraryFileIndexRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Cheap identity of a file or directory on disk (no content read)."""
+
+    path: str
+    directory: str
+    is_directory: bool
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def from_stat(
+        cls, path: str, st: os.stat_result, is_directory: bool = False
+    ) -> "FileFingerprint":
+        """Build a fingerprint from an existing stat result."""
+        return cls(
+            path=path,
+            directory=os.path.dirname(path),
+            is_directory=is_directory,
+            size=0 if is_directory else st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            inode=st.st_ino,
+        )
+
+    def key(self) -> tuple[bool, int, int, int]:
+        """Comparable tuple matching LibraryFileIndexRepository rows."""
+        return (self.is_directory, self.size, self.mtime_ns, self.inode)
+
+    def as_row(self) -> dict[str, Any]:
+        """Row dict for LibraryFileIndexRepository.upsert_many()."""
+        return {
+            "path": self.path,
+            "directory": self.directory,
+            "is_directory": self.is_directory,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "inode": self.inode,
+        }
+
+
+@dataclass
+class DirectoryListing:
+    """Raw scandir() result for a single directory."""
+
+    # (path, stat or None when not stat'ed)
+    files: list[tuple[str, os.stat_result | None]] = field(default_factory=list)
+    subdirs: list[tuple[str, os.stat_result]] = field(default_factory=list)
+
+
+@dataclass
+class DiscoveredDirectory:
+    """One directory worth of discovery output.
+
+    Persist ``fingerprint`` only AFTER every file in ``changed_files`` has been
+    processed - otherwise a crash would mark half-imported directories as clean.
+    ``fingerprint`` is None when only some files of the directory were looked at
+    (see LibraryDiscovery.iter_paths) - the directory must not be marked clean then.
+    """
+
+    fingerprint: FileFingerprint | None
+    changed_files: list[FileFingerprint]
+
+
+# Yo, this runs in a worker thread (asyncio.to_thread) - scandir/stat are blocking syscalls and
+# on a network mount each one can take milliseconds. Symlinked directories are NOT followed (same
+# as os.walk's default) so a link loop can't make us scan forever. Per-entry OSErrors (permission
+# denied, file vanished mid-scan) are logged and skipped - never abort the whole scan for one file.
+def list_directory(
+    directory: str,
+    extensions: Collection[str],
+    skip_stat: Collection[str] = frozenset(),
+    stat_files: bool = True,
+) -> DirectoryListing:
+    """List audio files and subdirectories of a single directory.
+
+    Entries are sorted by path, so the DFS order of a library walk is stable
+    across runs (scan checkpoints rely on that).
+
+    Args:
+        directory: Absolute directory path
+        extensions: Lowercase audio extensions (with leading dot)
+        skip_stat: File paths listed without a stat() call (stat is None)
+        stat_files: If False, no file is stat'ed at all
+
+    Returns:
+        DirectoryListing with files and subdirectories
+    """
+    listing = DirectoryListing()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        listing.subdirs.append(
+                            (entry.path, entry.stat(follow_symlinks=False))
+                        )
+                    elif (
+                        os.path.splitext(entry.name)[1].lower() in extensions
+                        and entry.is_file()
+                    ):
+                        listing.files.append(
+                            (
+                                entry.path,
+                                entry.stat()
+                                if stat_files and entry.path not in skip_stat
+                                else None,
+                            )
+                        )
+                except OSError as e:
+                    logger.warning(f"Skipping {entry.path}: {e}")
+    except OSError as e:
+        logger.warning(f"Cannot list directory {directory}: {e}")
+    listing.files.sort(key=lambda item: item[0])
+    listing.subdirs.sort(key=lambda item: item[0])
+    return listing
+
+
+def cursor_key(root: str, path: str) -> tuple[str, ...]:
+    """Position of a directory in the sorted pre-order walk below root."""
+    relative = os.path.relpath(path, root)
+    return () if relative == os.curdir else tuple(relative.split(os.sep))
+
+
+def stat_paths(paths: Iterable[str]) -> list[tuple[str, os.stat_result | None]]:
+    """stat() each path without following symlinks (None if it is gone)."""
+    results: list[tuple[str, os.stat_result | None]] = []
+    for path in paths:
+        try:
+            results.append((path, os.stat(path, follow_symlinks=False)))
+        except FileNotFoundError:
+            results.append((path, None))
+        except OSError as e:
+            logger.warning(f"Skipping {path}: {e}")
+    return results
+
+
+class LibraryDiscovery:
+    """Walks a library root and yields files whose fingerprint changed.
+
+    Counters (``total_files``, ``unchanged_files``, ``skipped_directories``,
+    ``removed_entries``) are updated while iterating.
+    """
+
+    def __init__(
+        self,
+        index_repo: LibraryFileIndexRepository,
+        extensions: Collection[str],
+        db_lock: asyncio.Lock | None = None,
+    ) -> None:
+        """Initialize discovery.
+
+        Args:
+            index_repo: Fingerprint index repository
+            extensions: Lowercase audio extensions (with leading dot)
+            db_lock: Lock guarding the shared DB session (held around each query)
+        """
+        self.index_repo = index_repo
+        self.extensions = frozenset(extensions)
+        self._db_lock = db_lock or asyncio.Lock()
+
+        self.total_files = 0
+        self.unchanged_files = 0
+        self.skipped_directories = 0
+        self.removed_entries = 0
+        self.resumed_directories = 0
+
+    # Hey future me - iterative DFS with an explicit stack (no recursion limit on deep trees).
+    # For each directory: ONE index query for its children, ONE scandir. If incremental and the
+    # directory's mtime_ns matches the index, its INDEXED files are counted as unchanged WITHOUT
+    # stat() (files missing from the index, e.g. ones that failed to import, are still stat'ed).
+    # Caveat: rewriting a file IN PLACE doesn't bump the directory mtime, so such edits are only
+    # seen by a full (incremental=False) scan - adding, removing or renaming files always is.
+    # Entries that are in the index but gone from disk get their index rows deleted (including
+    # whole subtrees for vanished directories). incremental=False yields every audio file but
+    # still refreshes the index, so the next incremental run is fast again.
+    # RESUME: the walk is a sorted pre-order DFS, so a directory's position is just its path
+    # components compared as a tuple (cursor_key). Everything <= resume_after was committed by an
+    # earlier run: such subtrees are skipped without even listing them, except the ANCESTORS of
+    # the cursor - those are listed (no file stats, nothing yielded) only to reach later siblings.
+    async def iter_directories(
+        self,
+        root: Path,
+        incremental: bool = True,
+        resume_after: str | None = None,
+    ) -> AsyncIterator[DiscoveredDirectory]:
+        """Stream directories with their changed audio files.
+
+        Args:
+            root: Library root directory
+            incremental: If False, every file is reported as changed
+            resume_after: Last directory committed by an interrupted scan; it and
+                everything before it in walk order is skipped
+
+        Yields:
+            DiscoveredDirectory per visited directory
+        """
+        root_path = str(root)
+        resume_key = (
+            cursor_key(root_path, resume_after) if resume_after is not None else None
+        )
+        root_stat = await asyncio.to_thread(os.stat, root_path)
+        async with self._db_lock:
+            root_known = await self.index_repo.get(root_path)
+
+        stack: list[tuple[str, os.stat_result, tuple[bool, int, int, int] | None]] = [
+            (root_path, root_stat, root_known)
+        ]
+
+        while stack:
+            directory, dir_stat, dir_known = stack.pop()
+            already_done = False
+            if resume_key is not None:
+                key = cursor_key(root_path, directory)
+                if key <= resume_key:
+                    if resume_key[: len(key)] != key:
+                        # Whole subtree lies before the cursor
+                        self.resumed_directories += 1
+                        continue
+                    already_done = True
+
+            dir_fingerprint = FileFingerprint.from_stat(
+                directory, dir_stat, is_directory=True
+            )
+            dir_unchanged = (
+                incremental
+                and dir_known is not None
+                and dir_known[2] == dir_fingerprint.mtime_ns
+            )
+
+            async with self._db_lock:
+                known = await self.index_repo.get_directory(directory)
+
+            listing = await asyncio.to_thread(
+                list_directory,
+                directory,
+                self.extensions,
+                known.keys() if dir_unchanged else frozenset(),
+                not already_done,
+            )
+
+            changed: list[FileFingerprint] = []
+            seen: set[str] = set()
+            for path, st in listing.files:
+                seen.add(path)
+                if already_done:
+                    continue
+                self.total_files += 1
+                if st is None:
+                    self.unchanged_files += 1
+                    continue
+                fingerprint = FileFingerprint.from_stat(path, st)
+                if incremental and known.get(path) == fingerprint.key():
+                    self.unchanged_files += 1
+                    continue
+                changed.append(fingerprint)
+
+            # Reversed, so pop() visits subdirectories in sorted order
+            for path, st in reversed(listing.subdirs):
+                seen.add(path)
+                stack.append((path, st, known.get(path)))
+
+            if dir_unchanged:
+                self.skipped_directories += 1
+
+            vanished = [path for path in known if path not in seen]
+            if vanished:
+                async with self._db_lock:
+                    self.removed_entries += await self.index_repo.delete_paths(vanished)
+
+            if already_done:
+                self.resumed_directories += 1
+                continue
+            yield DiscoveredDirectory(
+                fingerprint=dir_fingerprint, changed_files=changed
+            )
+
+    # Hey future me - this is the TARGETED variant for filesystem watcher batches! Instead of
+    # walking the whole library it only looks at the given paths: files are fingerprinted and
+    # compared against the index like in iter_directories, paths that are gone get their index rows
+    # (and subtrees) deleted, and directories (e.g. an album folder moved in as a whole - inotify
+    # only reports the folder itself) are walked via iter_directories. Directory fingerprints of
+    # the parents are NOT updated (fingerprint=None) - we haven't seen the rest of their files.
+    async def iter_paths(
+        self, paths: Iterable[Path]
+    ) -> AsyncIterator[DiscoveredDirectory]:
+        """Stream changed audio files for an explicit set of paths.
+
+        Args:
+            paths: Absolute file or directory paths (existing or deleted)
+
+        Yields:
+            DiscoveredDirectory per parent directory (and per walked subdirectory)
+        """
+        by_directory: dict[str, list[str]] = {}
+        for path in {str(p) for p in paths}:
+            by_directory.setdefault(os.path.dirname(path), []).append(path)
+
+        for directory, dir_paths in sorted(by_directory.items()):
+            async with self._db_lock:
+                known = await self.index_repo.get_directory(directory)
+            stats = await asyncio.to_thread(stat_paths, sorted(dir_paths))
+
+            changed: list[FileFingerprint] = []
+            vanished: list[str] = []
+            subdirs: list[str] = []
+            for path, st in stats:
+                if st is None:
+                    if path in known:
+                        vanished.append(path)
+                elif stat.S_ISDIR(st.st_mode):
+                    subdirs.append(path)
+                elif (
+                    stat.S_ISREG(st.st_mode)
+                    and os.path.splitext(path)[1].lower() in self.extensions
+                ):
+                    self.total_files += 1
+                    fingerprint = FileFingerprint.from_stat(path, st)
+                    if known.get(path) == fingerprint.key():
+                        self.unchanged_files += 1
+                        continue
+                    changed.append(fingerprint)
+
+            if vanished:
+                async with self._db_lock:
+                    self.removed_entries += await self.index_repo.delete_paths(vanished)
+
+            yield DiscoveredDirectory(fingerprint=None, changed_files=changed)
+
+            for subdir in subdirs:
+                async for found in self.iter_directories(Path(subdir)):
+                    yield found
@@ -1,12 +1,19 @@
 """Library scanner service for scanning and analyzing music library."""
 
-import hashlib
 import logging
 from pathlib import Path
 from typing import Any
 
 from mutagen import File as MutagenFile  # type: ignore[attr-defined]
 
+from soulspot.application.services.file_hashing import (
+    QUICK_HASH_ALGORITHM,
+    HashMode,
+    compute_full_hash,
+    compute_quick_hash,
+    is_quick_algorithm,
+)
+from soulspot.application.services.scan_engine import scan_audio_file
 from soulspot.infrastructure.security import PathValidator
 
 logger = logging.getLogger(__name__)
@@ -53,13 +60,18 @@ class FileInfo:
 class LibraryScannerService:
     """Service for scanning and analyzing music library."""
 
-    def __init__(self, hash_algorithm: str = "sha256") -> None:
+    def __init__(
+        self, hash_algorithm: str = "sha256", hash_mode: HashMode = "quick"
+    ) -> None:
         """Initialize library scanner service.
 
         Args:
-            hash_algorithm: Hash algorithm to use (md5, sha1, sha256)
+            hash_algorithm: Hash algorithm for full hashes (md5, sha1, sha256)
+            hash_mode: "quick" stores sampled fingerprints and computes full hashes
+                only for collisions, "full" hashes every byte of every file
         """
         self.hash_algorithm = hash_algorithm
+        self.hash_mode = hash_mode
 
     # Hey future me, this discovers all audio files in a directory! Uses rglob("*") to recursively find
     # files with audio extensions (.mp3, .flac, etc). SECURITY CRITICAL: validates each file is within
@@ -120,31 +132,44 @@ class LibraryScannerService:
 
         return audio_files
 
-    # Listen, hash calculation for duplicate detection - reads file in 8KB chunks
-    # WHY chunks? A 500MB FLAC file won't fit in RAM at once, chunk reading is memory-efficient
-    # WHY 8192 bytes? Common OS page size, good balance between syscalls and memory
+    # Listen, this is the FULL hash tier - reads every byte, so only call it when it matters
+    # (quick fingerprint collisions in detect_duplicates, explicit verify). See file_hashing.py.
     # hash_algorithm is configurable (md5/sha1/sha256) - sha256 is slower but more collision-resistant
     def calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate hash of a file.
+        """Calculate full hash of a file.
 
         Args:
             file_path: Path to file
 
         Returns:
-            Hash value as hex string
+            Hash value as hex string (empty string on error)
         """
-        hash_func = hashlib.new(self.hash_algorithm)
-
         try:
-            with open(file_path, "rb") as f:
-                # Read in chunks to handle large files efficiently
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hash_func.update(chunk)
-            return hash_func.hexdigest()
+            return compute_full_hash(file_path, self.hash_algorithm)
         except Exception as e:
             logger.error(f"Error calculating hash for {file_path}: {e}")
             return ""
 
+    def calculate_tiered_hash(
+        self, file_path: Path, size: int | None = None
+    ) -> tuple[str, str]:
+        """Calculate the hash for the configured tier.
+
+        Args:
+            file_path: Path to file
+            size: File size if already known
+
+        Returns:
+            Tuple of (hash_value, hash_algorithm); hash_value is "" on error
+        """
+        if self.hash_mode == "full":
+            return self.calculate_file_hash(file_path), self.hash_algorithm
+        try:
+            return compute_quick_hash(file_path, size=size), QUICK_HASH_ALGORITHM
+        except Exception as e:
+            logger.error(f"Error calculating quick hash for {file_path}: {e}")
+            return "", QUICK_HASH_ALGORITHM
+
     # Listen up - this validates audio file integrity using Mutagen! MutagenFile returns None for
     # unsupported formats which we catch. Checks audio.info.length > 0 to catch zero-duration files (often
     # corrupted). Returns tuple of (is_valid, error_message) which is clean API. hasattr() checks are
@@ -254,8 +279,10 @@ class LibraryScannerService:
         return metadata
 
     # Hey future me: All-in-one file scanner - combines hash, validation, and metadata
-    # WHY all at once? Efficient - one file open/read for multiple operations
-    # Returns FileInfo dataclass with everything you need for analysis
+    # WHY all at once? Efficient - goes through the single-pass scan engine, so the file is opened
+    # ONCE for tags + hash + integrity verdict (see scan_engine.py) instead of stat + hash open +
+    # two separate MutagenFile() parses.
+    # Returns FileInfo with everything you need for analysis
     # Used for library health checks, duplicate detection, metadata extraction
     def scan_file(self, file_path: Path) -> FileInfo:
         """Scan a single audio file.
@@ -266,25 +293,18 @@ class LibraryScannerService:
         Returns:
             FileInfo object with scan results
         """
-        # Get file size
-        file_size = file_path.stat().st_size
-
-        # Calculate hash
-        file_hash = self.calculate_file_hash(file_path)
-
-        # Validate file
-        is_valid, error = self.validate_audio_file(file_path)
-
-        # Extract metadata
-        metadata = self.extract_audio_metadata(file_path)
+        scanned = scan_audio_file(
+            file_path, hash_mode=self.hash_mode, hash_algorithm=self.hash_algorithm
+        )
+        metadata = scanned.metadata or {}
 
         return FileInfo(
             path=file_path,
-            size=file_size,
-            hash_value=file_hash,
-            hash_algorithm=self.hash_algorithm,
-            is_valid=is_valid,
-            error=error,
+            size=scanned.size,
+            hash_value=scanned.file_hash or "",
+            hash_algorithm=scanned.hash_algorithm or self.hash_algorithm,
+            is_valid=scanned.is_valid,
+            error=scanned.integrity_error,
             bitrate=metadata.get("bitrate"),
             sample_rate=metadata.get("sample_rate"),
             format=metadata.get("format"),
@@ -296,34 +316,59 @@ class LibraryScannerService:
 
     # Yo duplicate detection - groups files by hash value
     # WHY by hash? Two files with same hash = byte-identical = definite duplicate
+    # Quick-tier fingerprints only SAMPLE the file, so a quick collision is just a candidate: those
+    # files get their full hash computed right here (lazily - usually a handful of files, not the
+    # whole library) and are regrouped. Promoted FileInfos carry the full hash + algorithm afterwards,
+    # so callers can persist the upgraded tier.
     # Returns only actual duplicates (len > 1) - single files ignored
-    # Useful for reclaiming disk space or finding different encodings of same track
     def detect_duplicates(
         self, file_infos: list[FileInfo]
     ) -> dict[str, list[FileInfo]]:
         """Detect duplicate files by hash.
 
+        Quick fingerprint collisions are confirmed with a full hash first.
+
         Args:
             file_infos: List of scanned file information
 
         Returns:
-            Dictionary mapping hash to list of duplicate files
+            Dictionary mapping full hash to list of duplicate files
         """
-        hash_map: dict[str, list[FileInfo]] = {}
-
-        for file_info in file_infos:
-            if file_info.hash_value:
-                if file_info.hash_value not in hash_map:
-                    hash_map[file_info.hash_value] = []
-                hash_map[file_info.hash_value].append(file_info)
-
-        # Filter to only actual duplicates (more than one file with same hash)
+        hash_map = self._group_by_hash(file_infos)
+
+        candidates = [
+            file_info
+            for files in hash_map.values()
+            if len(files) > 1 and is_quick_algorithm(files[0].hash_algorithm)
+            for file_info in files
+        ]
+        if candidates:
+            for file_info in candidates:
+                file_info.hash_value = self.calculate_file_hash(file_info.path)
+                file_info.hash_algorithm = self.hash_algorithm
+            hash_map = self._group_by_hash(file_infos)
+
+        # Filter to only actual duplicates (more than one file with same full hash)
         return {
             hash_value: files
             for hash_value, files in hash_map.items()
-            if len(files) > 1
+            if len(files) > 1 and not is_quick_algorithm(files[0].hash_algorithm)
         }
 
+    @staticmethod
+    def _group_by_hash(file_infos: list[FileInfo]) -> dict[str, list[FileInfo]]:
+        """Group files by (tier-qualified) hash value."""
+        hash_map: dict[str, list[FileInfo]] = {}
+        for file_info in file_infos:
+            if file_info.hash_value:
+                key = (
+                    f"{QUICK_HASH_ALGORITHM}:{file_info.hash_value}"
+                    if is_quick_algorithm(file_info.hash_algorithm)
+                    else file_info.hash_value
+                )
+                hash_map.setdefault(key, []).append(file_info)
+        return hash_map
+
     # Listen, broken file filter - simple list comprehension
     # WHY separate method? Could inline but explicit is better for testing
     # is_valid=False means corrupted, truncated, or unsupported format
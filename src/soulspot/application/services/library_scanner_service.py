@@ -1,24 +1,32 @@
 # Hey future me - this service scans the local music directory and imports files into the DB!
 # Key features:
 # 1. JOB QUEUE integration - runs as background job (use JobQueue for async scanning)
-# 2. FUZZY MATCHING - finds existing artists/albums with 85% similarity (rapidfuzz)
-# 3. INCREMENTAL SCAN - only processes new/changed files based on mtime
+# 2. FUZZY MATCHING - finds existing artists/albums with 85% similarity (FuzzyNameResolver)
+# 3. INCREMENTAL SCAN - only processes files whose (size, mtime, inode) fingerprint changed
 # 4. COMPILATION DETECTION - reads TPE2 (Album Artist) tag, detects "Various Artists"
+# 5. STAGED PIPELINE - tag parsing + hashing run in a worker pool, ONE writer commits in batches
 # The goal: import existing music collection, avoid re-downloading already owned tracks!
 """Library scanner service for importing local music files into database."""
 
-import hashlib
+import asyncio
 import logging
-import os
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from mutagen import File as MutagenFile  # type: ignore[attr-defined]
-from rapidfuzz import fuzz
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from soulspot.application.services.file_hashing import HashMode
+from soulspot.application.services.fuzzy_resolver import FuzzyNameResolver
+from soulspot.application.services.library_discovery import (
+    DiscoveredDirectory,
+    FileFingerprint,
+    LibraryDiscovery,
+)
+from soulspot.application.services.scan_engine import ScannedFile, scan_audio_file
 from soulspot.config import Settings
 from soulspot.domain.entities import Album, Artist, Track
 from soulspot.domain.value_objects import AlbumId, ArtistId, FilePath, TrackId
@@ -35,11 +43,27 @@ from soulspot.infrastructure.persistence.models import (
 from soulspot.infrastructure.persistence.repositories import (
     AlbumRepository,
     ArtistRepository,
+    LibraryFileIndexRepository,
+    LibraryScanRepository,
     TrackRepository,
 )
 
 logger = logging.getLogger(__name__)
 
+# Counters carried over when an interrupted scan is resumed from its checkpoint
+CHECKPOINT_STAT_KEYS = (
+    "scanned",
+    "imported",
+    "errors",
+    "new_artists",
+    "new_albums",
+    "new_tracks",
+    "matched_artists",
+    "matched_albums",
+)
+# Keep checkpoints small - only the most recent errors survive a resume
+CHECKPOINT_ERROR_FILES_LIMIT = 100
+
 # Supported audio file extensions
 AUDIO_EXTENSIONS = {
     ".mp3",
@@ -55,16 +79,42 @@ AUDIO_EXTENSIONS = {
 }
 
 
+# Hey future me - this is the READ STAGE of the scan pipeline! It runs inside the worker pool
+# (thread or process), so it must stay free of DB/session access and event loop calls. It's a
+# module-level function (not a method) on purpose: ProcessPoolExecutor pickles the callable by
+# qualified name, and bound methods would drag the whole service (incl. AsyncSession) along.
+# The actual work is the single-pass scan engine (one open for tags + hash + integrity verdict).
+# Errors are RETURNED not raised, so one corrupt file never poisons the pipeline.
+def read_audio_file(
+    file_path: Path, size: int | None = None, hash_mode: HashMode = "quick"
+) -> ScannedFile:
+    """Parse tags and hash one audio file (runs in the scan worker pool).
+
+    Args:
+        file_path: Path to audio file
+        size: File size if already known from discovery (skips another stat())
+        hash_mode: Hash tier to compute ("quick" fingerprint or "full" SHA256)
+
+    Returns:
+        ScannedFile with metadata and hash, or error set if reading failed
+    """
+    return scan_audio_file(file_path, size=size, hash_mode=hash_mode)
+
+
 class LibraryScannerService:
     """Service for scanning local music directory and importing to database.
 
     This service handles:
-    1. Discovering audio files in the music directory
+    1. Discovering audio files in the music directory (streamed, fingerprint-indexed)
     2. Extracting metadata via mutagen (title, artist, album, etc.)
     3. Fuzzy-matching artists and albums (85% threshold)
     4. Incremental scanning (only new/modified files)
     5. Tracking scan progress for UI feedback
 
+    Scans run as a staged pipeline: discovered files are read (tags + hash) in a
+    bounded worker pool, and a single writer stage imports the results and commits
+    every ``settings.library.scan_batch_size`` files.
+
     Works with JobQueue for background processing!
     """
 
@@ -88,20 +138,39 @@ class LibraryScannerService:
         self.artist_repo = ArtistRepository(session)
         self.album_repo = AlbumRepository(session)
         self.track_repo = TrackRepository(session)
+        self.file_index_repo = LibraryFileIndexRepository(session)
+        self.scan_repo = LibraryScanRepository(session)
         self.music_path = settings.storage.music_path
 
-        # Cache for fuzzy matching (avoid repeated DB queries)
-        self._artist_cache: dict[str, ArtistId] = {}
-        self._album_cache: dict[str, AlbumId] = {}
+        # Indexed fuzzy matching (avoid repeated DB queries AND O(n) ratio loops)
+        self._artist_resolver = FuzzyNameResolver[ArtistId](threshold=self.FUZZY_THRESHOLD)
+        # Albums are scoped by artist id - only matched within the same artist
+        self._album_resolver = FuzzyNameResolver[AlbumId](threshold=self.FUZZY_THRESHOLD)
+
+        # Discovery queries and the writer share self.session - this lock serializes them
+        self._db_lock = asyncio.Lock()
+
+        # Track rows waiting for the next bulk upsert (see _flush_tracks)
+        self._pending_tracks: list[dict[str, Any]] = []
 
     # =========================================================================
     # MAIN SCAN METHODS
     # =========================================================================
 
+    # Hey future me - scans are RESUMABLE! Every scan gets a library_scans row, and every batch
+    # commit also writes a checkpoint into it (last fully committed directory + partial stats) in
+    # the SAME transaction. If the process dies, the row stays "running" with its checkpoint, and
+    # the next scan in the same mode picks it up: discovery skips everything up to the cursor (see
+    # LibraryDiscovery.iter_directories) and the stats continue from the checkpoint. Files of the
+    # directory that was half-done when we died are read again (and counted twice in the stats) -
+    # cheap compared to redoing the whole library. resume=False (or another mode) starts fresh and
+    # cancels the stale checkpoint.
     async def scan_library(
         self,
         incremental: bool = True,
         progress_callback: Any | None = None,
+        resume: bool = True,
+        scan_id: str | None = None,
     ) -> dict[str, Any]:
         """Scan the entire music library.
 
@@ -110,147 +179,434 @@ class LibraryScannerService:
         Args:
             incremental: If True, only scan new/modified files
             progress_callback: Optional callback for progress updates
+            resume: Continue an interrupted scan of the same mode from its checkpoint
+            scan_id: Specific interrupted scan to resume (default: most recent one)
 
         Returns:
             Dict with scan statistics
         """
-        stats: dict[str, Any] = {
-            "started_at": datetime.now(UTC).isoformat(),
-            "completed_at": None,
-            "total_files": 0,
-            "scanned": 0,
-            "imported": 0,
-            "skipped": 0,
-            "errors": 0,
-            "error_files": [],
-            "new_artists": 0,
-            "new_albums": 0,
-            "new_tracks": 0,
-            "matched_artists": 0,
-            "matched_albums": 0,
-        }
+        stats = self._new_stats()
+        current_scan_id: str | None = None
 
         try:
             # Validate music path
             if not self.music_path.exists():
                 raise FileNotFoundError(f"Music path does not exist: {self.music_path}")
 
-            # Discover all audio files
-            all_files = self._discover_audio_files(self.music_path)
-            stats["total_files"] = len(all_files)
-
-            logger.info(f"Found {len(all_files)} audio files in {self.music_path}")
-
-            # Filter to only new/modified files if incremental
-            if incremental:
-                files_to_scan = await self._filter_changed_files(all_files)
-                stats["skipped"] = len(all_files) - len(files_to_scan)
-                logger.info(
-                    f"Incremental scan: {len(files_to_scan)} new/modified, "
-                    f"{stats['skipped']} unchanged"
-                )
-            else:
-                files_to_scan = all_files
-
             # Pre-load artist/album caches for faster fuzzy matching
             await self._load_caches()
 
-            # Process each file
-            for i, file_path in enumerate(files_to_scan):
-                try:
-                    result = await self._import_file(file_path)
-                    stats["scanned"] += 1
-
-                    if result["imported"]:
-                        stats["imported"] += 1
-                        if result.get("new_artist"):
-                            stats["new_artists"] += 1
-                        if result.get("matched_artist"):
-                            stats["matched_artists"] += 1
-                        if result.get("new_album"):
-                            stats["new_albums"] += 1
-                        if result.get("matched_album"):
-                            stats["matched_albums"] += 1
-                        if result.get("new_track"):
-                            stats["new_tracks"] += 1
-
-                    # Progress callback
-                    if progress_callback:
-                        progress = (i + 1) / len(files_to_scan) * 100
-                        await progress_callback(progress, stats)
-
-                except Exception as e:
-                    stats["errors"] += 1
-                    stats["error_files"].append(
-                        {"path": str(file_path), "error": str(e)}
-                    )
-                    logger.warning(f"Error importing {file_path}: {e}")
+            discovery = LibraryDiscovery(
+                self.file_index_repo, AUDIO_EXTENSIONS, db_lock=self._db_lock
+            )
+            current_scan_id, cursor, restored = await self._begin_scan_record(
+                incremental, resume, scan_id
+            )
+            stats["scan_id"] = current_scan_id
+            if restored:
+                stats.update(restored)
+                stats["resumed_from"] = cursor
+                discovery.total_files = restored.get("total_files", 0)
+                discovery.unchanged_files = restored.get("skipped", 0)
+
+            async def save_checkpoint(last_directory: str | None) -> None:
+                nonlocal cursor
+                cursor = last_directory or cursor
+                await self._save_checkpoint(
+                    current_scan_id, cursor, incremental, stats, discovery
+                )
+
+            await self._run_import_pipeline(
+                discovery,
+                discovery.iter_directories(
+                    self.music_path, incremental=incremental, resume_after=cursor
+                ),
+                stats,
+                progress_callback=progress_callback,
+                on_commit=save_checkpoint,
+            )
 
+            stats["total_files"] = discovery.total_files
+            stats["skipped"] = discovery.unchanged_files
+            await self.scan_repo.finish(
+                current_scan_id,
+                "completed",
+                total_files=stats["total_files"],
+                scanned_files=stats["scanned"],
+                new_files=stats["new_tracks"],
+            )
             await self.session.commit()
             stats["completed_at"] = datetime.now(UTC).isoformat()
 
             logger.info(
-                f"Library scan complete: {stats['imported']} imported, "
-                f"{stats['skipped']} skipped, {stats['errors']} errors"
+                f"Library scan complete: {stats['total_files']} files, "
+                f"{stats['imported']} imported, {stats['skipped']} unchanged "
+                f"({discovery.skipped_directories} directories skipped, "
+                f"{discovery.resumed_directories} resumed past), "
+                f"{stats['errors']} errors"
             )
 
         except Exception as e:
             logger.error(f"Library scan failed: {e}")
             stats["error"] = str(e)
+            if current_scan_id is not None:
+                await self._fail_scan_record(current_scan_id, stats, str(e))
 
         return stats
 
-    def _discover_audio_files(self, directory: Path) -> list[Path]:
-        """Recursively discover all audio files in directory.
-
-        Args:
-            directory: Root directory to scan
+    async def _begin_scan_record(
+        self, incremental: bool, resume: bool, scan_id: str | None
+    ) -> tuple[str, str | None, dict[str, Any]]:
+        """Resume an interrupted scan record or create a new one.
 
         Returns:
-            List of audio file paths
+            Tuple of (scan_id, cursor, restored stats); cursor/stats are empty
+            for fresh scans
         """
-        audio_files: list[Path] = []
-        for root, _, files in os.walk(directory):
-            for filename in files:
-                if Path(filename).suffix.lower() in AUDIO_EXTENSIONS:
-                    audio_files.append(Path(root) / filename)
-        return audio_files
+        scan_path = str(self.music_path)
+        previous = (
+            await self.scan_repo.get(scan_id)
+            if scan_id
+            else await self.scan_repo.get_resumable(scan_path)
+        )
+        if previous is not None and previous.checkpoint is not None:
+            checkpoint = previous.checkpoint
+            if (
+                resume
+                and previous.scan_path == scan_path
+                and previous.status in self.scan_repo.RESUMABLE_STATUSES
+                and checkpoint.get("incremental") == incremental
+            ):
+                previous.status = "running"
+                previous.error_message = None
+                await self.session.commit()
+                logger.info(
+                    f"Resuming library scan {previous.id} after "
+                    f"{checkpoint.get('cursor') or 'start of library'}"
+                )
+                return previous.id, checkpoint.get("cursor"), checkpoint.get("stats", {})
+            # Superseded by a fresh scan - its checkpoint would never match again
+            await self.scan_repo.finish(previous.id, "cancelled")
 
-    async def _filter_changed_files(self, files: list[Path]) -> list[Path]:
-        """Filter to only new or modified files (incremental scan).
+        new_id = await self.scan_repo.create(
+            scan_path, {"cursor": None, "incremental": incremental, "stats": {}}
+        )
+        await self.session.commit()
+        return new_id, None, {}
 
-        Compares file mtime with last_scanned_at in database.
+    async def _save_checkpoint(
+        self,
+        scan_id: str,
+        cursor: str | None,
+        incremental: bool,
+        stats: dict[str, Any],
+        discovery: LibraryDiscovery,
+    ) -> None:
+        """Write the checkpoint for the batch being committed (caller commits)."""
+        snapshot = {key: stats[key] for key in CHECKPOINT_STAT_KEYS}
+        snapshot["total_files"] = discovery.total_files
+        snapshot["skipped"] = discovery.unchanged_files
+        snapshot["error_files"] = stats["error_files"][-CHECKPOINT_ERROR_FILES_LIMIT:]
+        await self.scan_repo.save_checkpoint(
+            scan_id,
+            {"cursor": cursor, "incremental": incremental, "stats": snapshot},
+            total_files=discovery.total_files,
+            scanned_files=stats["scanned"],
+        )
+
+    async def _fail_scan_record(
+        self, scan_id: str, stats: dict[str, Any], error: str
+    ) -> None:
+        """Mark a scan as failed but keep its last committed checkpoint."""
+        try:
+            await self.session.rollback()
+            await self.scan_repo.finish(
+                scan_id,
+                "failed",
+                total_files=stats["total_files"],
+                scanned_files=stats["scanned"],
+                new_files=stats["new_tracks"],
+                error_message=error,
+                keep_checkpoint=True,
+            )
+            await self.session.commit()
+        except Exception as e:
+            logger.warning(f"Could not mark library scan {scan_id} as failed: {e}")
+
+    # Hey future me - this is the INCREMENTAL INDEXING entry point for filesystem watcher batches!
+    # Same pipeline as scan_library, but discovery only looks at the changed paths (see
+    # LibraryDiscovery.iter_paths) - no tree walk. Paths outside the music dir are ignored, deleted
+    # paths just drop their fingerprint rows (like a full scan does).
+    async def scan_paths(
+        self,
+        paths: list[Path],
+        progress_callback: Any | None = None,
+    ) -> dict[str, Any]:
+        """Scan only the given files/directories below the music path.
 
         Args:
-            files: List of all audio file paths
+            paths: Changed file or directory paths (may include deleted ones)
+            progress_callback: Optional callback for progress updates
 
         Returns:
-            List of files that are new or modified since last scan
+            Dict with scan statistics (same keys as scan_library)
         """
-        # Get all known file paths with their last_scanned_at
-        stmt = select(TrackModel.file_path, TrackModel.last_scanned_at).where(
-            TrackModel.file_path.isnot(None)
-        )
-        result = await self.session.execute(stmt)
-        known_files = {row[0]: row[1] for row in result.all()}
+        stats = self._new_stats()
+        music_path = self.music_path.resolve()
+        targets = [p for p in paths if Path(p).resolve().is_relative_to(music_path)]
 
-        changed_files = []
-        for file_path in files:
-            path_str = str(file_path)
+        try:
+            if targets:
+                await self._load_caches()
+                discovery = LibraryDiscovery(
+                    self.file_index_repo, AUDIO_EXTENSIONS, db_lock=self._db_lock
+                )
+                await self._run_import_pipeline(
+                    discovery,
+                    discovery.iter_paths(targets),
+                    stats,
+                    progress_callback=progress_callback,
+                    estimated_total=len(targets),
+                )
+                stats["total_files"] = discovery.total_files
+                stats["skipped"] = discovery.unchanged_files
+                await self.session.commit()
+            stats["completed_at"] = datetime.now(UTC).isoformat()
 
-            # New file (not in DB)
-            if path_str not in known_files:
-                changed_files.append(file_path)
-                continue
+            logger.info(
+                f"Indexed {len(targets)} changed path(s): {stats['imported']} imported, "
+                f"{stats['skipped']} unchanged, {stats['errors']} errors"
+            )
 
-            # Check if modified since last scan
-            last_scanned = known_files[path_str]
-            if last_scanned:
-                file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime, tz=UTC)
-                if file_mtime > last_scanned:
-                    changed_files.append(file_path)
+        except Exception as e:
+            logger.error(f"Incremental path scan failed: {e}")
+            stats["error"] = str(e)
 
-        return changed_files
+        return stats
+
+    @staticmethod
+    def _new_stats() -> dict[str, Any]:
+        """Empty scan statistics dict."""
+        return {
+            "started_at": datetime.now(UTC).isoformat(),
+            "completed_at": None,
+            "total_files": 0,
+            "scanned": 0,
+            "imported": 0,
+            "skipped": 0,
+            "errors": 0,
+            "error_files": [],
+            "new_artists": 0,
+            "new_albums": 0,
+            "new_tracks": 0,
+            "matched_artists": 0,
+            "matched_albums": 0,
+        }
+
+    async def _split_known_files(
+        self, files: list[FileFingerprint]
+    ) -> tuple[list[FileFingerprint], list[FileFingerprint]]:
+        """Split changed files of one directory into (known, new) by track file_path.
+
+        Known files only get their last_scanned_at bumped (one UPDATE per directory).
+        """
+        if not files:
+            return [], []
+
+        paths = [f.path for f in files]
+        async with self._db_lock:
+            result = await self.session.execute(
+                select(TrackModel.file_path).where(TrackModel.file_path.in_(paths))
+            )
+            known_paths = set(result.scalars().all())
+            if known_paths:
+                await self.session.execute(
+                    update(TrackModel)
+                    .where(TrackModel.file_path.in_(known_paths))
+                    .values(last_scanned_at=datetime.now(UTC))
+                )
+
+        known = [f for f in files if f.path in known_paths]
+        new = [f for f in files if f.path not in known_paths]
+        return known, new
+
+    # =========================================================================
+    # SCAN PIPELINE
+    # =========================================================================
+
+    # Hey future me - this is the staged scan engine! Four stages:
+    # 0. DISCOVERY (LibraryDiscovery) streams one directory at a time via scandir and only hands
+    #    over files whose (size, mtime_ns, inode) fingerprint differs from library_file_index.
+    # 1. PRODUCER task submits read_audio_file() for each new path to the worker pool and puts the
+    #    resulting future into a BOUNDED asyncio.Queue. When the queue is full, the producer
+    #    blocks -> that's our backpressure. At most scan_queue_size results wait for the writer.
+    #    After a directory's files it enqueues the directory fingerprint itself as a marker.
+    # 2. WORKER POOL parses tags + hashes (off the event loop, so the API stays responsive).
+    # 3. WRITER (this coroutine) awaits futures IN ORDER and does all DB work with the single
+    #    session - AsyncSession is NOT safe for concurrent use, so every session call (writer AND
+    #    the producer's discovery queries) happens under self._db_lock.
+    #    It commits every scan_batch_size files, flushing buffered fingerprints in the same
+    #    transaction. Failed files get no fingerprint, so they're retried next scan. A directory's
+    #    fingerprint is only written once all its files are through - crash = rescan that dir.
+    # If the writer blows up, the finally block cancels the producer and drops queued pool work.
+    async def _run_import_pipeline(
+        self,
+        discovery: LibraryDiscovery,
+        directories: AsyncIterator[DiscoveredDirectory],
+        stats: dict[str, Any],
+        progress_callback: Any | None = None,
+        estimated_total: int | None = None,
+        on_commit: Callable[[str | None], Awaitable[None]] | None = None,
+    ) -> None:
+        """Discover, read and import files through the staged pipeline.
+
+        Args:
+            discovery: Streaming discovery stage (for its counters)
+            directories: Output of discovery.iter_directories() / iter_paths()
+            stats: Scan statistics dict (updated in place)
+            progress_callback: Optional callback for progress updates
+            estimated_total: Expected file count (default: indexed library size)
+            on_commit: Awaited right before every batch commit (inside the same
+                transaction) with the last directory whose files are all done
+        """
+        library_settings = self.settings.library
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[
+            tuple[FileFingerprint, asyncio.Future[ScannedFile] | None] | None
+        ] = asyncio.Queue(maxsize=library_settings.scan_queue_size)
+        executor = self._create_executor()
+
+        # Progress is estimated against the last known library size - discovery streams, so
+        # the real total is only known at the very end.
+        if estimated_total is None:
+            async with self._db_lock:
+                estimated_total = await self.file_index_repo.count_files()
+
+        async def produce() -> None:
+            try:
+                async for found in directories:
+                    known, new = await self._split_known_files(found.changed_files)
+                    stats["scanned"] += len(known)
+                    stats["imported"] += len(known)
+                    for fingerprint in known:
+                        await queue.put((fingerprint, None))
+                    for fingerprint in new:
+                        future = loop.run_in_executor(
+                            executor,
+                            read_audio_file,
+                            Path(fingerprint.path),
+                            fingerprint.size,
+                            library_settings.hash_mode,
+                        )
+                        await queue.put((fingerprint, future))
+                    if found.fingerprint is not None:
+                        await queue.put((found.fingerprint, None))
+            finally:
+                await queue.put(None)
+
+        async def report_progress() -> None:
+            if not progress_callback:
+                return
+            total = max(estimated_total, discovery.total_files, 1)
+            processed = discovery.unchanged_files + stats["scanned"] + stats["errors"]
+            await progress_callback(min(processed / total * 100, 100.0), stats)
+
+        async def commit() -> None:
+            if on_commit is not None:
+                await on_commit(last_directory)
+            await self._commit_batch(pending_rows)
+
+        producer = asyncio.create_task(produce())
+        pending_rows: list[dict[str, Any]] = []
+        last_directory: str | None = None
+        uncommitted = 0
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+
+                fingerprint, future = item
+                if future is None:
+                    pending_rows.append(fingerprint.as_row())
+                    if fingerprint.is_directory:
+                        # Markers come after all files of their directory
+                        last_directory = fingerprint.path
+                    continue
+
+                scanned = await future
+                async with self._db_lock:
+                    try:
+                        result = await self._import_scanned_file(scanned)
+                        stats["scanned"] += 1
+                        self._apply_import_result(stats, result)
+                        pending_rows.append(fingerprint.as_row())
+                    except Exception as e:
+                        stats["errors"] += 1
+                        stats["error_files"].append(
+                            {"path": str(scanned.path), "error": str(e)}
+                        )
+                        logger.warning(f"Error importing {scanned.path}: {e}")
+
+                    uncommitted += 1
+                    if uncommitted >= library_settings.scan_batch_size:
+                        await commit()
+                        uncommitted = 0
+
+                await report_progress()
+
+            await producer
+            async with self._db_lock:
+                await commit()
+            if progress_callback:
+                await progress_callback(100.0, stats)
+        finally:
+            if not producer.done():
+                producer.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _commit_batch(self, pending_rows: list[dict[str, Any]]) -> None:
+        """Persist buffered fingerprints and commit the current batch.
+
+        Caller must hold self._db_lock. ``pending_rows`` is cleared in place.
+        """
+        await self._flush_tracks()
+        if pending_rows:
+            await self.file_index_repo.upsert_many(pending_rows)
+            pending_rows.clear()
+        await self.session.commit()
+
+    async def _flush_tracks(self) -> None:
+        """Write buffered track rows via one bulk upsert per chunk."""
+        if not self._pending_tracks:
+            return
+        await self.track_repo.bulk_upsert(self._pending_tracks, conflict_key="file_path")
+        self._pending_tracks.clear()
+
+    def _create_executor(self) -> Executor:
+        """Create the worker pool for the scan read stage."""
+        workers = self.settings.library.scan_workers
+        if self.settings.library.scan_executor == "process":
+            return ProcessPoolExecutor(max_workers=workers)
+        return ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="library-scan"
+        )
+
+    @staticmethod
+    def _apply_import_result(stats: dict[str, Any], result: dict[str, Any]) -> None:
+        """Fold a single file import result into the scan statistics."""
+        if not result["imported"]:
+            return
+        stats["imported"] += 1
+        for key in (
+            "new_artist",
+            "matched_artist",
+            "new_album",
+            "matched_album",
+            "new_track",
+        ):
+            if result.get(key):
+                stats[f"{key}s"] += 1
 
     # =========================================================================
     # FILE IMPORT
@@ -259,7 +615,9 @@ class LibraryScannerService:
     async def _import_file(self, file_path: Path) -> dict[str, Any]:
         """Import a single audio file into the database.
 
-        Extracts metadata, finds/creates artist and album, creates track.
+        Convenience path for one-off imports outside of scan_library(). The read
+        stage runs in a thread so the event loop is not blocked. Re-importing a
+        known path updates the existing track (upsert on file_path).
 
         Args:
             file_path: Path to audio file
@@ -267,6 +625,27 @@ class LibraryScannerService:
         Returns:
             Dict with import result (imported, new_artist, matched_artist, etc.)
         """
+        scanned = await asyncio.to_thread(
+            read_audio_file, file_path, None, self.settings.library.hash_mode
+        )
+        result = await self._import_scanned_file(scanned)
+        await self._flush_tracks()
+        return result
+
+    async def _import_scanned_file(self, scanned: ScannedFile) -> dict[str, Any]:
+        """Write stage: import an already-read file into the database.
+
+        Finds/creates artist and album, creates track.
+
+        Args:
+            scanned: Output of read_audio_file()
+
+        Returns:
+            Dict with import result (imported, new_artist, matched_artist, etc.)
+
+        Raises:
+            ValueError: If the read stage failed for this file
+        """
         result = {
             "imported": False,
             "new_artist": False,
@@ -276,18 +655,13 @@ class LibraryScannerService:
             "new_track": False,
         }
 
-        # Check if track already exists by file path
-        existing = await self._get_track_by_file_path(file_path)
-        if existing:
-            # Update last_scanned_at
-            existing.last_scanned_at = datetime.now(UTC)
-            result["imported"] = True
-            return result
+        if scanned.error or not scanned.metadata:
+            raise ValueError(
+                scanned.error or f"Could not extract metadata from {scanned.path}"
+            )
 
-        # Extract metadata
-        metadata = self._extract_metadata(file_path)
-        if not metadata:
-            raise ValueError(f"Could not extract metadata from {file_path}")
+        file_path = scanned.path
+        metadata = scanned.metadata
 
         artist_name = metadata.get("artist", "Unknown Artist")
         album_name = metadata.get("album")
@@ -335,225 +709,73 @@ class LibraryScannerService:
         )
 
         # Add file metadata to track model directly
-        await self._add_track_with_file_info(track, file_path, metadata)
+        await self._add_track_with_file_info(track, scanned)
 
         result["imported"] = True
         result["new_track"] = True
         return result
 
+    # Hey future me - tracks are NOT session.add()-ed one by one anymore! Rows are buffered here and
+    # written by _flush_tracks() through TrackRepository.bulk_upsert (multi-row INSERT ... ON
+    # CONFLICT (file_path) DO UPDATE) at every batch commit -> a few round trips per thousand files.
+    # The upsert also makes re-imports of a known path idempotent instead of a duplicate row.
     async def _add_track_with_file_info(
         self,
         track: Track,
-        file_path: Path,
-        metadata: dict[str, Any],
+        scanned: ScannedFile,
     ) -> None:
-        """Add track with additional file info (hash, size, format, etc.)."""
+        """Buffer track row with additional file info (hash, size, format, etc.)."""
+        metadata = scanned.metadata or {}
         primary_genre = track.genres[0] if track.genres else None
 
-        model = TrackModel(
-            id=str(track.id.value),
-            title=track.title,
-            artist_id=str(track.artist_id.value),
-            album_id=str(track.album_id.value) if track.album_id else None,
-            duration_ms=track.duration_ms,
-            track_number=track.track_number,
-            disc_number=track.disc_number,
-            file_path=str(track.file_path) if track.file_path else None,
-            genre=primary_genre,
-            # File info
-            file_size=file_path.stat().st_size,
-            file_hash=self._compute_file_hash(file_path),
-            file_hash_algorithm="sha256",
-            audio_bitrate=metadata.get("bitrate"),
-            audio_format=metadata.get("format"),
-            audio_sample_rate=metadata.get("sample_rate"),
-            last_scanned_at=datetime.now(UTC),
-            is_broken=False,
-            created_at=track.created_at,
-            updated_at=track.updated_at,
-        )
-        self.session.add(model)
-
-    async def _get_track_by_file_path(self, file_path: Path) -> TrackModel | None:
-        """Get track by file path."""
-        stmt = select(TrackModel).where(TrackModel.file_path == str(file_path))
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
-
-    # =========================================================================
-    # METADATA EXTRACTION
-    # =========================================================================
-
-    def _extract_metadata(self, file_path: Path) -> dict[str, Any] | None:
-        """Extract audio metadata using mutagen.
-
-        Args:
-            file_path: Path to audio file
-
-        Returns:
-            Dict with metadata or None if extraction failed
-        """
-        try:
-            audio = MutagenFile(file_path)
-            if audio is None:
-                return None
-
-            metadata: dict[str, Any] = {
-                "format": file_path.suffix.lstrip(".").lower(),
+        self._pending_tracks.append(
+            {
+                "id": str(track.id.value),
+                "title": track.title,
+                "artist_id": str(track.artist_id.value),
+                "album_id": str(track.album_id.value) if track.album_id else None,
+                "duration_ms": track.duration_ms,
+                "track_number": track.track_number,
+                "disc_number": track.disc_number,
+                "file_path": str(track.file_path) if track.file_path else None,
+                "genre": primary_genre,
+                # File info
+                "file_size": scanned.size,
+                "file_hash": scanned.file_hash,
+                "file_hash_algorithm": scanned.hash_algorithm,
+                "audio_bitrate": metadata.get("bitrate"),
+                "audio_format": metadata.get("format"),
+                "audio_sample_rate": metadata.get("sample_rate"),
+                "last_scanned_at": datetime.now(UTC),
+                "is_broken": not scanned.is_valid,
+                "created_at": track.created_at,
+                "updated_at": track.updated_at,
             }
-
-            # Duration
-            if hasattr(audio.info, "length"):
-                metadata["duration_ms"] = int(audio.info.length * 1000)
-
-            # Audio quality
-            if hasattr(audio.info, "bitrate"):
-                metadata["bitrate"] = audio.info.bitrate
-            if hasattr(audio.info, "sample_rate"):
-                metadata["sample_rate"] = audio.info.sample_rate
-
-            # Extract tags based on format
-            if hasattr(audio, "tags") and audio.tags:
-                metadata.update(self._extract_tags(audio))
-
-            return metadata
-
-        except Exception as e:
-            logger.warning(f"Error extracting metadata from {file_path}: {e}")
-            return None
-
-    def _extract_tags(self, audio: Any) -> dict[str, Any]:
-        """Extract common tags from audio file.
-
-        Handles different tag formats (ID3, Vorbis, MP4).
-        Now also extracts album_artist (TPE2) for compilation detection!
-        """
-        tags: dict[str, Any] = {}
-
-        # Hey future me - TPE2 (Album Artist) is crucial for compilation detection!
-        # If TPE2 is "Various Artists" but TPE1 (track artist) is different, it's likely
-        # a compilation. Common patterns:
-        # - Various Artists / VA / V.A. -> compilation
-        # - Same as album title (like "Soundtrack") -> compilation
-        # Try common tag mappings
-        tag_mappings = {
-            # ID3 (MP3)
-            "TIT2": "title",
-            "TPE1": "artist",
-            "TPE2": "album_artist",  # Album Artist - crucial for compilations!
-            "TALB": "album",
-            "TRCK": "track_number",
-            "TPOS": "disc_number",
-            "TYER": "year",
-            "TDRC": "year",
-            "TCON": "genre",
-            "TCMP": "compilation",  # iTunes compilation flag (1 = compilation)
-            # Vorbis (FLAC, OGG)
-            "title": "title",
-            "artist": "artist",
-            "albumartist": "album_artist",  # Album artist for Vorbis
-            "album artist": "album_artist",  # Alternative spelling
-            "album": "album",
-            "tracknumber": "track_number",
-            "discnumber": "disc_number",
-            "date": "year",
-            "genre": "genre",
-            "compilation": "compilation",  # Vorbis compilation flag
-            # MP4 (M4A)
-            "©nam": "title",
-            "©ART": "artist",
-            "aART": "album_artist",  # MP4 Album Artist
-            "©alb": "album",
-            "©day": "year",
-            "©gen": "genre",
-            "trkn": "track_number",
-            "disk": "disc_number",
-            "cpil": "compilation",  # MP4 compilation flag
-        }
-
-        audio_tags = audio.tags
-        if not audio_tags:
-            return tags
-
-        for tag_key, field_name in tag_mappings.items():
-            if tag_key in audio_tags:
-                value = audio_tags[tag_key]
-
-                # Handle different value types
-                if isinstance(value, list) and value:
-                    value = value[0]
-                if hasattr(value, "text"):
-                    value = (
-                        value.text[0] if isinstance(value.text, list) else value.text
-                    )
-
-                # Parse track/disc numbers (might be "1/12" format)
-                if field_name in ("track_number", "disc_number"):
-                    if isinstance(value, tuple):
-                        value = value[0]
-                    elif isinstance(value, str) and "/" in value:
-                        value = value.split("/")[0]
-                    try:
-                        value = int(value)
-                    except (ValueError, TypeError):
-                        value = None
-
-                # Parse year
-                if field_name == "year" and value:
-                    try:
-                        value = int(str(value)[:4])
-                    except (ValueError, TypeError):
-                        value = None
-
-                # Parse compilation flag (can be "1", "true", True, etc.)
-                if field_name == "compilation" and value:
-                    if isinstance(value, bool):
-                        value = value
-                    elif isinstance(value, (int, float)):
-                        value = bool(value)
-                    elif isinstance(value, str):
-                        value = value.lower() in ("1", "true", "yes")
-                    else:
-                        value = False
-
-                if value is not None:
-                    tags[field_name] = value
-
-        return tags
-
-    def _compute_file_hash(self, file_path: Path, chunk_size: int = 8192) -> str:
-        """Compute SHA256 hash of file for deduplication."""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        )
 
     # =========================================================================
     # FUZZY MATCHING
     # =========================================================================
 
     async def _load_caches(self) -> None:
-        """Pre-load artist and album names for fuzzy matching."""
+        """Pre-load artist and album names into the fuzzy resolvers."""
         # Load all artists
         artist_stmt = select(ArtistModel.id, ArtistModel.name)
         result = await self.session.execute(artist_stmt)
         for row in result.all():
-            artist_id = ArtistId.from_string(row[0])
-            self._artist_cache[row[1].lower()] = artist_id
+            self._artist_resolver.add(row[1], ArtistId.from_string(row[0]))
 
         # Load all albums
         album_stmt = select(AlbumModel.id, AlbumModel.title, AlbumModel.artist_id)
         result = await self.session.execute(album_stmt)
         for row in result.all():
-            album_id = AlbumId.from_string(row[0])
-            # Key: "album_title|artist_id" for uniqueness
-            cache_key = f"{row[1].lower()}|{row[2]}"
-            self._album_cache[cache_key] = album_id
+            self._album_resolver.add(
+                row[1], AlbumId.from_string(row[0]), scope=row[2]
+            )
 
         logger.debug(
-            f"Loaded caches: {len(self._artist_cache)} artists, "
-            f"{len(self._album_cache)} albums"
+            f"Loaded caches: {len(self._artist_resolver)} artists, "
+            f"{len(self._album_resolver)} albums"
         )
 
     async def _find_or_create_artist(self, name: str) -> tuple[ArtistId, bool, bool]:
@@ -565,28 +787,14 @@ class LibraryScannerService:
         Returns:
             Tuple of (artist_id, is_new, is_fuzzy_matched)
         """
-        name_lower = name.lower()
-
-        # Exact match first
-        if name_lower in self._artist_cache:
-            return self._artist_cache[name_lower], False, False
-
-        # Fuzzy match
-        best_match: str | None = None
-        best_score: float = 0.0
-
-        for cached_name in self._artist_cache:
-            score = fuzz.ratio(name_lower, cached_name)
-            if score > best_score:
-                best_score = score
-                best_match = cached_name
-
-        # Use fuzzy match if above threshold
-        if best_match and best_score >= self.FUZZY_THRESHOLD:
-            logger.debug(
-                f"Fuzzy matched artist '{name}' to '{best_match}' (score: {best_score})"
-            )
-            return self._artist_cache[best_match], False, True
+        match = self._artist_resolver.resolve(name)
+        if match:
+            if not match.exact:
+                logger.debug(
+                    f"Fuzzy matched artist '{name}' to '{match.name}' "
+                    f"(score: {match.score})"
+                )
+            return match.key, False, not match.exact
 
         # Create new artist
         artist = Artist(
@@ -597,8 +805,8 @@ class LibraryScannerService:
         )
         await self.artist_repo.add(artist)
 
-        # Add to cache
-        self._artist_cache[name_lower] = artist.id
+        # Add to index
+        self._artist_resolver.add(name, artist.id)
         logger.debug(f"Created new artist: {name}")
 
         return artist.id, True, False
@@ -625,32 +833,14 @@ class LibraryScannerService:
         Returns:
             Tuple of (album_id, is_new, is_fuzzy_matched)
         """
-        title_lower = title.lower()
         artist_id_str = str(artist_id.value)
 
-        # Exact match first
-        cache_key = f"{title_lower}|{artist_id_str}"
-        if cache_key in self._album_cache:
-            return self._album_cache[cache_key], False, False
-
-        # Fuzzy match (only for same artist)
-        best_match_key: str | None = None
-        best_score: float = 0.0
-
-        for cached_key, _cached_album_id in self._album_cache.items():
-            cached_title, cached_artist = cached_key.rsplit("|", 1)
-            if cached_artist != artist_id_str:
-                continue
-
-            score = fuzz.ratio(title_lower, cached_title)
-            if score > best_score:
-                best_score = score
-                best_match_key = cached_key
-
-        # Use fuzzy match if above threshold
-        if best_match_key and best_score >= self.FUZZY_THRESHOLD:
-            logger.debug(f"Fuzzy matched album '{title}' (score: {best_score})")
-            return self._album_cache[best_match_key], False, True
+        # Exact or fuzzy match (only for same artist)
+        match = self._album_resolver.resolve(title, scope=artist_id_str)
+        if match:
+            if not match.exact:
+                logger.debug(f"Fuzzy matched album '{title}' (score: {match.score})")
+            return match.key, False, not match.exact
 
         # Determine secondary_types (compilation detection)
         # Hey future me - compilation is detected if:
@@ -671,19 +861,23 @@ class LibraryScannerService:
             updated_at=datetime.now(UTC),
         )
         
-        # Add album via repository, then update model directly for new fields
-        await self.album_repo.add(album)
-        
-        # Get the model and set the new fields (album_artist, secondary_types)
-        # Hey - we need to update the model directly because Album entity doesn't have these yet
-        stmt = select(AlbumModel).where(AlbumModel.id == str(album.id.value))
-        result = await self.session.execute(stmt)
-        album_model = result.scalar_one()
-        album_model.album_artist = album_artist
-        album_model.secondary_types = secondary_types
-
-        # Add to cache
-        self._album_cache[cache_key] = album.id
+        # Hey - we build the model directly because the Album entity doesn't have album_artist /
+        # secondary_types yet. (The old add-then-SELECT-back cost a flush + query per new album.)
+        self.session.add(
+            AlbumModel(
+                id=str(album.id.value),
+                title=album.title,
+                artist_id=artist_id_str,
+                release_year=album.release_year,
+                album_artist=album_artist,
+                secondary_types=secondary_types,
+                created_at=album.created_at,
+                updated_at=album.updated_at,
+            )
+        )
+
+        # Add to index
+        self._album_resolver.add(title, album.id, scope=artist_id_str)
         logger.debug(f"Created new album: {title}")
 
         return album.id, True, False
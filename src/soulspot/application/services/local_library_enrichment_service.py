@@ -33,11 +33,11 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-from rapidfuzz import fuzz
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from soulspot.application.services.app_settings_service import AppSettingsService
+from soulspot.application.services.fuzzy_resolver import score_names
 from soulspot.application.services.spotify_image_service import SpotifyImageService
 from soulspot.domain.entities import Album, Artist
 from soulspot.domain.value_objects import SpotifyUri
@@ -50,6 +50,7 @@ from soulspot.infrastructure.persistence.repositories import (
 if TYPE_CHECKING:
     from soulspot.config import Settings
     from soulspot.domain.ports import ISpotifyClient
+    from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +110,7 @@ class LocalLibraryEnrichmentService:
         spotify_client: "ISpotifyClient",
         settings: "Settings",
         access_token: str,
+        http: HttpClientRegistry | None = None,
     ) -> None:
         """Initialize enrichment service.
 
@@ -117,6 +119,7 @@ class LocalLibraryEnrichmentService:
             spotify_client: Spotify API client
             settings: Application settings
             access_token: Spotify OAuth access token
+            http: Optional registry providing pooled HTTP clients (image downloads)
         """
         self._session = session
         self._spotify_client = spotify_client
@@ -129,7 +132,7 @@ class LocalLibraryEnrichmentService:
 
         # Services
         self._settings_service = AppSettingsService(session)
-        self._image_service = SpotifyImageService(settings)
+        self._image_service = SpotifyImageService(settings, http=http)
 
     # =========================================================================
     # MAIN BATCH ENRICHMENT
@@ -341,7 +344,12 @@ class LocalLibraryEnrichmentService:
         """
         candidates = []
 
-        for sp_artist in spotify_artists:
+        # One batched rapidfuzz call for all names instead of fuzz.ratio per candidate
+        name_scores = score_names(
+            local_name, (sp_artist.get("name", "") for sp_artist in spotify_artists)
+        )
+
+        for sp_artist, raw_name_score in zip(spotify_artists, name_scores, strict=True):
             sp_name = sp_artist.get("name", "")
             sp_uri = sp_artist.get("uri", "")
             sp_popularity = sp_artist.get("popularity", 0) / 100.0  # Normalize to 0-1
@@ -352,8 +360,8 @@ class LocalLibraryEnrichmentService:
             images = sp_artist.get("images", [])
             sp_image_url = images[0]["url"] if images else None
 
-            # Calculate name similarity (0-100, normalize to 0-1)
-            name_score = fuzz.ratio(local_name.lower(), sp_name.lower()) / 100.0
+            # Name similarity (0-100, normalize to 0-1)
+            name_score = raw_name_score / 100.0
 
             # Combined score: 70% name, 30% popularity
             # Hey future me - popularity matters because "Pink Floyd" the tribute band
@@ -595,7 +603,21 @@ class LocalLibraryEnrichmentService:
         """
         candidates = []
 
-        for sp_album in spotify_albums:
+        # Batched scoring: one rapidfuzz call per field instead of one per candidate
+        title_scores = score_names(
+            local_title, (sp_album.get("name", "") for sp_album in spotify_albums)
+        )
+        artist_scores = score_names(
+            local_artist,
+            (
+                sp_album["artists"][0]["name"] if sp_album.get("artists") else ""
+                for sp_album in spotify_albums
+            ),
+        )
+
+        for sp_album, raw_title_score, raw_artist_score in zip(
+            spotify_albums, title_scores, artist_scores, strict=True
+        ):
             sp_title = sp_album.get("name", "")
             sp_uri = sp_album.get("uri", "")
             sp_artists = sp_album.get("artists", [])
@@ -608,8 +630,8 @@ class LocalLibraryEnrichmentService:
             sp_image_url = images[0]["url"] if images else None
 
             # Calculate scores
-            title_score = fuzz.ratio(local_title.lower(), sp_title.lower()) / 100.0
-            artist_score = fuzz.ratio(local_artist.lower(), sp_artist_name.lower()) / 100.0
+            title_score = raw_title_score / 100.0
+            artist_score = raw_artist_score / 100.0
 
             # Combined score
             confidence = (title_score * 0.5) + (artist_score * 0.5)
@@ -9,8 +9,13 @@ from typing import Any
 import httpx
 from PIL import Image as PILImage
 
+from soulspot.application.cache import MusicBrainzCache
 from soulspot.config import Settings
 from soulspot.domain.entities import Album, Track
+from soulspot.infrastructure.integrations.http_clients import (
+    HttpClientRegistry,
+    http_client,
+)
 from soulspot.infrastructure.security import PathValidator
 
 logger = logging.getLogger(__name__)
@@ -33,15 +38,21 @@ class ArtworkService:
         self,
         settings: Settings,
         spotify_client: Any | None = None,
+        musicbrainz_cache: MusicBrainzCache | None = None,
+        http: HttpClientRegistry | None = None,
     ) -> None:
         """Initialize artwork service.
 
         Args:
             settings: Application settings
             spotify_client: Optional Spotify client for artwork fallback
+            musicbrainz_cache: Optional cache remembering releases without a CoverArtArchive front
+            http: Optional registry providing the shared pooled HTTP client
         """
         self._settings = settings
         self._spotify_client = spotify_client
+        self._musicbrainz_cache = musicbrainz_cache
+        self._http = http
         self._artwork_path = settings.storage.artwork_path
         self._max_size = settings.postprocessing.artwork_max_size
         self._quality = settings.postprocessing.artwork_quality
@@ -106,7 +117,8 @@ class ArtworkService:
     # Hey future me: CoverArtArchive downloader - free high-quality album art source
     # WHY /front endpoint? Gets front cover specifically (not back, booklet, etc)
     # follow_redirects=True because CAA returns 307 redirect to actual image URL
-    # 404 is normal (album doesn't have artwork), don't spam error logs
+    # 404 is normal (album doesn't have artwork), don't spam error logs - and with a cache it's
+    # remembered (negative TTL), so every track of a cover-less album asks CAA only once
     async def _download_from_coverart(self, release_id: str) -> bytes | None:
         """Download artwork from CoverArtArchive.
 
@@ -116,9 +128,16 @@ class ArtworkService:
         Returns:
             Processed artwork data or None
         """
+        if self._musicbrainz_cache is not None and (
+            await self._musicbrainz_cache.is_not_found("cover_art", release_id)
+        ):
+            logger.debug("No artwork on CoverArtArchive for: %s (cached)", release_id)
+            return None
         try:
             url = f"{self.COVERART_API_BASE}/release/{release_id}/front"
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_client(
+                self._http, "coverartarchive", timeout=30.0
+            ) as client:
                 response = await client.get(url, follow_redirects=True)
                 response.raise_for_status()
                 image_data = response.content
@@ -126,6 +145,10 @@ class ArtworkService:
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 logger.debug("No artwork found on CoverArtArchive for: %s", release_id)
+                if self._musicbrainz_cache is not None:
+                    await self._musicbrainz_cache.cache_not_found(
+                        "cover_art", release_id
+                    )
             else:
                 logger.warning("Error downloading from CoverArtArchive: %s", e)
             return None
@@ -5,8 +5,13 @@ from typing import Any
 
 import httpx
 
+from soulspot.application.cache import LyricsCache
 from soulspot.config import Settings
 from soulspot.domain.entities import Track
+from soulspot.infrastructure.integrations.http_clients import (
+    HttpClientRegistry,
+    http_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +35,8 @@ class LyricsService:
         settings: Settings,
         genius_api_key: str | None = None,
         musixmatch_api_key: str | None = None,
+        cache: LyricsCache | None = None,
+        http: HttpClientRegistry | None = None,
     ) -> None:
         """Initialize lyrics service.
 
@@ -37,10 +44,16 @@ class LyricsService:
             settings: Application settings
             genius_api_key: Optional Genius API key
             musixmatch_api_key: Optional Musixmatch API key
+            cache: Optional lyrics cache (found lyrics are reused across imports)
+            http: Optional registry providing the shared pooled HTTP clients
         """
         self._settings = settings
         self._genius_api_key = genius_api_key
         self._musixmatch_api_key = musixmatch_api_key
+        self._cache = cache
+        self._http = http
+        # Bumped by every source failure (not by "no lyrics" answers) - see fetch_lyrics()
+        self._source_errors = 0
 
     # Hey future me: Lyrics fetching - the three-source fallback chain
     # WHY LRClib first? It has SYNCED lyrics (LRC format with timestamps) for karaoke/display
@@ -66,6 +79,38 @@ class LyricsService:
             Tuple of (lyrics text, is_synced)
             Returns (None, False) if no lyrics found
         """
+        if self._cache is None:
+            return await self._fetch_uncached(track, artist_name, album_name)
+
+        # Yo, the cache stores a dict, not the tuple - tuples come back from the disk tier as lists.
+        # "No lyrics anywhere" returns None, which the cache remembers as not found (negative
+        # TTL). If a source FAILED meanwhile (timeout, 500) we return {} instead - falsy, so the
+        # caller still gets (None, False), but not cached. The counter is per service, so a
+        # failure in a concurrent lookup can skip a negative write too - harmless, never the reverse.
+        async def fetch() -> dict[str, Any] | None:
+            errors_before = self._source_errors
+            lyrics, is_synced = await self._fetch_uncached(
+                track, artist_name, album_name
+            )
+            if lyrics:
+                return {"lyrics": lyrics, "synced": is_synced}
+            return None if self._source_errors == errors_before else {}
+
+        key = ":".join(
+            [artist_name, track.title, album_name or "", str(track.duration_ms // 1000)]
+        ).lower()
+        found = await self._cache.get_or_fetch("lyrics", key, fetch)
+        if not found:
+            return None, False
+        return found["lyrics"], found["synced"]
+
+    async def _fetch_uncached(
+        self,
+        track: Track,
+        artist_name: str,
+        album_name: str | None,
+    ) -> tuple[str | None, bool]:
+        """Try every lyrics source in order, without the cache."""
         # Try LRClib first (has synced lyrics)
         logger.info("Trying LRClib for: %s - %s", artist_name, track.title)
         lyrics, is_synced = await self._fetch_from_lrclib(
@@ -129,7 +174,7 @@ class LyricsService:
             if duration_ms > 0:
                 params["duration"] = duration_ms // 1000
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_client(self._http, "lrclib", timeout=30.0) as client:
                 response = await client.get(
                     f"{self.LRCLIB_API_BASE}/get",
                     params=params,
@@ -152,9 +197,11 @@ class LyricsService:
             if e.response.status_code == 404:
                 logger.debug("No lyrics found on LRClib")
             else:
+                self._source_errors += 1
                 logger.warning("Error fetching from LRClib: %s", e)
             return None, False
         except Exception as e:
+            self._source_errors += 1
             logger.exception("Error fetching lyrics from LRClib: %s", e)
             return None, False
 
@@ -184,7 +231,7 @@ class LyricsService:
             search_query = f"{artist} {title}"
             headers = {"Authorization": f"Bearer {self._genius_api_key}"}
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_client(self._http, "genius", timeout=30.0) as client:
                 response = await client.get(
                     f"{self.GENIUS_API_BASE}/search",
                     params={"q": search_query},
@@ -204,6 +251,7 @@ class LyricsService:
                 return None
 
         except Exception as e:
+            self._source_errors += 1
             logger.exception("Error fetching lyrics from Genius: %s", e)
             return None
 
@@ -233,7 +281,7 @@ class LyricsService:
                 "f_has_lyrics": 1,
             }
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_client(self._http, "musixmatch", timeout=30.0) as client:
                 # First, search for the track
                 response = await client.get(
                     f"{self.MUSIXMATCH_API_BASE}/track.search",
@@ -275,5 +323,6 @@ class LyricsService:
                 return lyrics_body
 
         except Exception as e:
+            self._source_errors += 1
             logger.exception("Error fetching lyrics from Musixmatch: %s", e)
             return None
@@ -0,0 +1,243 @@
+# Hey future me - this is the SINGLE-PASS scan engine shared by BOTH library scanners!
+# Before, one file was opened up to four times per scan: stat() + hash read in one place, then
+# MutagenFile() for the integrity check, then MutagenFile() AGAIN for the tags (library_scanner.py
+# scan_file), and yet another MutagenFile() + hash open in the import scanner. On a NAS every open
+# is a network round trip and every header parse re-reads the same blocks.
+# Now: ONE open() per file. Mutagen parses the open handle (it only reads the headers/tag blocks it
+# needs), the hash reads from the SAME handle (quick tier: 3 seeks, full tier: one sequential pass),
+# fstat() gives the size, and the broken/valid verdict falls out of the mutagen result we already
+# have. Errors are RETURNED, never raised - this runs in worker pools (import scanner) and in the
+# health scan loop, and one corrupt file must never abort either.
+# Module-level functions on purpose: ProcessPoolExecutor pickles callables by qualified name.
+"""Single-pass audio file scan (tags, hash and integrity verdict from one open)."""
+
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from mutagen import File as MutagenFile
+
+from soulspot.application.services.file_hashing import HashMode, hash_fileobj
+
+logger = logging.getLogger(__name__)
+
+# Hey future me - TPE2 (Album Artist) is crucial for compilation detection!
+# If TPE2 is "Various Artists" but TPE1 (track artist) is different, it's likely
+# a compilation. Common patterns:
+# - Various Artists / VA / V.A. -> compilation
+# - Same as album title (like "Soundtrack") -> compilation
+TAG_MAPPINGS = {
+    # ID3 (MP3)
+    "TIT2": "title",
+    "TPE1": "artist",
+    "TPE2": "album_artist",  # Album Artist - crucial for compilations!
+    "TALB": "album",
+    "TRCK": "track_number",
+    "TPOS": "disc_number",
+    "TYER": "year",
+    "TDRC": "year",
+    "TCON": "genre",
+    "TCMP": "compilation",  # iTunes compilation flag (1 = compilation)
+    # Vorbis (FLAC, OGG)
+    "title": "title",
+    "artist": "artist",
+    "albumartist": "album_artist",  # Album artist for Vorbis
+    "album artist": "album_artist",  # Alternative spelling
+    "album": "album",
+    "tracknumber": "track_number",
+    "discnumber": "disc_number",
+    "date": "year",
+    "genre": "genre",
+    "compilation": "compilation",  # Vorbis compilation flag
+    # MP4 (M4A)
+    "©nam": "title",
+    "©ART": "artist",
+    "aART": "album_artist",  # MP4 Album Artist
+    "©alb": "album",
+    "©day": "year",
+    "©gen": "genre",
+    "trkn": "track_number",
+    "disk": "disc_number",
+    "cpil": "compilation",  # MP4 compilation flag
+}
+
+
+@dataclass
+class ScannedFile:
+    """Result of scanning a single audio file.
+
+    ``error`` means the file could not be read as audio at all (no metadata);
+    ``integrity_error`` is the broken-file verdict and may be set even when
+    metadata was read (e.g. zero-length audio).
+    """
+
+    path: Path
+    size: int = 0
+    metadata: dict[str, Any] | None = None
+    file_hash: str | None = None
+    hash_algorithm: str | None = None
+    error: str | None = None
+    integrity_error: str | None = None
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the file passed the integrity check."""
+        return self.integrity_error is None
+
+
+def extract_tags(audio: Any) -> dict[str, Any]:
+    """Extract common tags from a parsed mutagen file.
+
+    Handles different tag formats (ID3, Vorbis, MP4), including album_artist
+    (TPE2) for compilation detection.
+    """
+    tags: dict[str, Any] = {}
+
+    audio_tags = getattr(audio, "tags", None)
+    if not audio_tags:
+        return tags
+
+    for tag_key, field_name in TAG_MAPPINGS.items():
+        # Vorbis comments (FLAC/OGG) raise ValueError on membership tests for keys that
+        # aren't valid Vorbis field names (the MP4 "©nam" style keys) - treat as absent
+        try:
+            present = tag_key in audio_tags
+        except ValueError:
+            present = False
+        if present:
+            value = audio_tags[tag_key]
+
+            # Handle different value types
+            if isinstance(value, list) and value:
+                value = value[0]
+            if hasattr(value, "text"):
+                value = value.text[0] if isinstance(value.text, list) else value.text
+
+            # Parse track/disc numbers (might be "1/12" format)
+            if field_name in ("track_number", "disc_number"):
+                if isinstance(value, tuple):
+                    value = value[0]
+                elif isinstance(value, str) and "/" in value:
+                    value = value.split("/")[0]
+                try:
+                    value = int(value)
+                except (ValueError, TypeError):
+                    value = None
+
+            # Parse year
+            if field_name == "year" and value:
+                try:
+                    value = int(str(value)[:4])
+                except (ValueError, TypeError):
+                    value = None
+
+            # Parse compilation flag (can be "1", "true", True, etc.)
+            if field_name == "compilation" and value:
+                if isinstance(value, bool):
+                    pass
+                elif isinstance(value, int | float):
+                    value = bool(value)
+                elif isinstance(value, str):
+                    value = value.lower() in ("1", "true", "yes")
+                else:
+                    value = False
+
+            if value is not None:
+                tags[field_name] = value
+
+    return tags
+
+
+def extract_metadata(audio: Any, file_path: Path) -> dict[str, Any]:
+    """Build the metadata dict (format, stream info, tags) from a parsed file.
+
+    Args:
+        audio: Parsed mutagen file (not None)
+        file_path: Path of the file (format is derived from the suffix)
+
+    Returns:
+        Dict with metadata
+    """
+    metadata: dict[str, Any] = {
+        "format": file_path.suffix.lstrip(".").lower(),
+    }
+
+    info = getattr(audio, "info", None)
+    if info is not None:
+        if hasattr(info, "length"):
+            metadata["duration_ms"] = int(info.length * 1000)
+        if hasattr(info, "bitrate"):
+            metadata["bitrate"] = info.bitrate
+        if hasattr(info, "sample_rate"):
+            metadata["sample_rate"] = info.sample_rate
+
+    metadata.update(extract_tags(audio))
+    return metadata
+
+
+def _integrity_error(audio: Any) -> str | None:
+    """Broken-file verdict for a parsed mutagen file (None = valid)."""
+    if audio is None:
+        return "Unsupported audio format"
+    # Zero-duration files are almost always truncated/corrupted downloads
+    info = getattr(audio, "info", None)
+    if info is not None and getattr(info, "length", 0) <= 0:
+        return "Invalid audio length"
+    return None
+
+
+# Listen up - order matters inside the one open: mutagen first (it seeks around the header/tag
+# blocks), then the hash (which seeks to wherever it needs, full tier rewinds to 0). A parse failure
+# still hashes the file, so broken files keep showing up in duplicate reports - only a failure to
+# open/read the file itself leaves file_hash empty.
+def scan_audio_file(
+    file_path: Path,
+    size: int | None = None,
+    hash_mode: HashMode = "quick",
+    hash_algorithm: str = "sha256",
+) -> ScannedFile:
+    """Parse tags, hash and integrity-check one audio file with a single open.
+
+    Args:
+        file_path: Path to audio file
+        size: File size if already known from discovery (skips fstat())
+        hash_mode: Hash tier to compute ("quick" fingerprint or "full")
+        hash_algorithm: Algorithm used for the full tier
+
+    Returns:
+        ScannedFile; errors are reported in ``error`` / ``integrity_error``
+    """
+    try:
+        with open(file_path, "rb") as f:
+            if size is None:
+                size = os.fstat(f.fileno()).st_size
+
+            audio = None
+            try:
+                audio = MutagenFile(f)
+                integrity_error = _integrity_error(audio)
+            except Exception as e:
+                integrity_error = f"Audio validation error: {e}"
+
+            metadata = extract_metadata(audio, file_path) if audio is not None else None
+            file_hash, algorithm = hash_fileobj(f, hash_mode, hash_algorithm, size)
+    except Exception as e:
+        logger.warning(f"Error scanning {file_path}: {e}")
+        return ScannedFile(
+            path=file_path,
+            size=size or 0,
+            error=str(e),
+            integrity_error=f"Audio validation error: {e}",
+        )
+
+    return ScannedFile(
+        path=file_path,
+        size=size,
+        metadata=metadata,
+        file_hash=file_hash,
+        hash_algorithm=algorithm,
+        error=None if metadata else f"Could not extract metadata from {file_path}",
+        integrity_error=integrity_error,
+    )
@@ -41,6 +41,10 @@ import httpx
 from PIL import Image as PILImage
 
 from soulspot.config import Settings
+from soulspot.infrastructure.integrations.http_clients import (
+    HttpClientRegistry,
+    http_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -73,13 +77,17 @@ class SpotifyImageService:
         # Returns: "spotify/artists/0OdUWJ0sBjDrqHygGUXeCF.webp"
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self, settings: Settings, http: HttpClientRegistry | None = None
+    ) -> None:
         """Initialize with app settings.
 
         Args:
             settings: Application settings with storage paths.
+            http: Optional registry providing the shared pooled HTTP client.
         """
         self._settings = settings
+        self._http = http
         self._artwork_base = settings.storage.artwork_path
         self._spotify_path = self._artwork_base / "spotify"
 
@@ -147,7 +155,9 @@ class SpotifyImageService:
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_client(
+                self._http, "spotify_images", timeout=30.0
+            ) as client:
                 response = await client.get(url, follow_redirects=True)
                 response.raise_for_status()
 
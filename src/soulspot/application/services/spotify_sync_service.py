@@ -17,12 +17,12 @@
 """Service for automatic Spotify data synchronization with diff logic."""
 
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
+from soulspot.domain.ports import ISpotifyClient
 from soulspot.infrastructure.persistence.models import ensure_utc_aware
 from soulspot.infrastructure.persistence.repositories import SpotifyBrowseRepository
 
@@ -56,10 +56,16 @@ class SpotifySyncService:
     ALBUMS_SYNC_COOLDOWN = 15
     TRACKS_SYNC_COOLDOWN = 60
 
+    # Hey future me - stale-while-revalidate for the browse pages: once a cooldown has passed,
+    # the synced rows may still be SHOWN for this many minutes while the sync runs in the
+    # background (see is_sync_stale() and ui.py). Older than cooldown + grace, or never synced,
+    # and the page waits for the sync like before.
+    STALE_SYNC_GRACE = 1440  # 24 hours
+
     def __init__(
         self,
         session: AsyncSession,
-        spotify_client: SpotifyClient,
+        spotify_client: ISpotifyClient,
         image_service: "SpotifyImageService | None" = None,
         settings_service: "AppSettingsService | None" = None,
     ) -> None:
@@ -346,8 +352,6 @@ class SpotifySyncService:
             # Check cooldown based on albums_synced_at
             # Hey future me - use ensure_utc_aware() because SQLite returns naive datetimes!
             if not force and artist.albums_synced_at:
-                from datetime import timedelta
-
                 cooldown = timedelta(minutes=self.ALBUMS_SYNC_COOLDOWN)
                 if datetime.now(UTC) < ensure_utc_aware(artist.albums_synced_at) + cooldown:
                     stats["skipped_cooldown"] = True
@@ -455,8 +459,6 @@ class SpotifySyncService:
             # Check cooldown
             # Hey future me - use ensure_utc_aware() because SQLite returns naive datetimes!
             if not force and album.tracks_synced_at:
-                from datetime import timedelta
-
                 cooldown = timedelta(minutes=self.TRACKS_SYNC_COOLDOWN)
                 if datetime.now(UTC) < ensure_utc_aware(album.tracks_synced_at) + cooldown:
                     stats["skipped_cooldown"] = True
@@ -548,6 +550,45 @@ class SpotifySyncService:
             album_id=album_id, limit=limit, offset=offset
         )
 
+    async def is_sync_stale(self, sync_type: str, spotify_id: str | None = None) -> bool:
+        """Check whether synced data is past its cooldown but may still be shown.
+
+        Args:
+            sync_type: "followed_artists", "artist_albums" or "album_tracks"
+            spotify_id: Artist ID (artist_albums) or album ID (album_tracks)
+
+        Returns:
+            True if the data should be refreshed in the background while shown,
+            False if it is fresh, never synced or too old to show
+
+        Raises:
+            ValueError: If sync_type is unknown
+        """
+        synced_at: datetime | None = None
+        if sync_type == "followed_artists":
+            status = await self.repo.get_sync_status(sync_type)
+            synced_at = status.last_sync_at if status else None
+            cooldown = self.ARTISTS_SYNC_COOLDOWN
+        elif sync_type == "artist_albums" and spotify_id:
+            artist = await self.repo.get_artist_by_id(spotify_id)
+            synced_at = artist.albums_synced_at if artist else None
+            cooldown = self.ALBUMS_SYNC_COOLDOWN
+        elif sync_type == "album_tracks" and spotify_id:
+            album = await self.repo.get_album_by_id(spotify_id)
+            synced_at = album.tracks_synced_at if album else None
+            cooldown = self.TRACKS_SYNC_COOLDOWN
+        else:
+            raise ValueError(f"Unknown sync type: {sync_type}")
+
+        if synced_at is None:
+            return False
+        age = datetime.now(UTC) - ensure_utc_aware(synced_at)
+        return (
+            timedelta(minutes=cooldown)
+            <= age
+            < timedelta(minutes=cooldown + self.STALE_SYNC_GRACE)
+        )
+
     async def get_sync_status(self, sync_type: str) -> Any | None:
         """Get sync status for display."""
         return await self.repo.get_sync_status(sync_type)
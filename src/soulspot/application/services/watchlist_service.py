@@ -7,8 +7,8 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from soulspot.domain.entities import ArtistWatchlist, WatchlistStatus
+from soulspot.domain.ports import ISpotifyClient
 from soulspot.domain.value_objects import ArtistId, WatchlistId
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 from soulspot.infrastructure.persistence.repositories import ArtistWatchlistRepository
 
 logger = logging.getLogger(__name__)
@@ -20,7 +20,7 @@ class WatchlistService:
     def __init__(
         self,
         session: AsyncSession,
-        spotify_client: SpotifyClient | None = None,
+        spotify_client: ISpotifyClient | None = None,
     ) -> None:
         """Initialize watchlist service.
 
@@ -10,8 +10,7 @@ from soulspot.application.services.album_completeness import (
     AlbumCompletenessInfo,
     AlbumCompletenessService,
 )
-from soulspot.infrastructure.integrations.musicbrainz_client import MusicBrainzClient
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
+from soulspot.domain.ports import IMusicBrainzClient, ISpotifyClient
 from soulspot.infrastructure.persistence.models import (
     AlbumModel,
     ArtistModel,
@@ -31,8 +30,8 @@ class CheckAlbumCompletenessUseCase:
     def __init__(
         self,
         session: AsyncSession,
-        spotify_client: SpotifyClient | None = None,
-        musicbrainz_client: MusicBrainzClient | None = None,
+        spotify_client: ISpotifyClient | None = None,
+        musicbrainz_client: IMusicBrainzClient | None = None,
         access_token: str | None = None,
     ) -> None:
         """Initialize use case.
@@ -7,6 +7,7 @@ from typing import Any
 
 import httpx
 
+from soulspot.application.cache import CachedMusicBrainzClient
 from soulspot.application.use_cases import UseCase
 from soulspot.domain.entities import Album, Artist, Track
 from soulspot.domain.ports import (
@@ -105,6 +106,12 @@ class EnrichMetadataUseCase(UseCase[EnrichMetadataRequest, EnrichMetadataRespons
         # Try to lookup by ISRC first (fastest and most accurate)
         recording = None
         if track.isrc:
+            # Hey future me - force_refresh means "the metadata is WRONG", so the cached
+            # lookup has to go too, otherwise we'd just re-apply the same stale recording
+            if force_refresh and isinstance(
+                self._musicbrainz_client, CachedMusicBrainzClient
+            ):
+                await self._musicbrainz_client.cache.invalidate_recording(track.isrc)
             try:
                 recording = await self._musicbrainz_client.lookup_recording_by_isrc(
                     track.isrc
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 from soulspot.application.use_cases import UseCase
-from soulspot.application.workers.job_queue import JobQueue, JobType
+from soulspot.application.workers.job_queue import JobQueue, JobType, make_dedup_key
 from soulspot.domain.value_objects import PlaylistId
 from soulspot.infrastructure.persistence.repositories import (
     PlaylistRepository,
@@ -162,6 +162,8 @@ class QueuePlaylistDownloadsUseCase(UseCase):
                         "quality_preference": request.quality_filter or "any",
                     },
                     priority=10,  # Higher priority for user-initiated downloads
+                    # Tracks shared with another queued playlist reuse that job
+                    dedup_key=make_dedup_key(JobType.DOWNLOAD, track.id.value),
                 )
 
                 job_ids.append(job_id)
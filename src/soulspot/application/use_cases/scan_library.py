@@ -1,5 +1,6 @@
 """Use case for library scanning operations."""
 
+import asyncio
 import logging
 import uuid
 from datetime import UTC, datetime
@@ -9,6 +10,7 @@ from typing import Any
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from soulspot.application.services.file_hashing import QUICK_HASH_ALGORITHM
 from soulspot.application.services.library_scanner import (
     FileInfo,
     LibraryScannerService,
@@ -19,6 +21,7 @@ from soulspot.infrastructure.persistence.models import (
     LibraryScanModel,
     TrackModel,
 )
+from soulspot.infrastructure.persistence.repositories import TrackRepository
 from soulspot.infrastructure.security import validate_safe_path
 
 logger = logging.getLogger(__name__)
@@ -42,7 +45,9 @@ class ScanLibraryUseCase:
         """
         self.session = session
         self.settings = settings
-        self.scanner_service = scanner_service or LibraryScannerService()
+        self.scanner_service = scanner_service or LibraryScannerService(
+            hash_mode=settings.library.hash_mode
+        )
 
     # Hey future me: Library scanning - the file system crawler that builds our music database
     # WHY validate_safe_path? CRITICAL security check - users could pass "../../../etc/passwd"
@@ -126,18 +131,19 @@ class ScanLibraryUseCase:
 
             # Scan each file
             file_infos: list[FileInfo] = []
+            pending_rows: list[dict[str, Any]] = []
             # Hey future me: Progress checkpoints every 100 files
             # WHY 100? Balance between DB writes and showing progress to user
             # If we commit every file, we kill the DB with transactions
             # If we only commit at the end, user sees nothing for minutes on big scans
             # 100 files ≈ every few seconds on modern hardware
+            # Track updates are buffered and flushed at the same checkpoints through ONE bulk
+            # UPDATE (TrackRepository.bulk_update_file_info) instead of select+update per file.
             for i, file_path in enumerate(audio_files):
                 try:
                     file_info = self.scanner_service.scan_file(file_path)
                     file_infos.append(file_info)
-
-                    # Update track in database if it exists
-                    await self._update_track_from_scan(file_info)
+                    pending_rows.append(self._scan_row(file_info))
 
                     # Track progress
                     scan.update_progress(
@@ -147,6 +153,7 @@ class ScanLibraryUseCase:
 
                     # Periodically save progress
                     if (i + 1) % 100 == 0:
+                        await self._flush_scan_rows(pending_rows)
                         scan_model.scanned_files = scan.scanned_files
                         scan_model.broken_files = scan.broken_files
                         await self.session.commit()
@@ -158,11 +165,14 @@ class ScanLibraryUseCase:
                     logger.error(f"Error scanning file {file_path}: {e}")
                     continue
 
-            # Detect duplicates
+            await self._flush_scan_rows(pending_rows)
+
+            # Detect duplicates (quick fingerprint collisions get their full hash here)
             duplicates = self.scanner_service.detect_duplicates(file_infos)
             scan.duplicate_files = len(duplicates)
 
             # Save duplicate information
+            await self._store_full_hashes(duplicates)
             await self._save_duplicates(duplicates)
 
             # Complete scan
@@ -190,35 +200,60 @@ class ScanLibraryUseCase:
             await self.session.commit()
             raise
 
-    async def _update_track_from_scan(self, file_info: FileInfo) -> None:
-        """Update track record with scan information.
+    @staticmethod
+    def _scan_row(file_info: FileInfo) -> dict[str, Any]:
+        """Build the bulk update row for a scanned file.
 
         Args:
             file_info: Scanned file information
         """
-        try:
-            # Try to find existing track by file path
-            stmt = select(TrackModel).where(TrackModel.file_path == str(file_info.path))
-            result = await self.session.execute(stmt)
-            track = result.scalar_one_or_none()
-
-            if track:
-                # Update track with scan info
-                track.file_size = file_info.size
-                track.file_hash = file_info.hash_value
-                track.file_hash_algorithm = file_info.hash_algorithm
-                track.last_scanned_at = datetime.now(UTC)
-                track.is_broken = not file_info.is_valid
-                track.audio_bitrate = file_info.bitrate
-                track.audio_format = file_info.format
-                track.audio_sample_rate = file_info.sample_rate
-
-                # Update duration if we extracted it and track doesn't have one
-                if file_info.duration_ms and track.duration_ms == 0:
-                    track.duration_ms = file_info.duration_ms
+        return {
+            "file_path": str(file_info.path),
+            "file_size": file_info.size,
+            "file_hash": file_info.hash_value,
+            "file_hash_algorithm": file_info.hash_algorithm,
+            "last_scanned_at": datetime.now(UTC),
+            "is_broken": not file_info.is_valid,
+            "audio_bitrate": file_info.bitrate,
+            "audio_format": file_info.format,
+            "audio_sample_rate": file_info.sample_rate,
+            # Only applied when the track has no duration yet
+            "duration_ms": file_info.duration_ms or None,
+        }
+
+    async def _flush_scan_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Update existing tracks with buffered scan information.
 
+        Args:
+            rows: Rows from _scan_row() (cleared in place)
+        """
+        if not rows:
+            return
+        try:
+            await TrackRepository(self.session).bulk_update_file_info(rows)
         except Exception as e:
-            logger.warning(f"Error updating track from scan: {e}")
+            logger.warning(f"Error updating tracks from scan: {e}")
+        rows.clear()
+
+    # Hey future me: tracks were written with the QUICK hash during the file loop. Duplicate groups
+    # now carry the full hash (promoted lazily in detect_duplicates), and GetDuplicatesUseCase looks
+    # tracks up by FileDuplicateModel.file_hash - so the tracks must get the full hash too!
+    async def _store_full_hashes(self, duplicates: dict[str, list[FileInfo]]) -> None:
+        """Persist full hashes of duplicate files on their track records.
+
+        Args:
+            duplicates: Dictionary of full hash to duplicate files
+        """
+        rows = [
+            {
+                "file_path": str(file_info.path),
+                "file_hash": file_info.hash_value,
+                "file_hash_algorithm": file_info.hash_algorithm,
+            }
+            for files in duplicates.values()
+            for file_info in files
+        ]
+        await TrackRepository(self.session).bulk_update_file_info(rows)
 
     # Hey future me: Duplicate detection - finds files with same hash but different paths
     # WHY save this? User might have "/music/album/song.mp3" and "/downloads/song.mp3" - same file, wasting space
@@ -386,3 +421,93 @@ class GetBrokenFilesUseCase:
             }
             for t in tracks
         ]
+
+
+# Yo, this is the "user asks for a verify" path of two-tier hashing! Scans only store the cheap quick
+# fingerprint, so this computes the FULL hash for the selected tracks (off the event loop - it reads
+# every byte) and upgrades file_hash/file_hash_algorithm. Tracks that already had a full hash are
+# compared: a different value means the file content changed on disk (re-tag, corruption) - we only
+# REPORT that, the caller decides what to do (re-scan, re-download).
+class VerifyFileHashesUseCase:
+    """Use case for computing/verifying full content hashes of tracks."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        scanner_service: LibraryScannerService | None = None,
+    ) -> None:
+        """Initialize use case.
+
+        Args:
+            session: Database session
+            scanner_service: Library scanner service (provides the full hash algorithm)
+        """
+        self.session = session
+        self.scanner_service = scanner_service or LibraryScannerService()
+
+    async def execute(
+        self, track_ids: list[str] | None = None, limit: int = 100
+    ) -> dict[str, Any]:
+        """Verify tracks with a full content hash.
+
+        Args:
+            track_ids: Tracks to verify (None = quick-tier tracks first, up to limit)
+            limit: Maximum tracks to verify in one call
+
+        Returns:
+            Dict with verified, upgraded, mismatched and missing counts
+        """
+        stmt = select(TrackModel)
+        if track_ids:
+            # Requested tracks without a file (path cleared by dedup) are reported as missing
+            stmt = stmt.where(TrackModel.id.in_(track_ids))
+        else:
+            stmt = stmt.where(
+                TrackModel.file_path.isnot(None),
+                TrackModel.file_hash_algorithm.is_(None)
+                | (TrackModel.file_hash_algorithm == QUICK_HASH_ALGORITHM),
+            )
+        result = await self.session.execute(stmt.limit(limit))
+        tracks = result.scalars().all()
+
+        stats: dict[str, Any] = {
+            "verified": 0,
+            "upgraded": 0,
+            "mismatched": [],
+            "missing": [],
+        }
+        algorithm = self.scanner_service.hash_algorithm
+
+        for track in tracks:
+            if track.file_path is None:
+                stats["missing"].append(track.id)
+                continue
+            path = Path(track.file_path)
+            if not path.exists():
+                stats["missing"].append(track.id)
+                continue
+
+            full_hash = await asyncio.to_thread(
+                self.scanner_service.calculate_file_hash, path
+            )
+            if not full_hash:
+                stats["missing"].append(track.id)
+                continue
+
+            if track.file_hash_algorithm == algorithm:
+                if track.file_hash != full_hash:
+                    stats["mismatched"].append(track.id)
+            else:
+                stats["upgraded"] += 1
+
+            track.file_hash = full_hash
+            track.file_hash_algorithm = algorithm
+            track.last_scanned_at = datetime.now(UTC)
+            stats["verified"] += 1
+
+        await self.session.commit()
+        logger.info(
+            f"Hash verify: {stats['verified']} verified, {stats['upgraded']} upgraded, "
+            f"{len(stats['mismatched'])} mismatched, {len(stats['missing'])} missing"
+        )
+        return stats
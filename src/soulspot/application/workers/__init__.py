@@ -14,6 +14,7 @@ from soulspot.application.workers.duplicate_detector_worker import (
 )
 from soulspot.application.workers.job_queue import JobQueue, JobStatus, JobType
 from soulspot.application.workers.metadata_worker import MetadataWorker
+from soulspot.application.workers.persistent_job_queue import PersistentJobQueue
 from soulspot.application.workers.playlist_sync_worker import PlaylistSyncWorker
 from soulspot.application.workers.spotify_sync_worker import SpotifySyncWorker
 from soulspot.application.workers.token_refresh_worker import TokenRefreshWorker
@@ -22,6 +23,7 @@ __all__ = [
     # Job Queue
     "JobQueue",
     "JobStatus",
+    "PersistentJobQueue",
     "JobType",
     # Core Workers
     "DownloadWorker",
@@ -15,7 +15,7 @@ from soulspot.application.services.discography_service import DiscographyService
 from soulspot.application.services.quality_upgrade_service import QualityUpgradeService
 from soulspot.application.services.watchlist_service import WatchlistService
 from soulspot.domain.entities import AutomationTrigger
-from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
+from soulspot.domain.ports import ISpotifyClient
 
 if TYPE_CHECKING:
     from soulspot.application.services.token_manager import DatabaseTokenManager
@@ -33,7 +33,7 @@ class WatchlistWorker:
     def __init__(
         self,
         session: AsyncSession,
-        spotify_client: SpotifyClient,
+        spotify_client: ISpotifyClient,
         check_interval_seconds: int = 3600,  # Default: 1 hour
     ) -> None:
         """Initialize watchlist worker.
@@ -301,7 +301,7 @@ class DiscographyWorker:
     def __init__(
         self,
         session: AsyncSession,
-        spotify_client: SpotifyClient,
+        spotify_client: ISpotifyClient,
         check_interval_seconds: int = 86400,  # Default: 24 hours
     ) -> None:
         """Initialize discography worker.
@@ -661,7 +661,7 @@ class AutomationWorkerManager:
     def __init__(
         self,
         session: AsyncSession,
-        spotify_client: SpotifyClient,
+        spotify_client: ISpotifyClient,
         watchlist_interval: int = 3600,
         discography_interval: int = 86400,
         quality_interval: int = 86400,
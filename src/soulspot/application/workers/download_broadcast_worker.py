@@ -0,0 +1,168 @@
+# Hey future me - dieser Worker ist der EINZIGE, der für die SSE-Downloadliste die DB liest!
+#
+# Problem: Früher hat jede offene Browser-Tab im SSE-Stream alle 2s selbst list_active()
+# aufgerufen. 10 Tabs = 10 DB-Queries alle 2 Sekunden, auch wenn sich nichts ändert.
+#
+# Lösung: Ein Broadcaster für alle Clients:
+# 1. Schläft, solange kein SSE-Client verbunden ist (null Queries)
+# 2. Lädt die aktiven Downloads, wenn ein Download-Event auf dem EventBus kommt
+#    (job_update für DOWNLOAD-Jobs, download_progress vom DownloadMonitorWorker)
+# 3. Fallback-Refresh alle refresh_interval Sekunden für Änderungen aus anderen Prozessen
+#    (z.B. externer Worker mit DOWNLOAD__EMBEDDED_WORKERS=false)
+# 4. Publiziert das Ergebnis als "downloads_update" Snapshot (retained) - neue Tabs bekommen
+#    den letzten Snapshot sofort vom Bus, ohne Query
+#
+# DB-Last: max. 1 Query pro min_interval, egal wie viele Clients verbunden sind.
+"""Download broadcast worker feeding the SSE downloads snapshot."""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from soulspot.application.services.event_bus import Event, EventBus
+from soulspot.application.workers.job_queue import JobType
+from soulspot.infrastructure.persistence.repositories import DownloadRepository
+
+logger = logging.getLogger(__name__)
+
+SessionScope = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+# Number of downloads sent per snapshot (same as the downloads widget)
+SNAPSHOT_LIMIT = 10
+
+
+class DownloadBroadcastWorker:
+    """Background worker that publishes active-download snapshots to SSE clients.
+
+    This worker:
+    1. Waits until at least one SSE client is subscribed to the event bus
+    2. Loads active downloads once per change (coalesced to min_interval)
+    3. Publishes them as a retained "downloads_update" event
+    4. Refreshes every refresh_interval even without events
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        session_scope: SessionScope,
+        min_interval: float = 1.0,
+        refresh_interval: float = 10.0,
+    ) -> None:
+        """Initialize download broadcast worker.
+
+        Args:
+            event_bus: Bus to read download events from and publish snapshots to
+            session_scope: Async context manager factory for DB sessions
+            min_interval: Minimum seconds between two snapshot queries
+            refresh_interval: Seconds between snapshots when no events arrive
+        """
+        self._event_bus = event_bus
+        self._session_scope = session_scope
+        self._min_interval = min_interval
+        self._refresh_interval = refresh_interval
+        self._changed = asyncio.Event()
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+        self._stats: dict[str, int | str | None] = {
+            "snapshots_published": 0,
+            "last_snapshot_at": None,
+            "last_error": None,
+        }
+        event_bus.add_listener(self._on_event)
+
+    async def start(self) -> None:
+        """Start the broadcast loop (idempotent)."""
+        if self._running:
+            logger.warning("Download broadcast worker is already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("Download broadcast worker started")
+
+    async def stop(self) -> None:
+        """Stop the broadcast loop (idempotent)."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        logger.info("Download broadcast worker stopped")
+
+    def get_status(self) -> dict[str, Any]:
+        """Get current worker status for monitoring/UI.
+
+        Returns:
+            Dict with running state, stats, and config
+        """
+        return {
+            "name": "Download Broadcast",
+            "running": self._running,
+            "status": "active" if self._running else "stopped",
+            "subscribers": self._event_bus.subscriber_count,
+            "refresh_interval_seconds": self._refresh_interval,
+            "stats": self._stats.copy(),
+        }
+
+    def _on_event(self, event: Event) -> None:
+        """Mark the snapshot dirty when a download changed."""
+        if event.type == "download_progress" or (
+            event.type == "job_update"
+            and event.data.get("job_type") == JobType.DOWNLOAD.value
+        ):
+            self._changed.set()
+
+    async def _run_loop(self) -> None:
+        """Publish a snapshot per change burst while clients are connected."""
+        while self._running:
+            try:
+                await self._event_bus.wait_for_subscribers()
+                self._changed.clear()
+                await self.publish_snapshot()
+            except Exception as e:
+                # Don't crash the loop - clients keep their last snapshot
+                logger.error(f"Error publishing downloads snapshot: {e}", exc_info=True)
+                self._stats["last_error"] = str(e)
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._changed.wait(), timeout=self._refresh_interval
+                )
+            # Coalesce a burst of events (e.g. a whole playlist queued) into one query
+            await asyncio.sleep(self._min_interval)
+
+    async def publish_snapshot(self) -> None:
+        """Load active downloads and publish them as "downloads_update"."""
+        async with self._session_scope() as session:
+            downloads = await DownloadRepository(session).list_active()
+
+        self._event_bus.publish(
+            "downloads_update",
+            {
+                "downloads": [
+                    {
+                        "id": str(download.id.value),
+                        "track_id": str(download.track_id.value),
+                        "status": download.status.value,
+                        "progress_percent": download.progress_percent or 0,
+                        "priority": download.priority,
+                        "created_at": download.created_at.isoformat(),
+                    }
+                    for download in downloads[:SNAPSHOT_LIMIT]
+                ],
+                "total_count": len(downloads),
+                "timestamp": datetime.now(UTC).isoformat(),
+            },
+            retain=True,
+        )
+        published = self._stats.get("snapshots_published")
+        self._stats["snapshots_published"] = (int(published) if published else 0) + 1
+        self._stats["last_snapshot_at"] = datetime.now(UTC).isoformat()
+        self._stats["last_error"] = None
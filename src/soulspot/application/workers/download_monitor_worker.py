@@ -21,6 +21,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from soulspot.application.services.event_bus import EventBus
     from soulspot.infrastructure.integrations.slskd_client import SlskdClient
 
 from soulspot.application.workers.job_queue import JobQueue, JobStatus, JobType
@@ -67,6 +68,7 @@ class DownloadMonitorWorker:
         job_queue: JobQueue,
         slskd_client: "SlskdClient",
         poll_interval_seconds: int = 10,
+        event_bus: "EventBus | None" = None,
     ) -> None:
         """Initialize download monitor worker.
 
@@ -74,10 +76,12 @@ class DownloadMonitorWorker:
             job_queue: Job queue to update job statuses
             slskd_client: Client for slskd API calls
             poll_interval_seconds: How often to poll slskd (default 10s)
+            event_bus: Bus that receives a "download_progress" event per update
         """
         self._job_queue = job_queue
         self._slskd_client = slskd_client
         self._poll_interval = poll_interval_seconds
+        self._event_bus = event_bus
         self._running = False
         self._task: asyncio.Task[None] | None = None
 
@@ -268,6 +272,27 @@ class DownloadMonitorWorker:
             logger.debug(
                 f"Job {job.id}: {state} - {progress}% ({bytes_transferred}/{total_size} bytes)"
             )
+            self._publish_progress(job)
+
+    # Hey future me - das ist der Live-Progress für die UI (SSE)! Ein Event pro Job und Poll,
+    # die Browser lesen es vom EventBus statt selbst die DB zu pollen.
+    def _publish_progress(self, job: Any) -> None:
+        """Publish a job's download progress on the event bus (if any)."""
+        if self._event_bus is None:
+            return
+        self._event_bus.publish(
+            "download_progress",
+            {
+                "job_id": job.id,
+                "track_id": job.payload.get("track_id"),
+                "status": job.status.value,
+                "slskd_state": job.result.get("slskd_state"),
+                "progress_percent": job.result.get("progress_percent", 0),
+                "bytes_downloaded": job.result.get("bytes_downloaded", 0),
+                "total_bytes": job.result.get("total_bytes", 0),
+                "error": job.result.get("error"),
+            },
+        )
 
     async def _mark_job_completed(self, job: Any) -> None:
         """Mark a job as successfully completed.
@@ -280,6 +305,7 @@ class DownloadMonitorWorker:
         completed = self._stats.get("downloads_completed")
         self._stats["downloads_completed"] = (int(completed) if completed else 0) + 1
         logger.info(f"Download job {job.id} completed successfully")
+        self._publish_progress(job)
 
         # Note: AutoImportService will pick up the file from downloads folder
         # We don't need to trigger it explicitly
@@ -297,3 +323,4 @@ class DownloadMonitorWorker:
         failed = self._stats.get("downloads_failed")
         self._stats["downloads_failed"] = (int(failed) if failed else 0) + 1
         logger.warning(f"Download job {job.id} failed: {error_message}")
+        self._publish_progress(job)
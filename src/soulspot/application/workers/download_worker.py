@@ -5,7 +5,12 @@ import logging
 from typing import Any
 
 from soulspot.application.use_cases import SearchAndDownloadTrackUseCase
-from soulspot.application.workers.job_queue import Job, JobQueue, JobType
+from soulspot.application.workers.job_queue import (
+    Job,
+    JobQueue,
+    JobType,
+    make_dedup_key,
+)
 from soulspot.domain.ports import IDownloadRepository, ISlskdClient, ITrackRepository
 from soulspot.domain.value_objects import TrackId
 
@@ -152,6 +157,8 @@ class DownloadWorker:
             },
             max_retries=max_retries,
             priority=priority,
+            # One active download job per track - re-queueing returns the existing job
+            dedup_key=make_dedup_key(JobType.DOWNLOAD, track_id.value),
         )
 
     # Yo future me, this monitor is a BACKGROUND LOOP that polls slskd for download progress! It runs FOREVER
@@ -1,13 +1,22 @@
 """Job queue management for background workers."""
 
 import asyncio
+import bisect
+import heapq
 import logging
+import random
+import time
 import uuid
-from collections.abc import Callable, Coroutine
+from collections import Counter, deque
+from collections.abc import Callable, Coroutine, Iterable
+from contextlib import suppress
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from soulspot.application.services.event_bus import EventBus
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +79,8 @@ class Job:
     result: Any | None = None
     retries: int = 0
     max_retries: int = 3
+    run_after: datetime | None = None  # Not runnable before this time (delayed retry)
+    dedup_key: str | None = None  # Idempotency key, see JobQueue.enqueue()
 
     def mark_running(self) -> None:
         """Mark job as running."""
@@ -89,6 +100,12 @@ class Job:
         self.error = error
         self.retries += 1
 
+    def mark_retry(self, delay: float) -> None:
+        """Put a failed job back to pending, runnable after delay seconds."""
+        self.status = JobStatus.PENDING
+        self.completed_at = None
+        self.run_after = datetime.now(UTC) + timedelta(seconds=delay)
+
     def mark_cancelled(self) -> None:
         """Mark job as cancelled."""
         self.status = JobStatus.CANCELLED
@@ -99,6 +116,407 @@ class Job:
         return self.status == JobStatus.FAILED and self.retries < self.max_retries
 
 
+# Hey future me - per-type defaults for the fair scheduler below!
+# Limits: long-running, heavy jobs get ONE slot each so a scan never eats every worker. DOWNLOAD
+# has no default here - lifecycle.py sets it from download.max_concurrent_downloads.
+# Weights: share of dispatches while several types are waiting. Short, interactive jobs get 2,
+# so one enrichment/playlist sync/import runs for every download even mid-way through a
+# 500-track playlist. Types not listed: no own limit (only the global one), weight 1.
+DEFAULT_TYPE_LIMITS: dict[JobType, int] = {
+    JobType.LIBRARY_SCAN: 1,
+    JobType.LIBRARY_SPOTIFY_ENRICHMENT: 1,
+    JobType.DUPLICATE_SCAN: 1,
+    JobType.CLEANUP: 1,
+}
+DEFAULT_TYPE_WEIGHTS: dict[JobType, float] = {
+    JobType.METADATA_ENRICHMENT: 2.0,
+    JobType.PLAYLIST_SYNC: 2.0,
+    JobType.AUTO_IMPORT: 2.0,
+}
+
+
+# Hey future me - retry backoff lives HERE now, not in an asyncio.sleep() inside the worker!
+# The old code slept 1s/2s/4s while holding the worker slot, so a flaky slskd brought throughput
+# to ~zero. A failed job now goes into a timer heap with run_after = now + delay() and the worker
+# moves on. Jitter (+/- fraction) spreads out retries of jobs that failed together (slskd restart
+# -> 200 downloads fail in the same second -> they must not all hit it again in the same second).
+# max_retries per type CAPS the job's own max_retries (never raises it).
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with jitter and per-job-type retry caps."""
+
+    base_delay: float = 1.0  # Delay before the first retry (seconds)
+    max_delay: float = 300.0  # Upper bound for any delay (seconds)
+    jitter: float = 0.1  # Random +/- fraction applied to the delay
+    max_retries: dict[JobType, int] = field(default_factory=dict)
+
+    def delay(self, retries: int) -> float:
+        """Seconds to wait before the given retry (1 = first retry).
+
+        Args:
+            retries: Retry number (job.retries after the failure)
+
+        Returns:
+            base_delay * 2^(retries-1), capped at max_delay, with jitter applied
+        """
+        delay: float = min(self.max_delay, self.base_delay * 2 ** max(retries - 1, 0))
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(delay, 0.0)
+
+    def should_retry(self, job: Job) -> bool:
+        """Check whether a failed job gets another attempt.
+
+        Args:
+            job: Job after mark_failed()
+
+        Returns:
+            True if both the job and its type allow another retry
+        """
+        cap = self.max_retries.get(job.job_type)
+        return job.should_retry() and (cap is None or job.retries < cap)
+
+
+# Yo, this is stride scheduling across job types! Every type carries a "pass" value; a dispatch
+# picks the waiting type with the SMALLEST pass (that still has a free per-type slot) and advances
+# its pass by 1/weight - so a weight-2 type gets picked twice as often as a weight-1 type while
+# both have work. A type that was idle (or blocked on its limit) is lifted to the current virtual
+# time before it competes, otherwise it would "bank" credit and then burst through the queue.
+# Priority still orders jobs WITHIN a type; ACROSS types fairness wins, which is the whole point
+# (a priority-10 bulk download flood must not starve a single metadata lookup).
+# Not thread-safe on purpose - everything runs on the event loop, and reserve() never awaits.
+class JobTypeScheduler:
+    """Per-job-type concurrency limits and weighted fair selection."""
+
+    def __init__(
+        self,
+        limits: dict[JobType, int] | None = None,
+        weights: dict[JobType, float] | None = None,
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            limits: Max concurrent jobs per type (missing = no per-type limit)
+            weights: Relative dispatch share per type (missing = 1.0)
+        """
+        self._limits: dict[JobType, int] = {}
+        self._weights: dict[JobType, float] = {}
+        self._running: Counter[JobType] = Counter()
+        self._pass: dict[JobType, float] = {}
+        self._virtual_time = 0.0
+        for job_type, limit in (limits or {}).items():
+            self.set_limit(job_type, limit)
+        for job_type, weight in (weights or {}).items():
+            self.set_weight(job_type, weight)
+
+    def set_limit(self, job_type: JobType, limit: int | None) -> None:
+        """Set max concurrent jobs of a type (None removes the limit, 0 holds the type).
+
+        Args:
+            job_type: Job type
+            limit: Maximum concurrent jobs or None
+        """
+        if limit is None:
+            self._limits.pop(job_type, None)
+            return
+        if limit < 0:
+            raise ValueError("limit must be at least 0")
+        self._limits[job_type] = limit
+
+    def get_limit(self, job_type: JobType) -> int | None:
+        """Get max concurrent jobs of a type (None = no per-type limit)."""
+        return self._limits.get(job_type)
+
+    def set_weight(self, job_type: JobType, weight: float) -> None:
+        """Set the relative dispatch share of a type.
+
+        Args:
+            job_type: Job type
+            weight: Weight (> 0)
+        """
+        if weight <= 0:
+            raise ValueError("weight must be greater than 0")
+        self._weights[job_type] = weight
+
+    def get_weight(self, job_type: JobType) -> float:
+        """Get the relative dispatch share of a type."""
+        return self._weights.get(job_type, 1.0)
+
+    def running(self, job_type: JobType) -> int:
+        """Number of reserved (running) jobs of a type."""
+        return self._running[job_type]
+
+    def total_running(self) -> int:
+        """Number of reserved (running) jobs of all types."""
+        return sum(self._running.values())
+
+    def has_capacity(self, job_type: JobType) -> bool:
+        """Check whether a type may start another job."""
+        limit = self._limits.get(job_type)
+        return limit is None or self._running[job_type] < limit
+
+    def reserve(self, candidates: Iterable[JobType]) -> JobType | None:
+        """Pick the type to run next and take one of its slots.
+
+        Args:
+            candidates: Types that have runnable jobs
+
+        Returns:
+            Selected type (caller must release() it), or None if none may run
+        """
+        best: tuple[float, float, str] | None = None
+        selected: JobType | None = None
+        for job_type in candidates:
+            if not self.has_capacity(job_type):
+                continue
+            pass_value = max(self._pass.get(job_type, 0.0), self._virtual_time)
+            # Ties: heavier weight first, then name for a stable order
+            key = (pass_value, -self.get_weight(job_type), job_type.value)
+            if best is None or key < best:
+                best, selected = key, job_type
+
+        if selected is None or best is None:
+            return None
+
+        self._virtual_time = best[0]
+        self._pass[selected] = best[0] + 1.0 / self.get_weight(selected)
+        self._running[selected] += 1
+        return selected
+
+    def release(self, job_type: JobType) -> None:
+        """Give back a slot taken by reserve()."""
+        if self._running[job_type] > 0:
+            self._running[job_type] -= 1
+
+
+def make_dedup_key(job_type: JobType, *parts: object) -> str:
+    """Build an idempotency key for enqueue(), e.g. "download:<track_id>".
+
+    Args:
+        job_type: Type of job
+        parts: Values identifying the work (track id, playlist id, ...)
+
+    Returns:
+        Key string
+    """
+    return ":".join([job_type.value, *(str(part) for part in parts)])
+
+
+# Statuses a job never leaves again (except COMPLETED over a cancelled running job)
+FINISHED_STATUSES = frozenset(
+    {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
+)
+
+
+# Hey future me - this replaced the plain dict of ALL jobs ever enqueued! list_jobs() used to copy,
+# filter and sort that dict on every call (DownloadMonitorWorker does it every 10s) and nothing was
+# ever evicted, so a long-running instance slowly ate its memory.
+# Now every job gets a sequence number at add() (= creation order), and each status/type has a
+# SORTED list of those numbers. "Newest running downloads" walks one list backwards and stops at
+# the limit - O(result), no full scan, no sort.
+# Finished jobs go into a history ring: beyond history_size (or older than history_retention
+# seconds) the oldest finished job is evicted from every index. get_job() of an evicted job
+# returns None, same as an unknown id.
+# IMPORTANT: Job status is changed by the Job.mark_*() methods, which the store can't see -
+# whoever changes a status must call update(job) afterwards to move it between indexes.
+class JobStore:
+    """In-memory job store with status/type indexes and bounded history."""
+
+    def __init__(
+        self, history_size: int = 1000, history_retention: float | None = None
+    ) -> None:
+        """Initialize job store.
+
+        Args:
+            history_size: Maximum number of finished jobs kept
+            history_retention: Seconds a finished job is kept (None = no age limit)
+        """
+        self._history_size = history_size
+        self._history_retention = history_retention
+        self._jobs: dict[str, Job] = {}
+        self._seq: dict[str, int] = {}
+        self._by_seq: dict[int, Job] = {}
+        self._indexed_status: dict[str, JobStatus] = {}
+        self._by_status: dict[JobStatus, list[int]] = {s: [] for s in JobStatus}
+        self._by_type: dict[JobType, list[int]] = {t: [] for t in JobType}
+        self._all: list[int] = []
+        # Finished jobs in finish order: (monotonic finish time, job id)
+        self._history: deque[tuple[float, str]] = deque()
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._jobs
+
+    def add(self, job: Job) -> None:
+        """Store a new job."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._jobs[job.id] = job
+        self._seq[job.id] = seq
+        self._by_seq[seq] = job
+        # Sequence numbers only grow, so appending keeps the lists sorted
+        self._all.append(seq)
+        self._by_type[job.job_type].append(seq)
+        self._by_status[job.status].append(seq)
+        self._indexed_status[job.id] = job.status
+        if job.status in FINISHED_STATUSES:
+            self._record_finished(job.id)
+
+    def get(self, job_id: str) -> Job | None:
+        """Get a job by ID."""
+        return self._jobs.get(job_id)
+
+    def update(self, job: Job) -> None:
+        """Re-index a job after its status changed."""
+        old_status = self._indexed_status.get(job.id)
+        if old_status is None or old_status == job.status:
+            return
+        seq = self._seq[job.id]
+        _remove_sorted(self._by_status[old_status], seq)
+        bisect.insort(self._by_status[job.status], seq)
+        self._indexed_status[job.id] = job.status
+        if job.status in FINISHED_STATUSES and old_status not in FINISHED_STATUSES:
+            self._record_finished(job.id)
+
+    def count(self, status: JobStatus) -> int:
+        """Number of stored jobs with a status."""
+        return len(self._by_status[status])
+
+    def query(
+        self,
+        status: JobStatus | None = None,
+        job_type: JobType | None = None,
+        limit: int = 100,
+    ) -> list[Job]:
+        """Jobs matching the filters, newest first.
+
+        Args:
+            status: Filter by status
+            job_type: Filter by job type
+            limit: Maximum number of jobs to return
+
+        Returns:
+            List of jobs
+        """
+        if status is not None and job_type is not None:
+            # Walk the shorter index, check the other attribute per job
+            by_status = self._by_status[status]
+            by_type = self._by_type[job_type]
+            seqs = by_status if len(by_status) <= len(by_type) else by_type
+        elif status is not None:
+            seqs = self._by_status[status]
+        elif job_type is not None:
+            seqs = self._by_type[job_type]
+        else:
+            seqs = self._all
+
+        jobs: list[Job] = []
+        for seq in reversed(seqs):
+            if len(jobs) >= limit:
+                break
+            job = self._by_seq[seq]
+            if status is not None and self._indexed_status[job.id] != status:
+                continue
+            if job_type is not None and job.job_type != job_type:
+                continue
+            jobs.append(job)
+        return jobs
+
+    def _record_finished(self, job_id: str) -> None:
+        now = time.monotonic()
+        self._history.append((now, job_id))
+        while self._history and (
+            len(self._history) > self._history_size
+            or (
+                self._history_retention is not None
+                and now - self._history[0][0] > self._history_retention
+            )
+        ):
+            _, evicted_id = self._history.popleft()
+            self._evict(evicted_id)
+
+    def _evict(self, job_id: str) -> None:
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return
+        seq = self._seq.pop(job_id)
+        del self._by_seq[seq]
+        _remove_sorted(self._all, seq)
+        _remove_sorted(self._by_type[job.job_type], seq)
+        _remove_sorted(self._by_status[self._indexed_status.pop(job_id)], seq)
+
+
+def _remove_sorted(seqs: list[int], seq: int) -> None:
+    """Remove a value from a sorted list (no-op if missing)."""
+    index = bisect.bisect_left(seqs, seq)
+    if index < len(seqs) and seqs[index] == seq:
+        del seqs[index]
+
+
+# Hey future me - batch handlers get up to max_batch_size ready jobs of ONE type per call, so
+# a worker can share one token lookup / one multi-id API request across all of them (Spotify
+# takes up to 50 ids). The whole batch uses ONE type slot - per-type limits count dispatches,
+# not jobs. max_wait is the linger window: with fewer jobs ready, the worker waits that long
+# for more to arrive before calling the handler. 0 = take what's ready right now.
+# The handler returns one result per job, in order. An Exception INSTEAD of a result fails just
+# that job (retried on its own); raising fails the whole batch.
+@dataclass
+class BatchHandler:
+    """Batch handler registration for one job type."""
+
+    handler: Callable[[list[Job]], Coroutine[Any, Any, list[Any]]]
+    max_batch_size: int = 50
+    max_wait: float = 0.0
+
+
+# Yo - enqueue-to-start latency: how long a job sat RUNNABLE before a worker picked it up
+# (created_at, or run_after for retries). With a free worker this should stay well under a
+# millisecond; a growing p95 means workers are saturated, not that dispatch is slow.
+class DispatchLatency:
+    """Rolling window of enqueue-to-start latencies."""
+
+    def __init__(self, window: int = 1000) -> None:
+        """Initialize the latency window.
+
+        Args:
+            window: Number of most recent dispatches kept
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+        self._count = 0
+
+    def record(self, ready_at: datetime, started_at: datetime) -> None:
+        """Record one dispatch.
+
+        Args:
+            ready_at: When the job became runnable
+            started_at: When a worker took it
+        """
+        self._samples.append(max(0.0, (started_at - ready_at).total_seconds()))
+        self._count += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get count and latency percentiles in milliseconds (None if no samples)."""
+        ordered = sorted(self._samples)
+        if not ordered:
+            return {
+                "count": 0,
+                "last_ms": None,
+                "p50_ms": None,
+                "p95_ms": None,
+                "max_ms": None,
+            }
+        return {
+            "count": self._count,
+            "last_ms": self._samples[-1] * 1000,
+            "p50_ms": ordered[len(ordered) // 2] * 1000,
+            "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+            "max_ms": ordered[-1] * 1000,
+        }
+
+
 class JobQueue:
     """In-memory job queue for background workers.
 
@@ -106,23 +524,54 @@ class JobQueue:
     consider using Redis, RabbitMQ, or Celery.
     """
 
-    def __init__(self, max_concurrent_jobs: int = 5) -> None:
+    def __init__(
+        self,
+        max_concurrent_jobs: int = 5,
+        type_limits: dict[JobType, int] | None = None,
+        type_weights: dict[JobType, float] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        history_size: int = 1000,
+        history_retention: float | None = None,
+        event_bus: "EventBus | None" = None,
+    ) -> None:
         """Initialize job queue.
 
         Args:
-            max_concurrent_jobs: Maximum number of jobs to run concurrently
+            max_concurrent_jobs: Maximum number of jobs to run concurrently (all types)
+            type_limits: Maximum concurrent jobs per type (default: DEFAULT_TYPE_LIMITS)
+            type_weights: Fair-share weight per type (default: DEFAULT_TYPE_WEIGHTS)
+            retry_policy: Backoff and per-type retry caps (default: RetryPolicy())
+            history_size: Maximum number of finished jobs kept for get_job/list_jobs
+            history_retention: Seconds finished jobs are kept (None = no age limit)
+            event_bus: Bus that receives a "job_update" event on every state change
         """
-        self._queue: asyncio.PriorityQueue[tuple[int, int, Job]] = (
-            asyncio.PriorityQueue()
-        )
-        self._jobs: dict[str, Job] = {}
+        # One priority heap per job type: (-priority, counter, job)
+        self._pending: dict[JobType, list[tuple[int, int, Job]]] = {}
+        # Timer heap of jobs waiting for their retry: (due monotonic time, counter, job)
+        self._delayed: list[tuple[float, int, Job]] = []
+        # Live heap entry (counter) per queued job, and dedup key -> active job id
+        self._queued: dict[str, int] = {}
+        self._active_keys: dict[str, str] = {}
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._jobs = JobStore(history_size, history_retention)
+        self._history_retention = history_retention
         self._running_jobs: set[str] = set()
         self._max_concurrent = max_concurrent_jobs
+        self._scheduler = JobTypeScheduler(
+            limits=DEFAULT_TYPE_LIMITS if type_limits is None else type_limits,
+            weights=DEFAULT_TYPE_WEIGHTS if type_weights is None else type_weights,
+        )
         self._workers: list[asyncio.Task[None]] = []
         self._shutdown = False
         self._paused = False
         self._handlers: dict[JobType, Callable[[Job], Coroutine[Any, Any, Any]]] = {}
+        self._batch_handlers: dict[JobType, BatchHandler] = {}
         self._counter = 0  # Counter for stable sorting
+        # Set whenever a worker might be able to do something new: job enqueued, slot freed,
+        # limits changed, resumed, stopping. Workers wait on it instead of sleep-polling.
+        self._wakeup = asyncio.Event()
+        self._dispatch_latency = DispatchLatency()
+        self._event_bus = event_bus
 
     def register_handler(
         self,
@@ -135,19 +584,52 @@ class JobQueue:
             job_type: Type of job to handle
             handler: Async function to process the job
         """
+        self._batch_handlers.pop(job_type, None)
         self._handlers[job_type] = handler
 
+    def register_batch_handler(
+        self,
+        job_type: JobType,
+        handler: Callable[[list[Job]], Coroutine[Any, Any, list[Any]]],
+        max_batch_size: int = 50,
+        max_wait: float = 0.0,
+    ) -> None:
+        """Register a handler that processes several jobs of one type per call.
+
+        Args:
+            job_type: Type of job to handle
+            handler: Async function taking the jobs and returning one result per
+                job (an Exception as a job's result fails only that job)
+            max_batch_size: Maximum number of jobs per handler call
+            max_wait: Seconds to wait for more jobs when fewer are ready
+
+        Raises:
+            ValueError: If max_batch_size < 1 or max_wait < 0
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_wait < 0:
+            raise ValueError("max_wait must be >= 0")
+        self._handlers.pop(job_type, None)
+        self._batch_handlers[job_type] = BatchHandler(handler, max_batch_size, max_wait)
+
     # Hey future me: Job queue - in-memory task queue for background work
     # WHY in-memory? Simple to start, no external dependencies (Redis/RabbitMQ)
     # WHY priority queue? Urgent tasks (user-initiated) should jump ahead of bulk automation
     # GOTCHA: In-memory means jobs lost on restart - for production, use persistent queue (Celery/RQ)
     # Priority sorting: Higher priority number = processed first (max-heap using negative priority)
+    # Hey future me - dedup_key makes enqueue() idempotent while a job is still pending/running:
+    # queueing two playlists that share tracks, or an automation trigger firing twice, returns the
+    # EXISTING job id instead of doing the slskd/Spotify work twice. A higher priority is passed
+    # on to the waiting job (user clicks "download now" on something automation already queued);
+    # it's never lowered. Once the job finished, the same key creates a new job again.
     async def enqueue(
         self,
         job_type: JobType,
         payload: dict[str, Any],
         max_retries: int = 3,
         priority: int = 0,
+        dedup_key: str | None = None,
     ) -> str:
         """Add a job to the queue.
 
@@ -156,26 +638,72 @@ class JobQueue:
             payload: Job data
             max_retries: Maximum retry attempts
             priority: Job priority (higher value = higher priority)
+            dedup_key: Idempotency key (see make_dedup_key); a pending or running
+                job with the same key is returned instead of creating a new one
 
         Returns:
-            Job ID
+            Job ID (of the existing job if coalesced)
         """
+        if dedup_key is not None:
+            existing = self._active_job_for_key(dedup_key)
+            if existing is not None:
+                self._raise_priority(existing, priority)
+                return existing.id
+
         job = Job(
             id=str(uuid.uuid4()),
             job_type=job_type,
             payload=payload,
             max_retries=max_retries,
             priority=priority,
+            dedup_key=dedup_key,
         )
 
-        self._jobs[job.id] = job
+        self._jobs.add(job)
+        if dedup_key is not None:
+            self._active_keys[dedup_key] = job.id
+        self._push(job)
+        self._wakeup.set()
+        self._publish(job)
+
+        return job.id
+
+    def _active_job_for_key(self, dedup_key: str) -> Job | None:
+        """Get the pending/running job holding a dedup key."""
+        job_id = self._active_keys.get(dedup_key)
+        job = self._jobs.get(job_id) if job_id else None
+        if job is None or job.status in FINISHED_STATUSES:
+            self._active_keys.pop(dedup_key, None)
+            return None
+        return job
+
+    def _release_key(self, job: Job) -> None:
+        """Free the dedup key of a finished job."""
+        if job.dedup_key and self._active_keys.get(job.dedup_key) == job.id:
+            del self._active_keys[job.dedup_key]
+
+    def _raise_priority(self, job: Job, priority: int) -> None:
+        """Raise the priority of a waiting job (never lowers it)."""
+        if priority <= job.priority or job.status != JobStatus.PENDING:
+            return
+        job.priority = priority
+        # Waiting in a ready heap: push a fresh entry, the old one is now stale.
+        # Waiting in the timer heap: _release_due_jobs() pushes it with the new priority.
+        if job.id in self._queued:
+            self._push(job)
+
+    def _push(self, job: Job) -> None:
+        """Add a job to the pending heap of its type."""
         # Use negative priority for max heap behavior (higher priority first)
         # Use counter for stable sorting (FIFO for same priority)
-        await self._queue.put((-job.priority, self._counter, job))
+        # _queued remembers the job's live entry - any older entry of it is stale
+        self._queued[job.id] = self._counter
+        heapq.heappush(
+            self._pending.setdefault(job.job_type, []),
+            (-job.priority, self._counter, job),
+        )
         self._counter += 1
 
-        return job.id
-
     async def get_job(self, job_id: str) -> Job | None:
         """Get job by ID.
 
@@ -187,6 +715,27 @@ class JobQueue:
         """
         return self._jobs.get(job_id)
 
+    # Hey future me - lets a producer fold new work into a job that hasn't started yet (the file
+    # watcher merges changed paths into its queued scan). False = already started, finished or
+    # gone - enqueue a new job instead.
+    async def update_pending_payload(
+        self, job_id: str, payload: dict[str, Any]
+    ) -> bool:
+        """Replace the payload of a job that is still waiting in the queue.
+
+        Args:
+            job_id: Job ID
+            payload: New job data
+
+        Returns:
+            True if updated, False if the job is no longer queued
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.id not in self._queued:
+            return False
+        job.payload = payload
+        return True
+
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a job.
 
@@ -200,10 +749,13 @@ class JobQueue:
         if not job:
             return False
 
-        if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+        if job.status in FINISHED_STATUSES:
             return False
 
         job.mark_cancelled()
+        self._jobs.update(job)
+        self._release_key(job)
+        self._publish(job)
         return True
 
     async def pause(self) -> None:
@@ -213,6 +765,7 @@ class JobQueue:
     async def resume(self) -> None:
         """Resume job processing globally."""
         self._paused = False
+        self._wakeup.set()
 
     def is_paused(self) -> bool:
         """Check if queue is paused."""
@@ -227,18 +780,85 @@ class JobQueue:
         if max_concurrent < 1:
             raise ValueError("max_concurrent must be at least 1")
         self._max_concurrent = max_concurrent
+        self._wakeup.set()
 
     def get_max_concurrent_jobs(self) -> int:
         """Get maximum concurrent jobs."""
         return self._max_concurrent
 
+    def set_type_limit(self, job_type: JobType, max_concurrent: int | None) -> None:
+        """Set maximum concurrent jobs of one type (applies to the next dispatch).
+
+        Args:
+            job_type: Job type
+            max_concurrent: Maximum concurrent jobs, 0 holds the type, None removes
+                the per-type limit (only the global limit applies)
+        """
+        self._scheduler.set_limit(job_type, max_concurrent)
+        self._wakeup.set()
+
+    def get_type_limit(self, job_type: JobType) -> int | None:
+        """Get maximum concurrent jobs of one type (None = global limit only)."""
+        return self._scheduler.get_limit(job_type)
+
+    def set_type_weight(self, job_type: JobType, weight: float) -> None:
+        """Set the fair-share weight of one type.
+
+        Args:
+            job_type: Job type
+            weight: Relative share of dispatches while several types wait (> 0)
+        """
+        self._scheduler.set_weight(job_type, weight)
+
+    def get_type_weight(self, job_type: JobType) -> float:
+        """Get the fair-share weight of one type."""
+        return self._scheduler.get_weight(job_type)
+
+    def _pending_by_type(self) -> dict[JobType, int]:
+        """Count pending jobs per type."""
+        counts: Counter[JobType] = Counter()
+        for heap in self._pending.values():
+            for _, counter, job in heap:
+                if (
+                    self._queued.get(job.id) == counter
+                    and job.status != JobStatus.CANCELLED
+                ):
+                    counts[job.job_type] += 1
+        for _, _, job in self._delayed:
+            if job.status != JobStatus.CANCELLED:
+                counts[job.job_type] += 1
+        return counts
+
+    def get_scheduling_stats(self) -> dict[str, Any]:
+        """Get global and per-type concurrency, weights, load and dispatch latency.
+
+        Returns:
+            Dictionary with max_concurrent_jobs, dispatch_latency and one entry
+            per job type
+        """
+        pending = self._pending_by_type()
+        return {
+            "max_concurrent_jobs": self._max_concurrent,
+            "running": len(self._running_jobs),
+            "dispatch_latency": self._dispatch_latency.snapshot(),
+            "job_types": {
+                job_type.value: {
+                    "max_concurrent": self._scheduler.get_limit(job_type),
+                    "weight": self._scheduler.get_weight(job_type),
+                    "running": self._scheduler.running(job_type),
+                    "pending": pending.get(job_type, 0),
+                }
+                for job_type in JobType
+            },
+        }
+
     async def list_jobs(
         self,
         status: JobStatus | None = None,
         job_type: JobType | None = None,
         limit: int = 100,
     ) -> list[Job]:
-        """List jobs with optional filtering.
+        """List jobs with optional filtering (newest first).
 
         Args:
             status: Filter by status
@@ -248,22 +868,12 @@ class JobQueue:
         Returns:
             List of jobs
         """
-        jobs = list(self._jobs.values())
-
-        # Apply filters
-        if status:
-            jobs = [j for j in jobs if j.status == status]
-        if job_type:
-            jobs = [j for j in jobs if j.job_type == job_type]
-
-        # Sort by creation time (newest first)
-        jobs.sort(key=lambda j: j.created_at, reverse=True)
-
-        return jobs[:limit]
+        return self._jobs.query(status=status, job_type=job_type, limit=limit)
 
     # Hey future me: Job execution with retry logic - exponential backoff on failures
     # WHY exponential backoff? 1s, 2s, 4s delays - gives transient issues time to resolve
     # Example: Network glitch fails download - retry immediately fails again, but retry after 2s succeeds
+    # The backoff is NOT slept here - the job waits in the timer heap and the worker slot is free
     # GOTCHA: Re-queued jobs go to BACK of queue (by priority) - could delay if queue is full
     async def _process_job(self, job: Job) -> None:
         """Process a single job.
@@ -275,7 +885,9 @@ class JobQueue:
             return
 
         job.mark_running()
+        self._jobs.update(job)
         self._running_jobs.add(job.id)
+        self._publish(job)
 
         try:
             # Get handler for job type
@@ -288,78 +900,238 @@ class JobQueue:
             job.mark_completed(result)
 
         except Exception as e:
-            error_msg = str(e)
-            job.mark_failed(error_msg)
-
-            # Re-queue with exponential backoff if should retry
-            if job.should_retry():
-                # Calculate backoff delay: 1s, 2s, 4s for retries 1, 2, 3
-                backoff_delay = 2 ** (job.retries - 1)
-                logger.info(
-                    "Job %s failed (retry %d/%d), retrying in %ds: %s",
-                    job.id,
-                    job.retries,
-                    job.max_retries,
-                    backoff_delay,
-                    error_msg,
-                )
-                await asyncio.sleep(backoff_delay)
-                # Re-queue with same priority
-                await self._queue.put((-job.priority, self._counter, job))
-                self._counter += 1
+            job.mark_failed(str(e))
+            self._retry_if_allowed(job)
+
+        finally:
+            self._finish(job)
+
+    async def _process_batch(self, jobs: list[Job]) -> None:
+        """Process jobs of one type with their batch handler.
+
+        Args:
+            jobs: Jobs taken from the queue (same job type)
+        """
+        jobs = [job for job in jobs if job.status != JobStatus.CANCELLED]
+        if not jobs:
+            return
+
+        for job in jobs:
+            job.mark_running()
+            self._jobs.update(job)
+            self._running_jobs.add(job.id)
+            self._publish(job)
 
+        try:
+            await self._run_batch_handler(jobs)
+            for job in jobs:
+                if job.status == JobStatus.FAILED:
+                    self._retry_if_allowed(job)
         finally:
-            self._running_jobs.discard(job.id)
+            for job in jobs:
+                self._finish(job)
+
+    async def _run_batch_handler(self, jobs: list[Job]) -> None:
+        """Call the batch handler and mark each job completed or failed."""
+        try:
+            batch = self._batch_handlers.get(jobs[0].job_type)
+            if not batch:
+                raise ValueError(
+                    f"No batch handler registered for job type: {jobs[0].job_type}"
+                )
+            results = await batch.handler(jobs)
+            if len(results) != len(jobs):
+                raise ValueError(
+                    f"Batch handler returned {len(results)} results for {len(jobs)} jobs"
+                )
+        except Exception as e:
+            for job in jobs:
+                job.mark_failed(str(e))
+            return
+
+        for job, result in zip(jobs, results, strict=True):
+            if isinstance(result, Exception):
+                job.mark_failed(str(result))
+            else:
+                job.mark_completed(result)
+
+    def _retry_if_allowed(self, job: Job) -> None:
+        """Re-queue a failed job with exponential backoff if it may retry."""
+        if not self._retry_policy.should_retry(job):
+            return
+        backoff_delay = self._retry_policy.delay(job.retries)
+        logger.info(
+            "Job %s failed (retry %d/%d), retrying in %.1fs: %s",
+            job.id,
+            job.retries,
+            job.max_retries,
+            backoff_delay,
+            job.error,
+        )
+        self._schedule_retry(job, backoff_delay)
+
+    def _finish(self, job: Job) -> None:
+        """Store a processed job's state and free what it held."""
+        self._jobs.update(job)
+        if job.status in FINISHED_STATUSES:
+            self._release_key(job)
+        self._running_jobs.discard(job.id)
+        self._publish(job)
+
+    # Hey future me - job deltas for the live UI (SSE). Small on purpose: no payload/result,
+    # the browser fetches details if it cares. status lets callers report what was STORED
+    # (the persistent queue writes "pending" for a failed job that will be retried).
+    def _publish(self, job: Job, status: JobStatus | None = None) -> None:
+        """Publish a job's state change on the event bus (if any)."""
+        if self._event_bus is None:
+            return
+        self._event_bus.publish(
+            "job_update",
+            {
+                "id": job.id,
+                "job_type": job.job_type.value,
+                "status": (status or job.status).value,
+                "priority": job.priority,
+                "retries": job.retries,
+                "error": job.error,
+                "started_at": job.started_at.isoformat() if job.started_at else None,
+                "completed_at": (
+                    job.completed_at.isoformat() if job.completed_at else None
+                ),
+            },
+        )
 
     # Hey future me: Worker loop - the main event loop that processes jobs
     # WHY respect max_concurrent? slskd has limits, don't DDoS it with 100 simultaneous downloads
-    # WHY sleep intervals (0.1s, 0.5s, 1.0s)? Prevent busy-waiting and CPU spinning
-    # GOTCHA: Shutdown is checked every second max - could delay shutdown up to 1 second
+    # NO sleep-polling: an idle or paused worker waits on _wakeup (or the next retry coming due),
+    # so a job enqueued on an idle queue starts right away and an idle host gets zero wakeups.
+    # GOTCHA: clear() -> check -> wait() has NO await in between, so a set() can't slip through
+    # unseen. Every worker that was already waiting wakes up on set(), even if another clears it.
     async def _worker_loop(self) -> None:
         """Worker loop to process jobs from queue."""
         while not self._shutdown:
             try:
-                # Skip processing if paused
-                if self._paused:
-                    await asyncio.sleep(0.5)
-                    continue
+                self._wakeup.clear()
 
                 # Hey future me: The concurrency limit enforcement - wait for free slot before taking next job
-                # WHY while loop? Keep checking until slot opens or shutdown requested
-                # WHY 0.1s sleep? Fast enough response without CPU burning
                 # GOTCHA: We wait for slot BEFORE dequeuing - prevents queue from being drained while all workers busy
-
-                # Wait for available slot
-                while (
-                    len(self._running_jobs) >= self._max_concurrent
-                    and not self._shutdown
+                # Counts dispatches (type slots), so a batch of 50 jobs is ONE slot
+                if (
+                    self._paused
+                    or self._scheduler.total_running() >= self._max_concurrent
                 ):
-                    await asyncio.sleep(0.1)
-
-                if self._shutdown:
-                    break
-
-                # Wait for job with timeout to allow checking shutdown flag
-                priority_tuple = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                _, _, job = priority_tuple  # Extract job from priority tuple
+                    await self._wakeup.wait()
+                    continue
 
-                # Skip if paused while waiting
-                if self._paused:
-                    # Put job back in queue
-                    await self._queue.put(priority_tuple)
-                    await asyncio.sleep(0.5)
+                job = self._next_job()
+                if job is None:
+                    await self._wait_for_work()
                     continue
 
                 # Process job directly (not as a new task) to respect concurrency limit
-                await self._process_job(job)
+                try:
+                    if job.job_type in self._batch_handlers:
+                        await self._process_batch(await self._collect_batch(job))
+                    else:
+                        await self._process_job(job)
+                finally:
+                    self._scheduler.release(job.job_type)
+                    self._wakeup.set()
 
-            except TimeoutError:
-                continue
             except Exception as e:
                 # Log error but continue processing
                 logger.exception("Worker error: %s", e)
                 continue
 
+    async def _wait_for_work(self) -> None:
+        """Sleep until something changes or the next delayed retry is due."""
+        timeout = self._delayed[0][0] - time.monotonic() if self._delayed else None
+        with suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+    def _schedule_retry(self, job: Job, delay: float) -> None:
+        """Park a failed job in the timer heap until its retry is due."""
+        job.mark_retry(delay)
+        heapq.heappush(self._delayed, (time.monotonic() + delay, self._counter, job))
+        self._counter += 1
+
+    def _release_due_jobs(self) -> None:
+        """Move delayed jobs whose run_after has passed to the pending heaps."""
+        now = time.monotonic()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, job = heapq.heappop(self._delayed)
+            if job.status != JobStatus.CANCELLED:
+                self._push(job)
+
+    # Listen up - this is the ONLY place jobs leave the pending heaps. The scheduler picks the type
+    # (per-type limit + weighted fairness), the heap of that type gives its highest-priority job.
+    # Cancelled jobs are dropped here lazily and don't use up the reserved slot. No await in here,
+    # so two workers can never reserve the same slot or pop the same job.
+    def _next_job(self) -> Job | None:
+        """Take the next job to run and reserve its type slot.
+
+        Returns:
+            Job (caller must release its type slot), or None if nothing may run
+        """
+        self._release_due_jobs()
+        while True:
+            job_type = self._scheduler.reserve(
+                job_type for job_type, heap in self._pending.items() if heap
+            )
+            if job_type is None:
+                return None
+            job = self._pop_pending(job_type)
+            if job is not None:
+                return job
+            # Only stale/cancelled entries left for this type
+            self._scheduler.release(job_type)
+
+    def _pop_pending(self, job_type: JobType) -> Job | None:
+        """Pop the highest-priority live job of one type (None if there is none)."""
+        heap = self._pending.get(job_type)
+        while heap:
+            _, counter, job = heapq.heappop(heap)
+            if self._queued.get(job.id) != counter:
+                # Stale entry left behind by a priority raise
+                continue
+            del self._queued[job.id]
+            if job.status != JobStatus.CANCELLED:
+                self._dispatch_latency.record(
+                    job.run_after or job.created_at, datetime.now(UTC)
+                )
+                return job
+        return None
+
+    # Listen up - the first job already holds the type slot (from _next_job), the rest of the batch
+    # rides along on it. Lingering only happens when a batch handler asked for it (max_wait > 0).
+    async def _collect_batch(self, first: Job) -> list[Job]:
+        """Gather up to max_batch_size ready jobs of the first job's type.
+
+        Args:
+            first: Job already taken by _next_job()
+
+        Returns:
+            Jobs for one batch handler call, first job included
+        """
+        batch = self._batch_handlers[first.job_type]
+        jobs = [first]
+        deadline = time.monotonic() + batch.max_wait
+        while True:
+            self._wakeup.clear()
+            self._release_due_jobs()
+            while len(jobs) < batch.max_batch_size:
+                job = self._pop_pending(first.job_type)
+                if job is None:
+                    break
+                jobs.append(job)
+            remaining = deadline - time.monotonic()
+            if len(jobs) >= batch.max_batch_size or remaining <= 0 or self._shutdown:
+                return jobs
+            if self._delayed:
+                remaining = min(remaining, self._delayed[0][0] - time.monotonic())
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(remaining, 0))
+
     async def start(self, num_workers: int = 3) -> None:
         """Start worker threads.
 
@@ -374,6 +1146,7 @@ class JobQueue:
     async def stop(self) -> None:
         """Stop all workers and wait for completion."""
         self._shutdown = True
+        self._wakeup.set()
 
         # Wait for workers to finish
         if self._workers:
@@ -422,13 +1195,13 @@ class JobQueue:
         Returns:
             Dictionary with queue statistics
         """
-        jobs = list(self._jobs.values())
         return {
-            "total_jobs": len(jobs),
-            "pending": len([j for j in jobs if j.status == JobStatus.PENDING]),
+            "total_jobs": len(self._jobs),
+            "pending": self._jobs.count(JobStatus.PENDING),
             "running": len(self._running_jobs),
-            "completed": len([j for j in jobs if j.status == JobStatus.COMPLETED]),
-            "failed": len([j for j in jobs if j.status == JobStatus.FAILED]),
-            "cancelled": len([j for j in jobs if j.status == JobStatus.CANCELLED]),
-            "queue_size": self._queue.qsize(),
+            "completed": self._jobs.count(JobStatus.COMPLETED),
+            "failed": self._jobs.count(JobStatus.FAILED),
+            "cancelled": self._jobs.count(JobStatus.CANCELLED),
+            "queue_size": len(self._queued),
+            "delayed": len(self._delayed),
         }
@@ -11,6 +11,9 @@ from soulspot.application.workers.job_queue import Job, JobQueue, JobType
 from soulspot.config import Settings
 
 if TYPE_CHECKING:
+    from soulspot.application.cache import SpotifyCache
+    from soulspot.domain.ports import ISpotifyClient
+    from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
     from soulspot.infrastructure.persistence.database import Database
 
 logger = logging.getLogger(__name__)
@@ -34,6 +37,8 @@ class LibraryEnrichmentWorker:
         job_queue: JobQueue,
         db: "Database",
         settings: Settings,
+        spotify_cache: "SpotifyCache | None" = None,
+        http: "HttpClientRegistry | None" = None,
     ) -> None:
         """Initialize worker.
 
@@ -41,10 +46,14 @@ class LibraryEnrichmentWorker:
             job_queue: Job queue for background processing
             db: Database instance for creating sessions
             settings: Application settings
+            spotify_cache: Shared Spotify response cache (None = no caching)
+            http: Shared HTTP client registry (None = per-client connections)
         """
         self._job_queue = job_queue
         self.db = db
         self.settings = settings
+        self._spotify_cache = spotify_cache
+        self._http = http
 
     def register(self) -> None:
         """Register handler with job queue.
@@ -66,6 +75,7 @@ class LibraryEnrichmentWorker:
         Returns:
             Enrichment statistics dict
         """
+        from soulspot.application.cache import CachedSpotifyClient
         from soulspot.application.services.local_library_enrichment_service import (
             LocalLibraryEnrichmentService,
         )
@@ -94,12 +104,21 @@ class LibraryEnrichmentWorker:
                     }
 
                 # Create Spotify client and enrichment service
-                spotify_client = SpotifyClient(self.settings)
+                # Hey - search_artist/search_track results go through the shared cache, so
+                # re-running enrichment (or a scan-triggered run right after) doesn't re-search
+                spotify_client: ISpotifyClient = SpotifyClient(
+                    self.settings.spotify, http=self._http
+                )
+                if self._spotify_cache is not None:
+                    spotify_client = CachedSpotifyClient(
+                        spotify_client, self._spotify_cache
+                    )
                 service = LocalLibraryEnrichmentService(
                     session=session,
                     spotify_client=spotify_client,
                     settings=self.settings,
                     access_token=access_token,
+                    http=self._http,
                 )
 
                 # Run batch enrichment
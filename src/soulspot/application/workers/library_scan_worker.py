@@ -5,12 +5,21 @@
 """Library scan worker for background scanning jobs."""
 
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from soulspot.application.workers.job_queue import Job, JobQueue, JobType
+from soulspot.application.workers.job_queue import (
+    Job,
+    JobQueue,
+    JobStatus,
+    JobType,
+    make_dedup_key,
+)
 from soulspot.config import Settings
 
 if TYPE_CHECKING:
+    from soulspot.application.services.event_bus import EventBus
+    from soulspot.application.services.file_watcher import ChangeBatch
     from soulspot.infrastructure.persistence.database import Database
 
 logger = logging.getLogger(__name__)
@@ -33,6 +42,7 @@ class LibraryScanWorker:
         job_queue: JobQueue,
         db: "Database",
         settings: Settings,
+        event_bus: "EventBus | None" = None,
     ) -> None:
         """Initialize worker.
 
@@ -40,10 +50,14 @@ class LibraryScanWorker:
             job_queue: Job queue for background processing
             db: Database instance for creating sessions
             settings: Application settings
+            event_bus: Bus that receives "scan_progress" events while scanning
         """
         self._job_queue = job_queue
         self.db = db
         self.settings = settings
+        self._event_bus = event_bus
+        # Last watcher scan job - new batches are merged into it while it's still queued
+        self._watcher_job_id: str | None = None
 
     def register(self) -> None:
         """Register handler with job queue.
@@ -52,6 +66,42 @@ class LibraryScanWorker:
         """
         self._job_queue.register_handler(JobType.LIBRARY_SCAN, self._handle_scan_job)
 
+    # Hey future me - this is the FilesystemWatcher subscriber for the music dir! Every debounced
+    # batch becomes a small LIBRARY_SCAN job with explicit paths, so new/changed files are indexed
+    # within seconds without walking the library. Going through the JobQueue (instead of scanning
+    # right here in the watcher task) keeps scans visible in the jobs API and off the watcher loop.
+    # While our last watcher job is still queued (e.g. behind a long full scan - LIBRARY_SCAN runs
+    # one at a time) new batches are merged into its paths instead of piling up more small jobs.
+    # Once it has started, changes go into a new job so nothing is missed.
+    async def handle_changes(self, batch: "ChangeBatch") -> None:
+        """Queue an incremental scan for a watcher change batch.
+
+        Args:
+            batch: Coalesced changes below the music directory
+        """
+        paths = [str(p) for p in batch.changes]
+        if self._watcher_job_id is not None:
+            job = await self._job_queue.get_job(self._watcher_job_id)
+            if job is not None and job.status == JobStatus.PENDING:
+                merged = sorted({*job.payload.get("paths", []), *paths})
+                if await self._job_queue.update_pending_payload(
+                    job.id, {**job.payload, "paths": merged}
+                ):
+                    logger.debug(
+                        f"Merged {len(paths)} changed path(s) into queued scan {job.id}"
+                    )
+                    return
+
+        logger.debug(f"Queuing incremental scan for {len(paths)} changed path(s)")
+        self._watcher_job_id = await self._job_queue.enqueue(
+            job_type=JobType.LIBRARY_SCAN,
+            payload={
+                "incremental": True,
+                "paths": paths,
+                "triggered_by": "file_watcher",
+            },
+        )
+
     async def _handle_scan_job(self, job: Job) -> dict[str, Any]:
         """Handle a library scan job.
 
@@ -69,9 +119,13 @@ class LibraryScanWorker:
 
         payload = job.payload
         incremental = payload.get("incremental", True)
+        paths = payload.get("paths")
+        resume = payload.get("resume", True)
+        scan_id = payload.get("scan_id")
 
         logger.info(
-            f"Starting library scan job {job.id} " f"(incremental={incremental})"
+            f"Starting library scan job {job.id} "
+            f"(incremental={incremental}, paths={len(paths) if paths else 'all'})"
         )
 
         # Create fresh session for this job using session_scope context manager
@@ -91,12 +145,29 @@ class LibraryScanWorker:
                         "progress": progress,
                         "stats": stats,
                     }
-
-                # Run scan
-                stats = await service.scan_library(
-                    incremental=incremental,
-                    progress_callback=progress_callback,
-                )
+                    if self._event_bus is not None:
+                        self._event_bus.publish(
+                            "scan_progress",
+                            {
+                                "job_id": job.id,
+                                "progress": progress,
+                                "stats": dict(stats),
+                            },
+                        )
+
+                # Run scan - watcher batches carry explicit paths, everything else walks the tree
+                if paths:
+                    stats = await service.scan_paths(
+                        [Path(p) for p in paths],
+                        progress_callback=progress_callback,
+                    )
+                else:
+                    stats = await service.scan_library(
+                        incremental=incremental,
+                        progress_callback=progress_callback,
+                        resume=resume,
+                        scan_id=scan_id,
+                    )
 
                 logger.info(
                     f"Library scan job {job.id} complete: "
@@ -114,6 +185,47 @@ class LibraryScanWorker:
                 logger.error(f"Library scan job {job.id} failed: {e}")
                 raise
 
+    # Hey future me - called once at startup. A library_scans row still "running" with a checkpoint
+    # means the process died mid-scan (the in-memory JobQueue lost the job), so we queue a job that
+    # continues from that checkpoint instead of waiting for someone to start over from zero.
+    # Only for the in-memory queue: with the database backend the interrupted job's own row is
+    # still in background_jobs and lease recovery requeues it - a second job would scan twice.
+    # The in-memory queue only ever lives in this one process, so a "running" row can't belong to
+    # anyone else - no staleness check, the dedup key is what stops double-queueing.
+    async def resume_interrupted_scan(self) -> str | None:
+        """Queue a LIBRARY_SCAN job for an interrupted checkpointed scan.
+
+        Returns:
+            Job ID, or None if there is nothing to resume
+        """
+        from soulspot.application.workers.persistent_job_queue import (
+            PersistentJobQueue,
+        )
+        from soulspot.infrastructure.persistence.repositories import (
+            LibraryScanRepository,
+        )
+
+        if isinstance(self._job_queue, PersistentJobQueue):
+            return None
+
+        async with self.db.session_scope() as session:
+            scan = await LibraryScanRepository(session).get_resumable(
+                str(self.settings.storage.music_path)
+            )
+            if scan is None or scan.status != "running" or not scan.checkpoint:
+                return None
+            scan_id = scan.id
+            incremental = scan.checkpoint.get("incremental", True)
+
+        logger.info(f"Resuming interrupted library scan {scan_id}")
+        return await self._job_queue.enqueue(
+            job_type=JobType.LIBRARY_SCAN,
+            payload={"incremental": incremental, "resume": True, "scan_id": scan_id},
+            max_retries=1,
+            priority=5,
+            dedup_key=make_dedup_key(JobType.LIBRARY_SCAN, scan_id),
+        )
+
     async def _trigger_enrichment_if_enabled(
         self,
         session: Any,
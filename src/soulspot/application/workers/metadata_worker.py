@@ -3,7 +3,12 @@
 from typing import Any
 
 from soulspot.application.use_cases import EnrichMetadataUseCase
-from soulspot.application.workers.job_queue import Job, JobQueue, JobType
+from soulspot.application.workers.job_queue import (
+    Job,
+    JobQueue,
+    JobType,
+    make_dedup_key,
+)
 from soulspot.domain.ports import (
     IAlbumRepository,
     IArtistRepository,
@@ -145,6 +150,10 @@ class MetadataWorker:
                 "enrich_album": enrich_album,
             },
             max_retries=max_retries,
+            # A forced refresh must not be swallowed by a pending normal enrichment
+            dedup_key=None
+            if force_refresh
+            else make_dedup_key(JobType.METADATA_ENRICHMENT, track_id),
         )
 
     # Yo, batch enrichment for multiple tracks - loops and calls enqueue_metadata_enrichment for each. This
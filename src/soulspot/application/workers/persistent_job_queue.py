@@ -0,0 +1,693 @@
+# Hey future me - this is the DURABLE JobQueue backend (download.queue_backend = "database")!
+# The in-memory JobQueue loses every queued job on restart - with a few thousand queued downloads
+# and enrichment jobs that means re-running all the Spotify/slskd calls that produced them.
+# This subclass keeps the exact same API (enqueue/get_job/list_jobs/cancel_job/wait_for_job,
+# register_handler, start/stop, pause/resume) but the jobs live in the background_jobs table:
+# - enqueue() INSERTs + commits before returning, so an acknowledged job survives a crash
+# - workers CLAIM jobs atomically (BackgroundJobRepository.claim_next), never two at once
+# - retries don't sleep inside the worker slot: the row goes back to pending with
+#   run_after = now + backoff (RetryPolicy) and any worker picks it up when it's due
+# - workers refresh heartbeat_at of their running jobs; rows whose heartbeat is older than the
+#   lease timeout (their process died) go back to pending - on start() and periodically, so
+#   several worker processes can share the table (python -m soulspot.worker)
+# Delivery is AT-LEAST-ONCE: a job whose handler finished but whose result wasn't committed yet
+# when the process died runs again after recovery. Handlers must tolerate that (they already have
+# to for retries). Payloads and results are stored as JSON - non-JSON values are stringified.
+"""Persistent (database-backed) job queue."""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, suppress
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from soulspot.application.workers.job_queue import (
+    Job,
+    JobQueue,
+    JobStatus,
+    JobType,
+    RetryPolicy,
+)
+from soulspot.infrastructure.persistence.models import (
+    BackgroundJobModel,
+    ensure_utc_aware,
+)
+from soulspot.infrastructure.persistence.repositories import BackgroundJobRepository
+
+if TYPE_CHECKING:
+    from soulspot.application.services.event_bus import EventBus
+
+logger = logging.getLogger(__name__)
+
+SessionScope = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+# Minimum seconds between two get_stats() refreshes from the database
+STATS_REFRESH_INTERVAL = 1.0
+
+# Seconds between two deletions of finished jobs past history_retention
+PRUNE_INTERVAL = 600.0
+
+# Default seconds between polls while no pending job is waiting for its run_after
+IDLE_POLL_INTERVAL = 10.0
+
+# Rows written by a newer version may carry job types this process doesn't know - get_job()
+# and list_jobs() leave them out instead of failing on JobType(...)
+_JOB_TYPE_VALUES = {job_type.value for job_type in JobType}
+
+
+def _json_safe(value: Any) -> Any:
+    """Convert a payload/result to plain JSON types (unknown objects become str)."""
+    try:
+        return json.loads(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def _optional_utc(value: datetime | None) -> datetime | None:
+    return ensure_utc_aware(value) if value is not None else None
+
+
+def job_from_model(model: BackgroundJobModel) -> Job:
+    """Build a Job from a background_jobs row."""
+    return Job(
+        id=model.id,
+        job_type=JobType(model.job_type),
+        payload=model.payload or {},
+        status=JobStatus(model.status),
+        priority=model.priority,
+        created_at=ensure_utc_aware(model.created_at),
+        started_at=_optional_utc(model.started_at),
+        completed_at=_optional_utc(model.completed_at),
+        error=model.error,
+        result=model.result,
+        retries=model.retries,
+        max_retries=model.max_retries,
+        run_after=_optional_utc(model.run_after),
+        dedup_key=model.dedup_key,
+    )
+
+
+class PersistentJobQueue(JobQueue):
+    """JobQueue whose jobs are stored in the database and survive restarts.
+
+    Usage:
+        job_queue = PersistentJobQueue(session_scope=db.session_scope)
+        job_queue.register_handler(JobType.DOWNLOAD, handler)
+        await job_queue.start(num_workers=3)  # recovers interrupted jobs first
+    """
+
+    def __init__(
+        self,
+        session_scope: SessionScope,
+        max_concurrent_jobs: int = 5,
+        poll_interval: float = 1.0,
+        idle_poll_interval: float = IDLE_POLL_INTERVAL,
+        worker_id: str | None = None,
+        type_limits: dict[JobType, int] | None = None,
+        type_weights: dict[JobType, float] | None = None,
+        retry_policy: RetryPolicy | None = None,
+        history_retention: float | None = None,
+        lease_timeout: float = 60.0,
+        event_bus: "EventBus | None" = None,
+    ) -> None:
+        """Initialize persistent job queue.
+
+        Args:
+            session_scope: Async context manager factory for DB sessions (commits on exit)
+            max_concurrent_jobs: Maximum number of jobs to run concurrently (all types)
+            poll_interval: Minimum seconds between two polls for due jobs (and the
+                back-off after a database error)
+            idle_poll_interval: Seconds between polls while no pending job has a
+                known run_after - bounds how late jobs enqueued by other processes start
+            worker_id: Name stored in claimed_by (default: host:pid:random)
+            type_limits: Maximum concurrent jobs per type (default: DEFAULT_TYPE_LIMITS)
+            type_weights: Fair-share weight per type (default: DEFAULT_TYPE_WEIGHTS)
+            retry_policy: Backoff and per-type retry caps (default: RetryPolicy())
+            history_retention: Seconds finished jobs stay in the table (None = forever)
+            lease_timeout: Seconds without heartbeat after which a running job counts
+                as abandoned and is requeued
+            event_bus: Bus that receives a "job_update" event on every state change
+                made by this process
+        """
+        super().__init__(
+            max_concurrent_jobs=max_concurrent_jobs,
+            type_limits=type_limits,
+            type_weights=type_weights,
+            retry_policy=retry_policy,
+            history_retention=history_retention,
+            event_bus=event_bus,
+        )
+        self._session_scope = session_scope
+        self._poll_interval = poll_interval
+        self._idle_poll_interval = max(idle_poll_interval, poll_interval)
+        self._poll_wakeup = asyncio.Event()
+        self._poll_task: asyncio.Task[None] | None = None
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )[:64]
+        self._status_counts: dict[str, int] = {}
+        self._pending_counts: dict[str, int] = {}
+        self._stats_refreshed_at = 0.0
+        self._stats_task: asyncio.Task[None] | None = None
+        self._pruned_at: float | None = None
+        self._lease_timeout = lease_timeout
+        self._heartbeat_task: asyncio.Task[None] | None = None
+
+    # Listen up - dedup is enforced by the partial unique index on dedup_key (pending/running rows
+    # only), the lookup first is just the cheap common path. Two processes racing past the lookup:
+    # the second INSERT fails on the index and we return the job that won.
+    async def enqueue(
+        self,
+        job_type: JobType,
+        payload: dict[str, Any],
+        max_retries: int = 3,
+        priority: int = 0,
+        dedup_key: str | None = None,
+    ) -> str:
+        """Persist a job and wake up idle workers.
+
+        Args:
+            job_type: Type of job
+            payload: Job data (stored as JSON)
+            max_retries: Maximum retry attempts
+            priority: Job priority (higher value = higher priority)
+            dedup_key: Idempotency key; a pending or running job with the same
+                key is returned (and its priority raised) instead
+
+        Returns:
+            Job ID (of the existing job if coalesced)
+        """
+        if dedup_key is not None:
+            existing_id = await self._coalesce(dedup_key, priority)
+            if existing_id is not None:
+                return existing_id
+
+        job = Job(
+            id=str(uuid.uuid4()),
+            job_type=job_type,
+            payload=payload,
+            max_retries=max_retries,
+            priority=priority,
+            dedup_key=dedup_key,
+        )
+        try:
+            async with self._session_scope() as session:
+                await BackgroundJobRepository(session).add(
+                    {
+                        "id": job.id,
+                        "job_type": job.job_type.value,
+                        "status": job.status.value,
+                        "priority": job.priority,
+                        "payload": _json_safe(job.payload),
+                        "max_retries": job.max_retries,
+                        "dedup_key": dedup_key,
+                        "run_after": job.created_at,
+                        "created_at": job.created_at,
+                    }
+                )
+        except IntegrityError:
+            if dedup_key is None:
+                raise
+            existing_id = await self._coalesce(dedup_key, priority)
+            if existing_id is None:
+                raise
+            return existing_id
+        self._wakeup.set()
+        self._publish(job)
+        return job.id
+
+    async def _coalesce(self, dedup_key: str, priority: int) -> str | None:
+        """Return the active job with dedup_key (raising its priority), if any."""
+        async with self._session_scope() as session:
+            repo = BackgroundJobRepository(session)
+            existing = await repo.get_active_by_dedup_key(dedup_key)
+            if existing is None:
+                return None
+            await repo.raise_priority(existing.id, priority)
+            return existing.id
+
+    async def get_job(self, job_id: str) -> Job | None:
+        """Get job by ID.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job if found (and of a known type), None otherwise
+        """
+        async with self._session_scope() as session:
+            model = await BackgroundJobRepository(session).get(job_id)
+            if model is None or model.job_type not in _JOB_TYPE_VALUES:
+                return None
+            return job_from_model(model)
+
+    async def update_pending_payload(
+        self, job_id: str, payload: dict[str, Any]
+    ) -> bool:
+        """Replace the payload of a job nobody has claimed yet.
+
+        Args:
+            job_id: Job ID
+            payload: New job data (stored as JSON)
+
+        Returns:
+            True if updated, False if the job is no longer pending
+        """
+        async with self._session_scope() as session:
+            return await BackgroundJobRepository(session).update_pending_payload(
+                job_id, _json_safe(payload)
+            )
+
+    async def cancel_job(self, job_id: str) -> bool:
+        """Cancel a pending or running job.
+
+        A running handler is not interrupted, but its result is discarded.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            True if cancelled, False if not found or already finished
+        """
+        async with self._session_scope() as session:
+            cancelled = await BackgroundJobRepository(session).cancel(job_id)
+        if cancelled and self._event_bus is not None:
+            self._event_bus.publish(
+                "job_update", {"id": job_id, "status": JobStatus.CANCELLED.value}
+            )
+        return cancelled
+
+    async def list_jobs(
+        self,
+        status: JobStatus | None = None,
+        job_type: JobType | None = None,
+        limit: int = 100,
+    ) -> list[Job]:
+        """List jobs with optional filtering (newest first).
+
+        Args:
+            status: Filter by status
+            job_type: Filter by job type
+            limit: Maximum number of jobs to return
+
+        Returns:
+            List of jobs (rows of job types unknown to this version are skipped)
+        """
+        async with self._session_scope() as session:
+            models = await BackgroundJobRepository(session).list_jobs(
+                status=status.value if status else None,
+                job_type=job_type.value if job_type else None,
+                limit=limit,
+                job_types=_JOB_TYPE_VALUES,
+            )
+            return [job_from_model(model) for model in models]
+
+    async def recover(self) -> int:
+        """Reset abandoned running jobs (no heartbeat within the lease) to pending.
+
+        Returns:
+            Number of recovered jobs
+        """
+        stale_before = datetime.now(UTC) - timedelta(seconds=self._lease_timeout)
+        async with self._session_scope() as session:
+            recovered = await BackgroundJobRepository(session).requeue_running(
+                stale_before=stale_before
+            )
+        if recovered:
+            logger.info(f"Recovered {recovered} interrupted job(s) of a dead worker")
+        return recovered
+
+    # Listen up - several processes may consume this table (web process + python -m soulspot.worker,
+    # or more than one worker process). Recovery therefore only takes rows whose heartbeat went
+    # stale - a live worker refreshes its running jobs every lease_timeout / 3. A job of a crashed
+    # worker is picked up again at most ~lease_timeout later, by whichever worker runs recovery.
+    # num_workers=0 is the enqueue/status-only mode of the API process: no recovery, no pruning,
+    # no heartbeats - it never owns a running job.
+    async def start(self, num_workers: int = 3) -> None:
+        """Recover abandoned jobs, then start worker tasks and heartbeats.
+
+        Args:
+            num_workers: Number of worker tasks to start (0 = enqueue/status only)
+        """
+        if num_workers > 0:
+            await self.recover()
+            await self._prune_history()
+        await self._refresh_stats(force=True)
+        await super().start(num_workers=num_workers)
+        if num_workers > 0:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+            self._poll_task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        """Stop all workers and wait for completion."""
+        self._shutdown = True
+        self._wakeup.set()
+        await super().stop()
+        for task in (self._heartbeat_task, self._poll_task, self._stats_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+        self._heartbeat_task = None
+        self._poll_task = None
+        await self._refresh_stats(force=True)
+
+    async def _heartbeat_loop(self) -> None:
+        """Keep our running jobs' leases fresh and requeue abandoned ones."""
+        while not self._shutdown:
+            await asyncio.sleep(self._lease_timeout / 3)
+            try:
+                if self._running_jobs:
+                    async with self._session_scope() as session:
+                        await BackgroundJobRepository(session).heartbeat(
+                            self.worker_id, list(self._running_jobs)
+                        )
+                await self.recover()
+            except Exception as e:
+                logger.warning(f"Job heartbeat failed: {e}")
+
+    # Hey future me - same fair scheduler as the in-memory queue, the database just tells us which
+    # types have due jobs. The slot is reserved BEFORE the claim round trip (and the global limit
+    # re-checked after the query) so parallel worker tasks can't overshoot a limit while awaiting.
+    # Lost race (someone else claimed the last job of that type) = give the slot back, try again.
+    # The type limit is checked twice: by our scheduler (this process) and by the claim itself
+    # (running rows of ALL processes), so LIBRARY_SCAN=1 holds with several worker processes.
+    # The global max_concurrent_jobs and the weights stay per process.
+    async def _claim(self) -> Job | None:
+        """Atomically claim the next runnable job and reserve its type slot.
+
+        Returns:
+            Claimed job (caller must release its type slot), or None
+        """
+        async with self._session_scope() as session:
+            repo = BackgroundJobRepository(session)
+            runnable = await repo.runnable_job_types()
+            if self._scheduler.total_running() >= self._max_concurrent:
+                return None
+            job_type = self._scheduler.reserve(
+                JobType(value) for value in runnable if value in _JOB_TYPE_VALUES
+            )
+            if job_type is None:
+                return None
+            try:
+                model = await repo.claim_next(
+                    self.worker_id,
+                    job_type=job_type.value,
+                    max_running=self._scheduler.get_limit(job_type),
+                )
+            except Exception:
+                self._scheduler.release(job_type)
+                raise
+            if model is None:
+                self._scheduler.release(job_type)
+                return None
+            return self._claimed(model)
+
+    def _claimed(self, model: BackgroundJobModel) -> Job:
+        """Convert a freshly claimed row and record its dispatch latency."""
+        job = job_from_model(model)
+        if job.started_at is not None:
+            self._dispatch_latency.record(
+                job.run_after or job.created_at, job.started_at
+            )
+        self._publish(job)
+        return job
+
+    # Listen up - the rest of the batch is claimed in ONE UPDATE ... RETURNING per round, riding on
+    # the type slot _claim() already reserved for the first job. Lingering waits on the same
+    # enqueue wakeup as idle workers, so a burst of enqueues fills the batch quickly.
+    async def _collect_batch(self, first: Job) -> list[Job]:
+        """Claim up to max_batch_size jobs of the first job's type.
+
+        Args:
+            first: Job already claimed by _claim()
+
+        Returns:
+            Claimed jobs for one batch handler call, first job included
+        """
+        batch = self._batch_handlers[first.job_type]
+        jobs = [first]
+        deadline = time.monotonic() + batch.max_wait
+        while True:
+            if len(jobs) < batch.max_batch_size:
+                self._wakeup.clear()
+                try:
+                    async with self._session_scope() as session:
+                        models = await BackgroundJobRepository(session).claim_batch(
+                            self.worker_id,
+                            limit=batch.max_batch_size - len(jobs),
+                            job_type=first.job_type.value,
+                        )
+                except Exception as e:
+                    # Jobs already claimed must still run - go with what we have
+                    logger.warning(f"Could not claim more jobs for the batch: {e}")
+                    return jobs
+                jobs.extend(self._claimed(model) for model in models)
+            remaining = deadline - time.monotonic()
+            if len(jobs) >= batch.max_batch_size or remaining <= 0 or self._shutdown:
+                return jobs
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+
+    async def _wait_for_work(self) -> None:
+        """Sleep until a local enqueue/finished job or the poller wakes us."""
+        await self._wakeup.wait()
+
+    # Hey future me - idle worker tasks don't poll the database themselves any more (5 workers x
+    # 1 query per second on an idle host). ONE poller per process looks up the earliest pending
+    # run_after and sleeps until then, or idle_poll_interval when nothing is waiting; when jobs
+    # are due it sets _wakeup for all workers. Local enqueues/finishes wake workers directly, a
+    # retry scheduled here wakes the poller (_poll_wakeup) so it re-reads the next due time.
+    # The idle interval is the latency for jobs enqueued by ANOTHER process (API -> worker).
+    async def _poll_loop(self) -> None:
+        """Wake the workers when pending jobs come due."""
+        while not self._shutdown:
+            self._poll_wakeup.clear()
+            timeout = self._idle_poll_interval
+            try:
+                await self._prune_history()
+                async with self._session_scope() as session:
+                    next_due = await BackgroundJobRepository(session).next_run_after()
+                if next_due is not None:
+                    due_in = (
+                        ensure_utc_aware(next_due) - datetime.now(UTC)
+                    ).total_seconds()
+                    if due_in <= 0:
+                        self._wakeup.set()
+                    timeout = min(max(due_in, self._poll_interval), timeout)
+            except Exception as e:
+                logger.warning(f"Job queue poll failed: {e}")
+                timeout = self._poll_interval
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._poll_wakeup.wait(), timeout=timeout)
+
+    async def _process_job(self, job: Job) -> None:
+        """Run a claimed job and persist its outcome.
+
+        Args:
+            job: Claimed job (status running)
+        """
+        self._running_jobs.add(job.id)
+        try:
+            try:
+                handler = self._handlers.get(job.job_type)
+                if not handler:
+                    raise ValueError(
+                        f"No handler registered for job type: {job.job_type}"
+                    )
+                job.mark_completed(await handler(job))
+            except Exception as e:
+                job.mark_failed(str(e))
+
+            await self._store_outcomes([job])
+        finally:
+            self._running_jobs.discard(job.id)
+
+    async def _process_batch(self, jobs: list[Job]) -> None:
+        """Run claimed jobs with their batch handler and persist every outcome.
+
+        Args:
+            jobs: Claimed jobs of one type (status running)
+        """
+        self._running_jobs.update(job.id for job in jobs)
+        try:
+            await self._run_batch_handler(jobs)
+            await self._store_outcomes(jobs)
+        finally:
+            self._running_jobs.difference_update(job.id for job in jobs)
+
+    # Hey future me - a whole batch gets written in ONE transaction (one commit instead of 50).
+    async def _store_outcomes(self, jobs: list[Job]) -> None:
+        """Write handler outcomes (completed, retry scheduled, or failed)."""
+        stored: list[Job] = []
+        async with self._session_scope() as session:
+            repo = BackgroundJobRepository(session)
+            for job in jobs:
+                if await self._store_outcome(repo, job):
+                    stored.append(job)
+                else:
+                    logger.info(
+                        f"Job {job.id} was cancelled while running, outcome discarded"
+                    )
+        # Published after the commit, so a client refetching on the event sees the new row
+        for job in stored:
+            retrying = (
+                job.status == JobStatus.FAILED and self._retry_policy.should_retry(job)
+            )
+            if retrying:
+                self._poll_wakeup.set()
+            self._publish(job, JobStatus.PENDING if retrying else None)
+        await self._refresh_stats()
+
+    async def _store_outcome(self, repo: BackgroundJobRepository, job: Job) -> bool:
+        """Write one job's outcome, False if the row is no longer ours."""
+        if job.status == JobStatus.COMPLETED:
+            return await repo.finish(
+                job.id,
+                self.worker_id,
+                JobStatus.COMPLETED.value,
+                result=_json_safe(job.result),
+            )
+        if self._retry_policy.should_retry(job):
+            # Same backoff as the in-memory queue - the row itself is the timer
+            # (run_after), claim_next() skips it until it's due
+            backoff_delay = self._retry_policy.delay(job.retries)
+            logger.info(
+                f"Job {job.id} failed (retry {job.retries}/{job.max_retries}), "
+                f"retrying in {backoff_delay:.1f}s: {job.error}"
+            )
+            return await repo.schedule_retry(
+                job.id,
+                self.worker_id,
+                error=job.error or "",
+                retries=job.retries,
+                run_after=datetime.now(UTC) + timedelta(seconds=backoff_delay),
+            )
+        return await repo.finish(
+            job.id,
+            self.worker_id,
+            JobStatus.FAILED.value,
+            error=job.error,
+            retries=job.retries,
+        )
+
+    async def _worker_loop(self) -> None:
+        """Worker loop: claim due jobs from the database and process them."""
+        while not self._shutdown:
+            try:
+                # Clear BEFORE checking/claiming: an enqueue() racing with an empty
+                # claim sets the event again and we don't sleep through it
+                self._wakeup.clear()
+                if (
+                    self._paused
+                    or self._scheduler.total_running() >= self._max_concurrent
+                ):
+                    await self._wakeup.wait()
+                    continue
+
+                job = await self._claim()
+                if job is None:
+                    await self._wait_for_work()
+                    continue
+
+                try:
+                    if job.job_type in self._batch_handlers:
+                        await self._process_batch(await self._collect_batch(job))
+                    else:
+                        await self._process_job(job)
+                finally:
+                    self._scheduler.release(job.job_type)
+                    # A freed type slot can make a waiting type runnable again
+                    self._wakeup.set()
+
+            except Exception as e:
+                # DB hiccup (locked, connection lost) - back off instead of spinning
+                logger.exception(f"Worker error: {e}")
+                await asyncio.sleep(self._poll_interval)
+
+    # The table IS the history here, so retention means deleting old finished rows. Runs on
+    # start() and then at most every PRUNE_INTERVAL from idle workers - never on the claim path.
+    async def _prune_history(self) -> None:
+        """Delete finished jobs older than history_retention (throttled)."""
+        if self._history_retention is None:
+            return
+        now = time.monotonic()
+        if self._pruned_at is not None and now - self._pruned_at < PRUNE_INTERVAL:
+            return
+        self._pruned_at = now
+        cutoff = datetime.now(UTC) - timedelta(seconds=self._history_retention)
+        async with self._session_scope() as session:
+            deleted = await BackgroundJobRepository(session).delete_finished_before(
+                cutoff
+            )
+        if deleted:
+            logger.info(f"Deleted {deleted} finished job(s) past retention")
+
+    async def _refresh_stats(self, force: bool = False) -> None:
+        """Reload per-status job counts for get_stats() (throttled)."""
+        now = time.monotonic()
+        if not force and now - self._stats_refreshed_at < STATS_REFRESH_INTERVAL:
+            return
+        self._stats_refreshed_at = now
+        async with self._session_scope() as session:
+            repo = BackgroundJobRepository(session)
+            self._status_counts = await repo.count_by_status()
+            self._pending_counts = await repo.count_pending_by_type()
+
+    def _pending_by_type(self) -> dict[JobType, int]:
+        """Count pending jobs per type (as of the last stats refresh)."""
+        self._refresh_stats_soon()
+        return {
+            JobType(value): count
+            for value, count in self._pending_counts.items()
+            if value in _JOB_TYPE_VALUES
+        }
+
+    # Hey future me - get_stats() is sync, but in the enqueue-only API process no worker loop
+    # refreshes the counts. So a stale read kicks off a refresh in the background and returns the
+    # last known counts - at most one refresh in flight, never a query per status request.
+    def _refresh_stats_soon(self) -> None:
+        """Start a background stats refresh if the counts are stale."""
+        if self._stats_task is not None and not self._stats_task.done():
+            return
+        if time.monotonic() - self._stats_refreshed_at < STATS_REFRESH_INTERVAL:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._stats_task = loop.create_task(self._refresh_stats_quietly())
+
+    async def _refresh_stats_quietly(self) -> None:
+        try:
+            await self._refresh_stats()
+        except Exception as e:
+            logger.warning(f"Could not refresh job queue stats: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue statistics (counts refreshed at most once per second).
+
+        Returns:
+            Dictionary with queue statistics
+        """
+        self._refresh_stats_soon()
+        counts = self._status_counts
+        return {
+            "total_jobs": sum(counts.values()),
+            "pending": counts.get(JobStatus.PENDING.value, 0),
+            "running": len(self._running_jobs),
+            "completed": counts.get(JobStatus.COMPLETED.value, 0),
+            "failed": counts.get(JobStatus.FAILED.value, 0),
+            "cancelled": counts.get(JobStatus.CANCELLED.value, 0),
+            "queue_size": counts.get(JobStatus.PENDING.value, 0),
+            "backend": "database",
+        }
@@ -4,7 +4,12 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from soulspot.application.use_cases import ImportSpotifyPlaylistUseCase
-from soulspot.application.workers.job_queue import Job, JobQueue, JobType
+from soulspot.application.workers.job_queue import (
+    Job,
+    JobQueue,
+    JobType,
+    make_dedup_key,
+)
 from soulspot.domain.ports import (
     IAlbumRepository,
     IArtistRepository,
@@ -18,6 +23,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Playlists per handler call - they sync one after another inside the batch, so keep it small
+# enough that one batch doesn't hold the type slot for ages
+SYNC_BATCH_SIZE = 10
+
 
 class PlaylistSyncWorker:
     """Worker for processing playlist sync jobs in the background.
@@ -79,23 +88,55 @@ class PlaylistSyncWorker:
 
     # Yo, register this worker to handle PLAYLIST_SYNC jobs. Call after app startup when everything is ready.
     # If you register too early, jobs might fail because Spotify client isn't configured or DB isn't migrated!
+    # Registered as a BATCH handler: "sync all my playlists" hands us up to SYNC_BATCH_SIZE jobs at once
+    # and the token lookup (a DB read + maybe a refresh round trip to Spotify) happens once per batch.
     def register(self) -> None:
         """Register handler with job queue."""
-        self._job_queue.register_handler(
-            JobType.PLAYLIST_SYNC, self._handle_playlist_sync_job
+        self._job_queue.register_batch_handler(
+            JobType.PLAYLIST_SYNC,
+            self._handle_playlist_sync_batch,
+            max_batch_size=SYNC_BATCH_SIZE,
         )
 
+    # Hey future me - one failing playlist must NOT fail the others! Its exception goes into the
+    # results list, the queue then fails/retries only that job.
+    async def _handle_playlist_sync_batch(self, jobs: list[Job]) -> list[Any]:
+        """Handle several playlist sync jobs with one token lookup.
+
+        Args:
+            jobs: Jobs to process
+
+        Returns:
+            Sync result or exception per job, in job order
+        """
+        access_token = None
+        if self._token_manager:
+            access_token = await self._token_manager.get_token_for_background()
+
+        results: list[Any] = []
+        for job in jobs:
+            try:
+                results.append(
+                    await self._handle_playlist_sync_job(job, access_token=access_token)
+                )
+            except Exception as e:
+                results.append(e)
+        return results
+
     # Listen up future me, this handler fetches a WHOLE playlist from Spotify and imports ALL tracks! For
     # huge playlists (1000+ tracks), this can take MINUTES and hit Spotify rate limits. We now use
     # DatabaseTokenManager to get fresh tokens automatically - no more expired tokens in job payload!
     # The fetch_all_tracks flag controls pagination - True means fetch every track (slow!), False might
     # fetch only first 100 (faster but incomplete). IMPORTANT: We DON'T fail the job if some tracks fail
     # to import! We log warnings but return success with error list. Partial sync is better than no sync.
-    async def _handle_playlist_sync_job(self, job: Job) -> Any:
+    async def _handle_playlist_sync_job(
+        self, job: Job, access_token: str | None = None
+    ) -> Any:
         """Handle a playlist sync job.
 
         Args:
             job: Job to process
+            access_token: Token already fetched for the batch (skips the lookup)
 
         Returns:
             Sync result
@@ -108,8 +149,7 @@ class PlaylistSyncWorker:
             raise ValueError("Missing playlist_id in job payload")
 
         # Get access token from TokenManager (preferred) or fall back to payload
-        access_token = None
-        if self._token_manager:
+        if not access_token and self._token_manager:
             access_token = await self._token_manager.get_token_for_background()
 
         # Fall back to payload for backwards compatibility
@@ -186,6 +226,7 @@ class PlaylistSyncWorker:
             job_type=JobType.PLAYLIST_SYNC,
             payload=payload,
             max_retries=max_retries,
+            dedup_key=make_dedup_key(JobType.PLAYLIST_SYNC, playlist_id),
         )
 
     # Yo, this is for "sync all my playlists" feature - queues multiple playlists in one call. With
@@ -32,6 +32,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from soulspot.application.services.token_manager import DatabaseTokenManager
     from soulspot.config import Settings
+    from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
     from soulspot.infrastructure.persistence import Database
 
 logger = logging.getLogger(__name__)
@@ -62,6 +63,7 @@ class SpotifySyncWorker:
         token_manager: "DatabaseTokenManager",
         settings: "Settings",
         check_interval_seconds: int = 60,  # Check every minute
+        http: "HttpClientRegistry | None" = None,
     ) -> None:
         """Initialize Spotify sync worker.
 
@@ -70,10 +72,12 @@ class SpotifySyncWorker:
             token_manager: DatabaseTokenManager for getting access tokens
             settings: Application settings (for SpotifyImageService)
             check_interval_seconds: How often to check if syncs are due
+            http: Shared HTTP client registry (None = per-client connections)
         """
         self.db = db
         self.token_manager = token_manager
         self.settings = settings
+        self.http = http
         self.check_interval_seconds = check_interval_seconds
         self._running = False
         self._task: asyncio.Task[None] | None = None
@@ -285,8 +289,8 @@ class SpotifySyncWorker:
                 SpotifyClient,
             )
 
-            spotify_client = SpotifyClient(self.settings.spotify)
-            image_service = SpotifyImageService(self.settings)
+            spotify_client = SpotifyClient(self.settings.spotify, http=self.http)
+            image_service = SpotifyImageService(self.settings, http=self.http)
             settings_service = AppSettingsService(session)
 
             sync_service = SpotifySyncService(
@@ -333,8 +337,8 @@ class SpotifySyncWorker:
                 SpotifyClient,
             )
 
-            spotify_client = SpotifyClient(self.settings.spotify)
-            image_service = SpotifyImageService(self.settings)
+            spotify_client = SpotifyClient(self.settings.spotify, http=self.http)
+            image_service = SpotifyImageService(self.settings, http=self.http)
             settings_service = AppSettingsService(session)
 
             sync_service = SpotifySyncService(
@@ -380,8 +384,8 @@ class SpotifySyncWorker:
                 SpotifyClient,
             )
 
-            spotify_client = SpotifyClient(self.settings.spotify)
-            image_service = SpotifyImageService(self.settings)
+            spotify_client = SpotifyClient(self.settings.spotify, http=self.http)
+            image_service = SpotifyImageService(self.settings, http=self.http)
             settings_service = AppSettingsService(session)
 
             sync_service = SpotifySyncService(
@@ -426,8 +430,8 @@ class SpotifySyncWorker:
                 SpotifyClient,
             )
 
-            spotify_client = SpotifyClient(self.settings.spotify)
-            image_service = SpotifyImageService(self.settings)
+            spotify_client = SpotifyClient(self.settings.spotify, http=self.http)
+            image_service = SpotifyImageService(self.settings, http=self.http)
             settings_service = AppSettingsService(session)
 
             sync_service = SpotifySyncService(
@@ -392,12 +392,108 @@ class DownloadSettings(BaseSettings):
         default=True,
         description="Enable priority-based download queue",
     )
+    # Hey future me - num_workers is the GLOBAL concurrency of the job queue (all job types), while
+    # max_concurrent_downloads only caps DOWNLOAD jobs. Keep num_workers above it so metadata,
+    # playlist sync and imports still get slots while downloads are maxed out (default 5 = 3 + 2).
     num_workers: int = Field(
-        default=3,
-        description="Number of job queue worker threads",
+        default=5,
+        description="Number of job queue workers (max concurrent jobs of all types)",
         ge=1,
         le=10,
     )
+    # Hey future me - "memory" keeps jobs in the process (lost on restart), "database" persists
+    # them in background_jobs so queued downloads/enrichment survive restarts (PersistentJobQueue).
+    # Database backend: one poller per process sleeps until the next pending job is due, at least
+    # queue_poll_interval apart. With nothing waiting it checks every queue_idle_poll_interval -
+    # that's how late a job enqueued by ANOTHER process (API -> worker process) can start.
+    queue_backend: Literal["memory", "database"] = Field(
+        default="memory",
+        description="Job queue backend: in-memory or persistent (database)",
+    )
+    queue_poll_interval: float = Field(
+        default=1.0,
+        description="Minimum seconds between two polls for due jobs (database backend)",
+        ge=0.05,
+        le=60.0,
+    )
+    queue_idle_poll_interval: float = Field(
+        default=10.0,
+        description="Seconds between polls while no pending job is due (database backend)",
+        ge=0.05,
+        le=600.0,
+    )
+    # Hey future me - embedded_workers=False turns the web process into an enqueue/status-only
+    # client of the database queue: job handlers, monitors, automation, auto-import and the file
+    # watcher run in "python -m soulspot.worker" instead. That's what lets api.workers go above 1
+    # (each uvicorn worker would otherwise start its own copy of every background loop).
+    # Runtime controls (pause/resume, scheduling PATCH) act on the process serving the request,
+    # so in this mode they answer 409 - change the env of the worker process and restart it.
+    # Per-type limits (queue_type_limits) are also checked in the claim query, so they hold
+    # across worker processes; max_concurrent_jobs and the weights apply per process.
+    # queue_lease_timeout: a running job whose worker sent no heartbeat for this long is requeued.
+    embedded_workers: bool = Field(
+        default=True,
+        description="Run job handlers and background workers inside the web process",
+    )
+    queue_lease_timeout: float = Field(
+        default=60.0,
+        description="Seconds without heartbeat before a running job is requeued (database backend)",
+        ge=5.0,
+        le=3600.0,
+    )
+    # Per job type overrides for the fair scheduler, keyed by job type value, e.g.
+    # DOWNLOAD__QUEUE_TYPE_LIMITS='{"library_scan": 1, "metadata_enrichment": 2}'
+    # Limits: max concurrent jobs of that type (0 = hold). Weights: share of dispatches while
+    # several types wait (2 = twice as often as weight 1). Unset types keep the built-in defaults.
+    # The download limit always comes from max_concurrent_downloads.
+    queue_type_limits: dict[str, int] = Field(
+        default_factory=dict,
+        description="Max concurrent jobs per job type (overrides defaults)",
+    )
+    queue_type_weights: dict[str, float] = Field(
+        default_factory=dict,
+        description="Fair-share weight per job type (overrides defaults)",
+    )
+    # Failed jobs wait in a timer heap (or run_after in the DB) instead of blocking a worker:
+    # delay = base * 2^(retry-1), capped at max, +/- jitter fraction. queue_type_max_retries caps
+    # the per-job max_retries of a type, e.g. DOWNLOAD__QUEUE_TYPE_MAX_RETRIES='{"library_scan": 1}'
+    queue_retry_base_delay: float = Field(
+        default=1.0,
+        description="Delay before the first retry of a failed job (seconds)",
+        ge=0.0,
+        le=600.0,
+    )
+    queue_retry_max_delay: float = Field(
+        default=300.0,
+        description="Maximum retry delay (seconds)",
+        ge=0.0,
+        le=86400.0,
+    )
+    queue_retry_jitter: float = Field(
+        default=0.1,
+        description="Random +/- fraction applied to retry delays",
+        ge=0.0,
+        le=1.0,
+    )
+    queue_type_max_retries: dict[str, int] = Field(
+        default_factory=dict,
+        description="Maximum retries per job type (caps each job's max_retries)",
+    )
+    # Finished jobs (completed/failed/cancelled) are kept for status pages and wait_for_job():
+    # in memory at most queue_history_size of them, and no longer than the retention window
+    # (database backend: finished rows older than that are deleted).
+    queue_history_size: int = Field(
+        default=1000,
+        description="Maximum finished jobs kept in memory (memory backend)",
+        ge=10,
+        le=100000,
+    )
+    queue_history_retention_hours: float = Field(
+        default=24.0,
+        description="Hours finished jobs are kept",
+        gt=0.0,
+        le=8760.0,
+    )
 
     model_config = SettingsConfigDict(env_prefix="DOWNLOAD_")
 
@@ -457,6 +553,196 @@ class PostProcessingSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="POSTPROCESSING_")
 
 
+# Hey future me, LibrarySettings tunes the local library scan engine! The scan is a staged
+# pipeline: discovery -> read stage (tag parsing + hashing in a thread/process pool) -> ONE writer
+# coroutine that owns the DB session and commits every scan_batch_size files. scan_workers is the
+# pool size - more workers only help if your disks can keep up (NAS over SMB = keep it low, local
+# SSD = go up to your core count). scan_queue_size is the BACKPRESSURE knob: it caps how many read
+# results may pile up in front of the writer, so a slow DB never lets memory grow unbounded.
+# "process" executor sidesteps the GIL for mutagen's pure-Python tag parsing, but costs pickling
+# per file - "thread" is the safe default (hashlib releases the GIL anyway).
+class LibrarySettings(BaseSettings):
+    """Local library scan configuration."""
+
+    scan_workers: int = Field(
+        default=4,
+        description="Number of pool workers for tag parsing and hashing during scans",
+        ge=1,
+        le=32,
+    )
+    scan_executor: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Executor used for the scan read stage (thread or process pool)",
+    )
+    scan_queue_size: int = Field(
+        default=64,
+        description="Maximum read results buffered in front of the DB writer (backpressure)",
+        ge=1,
+        le=10000,
+    )
+    scan_batch_size: int = Field(
+        default=200,
+        description="Number of files imported per DB commit during scans",
+        ge=1,
+        le=10000,
+    )
+    hash_mode: Literal["quick", "full"] = Field(
+        default="quick",
+        description=(
+            "Content hash tier computed during scans: 'quick' samples head/middle/tail "
+            "blocks (full hash computed lazily on collisions), 'full' hashes every byte"
+        ),
+    )
+    # Yo, the watcher turns filesystem events on the music + downloads dirs into debounced batches
+    # (auto-import + incremental indexing) instead of re-walking the trees. "auto" = inotify with
+    # polling fallback. Music on SMB/NFS? Use "polling" - inotify never sees remote writes there.
+    watch_enabled: bool = Field(
+        default=True,
+        description="Watch music and download directories for changes",
+    )
+    watch_mode: Literal["auto", "inotify", "polling"] = Field(
+        default="auto",
+        description="Watcher backend: inotify, polling, or auto (inotify with polling fallback)",
+    )
+    watch_debounce_ms: int = Field(
+        default=2000,
+        description="Maximum time in ms to collect filesystem events into one batch",
+        ge=50,
+        le=60000,
+    )
+    watch_poll_interval_ms: int = Field(
+        default=5000,
+        description="Tree polling interval in ms when the polling backend is used",
+        ge=100,
+        le=600000,
+    )
+
+    model_config = SettingsConfigDict(env_prefix="LIBRARY_")
+
+
+# Yo, CacheSettings are MEMORY budgets per cache namespace, in MB! The caches account approximate
+# byte sizes (a cached Spotify playlist can be several MB, a track lookup a few KB), so a count limit
+# would say nothing about RAM. Over budget, expired entries go first, then least recently used ones.
+# A single value bigger than its whole namespace budget is simply not cached.
+class CacheSettings(BaseSettings):
+    """In-memory cache budgets per namespace and the persistent disk tier."""
+
+    spotify_max_mb: int = Field(
+        default=64,
+        description="Memory budget in MB for cached Spotify responses",
+        ge=1,
+        le=4096,
+    )
+    musicbrainz_max_mb: int = Field(
+        default=16,
+        description="Memory budget in MB for cached MusicBrainz responses",
+        ge=1,
+        le=4096,
+    )
+    lastfm_max_mb: int = Field(
+        default=8,
+        description="Memory budget in MB for cached Last.fm responses",
+        ge=1,
+        le=4096,
+    )
+    lyrics_max_mb: int = Field(
+        default=4,
+        description="Memory budget in MB for cached lyrics",
+        ge=1,
+        le=4096,
+    )
+    track_file_max_mb: int = Field(
+        default=8,
+        description="Memory budget in MB for cached track file paths/checksums",
+        ge=1,
+        le=4096,
+    )
+    # Yo, "not found" answers (no MusicBrainz recording, no lyrics, no Cover Art Archive front) are
+    # cached too, but shorter than real responses - data for obscure releases does get added.
+    negative_ttl_seconds: int = Field(
+        default=21600,
+        description="How long 'not found' lookups are remembered before asking again",
+        ge=60,
+        le=2592000,
+    )
+    # Listen up - stale-while-revalidate window for Spotify browse data (artists, albums, their
+    # tracks): past its TTL a response is still served instantly while ONE background refresh
+    # replaces it; only after this window does a lookup wait for Spotify again. 0 = off.
+    stale_ttl_seconds: int = Field(
+        default=86400,
+        description="How long expired Spotify browse responses are served while refreshing",
+        ge=0,
+        le=2592000,
+    )
+    # Hey future me - the disk tier is ONE SQLite file shared by every API cache namespace and
+    # by every process on the host (web + standalone worker), so its cap is global, not per API.
+    # Put it next to the database in Docker (/config) so it survives container recreation.
+    disk_enabled: bool = Field(
+        default=True,
+        description="Keep API responses in a local SQLite file that survives restarts",
+    )
+    disk_path: Path = Field(
+        default=Path("./cache/metadata_cache.db"),
+        description="SQLite file of the persistent response cache",
+    )
+    disk_max_mb: int = Field(
+        default=256,
+        description="Size cap in MB for the stored (compressed) responses on disk",
+        ge=1,
+        le=65536,
+    )
+
+    @field_validator("disk_path")
+    @classmethod
+    def ensure_disk_path_is_absolute(cls, v: Path) -> Path:
+        """Ensure the disk cache path is absolute."""
+        return v.resolve()
+
+    def max_bytes(
+        self,
+        namespace: Literal["spotify", "musicbrainz", "lastfm", "lyrics", "track_file"],
+    ) -> int:
+        """Get the memory budget of a cache namespace in bytes."""
+        max_mb: int = getattr(self, f"{namespace}_max_mb")
+        return max_mb * 1024 * 1024
+
+    model_config = SettingsConfigDict(env_prefix="CACHE_")
+
+
+# Hey future me - HttpSettings size the ONE pooled httpx client per upstream (Spotify, MusicBrainz,
+# Last.fm, slskd, Cover Art Archive, lyrics sites, Spotify image CDN). Limits are PER upstream, not
+# global. Keep-alive connections are what saves the TLS handshake on the next call - keepalive_expiry
+# is how long an idle one is kept around. HTTP/2 needs the optional "h2" package (httpx[http2]);
+# without it the setting is ignored with a warning and HTTP/1.1 is used.
+class HttpSettings(BaseSettings):
+    """Connection pooling of the shared outbound HTTP clients."""
+
+    max_connections: int = Field(
+        default=20,
+        description="Maximum open connections per upstream",
+        ge=1,
+        le=1000,
+    )
+    max_keepalive_connections: int = Field(
+        default=10,
+        description="Maximum idle keep-alive connections kept per upstream",
+        ge=0,
+        le=1000,
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle keep-alive connection stays open",
+        ge=0,
+        le=3600,
+    )
+    http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 where the upstream supports it (needs 'h2')",
+    )
+
+    model_config = SettingsConfigDict(env_prefix="HTTP_")
+
+
 # Listen up future me, Settings is the TOP-LEVEL config class! All other *Settings classes are nested
 # inside this one. Pydantic loads config from .env file (env_file=".env") and environment variables.
 # The env_nested_delimiter="__" means DATABASE_URL becomes database.url (double underscore = nesting).
@@ -533,6 +819,18 @@ class Settings(BaseSettings):
         default_factory=PostProcessingSettings,
         description="Post-processing pipeline configuration",
     )
+    library: LibrarySettings = Field(
+        default_factory=LibrarySettings,
+        description="Local library scan configuration",
+    )
+    cache: CacheSettings = Field(
+        default_factory=CacheSettings,
+        description="Cache memory budgets",
+    )
+    http: HttpSettings = Field(
+        default_factory=HttpSettings,
+        description="Outbound HTTP connection pooling",
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -532,6 +532,40 @@ class ISpotifyClient(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_saved_tracks(
+        self, access_token: str, limit: int = 50, offset: int = 0
+    ) -> dict[str, Any]:
+        """
+        Get current user's saved tracks (Liked Songs).
+
+        Args:
+            access_token: OAuth access token
+            limit: Maximum number of tracks to return (max 50)
+            offset: The index of the first track to return
+
+        Returns:
+            Paginated response with 'items' (each with 'added_at' and 'track'), 'next', 'total'
+        """
+        pass
+
+    @abstractmethod
+    async def get_saved_albums(
+        self, access_token: str, limit: int = 50, offset: int = 0
+    ) -> dict[str, Any]:
+        """
+        Get current user's saved albums.
+
+        Args:
+            access_token: OAuth access token
+            limit: Maximum number of albums to return (max 50)
+            offset: The index of the first album to return
+
+        Returns:
+            Paginated response with 'items' (each with 'added_at' and 'album'), 'next', 'total'
+        """
+        pass
+
     @abstractmethod
     async def get_album(self, album_id: str, access_token: str) -> dict[str, Any]:
         """
@@ -219,6 +219,50 @@ class CircuitBreakerSpotifyClient(ISpotifyClient):
         )
         return cast(dict[str, Any], result)
 
+    async def get_saved_tracks(
+        self, access_token: str, limit: int = 50, offset: int = 0
+    ) -> dict[str, Any]:
+        """
+        Get current user's saved tracks (Liked Songs).
+
+        Args:
+            access_token: OAuth access token
+            limit: Maximum number of tracks to return (max 50)
+            offset: The index of the first track to return
+
+        Returns:
+            Paginated response with 'items' (each with 'added_at' and 'track'), 'next', 'total'
+        """
+        result = await self._circuit_breaker.call(
+            self._client.get_saved_tracks,
+            access_token=access_token,
+            limit=limit,
+            offset=offset,
+        )
+        return cast(dict[str, Any], result)
+
+    async def get_saved_albums(
+        self, access_token: str, limit: int = 50, offset: int = 0
+    ) -> dict[str, Any]:
+        """
+        Get current user's saved albums.
+
+        Args:
+            access_token: OAuth access token
+            limit: Maximum number of albums to return (max 50)
+            offset: The index of the first album to return
+
+        Returns:
+            Paginated response with 'items' (each with 'added_at' and 'album'), 'next', 'total'
+        """
+        result = await self._circuit_breaker.call(
+            self._client.get_saved_albums,
+            access_token=access_token,
+            limit=limit,
+            offset=offset,
+        )
+        return cast(dict[str, Any], result)
+
     # Hey future me, these album methods were added for Phase 1 of the Spotify Album Roadmap.
     # They follow the same circuit breaker pattern as all other methods - wrap the call,
     # let the breaker handle failures, and cast the result. If you need to debug album
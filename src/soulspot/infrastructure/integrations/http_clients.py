@@ -0,0 +1,236 @@
+"""Shared pooled HTTP clients, one per upstream service."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import partial
+from importlib.util import find_spec
+from typing import Any
+
+import httpx
+
+from soulspot.config.settings import HttpSettings
+
+logger = logging.getLogger(__name__)
+
+# Seconds a replaced client stays open so requests already running on it can finish
+RETIRED_CLIENT_GRACE = 120.0
+# Replaced clients kept open at most - beyond that the oldest one is closed right away
+MAX_RETIRED_CLIENTS = 4
+
+
+@dataclass
+class _PoolMetrics:
+    """Request and connection counters of one upstream's client."""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+
+# Hey future me - this is WHY the registry exists: every `SpotifyClient(settings.spotify)` per request
+# and every `async with httpx.AsyncClient()` per artwork/lyrics download paid a fresh TCP connect +
+# TLS handshake (and never reused a connection). Now there is ONE httpx.AsyncClient per upstream for
+# the whole process (app.state.http_clients / worker state), created in lifecycle.background_services and
+# closed on shutdown. The integration clients and services ASK the registry for their client with
+# the options they always used (base_url, headers, timeout, ...); pooling limits and HTTP/2 are
+# added here from HttpSettings.
+# Rules of the road:
+# - Never aclose() a client you got from get() - the registry owns it. The integration clients'
+#   close() only closes clients they created themselves (no registry = old behavior).
+# - Same name, different options (slskd URL/credentials changed) -> a new client replaces the old
+#   one. The old one is closed after retire_grace seconds, so requests still running on it can
+#   finish; at most MAX_RETIRED_CLIENTS wait like that (toggling settings can't pile them up).
+# - Everything here is sync between awaits (event loop only), like BoundedCache - no lock needed.
+class HttpClientRegistry:
+    """Lifecycle-managed pool of shared httpx clients, keyed by upstream name.
+
+    Usage:
+        registry = HttpClientRegistry(settings.http)
+        client = registry.get("musicbrainz", base_url=..., timeout=30.0)
+        ...
+        await registry.close()  # on shutdown
+    """
+
+    def __init__(
+        self,
+        settings: HttpSettings | None = None,
+        retire_grace: float = RETIRED_CLIENT_GRACE,
+    ) -> None:
+        """Initialize HTTP client registry.
+
+        Args:
+            settings: Pool limits and HTTP/2 switch (None = defaults)
+            retire_grace: Seconds a replaced client stays open before it is closed
+        """
+        self.settings = settings or HttpSettings()
+        self._retire_grace = retire_grace
+        self._http2 = self.settings.http2 and find_spec("h2") is not None
+        if self.settings.http2 and not self._http2:
+            logger.warning(
+                "HTTP__HTTP2 is enabled but the 'h2' package is not installed, "
+                "using HTTP/1.1 (install httpx[http2] to enable it)"
+            )
+        self._limits = httpx.Limits(
+            max_connections=self.settings.max_connections,
+            max_keepalive_connections=self.settings.max_keepalive_connections,
+            keepalive_expiry=self.settings.keepalive_expiry,
+        )
+        self._clients: dict[str, tuple[dict[str, Any], httpx.AsyncClient]] = {}
+        self._retired: list[httpx.AsyncClient] = []
+        self._closing: set[httpx.AsyncClient] = set()
+        self._retire_tasks: set[asyncio.Task[None]] = set()
+        self._metrics: dict[str, _PoolMetrics] = {}
+        self._closed = False
+
+    def get(self, name: str, **options: Any) -> httpx.AsyncClient:
+        """Get the pooled client of an upstream, creating it on first use.
+
+        Args:
+            name: Upstream name (e.g. "spotify", "musicbrainz")
+            **options: httpx.AsyncClient options (base_url, headers, auth, timeout, ...)
+
+        Returns:
+            Shared client - do not close it
+
+        Raises:
+            RuntimeError: If the registry was already closed
+        """
+        entry = self._clients.get(name)
+        if entry is not None and entry[0] == options:
+            return entry[1]
+        if self._closed:
+            raise RuntimeError(f"HTTP client registry is closed (requested {name!r})")
+        if entry is not None:
+            logger.info("HTTP client options for %s changed, opening a new pool", name)
+            self._retire(entry[1])
+
+        metrics = self._metrics.setdefault(name, _PoolMetrics())
+        client = httpx.AsyncClient(
+            limits=self._limits,
+            http2=self._http2,
+            event_hooks={"request": [partial(self._on_request, metrics)]},
+            **options,
+        )
+        self._clients[name] = (dict(options), client)
+        return client
+
+    # Yo, connection reuse is measured, not guessed: every request gets an httpcore "trace"
+    # callback, and only a request that had to open a TCP connection sees connect_tcp events.
+    # requests - connections_opened = requests served over an already open (keep-alive) connection.
+    @staticmethod
+    async def _on_request(metrics: _PoolMetrics, request: httpx.Request) -> None:
+        """Count a request and trace whether it opens a new connection."""
+        metrics.requests += 1
+
+        async def trace(event_name: str, _info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                metrics.connections_opened += 1
+
+        request.extensions["trace"] = trace
+
+    def _retire(self, client: httpx.AsyncClient) -> None:
+        """Close a replaced client once its grace period is over."""
+        self._retired.append(client)
+        if len(self._retired) > MAX_RETIRED_CLIENTS:
+            oldest = self._retired.pop(0)
+            self._closing.add(oldest)
+            self._spawn(self._close_client(oldest))
+        self._spawn(self._close_retired(client))
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a close in the background, cancelled by close() if still waiting."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._retire_tasks.add(task)
+        task.add_done_callback(self._retire_tasks.discard)
+
+    async def _close_retired(self, client: httpx.AsyncClient) -> None:
+        """Close a retired client after the grace period (no-op if already closed)."""
+        await asyncio.sleep(self._retire_grace)
+        if client in self._retired:
+            self._retired.remove(client)
+            self._closing.add(client)
+            await self._close_client(client)
+
+    async def _close_client(self, client: httpx.AsyncClient) -> None:
+        """Close one client, logging instead of raising."""
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("Error closing HTTP client: %s", e)
+        finally:
+            self._closing.discard(client)
+
+    async def close(self) -> None:
+        """Close every pooled client (call once on shutdown)."""
+        self._closed = True
+        tasks = list(self._retire_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        clients = [client for _, client in self._clients.values()]
+        clients += self._retired + list(self._closing)
+        self._clients.clear()
+        self._retired.clear()
+        self._closing.clear()
+        for client in clients:
+            await self._close_client(client)
+
+    # Listen up - open/idle connection counts come from httpx's transport internals (the httpcore
+    # pool), read with getattr defaults like Database.get_pool_stats() does, so a different
+    # transport just reports 0 instead of crashing the stats endpoint.
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool configuration and per-upstream request/connection statistics.
+
+        Returns:
+            Dictionary with limits, HTTP/2 state and an entry per upstream
+        """
+        upstreams: dict[str, Any] = {}
+        for name, (_, client) in sorted(self._clients.items()):
+            metrics = self._metrics[name]
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+            reused = max(metrics.requests - metrics.connections_opened, 0)
+            upstreams[name] = {
+                "requests": metrics.requests,
+                "connections_opened": metrics.connections_opened,
+                "reuse_rate": (
+                    (reused / metrics.requests) * 100 if metrics.requests else 0.0
+                ),
+                "open_connections": len(connections),
+                "idle_connections": sum(
+                    1 for connection in connections if connection.is_idle()
+                ),
+            }
+        return {
+            "max_connections": self.settings.max_connections,
+            "max_keepalive_connections": self.settings.max_keepalive_connections,
+            "keepalive_expiry": self.settings.keepalive_expiry,
+            "http2": self._http2,
+            "upstreams": upstreams,
+        }
+
+
+# Hey future me - for code paths that may run WITHOUT a registry (tests, scripts, services built
+# by hand): with a registry you borrow the shared client, without one you get a throwaway client
+# that is closed on exit - exactly what `async with httpx.AsyncClient(...)` did before.
+@asynccontextmanager
+async def http_client(
+    registry: HttpClientRegistry | None, name: str, **options: Any
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Borrow the pooled client of an upstream, or use a one-off client.
+
+    Args:
+        registry: Shared registry, or None for a temporary client
+        name: Upstream name (e.g. "coverartarchive")
+        **options: httpx.AsyncClient options
+
+    Yields:
+        HTTP client (only closed on exit if it is a temporary one)
+    """
+    if registry is not None:
+        yield registry.get(name, **options)
+        return
+    async with httpx.AsyncClient(**options) as client:
+        yield client
@@ -7,6 +7,7 @@ import httpx
 
 from soulspot.config.settings import LastfmSettings
 from soulspot.domain.ports import ILastfmClient
+from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
 
 
 class LastfmClient(ILastfmClient):
@@ -16,14 +17,18 @@ class LastfmClient(ILastfmClient):
 
     # Hey future me, Last.fm client is simple compared to MusicBrainz - no crazy rate limits!
     # Just store the settings and lazy-load the HTTP client. Easy peasy.
-    def __init__(self, settings: LastfmSettings) -> None:
+    def __init__(
+        self, settings: LastfmSettings, http: HttpClientRegistry | None = None
+    ) -> None:
         """
         Initialize Last.fm client.
 
         Args:
             settings: Last.fm configuration settings
+            http: Optional registry providing the shared pooled HTTP client
         """
         self.settings = settings
+        self._http = http
         self._client: httpx.AsyncClient | None = None
 
     # Listen up, Last.fm is chill - no special headers required, 30s timeout is plenty.
@@ -31,6 +36,10 @@ class LastfmClient(ILastfmClient):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
+            if self._http is not None:
+                return self._http.get(
+                    "lastfm", base_url=self.API_BASE_URL, timeout=30.0
+                )
             self._client = httpx.AsyncClient(
                 base_url=self.API_BASE_URL,
                 timeout=30.0,
@@ -38,6 +47,7 @@ class LastfmClient(ILastfmClient):
         return self._client
 
     # Hey, cleanup - you know the drill by now!
+    # Only closes a client this instance created - a pooled one belongs to the registry.
     async def close(self) -> None:
         """Close HTTP client."""
         if self._client is not None:
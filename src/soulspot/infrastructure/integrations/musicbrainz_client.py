@@ -7,6 +7,7 @@ import httpx
 
 from soulspot.config.settings import MusicBrainzSettings
 from soulspot.domain.ports import IMusicBrainzClient
+from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
 
 
 class MusicBrainzClient(IMusicBrainzClient):
@@ -20,14 +21,18 @@ class MusicBrainzClient(IMusicBrainzClient):
     # IP-ban you for hours (or days if you're really naughty). The lock ensures even with
     # concurrent requests, we stay compliant. Don't remove this thinking "oh we're not busy
     # enough" - you WILL get banned eventually!
-    def __init__(self, settings: MusicBrainzSettings) -> None:
+    def __init__(
+        self, settings: MusicBrainzSettings, http: HttpClientRegistry | None = None
+    ) -> None:
         """
         Initialize MusicBrainz client.
 
         Args:
             settings: MusicBrainz configuration settings
+            http: Optional registry providing the shared pooled HTTP client
         """
         self.settings = settings
+        self._http = http
         self._client: httpx.AsyncClient | None = None
         self._last_request_time: float = 0.0
         self._rate_limit_lock = asyncio.Lock()
@@ -46,17 +51,21 @@ class MusicBrainzClient(IMusicBrainzClient):
                 f"( {self.settings.contact} )"
             )
 
-            self._client = httpx.AsyncClient(
-                base_url=self.API_BASE_URL,
-                headers={
+            options: dict[str, Any] = {
+                "base_url": self.API_BASE_URL,
+                "headers": {
                     "User-Agent": user_agent,
                     "Accept": "application/json",
                 },
-                timeout=30.0,
-            )
+                "timeout": 30.0,
+            }
+            if self._http is not None:
+                return self._http.get("musicbrainz", **options)
+            self._client = httpx.AsyncClient(**options)
         return self._client
 
     # Hey, same cleanup drill - close the client or leak connections. Use context manager!
+    # Only closes a client this instance created - a pooled one belongs to the registry.
     async def close(self) -> None:
         """Close HTTP client."""
         if self._client is not None:
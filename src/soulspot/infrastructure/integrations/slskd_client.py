@@ -6,6 +6,7 @@ import httpx
 
 from soulspot.config.settings import SlskdSettings
 from soulspot.domain.ports import ISlskdClient
+from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
 
 
 class SlskdClient(ISlskdClient):
@@ -15,15 +16,19 @@ class SlskdClient(ISlskdClient):
     # is important: we strip the trailing slash from base_url because httpx gets confused
     # when you have double slashes in URLs. Learned that the hard way with 404 errors!
     # Client creation is lazy (in _get_client) to avoid asyncio headaches.
-    def __init__(self, settings: SlskdSettings) -> None:
+    def __init__(
+        self, settings: SlskdSettings, http: HttpClientRegistry | None = None
+    ) -> None:
         """
         Initialize slskd client.
 
         Args:
             settings: slskd configuration settings
+            http: Optional registry providing the shared pooled HTTP client
         """
         self.settings = settings
         self.base_url = settings.url.rstrip("/")
+        self._http = http
         self._client: httpx.AsyncClient | None = None
 
     # Listen up, slskd supports TWO auth methods: API key (preferred) OR basic auth.
@@ -41,20 +46,26 @@ class SlskdClient(ISlskdClient):
             if self.settings.api_key:
                 headers["X-API-Key"] = self.settings.api_key
 
+            # A (username, password) tuple is basic auth to httpx - and unlike httpx.BasicAuth it
+            # compares by value, so the registry can tell whether the credentials changed
             auth = None
             if not self.settings.api_key:
-                auth = httpx.BasicAuth(self.settings.username, self.settings.password)
+                auth = (self.settings.username, self.settings.password)
 
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers=headers,
-                auth=auth,
-                timeout=30.0,
-            )
+            options: dict[str, Any] = {
+                "base_url": self.base_url,
+                "headers": headers,
+                "auth": auth,
+                "timeout": 30.0,
+            }
+            if self._http is not None:
+                return self._http.get("slskd", **options)
+            self._client = httpx.AsyncClient(**options)
         return self._client
 
     # Hey, cleanup is critical! If you don't close this, you'll leak file descriptors and
     # eventually hit system limits. Always use this as async context manager or call close()!
+    # Only closes a client this instance created - a pooled one belongs to the registry.
     async def close(self) -> None:
         """Close HTTP client."""
         if self._client is not None:
@@ -10,6 +10,7 @@ import httpx
 
 from soulspot.config.settings import SpotifySettings
 from soulspot.domain.ports import ISpotifyClient
+from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
 
 
 class SpotifyClient(ISpotifyClient):
@@ -22,14 +23,20 @@ class SpotifyClient(ISpotifyClient):
     # Hey future me, this init is deceptively simple - we DON'T create the HTTP client here
     # because we need to be async-friendly. The actual client gets lazy-loaded in _get_client().
     # If you try to create httpx.AsyncClient here, you'll get weird asyncio loop issues.
-    def __init__(self, settings: SpotifySettings) -> None:
+    # With an HttpClientRegistry (app.state.http_clients), the pooled "spotify" client is used
+    # instead, so per-request SpotifyClient instances share keep-alive connections.
+    def __init__(
+        self, settings: SpotifySettings, http: HttpClientRegistry | None = None
+    ) -> None:
         """
         Initialize Spotify client.
 
         Args:
             settings: Spotify configuration settings
+            http: Optional registry providing the shared pooled HTTP client
         """
         self.settings = settings
+        self._http = http
         self._client: httpx.AsyncClient | None = None
 
     # Listen up, future me: This is our lazy HTTP client factory. Timeout is 30s because
@@ -38,12 +45,15 @@ class SpotifyClient(ISpotifyClient):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
+            if self._http is not None:
+                return self._http.get("spotify", timeout=30.0)
             self._client = httpx.AsyncClient(timeout=30.0)
         return self._client
 
     # Hey, this close() is IMPORTANT - if you don't call it, you'll leak connections and
     # eventually run out of file descriptors. Always use this client as an async context
     # manager (async with) or explicitly call close() in finally blocks. Trust me on this.
+    # Only closes a client this instance created - a pooled one belongs to the registry.
     async def close(self) -> None:
         """Close HTTP client."""
         if self._client is not None:
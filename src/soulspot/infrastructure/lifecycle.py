@@ -1,13 +1,15 @@
 """Application lifecycle management for startup and shutdown tasks.
 
 This module handles the FastAPI lifespan context manager that orchestrates
-application initialization and cleanup.
+application initialization and cleanup, and the background services shared
+with the standalone worker process (soulspot.worker).
 """
 
 import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager, suppress
+from typing import TYPE_CHECKING, Any
 
 from fastapi import FastAPI
 
@@ -15,6 +17,10 @@ from soulspot.config import Settings, get_settings
 from soulspot.infrastructure.observability import configure_logging
 from soulspot.infrastructure.persistence import Database
 
+if TYPE_CHECKING:
+    from soulspot.application.services.event_bus import EventBus
+    from soulspot.application.workers.job_queue import JobQueue
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,157 +78,261 @@ def _validate_sqlite_path(settings: Settings) -> None:
         ) from exc
 
 
-# Listen future me, @asynccontextmanager makes this a CONTEXT MANAGER for FastAPI lifespan!
-# Everything before `yield` runs at STARTUP, everything after runs at SHUTDOWN. FastAPI calls
-# this ONCE when server starts and cleans up when server stops. The try/finally ensures cleanup
-# ALWAYS runs even if startup fails! If startup crashes, app won't start. Resources like DB
-# connections, job queue workers, and auto-import tasks are stored on app.state so routes can
-# access them. DON'T put long-running code here without timeouts - blocks server startup!
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Application lifespan manager.
-
-    Handles startup and shutdown tasks including:
-    - Logging configuration
-    - Directory creation
-    - Database initialization
-    - Job queue and download worker startup
-    - Token refresh worker startup (background Spotify token management)
-    - Auto-import service startup
-    - Resource cleanup
+# Hey future me - the web process and the worker process (python -m soulspot.worker) build the
+# SAME job queue from the same settings, so both sides agree on backend, limits and retries.
+# Per-type limits/weights for the fair scheduler: built-in defaults, then env overrides
+# (DOWNLOAD__QUEUE_TYPE_LIMITS / _WEIGHTS), and DOWNLOAD always capped by
+# max_concurrent_downloads. num_workers is the global cap across all types.
+# Unknown job type keys raise ValueError here - a typo should fail loudly at startup.
+def create_job_queue(
+    settings: Settings, db: Database, event_bus: "EventBus | None" = None
+) -> "JobQueue":
+    """Create the configured job queue (in-memory or database-backed).
+
+    Args:
+        settings: Application settings
+        db: Database (session scope for the persistent backend)
+        event_bus: Bus that receives job state changes (live UI updates)
+
+    Returns:
+        Job queue, not started yet
     """
-    settings = get_settings()
-
-    # Configure structured logging
-    configure_logging(
-        log_level=settings.log_level,
-        json_format=settings.observability.log_json_format,
-        app_name=settings.app_name,
+    from soulspot.application.workers.job_queue import (
+        DEFAULT_TYPE_LIMITS,
+        DEFAULT_TYPE_WEIGHTS,
+        JobQueue,
+        JobType,
+        RetryPolicy,
     )
-    logger.info("Starting application: %s", settings.app_name)
 
-    # Startup
-    auto_import_task = None
-    job_queue = None
-    token_refresh_worker = None
-    try:
-        # Ensure storage directories exist
-        settings.ensure_directories()
-        logger.info("Storage directories initialized")
+    type_limits = dict(DEFAULT_TYPE_LIMITS)
+    type_limits.update(
+        {
+            JobType(key): value
+            for key, value in settings.download.queue_type_limits.items()
+        }
+    )
+    type_limits[JobType.DOWNLOAD] = settings.download.max_concurrent_downloads
+    type_weights = dict(DEFAULT_TYPE_WEIGHTS)
+    type_weights.update(
+        {
+            JobType(key): value
+            for key, value in settings.download.queue_type_weights.items()
+        }
+    )
+    retry_policy = RetryPolicy(
+        base_delay=settings.download.queue_retry_base_delay,
+        max_delay=settings.download.queue_retry_max_delay,
+        jitter=settings.download.queue_retry_jitter,
+        max_retries={
+            JobType(key): value
+            for key, value in settings.download.queue_type_max_retries.items()
+        },
+    )
 
-        # Validate SQLite path before initializing database engine
-        try:
-            _validate_sqlite_path(settings)
-            logger.info("SQLite path validation completed successfully")
-        except RuntimeError as e:
-            logger.error("SQLite path validation failed: %s", e)
-            raise
+    history_retention = settings.download.queue_history_retention_hours * 3600
 
-        # Initialize database
-        db = Database(settings)
-        app.state.db = db
-        logger.info("Database initialized: %s", settings.database.url)
+    # Hey future me - queue_backend="database" persists jobs in background_jobs so queued
+    # downloads/enrichment survive restarts; start() recovers interrupted ones.
+    if settings.download.queue_backend == "database":
+        from soulspot.application.workers.persistent_job_queue import (
+            PersistentJobQueue,
+        )
 
-        # =================================================================
-        # Load runtime settings from DB (log level, etc.)
-        # =================================================================
-        # Hey future me - this is the STARTUP HOOK for dynamic settings!
-        # It reads log_level from DB and applies it before other components start.
-        # If no DB value exists, env default is kept. This ensures user's log_level
-        # choice persists across container restarts!
-        from soulspot.application.services.app_settings_service import (
-            AppSettingsService,
+        return PersistentJobQueue(
+            session_scope=db.session_scope,
+            max_concurrent_jobs=settings.download.num_workers,
+            poll_interval=settings.download.queue_poll_interval,
+            idle_poll_interval=settings.download.queue_idle_poll_interval,
+            type_limits=type_limits,
+            type_weights=type_weights,
+            retry_policy=retry_policy,
+            history_retention=history_retention,
+            lease_timeout=settings.download.queue_lease_timeout,
+            event_bus=event_bus,
         )
+    return JobQueue(
+        max_concurrent_jobs=settings.download.num_workers,
+        type_limits=type_limits,
+        type_weights=type_weights,
+        retry_policy=retry_policy,
+        history_size=settings.download.queue_history_size,
+        history_retention=history_retention,
+        event_bus=event_bus,
+    )
 
-        async with db.session_scope() as startup_session:
-            startup_settings_service = AppSettingsService(startup_session)
-            try:
-                # Load log level from DB (if set), otherwise keep env default
-                db_log_level = await startup_settings_service.get_string(
-                    "general.log_level", default=None
-                )
-                if db_log_level:
-                    # Apply the DB-stored log level
-                    await startup_settings_service.set_log_level(db_log_level)
-                    logger.info(
-                        "Applied log level from database: %s", db_log_level
-                    )
-                else:
-                    logger.debug(
-                        "No log level in database, using env default: %s",
-                        settings.log_level,
-                    )
-            except Exception as e:
-                # Don't fail startup if settings load fails - just log and continue
-                logger.warning(
-                    "Failed to load runtime settings from DB: %s (using env defaults)",
-                    e,
-                )
 
-        # Initialize database-backed session store for OAuth persistence
-        from soulspot.application.services.session_store import DatabaseSessionStore
+# Hey future me - this is the STARTUP HOOK for dynamic settings!
+# It reads log_level from DB and applies it before other components start.
+# If no DB value exists, env default is kept. This ensures user's log_level
+# choice persists across container restarts!
+async def load_runtime_settings(db: Database, settings: Settings) -> None:
+    """Apply runtime settings stored in the database (log level)."""
+    from soulspot.application.services.app_settings_service import (
+        AppSettingsService,
+    )
 
-        # Hey future me - we pass the session_scope context manager factory directly!
-        # This ensures proper connection cleanup (no more "GC cleaning up non-checked-in connection" errors).
-        # The old get_session() generator pattern leaked connections when used with "async for ... break".
-        session_store = DatabaseSessionStore(
-            session_timeout_seconds=settings.api.session_max_age,
-            session_scope=db.session_scope,
-        )
-        app.state.session_store = session_store
-        logger.info("Session store initialized with database persistence")
+    async with db.session_scope() as startup_session:
+        startup_settings_service = AppSettingsService(startup_session)
+        try:
+            # Load log level from DB (if set), otherwise keep env default
+            db_log_level = await startup_settings_service.get_string(
+                "general.log_level", default=None
+            )
+            if db_log_level:
+                # Apply the DB-stored log level
+                await startup_settings_service.set_log_level(db_log_level)
+                logger.info("Applied log level from database: %s", db_log_level)
+            else:
+                logger.debug(
+                    "No log level in database, using env default: %s",
+                    settings.log_level,
+                )
+        except Exception as e:
+            # Don't fail startup if settings load fails - just log and continue
+            logger.warning(
+                "Failed to load runtime settings from DB: %s (using env defaults)",
+                e,
+            )
 
+
+# Listen up - this is everything around the job queue, shared by BOTH entry points:
+# - run_workers=True: register job handlers, start queue workers and every background loop
+#   (token refresh, Spotify sync, download monitor, automation, cleanup, duplicates,
+#   auto-import, file watcher). That's the embedded web process or python -m soulspot.worker.
+# - run_workers=False: web process with DOWNLOAD__EMBEDDED_WORKERS=false. Only what request
+#   handlers need: token manager, the queue in enqueue/status-only mode and the (unregistered)
+#   download worker for enqueue_download(). Routes for absent workers already answer
+#   "not available" (they look them up with getattr/hasattr).
+# Everything is stored on `state` (app.state or a plain namespace) so shutdown can find it.
+@asynccontextmanager
+async def background_services(
+    settings: Settings, db: Database, state: Any, run_workers: bool = True
+) -> AsyncGenerator[None, None]:
+    """Start the job queue and background workers, stop them on exit.
+
+    Args:
+        settings: Application settings
+        db: Initialized database
+        state: Attribute namespace the services are stored on
+        run_workers: Run job handlers and background loops here (False = the
+            queue is only used to enqueue jobs and read their status)
+    """
+    auto_import_task = None
+    try:
         # =================================================================
         # Initialize DatabaseTokenManager for background workers
         # =================================================================
         # Hey future me - this is THE central token store for background workers!
         # It's separate from session_store (which is for user requests).
         # Workers like WatchlistWorker, DiscographyWorker use this to get tokens.
+        from soulspot.application.cache import (
+            CachedSpotifyClient,
+            DiskCache,
+            LastfmCache,
+            LyricsCache,
+            MusicBrainzCache,
+            SpotifyCache,
+        )
         from soulspot.application.services.token_manager import DatabaseTokenManager
         from soulspot.application.workers.token_refresh_worker import TokenRefreshWorker
+        from soulspot.infrastructure.integrations.http_clients import HttpClientRegistry
         from soulspot.infrastructure.integrations.spotify_client import SpotifyClient
 
-        spotify_client = SpotifyClient(settings.spotify)
+        # Hey future me - ONE pooled httpx client per upstream for the whole process! Request
+        # handlers (api/dependencies.py) and workers take their connections from here, so
+        # keep-alive connections are reused instead of a new TCP + TLS handshake per call.
+        state.http_clients = HttpClientRegistry(settings.http)
+
+        spotify_client = SpotifyClient(settings.spotify, http=state.http_clients)
+
+        # Hey future me - ONE set of API response caches per process! Request handlers
+        # (api/dependencies.py) and background workers wrap their clients with these, so an
+        # album fetched by a completeness check is a cache hit for the watchlist run and vice versa.
+        # With the disk tier, every cache also writes to one SQLite file and is warmed from it,
+        # so a restart (or the standalone worker process) starts with the responses already known.
+        disk_cache = None
+        if settings.cache.disk_enabled:
+            disk_cache = DiskCache(
+                settings.cache.disk_path, settings.cache.disk_max_mb * 1024 * 1024
+            )
+            state.disk_cache = disk_cache
+        state.spotify_cache = SpotifyCache(
+            settings.cache.max_bytes("spotify"),
+            disk=disk_cache,
+            stale_ttl=settings.cache.stale_ttl_seconds,
+        )
+        state.musicbrainz_cache = MusicBrainzCache(
+            settings.cache.max_bytes("musicbrainz"),
+            disk=disk_cache,
+            negative_ttl=settings.cache.negative_ttl_seconds,
+        )
+        state.lastfm_cache = LastfmCache(
+            settings.cache.max_bytes("lastfm"), disk=disk_cache
+        )
+        state.lyrics_cache = LyricsCache(
+            settings.cache.max_bytes("lyrics"),
+            disk=disk_cache,
+            negative_ttl=settings.cache.negative_ttl_seconds,
+        )
+        if disk_cache is not None:
+            for cache in (
+                state.spotify_cache,
+                state.musicbrainz_cache,
+                state.lastfm_cache,
+                state.lyrics_cache,
+            ):
+                warmed = await cache.warm()
+                logger.info(
+                    "Warmed %s cache with %d entries from disk", cache.name, warmed
+                )
 
         # Hey future me - same pattern as session_store: pass session_scope context manager factory!
         db_token_manager = DatabaseTokenManager(
             spotify_client=spotify_client,
             session_scope=db.session_scope,
         )
-        app.state.db_token_manager = db_token_manager
+        state.db_token_manager = db_token_manager
         logger.info("Database token manager initialized for background workers")
 
-        # Start token refresh worker (proactively refreshes tokens before expiry)
-        token_refresh_worker = TokenRefreshWorker(
-            token_manager=db_token_manager,
-            check_interval_seconds=300,  # Check every 5 minutes
-            refresh_threshold_minutes=10,  # Refresh if expires within 10 minutes
-        )
-        await token_refresh_worker.start()
-        app.state.token_refresh_worker = token_refresh_worker
-        logger.info("Token refresh worker started (checks every 5 min)")
+        if run_workers:
+            # Start token refresh worker (proactively refreshes tokens before expiry)
+            token_refresh_worker = TokenRefreshWorker(
+                token_manager=db_token_manager,
+                check_interval_seconds=300,  # Check every 5 minutes
+                refresh_threshold_minutes=10,  # Refresh if expires within 10 minutes
+            )
+            await token_refresh_worker.start()
+            state.token_refresh_worker = token_refresh_worker
+            logger.info("Token refresh worker started (checks every 5 min)")
 
-        # =================================================================
-        # Start Spotify Sync Worker (automatic background syncing)
-        # =================================================================
-        # Hey future me - this worker automatically syncs Spotify data based on settings!
-        # It respects the app_settings table for enable/disable and intervals.
-        # Runs after token_refresh_worker so tokens are always fresh.
-        from soulspot.application.workers.spotify_sync_worker import SpotifySyncWorker
-
-        spotify_sync_worker = SpotifySyncWorker(
-            db=db,
-            token_manager=db_token_manager,
-            settings=settings,
-            check_interval_seconds=60,  # Check every minute if syncs are due
-        )
-        await spotify_sync_worker.start()
-        app.state.spotify_sync_worker = spotify_sync_worker
-        logger.info("Spotify sync worker started (checks every 60s)")
+            # =================================================================
+            # Start Spotify Sync Worker (automatic background syncing)
+            # =================================================================
+            # Hey future me - this worker automatically syncs Spotify data based on settings!
+            # It respects the app_settings table for enable/disable and intervals.
+            # Runs after token_refresh_worker so tokens are always fresh.
+            from soulspot.application.workers.spotify_sync_worker import (
+                SpotifySyncWorker,
+            )
+
+            spotify_sync_worker = SpotifySyncWorker(
+                db=db,
+                token_manager=db_token_manager,
+                settings=settings,
+                check_interval_seconds=60,  # Check every minute if syncs are due
+                http=state.http_clients,
+            )
+            await spotify_sync_worker.start()
+            state.spotify_sync_worker = spotify_sync_worker
+            logger.info("Spotify sync worker started (checks every 60s)")
 
         # Initialize job queue with configured max concurrent downloads
+        from soulspot.application.services.event_bus import EventBus
+        from soulspot.application.workers.download_broadcast_worker import (
+            DownloadBroadcastWorker,
+        )
         from soulspot.application.workers.download_worker import DownloadWorker
-        from soulspot.application.workers.job_queue import JobQueue
         from soulspot.application.workers.library_scan_worker import LibraryScanWorker
         from soulspot.infrastructure.integrations.slskd_client import SlskdClient
         from soulspot.infrastructure.persistence.repositories import (
@@ -230,14 +340,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             TrackRepository,
         )
 
-        job_queue = JobQueue(
-            max_concurrent_jobs=settings.download.max_concurrent_downloads
+        # Hey future me - the EventBus carries live updates (job transitions, download and scan
+        # progress) to SSE clients. DownloadBroadcastWorker is the ONE reader of active downloads
+        # for all of them, and only queries while a client is connected - so in the standalone
+        # worker process (no SSE) it never touches the DB.
+        event_bus = EventBus()
+        state.event_bus = event_bus
+
+        job_queue = create_job_queue(settings, db, event_bus=event_bus)
+        state.job_queue = job_queue
+
+        download_broadcast_worker = DownloadBroadcastWorker(
+            event_bus=event_bus, session_scope=db.session_scope
         )
-        app.state.job_queue = job_queue
+        await download_broadcast_worker.start()
+        state.download_broadcast_worker = download_broadcast_worker
 
         # Create slskd client outside the session context (it doesn't need DB)
-        slskd_client = SlskdClient(settings.slskd)
-        app.state.slskd_client = slskd_client
+        slskd_client = SlskdClient(settings.slskd, http=state.http_clients)
+        state.slskd_client = slskd_client
 
         # =================================================================
         # Create a single long-lived session for background workers
@@ -275,18 +396,36 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 track_repository=track_repository,
                 download_repository=download_repository,
             )
+            state.download_worker = download_worker
+
+            if not run_workers:
+                # Enqueue/status only - the worker process claims and runs the jobs
+                await job_queue.start(num_workers=0)
+                logger.info(
+                    "Job queue (%s) started in enqueue-only mode, "
+                    "jobs run in the worker process",
+                    settings.download.queue_backend,
+                )
+                yield
+                return
+
             download_worker.register()
-            app.state.download_worker = download_worker
 
             # Initialize library scan worker
             library_scan_worker = LibraryScanWorker(
                 job_queue=job_queue,
                 db=db,
                 settings=settings,
+                event_bus=event_bus,
             )
             library_scan_worker.register()
-            app.state.library_scan_worker = library_scan_worker
+            state.library_scan_worker = library_scan_worker
             logger.info("Library scan worker registered")
+            try:
+                if await library_scan_worker.resume_interrupted_scan():
+                    logger.info("Queued resume of interrupted library scan")
+            except Exception as e:
+                logger.warning("Could not check for interrupted library scans: %s", e)
 
             # Initialize library enrichment worker
             # Hey future me - this worker enriches local library items with Spotify data!
@@ -299,15 +438,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 job_queue=job_queue,
                 db=db,
                 settings=settings,
+                spotify_cache=state.spotify_cache,
+                http=state.http_clients,
             )
             library_enrichment_worker.register()
-            app.state.library_enrichment_worker = library_enrichment_worker
+            state.library_enrichment_worker = library_enrichment_worker
             logger.info("Library enrichment worker registered")
 
             # Start job queue workers
             await job_queue.start(num_workers=settings.download.num_workers)
             logger.info(
-                "Job queue started with %d workers, max concurrent downloads: %d",
+                "Job queue (%s) started with %d workers, max concurrent downloads: %d",
+                settings.download.queue_backend,
                 settings.download.num_workers,
                 settings.download.max_concurrent_downloads,
             )
@@ -326,9 +468,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 job_queue=job_queue,
                 slskd_client=slskd_client,
                 poll_interval_seconds=10,  # Poll every 10 seconds
+                event_bus=event_bus,
             )
             await download_monitor_worker.start()
-            app.state.download_monitor_worker = download_monitor_worker
+            state.download_monitor_worker = download_monitor_worker
             logger.info("Download monitor worker started (polls every 10s)")
 
             # =================================================================
@@ -343,14 +486,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
             automation_manager = AutomationWorkerManager(
                 session=worker_session,
-                spotify_client=spotify_client,
+                spotify_client=CachedSpotifyClient(spotify_client, state.spotify_cache),
                 token_manager=db_token_manager,
                 watchlist_interval=3600,  # 1 hour
                 discography_interval=86400,  # 24 hours
                 quality_interval=86400,  # 24 hours
             )
             await automation_manager.start_all()
-            app.state.automation_manager = automation_manager
+            state.automation_manager = automation_manager
             logger.info("Automation workers started (watchlist/discography/quality)")
 
             # =================================================================
@@ -372,7 +515,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 dry_run=False,  # Set to True for testing
             )
             await cleanup_worker.start()
-            app.state.cleanup_worker = cleanup_worker
+            state.cleanup_worker = cleanup_worker
             logger.info("Cleanup worker started (checks daily, disabled by default)")
 
             # =================================================================
@@ -391,123 +534,305 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 session_scope=db.session_scope,
             )
             await duplicate_detector_worker.start()
-            app.state.duplicate_detector_worker = duplicate_detector_worker
+            state.duplicate_detector_worker = duplicate_detector_worker
             logger.info(
                 "Duplicate detector worker started (weekly scan, disabled by default)"
             )
 
             # Start auto-import service in the background
             from soulspot.application.services import AutoImportService
+            from soulspot.application.services.postprocessing import (
+                ArtworkService,
+                LyricsService,
+                PostProcessingPipeline,
+            )
             from soulspot.infrastructure.persistence.repositories import (
                 AlbumRepository,
                 ArtistRepository,
             )
 
+            # Hey future me - the filesystem watcher feeds auto-import (downloads dir) and
+            # incremental library indexing (music dir) from inotify/polling change batches,
+            # so neither has to re-walk its tree. Subscribers register before start().
+            file_watcher = None
+            if settings.library.watch_enabled:
+                from soulspot.application.services.file_watcher import (
+                    FilesystemWatcher,
+                )
+                from soulspot.application.services.library_scanner_service import (
+                    AUDIO_EXTENSIONS,
+                )
+
+                file_watcher = FilesystemWatcher(
+                    mode=settings.library.watch_mode,
+                    debounce_ms=settings.library.watch_debounce_ms,
+                    poll_interval_ms=settings.library.watch_poll_interval_ms,
+                    extensions=AUDIO_EXTENSIONS,
+                )
+                file_watcher.subscribe(
+                    settings.storage.music_path, library_scan_worker.handle_changes
+                )
+
             # Create auto-import service using the worker session
+            artist_repository = ArtistRepository(worker_session)
+            album_repository = AlbumRepository(worker_session)
+            post_processing_pipeline = PostProcessingPipeline(
+                settings=settings,
+                artist_repository=artist_repository,
+                album_repository=album_repository,
+                artwork_service=ArtworkService(
+                    settings,
+                    musicbrainz_cache=state.musicbrainz_cache,
+                    http=state.http_clients,
+                ),
+                lyrics_service=LyricsService(
+                    settings, cache=state.lyrics_cache, http=state.http_clients
+                ),
+                app_settings_service=app_settings_service,  # For dynamic naming templates
+            )
             auto_import_service = AutoImportService(
                 settings=settings,
                 track_repository=track_repository,
-                artist_repository=ArtistRepository(worker_session),
-                album_repository=AlbumRepository(worker_session),
+                artist_repository=artist_repository,
+                album_repository=album_repository,
                 poll_interval=settings.postprocessing.auto_import_poll_interval,
-                app_settings_service=app_settings_service,  # For dynamic naming templates
+                post_processing_pipeline=post_processing_pipeline,
+                app_settings_service=app_settings_service,
+                file_watcher=file_watcher,
             )
-            app.state.auto_import = auto_import_service
+            state.auto_import = auto_import_service
             auto_import_task = asyncio.create_task(auto_import_service.start())
             logger.info("Auto-import service started")
 
+            if file_watcher is not None:
+                await file_watcher.start()
+                state.file_watcher = file_watcher
+                logger.info(
+                    "Filesystem watcher started (mode: %s)",
+                    settings.library.watch_mode,
+                )
+
             # Yield to keep the app running - session stays open during app lifetime
             yield
 
-    except Exception as e:
-        logger.exception("Error during application startup: %s", e)
-        raise
     finally:
-        # Shutdown - always attempt cleanup
-        logger.info("Shutting down application")
+        await _stop_background_services(settings, state, auto_import_task)
 
-        # Stop duplicate detector worker first (least critical)
-        if hasattr(app.state, "duplicate_detector_worker"):
-            try:
-                logger.info("Stopping duplicate detector worker...")
-                await app.state.duplicate_detector_worker.stop()
-                logger.info("Duplicate detector worker stopped")
-            except Exception as e:
-                logger.exception("Error stopping duplicate detector worker: %s", e)
 
-        # Stop cleanup worker
-        if hasattr(app.state, "cleanup_worker"):
-            try:
-                logger.info("Stopping cleanup worker...")
-                await app.state.cleanup_worker.stop()
-                logger.info("Cleanup worker stopped")
-            except Exception as e:
-                logger.exception("Error stopping cleanup worker: %s", e)
+async def _stop_background_services(
+    settings: Settings, state: Any, auto_import_task: "asyncio.Task[None] | None"
+) -> None:
+    """Stop everything background_services() started, least critical first."""
+    logger.info("Stopping background services")
+    # Stop filesystem watcher first - it feeds auto-import and the job queue
+    if hasattr(state, "file_watcher"):
+        try:
+            logger.info("Stopping filesystem watcher...")
+            await state.file_watcher.stop()
+            logger.info("Filesystem watcher stopped")
+        except Exception as e:
+            logger.exception("Error stopping filesystem watcher: %s", e)
 
-        # Stop automation workers
-        if hasattr(app.state, "automation_manager"):
-            try:
-                logger.info("Stopping automation workers...")
-                await app.state.automation_manager.stop_all()
-                logger.info("Automation workers stopped")
-            except Exception as e:
-                logger.exception("Error stopping automation workers: %s", e)
+    # Stop duplicate detector worker (least critical)
+    if hasattr(state, "duplicate_detector_worker"):
+        try:
+            logger.info("Stopping duplicate detector worker...")
+            await state.duplicate_detector_worker.stop()
+            logger.info("Duplicate detector worker stopped")
+        except Exception as e:
+            logger.exception("Error stopping duplicate detector worker: %s", e)
 
-        # Stop download monitor worker
-        if hasattr(app.state, "download_monitor_worker"):
-            try:
-                logger.info("Stopping download monitor worker...")
-                await app.state.download_monitor_worker.stop()
-                logger.info("Download monitor worker stopped")
-            except Exception as e:
-                logger.exception("Error stopping download monitor worker: %s", e)
+    # Stop cleanup worker
+    if hasattr(state, "cleanup_worker"):
+        try:
+            logger.info("Stopping cleanup worker...")
+            await state.cleanup_worker.stop()
+            logger.info("Cleanup worker stopped")
+        except Exception as e:
+            logger.exception("Error stopping cleanup worker: %s", e)
 
-        # Stop Spotify sync worker first (depends on token manager)
-        if hasattr(app.state, "spotify_sync_worker"):
-            try:
-                logger.info("Stopping Spotify sync worker...")
-                await app.state.spotify_sync_worker.stop()
-                logger.info("Spotify sync worker stopped")
-            except Exception as e:
-                logger.exception("Error stopping Spotify sync worker: %s", e)
+    # Stop automation workers
+    if hasattr(state, "automation_manager"):
+        try:
+            logger.info("Stopping automation workers...")
+            await state.automation_manager.stop_all()
+            logger.info("Automation workers stopped")
+        except Exception as e:
+            logger.exception("Error stopping automation workers: %s", e)
 
-        # Stop token refresh worker
-        if token_refresh_worker is not None:
-            try:
-                logger.info("Stopping token refresh worker...")
-                await token_refresh_worker.stop()
-                logger.info("Token refresh worker stopped")
-            except Exception as e:
-                logger.exception("Error stopping token refresh worker: %s", e)
+    # Stop download monitor worker
+    if hasattr(state, "download_monitor_worker"):
+        try:
+            logger.info("Stopping download monitor worker...")
+            await state.download_monitor_worker.stop()
+            logger.info("Download monitor worker stopped")
+        except Exception as e:
+            logger.exception("Error stopping download monitor worker: %s", e)
 
-        # Stop job queue
-        if job_queue is not None:
-            try:
-                logger.info("Stopping job queue...")
-                await job_queue.stop()
-                logger.info("Job queue stopped")
-            except Exception as e:
-                logger.exception("Error stopping job queue: %s", e)
+    # Stop download broadcast worker (SSE snapshots)
+    if hasattr(state, "download_broadcast_worker"):
+        try:
+            logger.info("Stopping download broadcast worker...")
+            await state.download_broadcast_worker.stop()
+            logger.info("Download broadcast worker stopped")
+        except Exception as e:
+            logger.exception("Error stopping download broadcast worker: %s", e)
 
-        # Stop auto-import service
-        if auto_import_task is not None:
-            try:
-                if hasattr(app.state, "auto_import"):
-                    await app.state.auto_import.stop()
-                    # Wait for task to complete gracefully with timeout
-                    try:
-                        await asyncio.wait_for(
-                            auto_import_task,
-                            timeout=settings.observability.shutdown_timeout,
-                        )
-                    except TimeoutError:
-                        # If timeout, cancel forcefully
-                        auto_import_task.cancel()
-                        with suppress(asyncio.CancelledError):
-                            await auto_import_task
-                    logger.info("Auto-import service stopped")
-            except Exception as e:
-                logger.exception("Error stopping auto-import service: %s", e)
+    # Stop Spotify sync worker first (depends on token manager)
+    if hasattr(state, "spotify_sync_worker"):
+        try:
+            logger.info("Stopping Spotify sync worker...")
+            await state.spotify_sync_worker.stop()
+            logger.info("Spotify sync worker stopped")
+        except Exception as e:
+            logger.exception("Error stopping Spotify sync worker: %s", e)
+
+    # Stop token refresh worker
+    if hasattr(state, "token_refresh_worker"):
+        try:
+            logger.info("Stopping token refresh worker...")
+            await state.token_refresh_worker.stop()
+            logger.info("Token refresh worker stopped")
+        except Exception as e:
+            logger.exception("Error stopping token refresh worker: %s", e)
+
+    # Stop job queue
+    if hasattr(state, "job_queue"):
+        try:
+            logger.info("Stopping job queue...")
+            await state.job_queue.stop()
+            logger.info("Job queue stopped")
+        except Exception as e:
+            logger.exception("Error stopping job queue: %s", e)
+
+    # Stop auto-import service
+    if auto_import_task is not None:
+        try:
+            if hasattr(state, "auto_import"):
+                await state.auto_import.stop()
+                # Wait for task to complete gracefully with timeout
+                try:
+                    await asyncio.wait_for(
+                        auto_import_task,
+                        timeout=settings.observability.shutdown_timeout,
+                    )
+                except TimeoutError:
+                    # If timeout, cancel forcefully
+                    auto_import_task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await auto_import_task
+                logger.info("Auto-import service stopped")
+        except Exception as e:
+            logger.exception("Error stopping auto-import service: %s", e)
+
+    # Close the disk cache last - workers stopped above may still have written to it
+    if hasattr(state, "disk_cache"):
+        try:
+            await state.disk_cache.close()
+            logger.info("Disk cache closed")
+        except Exception as e:
+            logger.exception("Error closing disk cache: %s", e)
+
+    # Close the pooled HTTP clients after everything that could still send a request
+    if hasattr(state, "http_clients"):
+        try:
+            await state.http_clients.close()
+            logger.info("HTTP client pools closed")
+        except Exception as e:
+            logger.exception("Error closing HTTP client pools: %s", e)
+
+
+# Listen future me, @asynccontextmanager makes this a CONTEXT MANAGER for FastAPI lifespan!
+# Everything before `yield` runs at STARTUP, everything after runs at SHUTDOWN. FastAPI calls
+# this ONCE when server starts and cleans up when server stops. The try/finally ensures cleanup
+# ALWAYS runs even if startup fails! If startup crashes, app won't start. Resources like DB
+# connections, job queue workers, and auto-import tasks are stored on app.state so routes can
+# access them. DON'T put long-running code here without timeouts - blocks server startup!
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Application lifespan manager.
+
+    Handles startup and shutdown tasks including:
+    - Logging configuration
+    - Directory creation
+    - Database initialization
+    - Job queue and download worker startup (unless they run in the worker process)
+    - Token refresh worker startup (background Spotify token management)
+    - Auto-import service startup
+    - Resource cleanup
+    """
+    settings = get_settings()
+
+    # Configure structured logging
+    configure_logging(
+        log_level=settings.log_level,
+        json_format=settings.observability.log_json_format,
+        app_name=settings.app_name,
+    )
+    logger.info("Starting application: %s", settings.app_name)
+
+    run_workers = settings.download.embedded_workers
+    if not run_workers and settings.download.queue_backend != "database":
+        raise RuntimeError(
+            "DOWNLOAD__EMBEDDED_WORKERS=false needs DOWNLOAD__QUEUE_BACKEND=database - "
+            "the worker process can only share a database-backed queue"
+        )
+    if run_workers and settings.api.workers > 1:
+        logger.warning(
+            "API_WORKERS=%d with embedded workers: every web process runs its own job "
+            "queue and background workers. Set DOWNLOAD__EMBEDDED_WORKERS=false and run "
+            "'python -m soulspot.worker' instead.",
+            settings.api.workers,
+        )
+
+    # Startup
+    try:
+        # Ensure storage directories exist
+        settings.ensure_directories()
+        logger.info("Storage directories initialized")
+
+        # Validate SQLite path before initializing database engine
+        try:
+            _validate_sqlite_path(settings)
+            logger.info("SQLite path validation completed successfully")
+        except RuntimeError as e:
+            logger.error("SQLite path validation failed: %s", e)
+            raise
+
+        # Initialize database
+        db = Database(settings)
+        app.state.db = db
+        logger.info("Database initialized: %s", settings.database.url)
+
+        # =================================================================
+        # Load runtime settings from DB (log level, etc.)
+        # =================================================================
+        await load_runtime_settings(db, settings)
+
+        # Initialize database-backed session store for OAuth persistence
+        from soulspot.application.services.session_store import DatabaseSessionStore
+
+        # Hey future me - we pass the session_scope context manager factory directly!
+        # This ensures proper connection cleanup (no more "GC cleaning up non-checked-in connection" errors).
+        # The old get_session() generator pattern leaked connections when used with "async for ... break".
+        session_store = DatabaseSessionStore(
+            session_timeout_seconds=settings.api.session_max_age,
+            session_scope=db.session_scope,
+        )
+        app.state.session_store = session_store
+        logger.info("Session store initialized with database persistence")
+
+        async with background_services(
+            settings, db, app.state, run_workers=run_workers
+        ):
+            yield
+
+    except Exception as e:
+        logger.exception("Error during application startup: %s", e)
+        raise
+    finally:
+        # Shutdown - always attempt cleanup
+        logger.info("Shutting down application")
 
         # Close database
         try:
@@ -14,6 +14,7 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -241,7 +242,12 @@ class TrackModel(Base):
         uselist=False,
     )
 
-    __table_args__ = (Index("ix_tracks_title_artist", "title", "artist_id"),)
+    # Hey - file_path is UNIQUE so bulk ingest can use INSERT ... ON CONFLICT (file_path).
+    # NULLs don't collide (tracks without a local file are fine).
+    __table_args__ = (
+        Index("ix_tracks_title_artist", "title", "artist_id"),
+        Index("uq_tracks_file_path", "file_path", unique=True),
+    )
 
 
 class PlaylistModel(Base):
@@ -369,6 +375,9 @@ class LibraryScanModel(Base):
     broken_files: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     duplicate_files: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Hey future me - only import scans (LibraryScannerService) write this: the last fully
+    # committed directory ("cursor"), partial stats and the scan mode. NULL = nothing to resume.
+    checkpoint: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
     started_at: Mapped[datetime] = mapped_column(nullable=False)
     completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
     created_at: Mapped[datetime] = mapped_column(default=utc_now, nullable=False)
@@ -1164,3 +1173,91 @@ class EnrichmentCandidateModel(Base):
         Index("ix_enrichment_spotify_uri", "spotify_uri"),
         Index("ix_enrichment_confidence", "confidence_score"),
     )
+
+
+# =============================================================================
+# LIBRARY FILE INDEX (for incremental LibraryScannerService scans)
+# =============================================================================
+# Hey future me - this is the persisted FINGERPRINT INDEX of the music directory!
+# One row per audio file AND per directory, keyed by absolute path. A file is unchanged
+# if (size, mtime_ns, inode) all still match - no need to open it, no tag parsing, no hash.
+# Directories store only their mtime_ns: a directory's mtime moves when entries are added,
+# removed or renamed INSIDE it, so if it hasn't moved we don't even stat its files.
+# The `directory` column (parent path) is indexed so discovery can load ONE directory's
+# rows at a time - that's what keeps incremental scans at constant memory.
+# GOTCHA: in-place edits (retagging) don't bump the parent dir mtime - run a full scan
+# (incremental=False) to catch those.
+# =============================================================================
+
+
+class LibraryFileIndexModel(Base):
+    """Filesystem fingerprint of a scanned file or directory."""
+
+    __tablename__ = "library_file_index"
+
+    path: Mapped[str] = mapped_column(String(1024), primary_key=True)
+    directory: Mapped[str] = mapped_column(String(1024), nullable=False)
+    is_directory: Mapped[bool] = mapped_column(
+        sa.Boolean, nullable=False, default=False
+    )
+    size: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, default=0)
+    mtime_ns: Mapped[int] = mapped_column(sa.BigInteger, nullable=False)
+    inode: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, default=0)
+    indexed_at: Mapped[datetime] = mapped_column(default=utc_now, nullable=False)
+
+    __table_args__ = (Index("ix_library_file_index_directory", "directory"),)
+
+
+# =============================================================================
+# BACKGROUND JOBS (durable JobQueue backend)
+# =============================================================================
+# Hey future me - this table backs PersistentJobQueue (download.queue_backend = "database").
+# Workers CLAIM rows atomically with one UPDATE ... WHERE id = (oldest pending, highest priority)
+# RETURNING, so two workers never get the same job. run_after delays a row (retry backoff) - a
+# pending row is only claimable once run_after has passed. claimed_by names the queue instance
+# that runs the job, and that instance refreshes heartbeat_at of its running rows - its lease.
+# Several live processes share this table, so a "running" row is only reclaimed (reset to
+# pending) once its heartbeat is older than download.queue_lease_timeout, i.e. its owner died.
+# The (status, priority, run_after) index is what the claim query walks.
+# dedup_key is unique among pending/running rows only (partial index) - enqueue() coalesces
+# onto the active job with the same key, finished rows don't block a new job.
+# =============================================================================
+
+
+class BackgroundJobModel(Base):
+    """Persistent background job (see PersistentJobQueue)."""
+
+    __tablename__ = "background_jobs"
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    job_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    result: Mapped[Any | None] = mapped_column(JSON, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    retries: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_retries: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    run_after: Mapped[datetime] = mapped_column(default=utc_now, nullable=False)
+    claimed_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    dedup_key: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(default=utc_now, nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    # Refreshed by the claiming worker while the job runs, stale = worker is gone
+    heartbeat_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    __table_args__ = (
+        Index("ix_background_jobs_claim", "status", "priority", "run_after"),
+        Index("ix_background_jobs_type_status", "job_type", "status"),
+        Index("ix_background_jobs_created_at", "created_at"),
+        Index(
+            "ux_background_jobs_dedup_active",
+            "dedup_key",
+            unique=True,
+            sqlite_where=text("status IN ('pending', 'running')"),
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
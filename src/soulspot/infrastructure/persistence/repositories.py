@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import json
+import os
+import uuid
+from collections.abc import Collection
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 if TYPE_CHECKING:
     from soulspot.application.services.session_store import Session
 
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import Table, bindparam, case, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from soulspot.domain.entities import (
     Album,
@@ -43,7 +46,9 @@ from soulspot.domain.value_objects import (
 from .models import (
     AlbumModel,
     ArtistModel,
+    BackgroundJobModel,
     DownloadModel,
+    LibraryScanModel,
     PlaylistModel,
     PlaylistTrackModel,
     SessionModel,
@@ -56,6 +61,41 @@ from .models import (
 T = TypeVar("T")
 
 
+# Unique track columns usable as ON CONFLICT target for TrackRepository.bulk_upsert()
+TRACK_UPSERT_KEYS = frozenset({"file_path", "isrc", "spotify_uri"})
+# 500 rows x ~20 columns stays well below SQLite's 32766 bound-parameter limit
+TRACK_UPSERT_CHUNK_SIZE = 500
+# Columns TrackRepository.bulk_update_file_info() may touch
+TRACK_FILE_INFO_COLUMNS = frozenset(
+    {
+        "file_size",
+        "file_hash",
+        "file_hash_algorithm",
+        "is_broken",
+        "audio_bitrate",
+        "audio_format",
+        "audio_sample_rate",
+        "duration_ms",
+        "last_scanned_at",
+    }
+)
+
+
+# Hey future me - SQLite and PostgreSQL both speak INSERT ... ON CONFLICT, but SQLAlchemy only
+# exposes it through the dialect-specific insert() constructs. This picks the right one for the
+# session's bind, so repositories can do multi-row upserts without caring about the backend.
+def _dialect_insert(session: AsyncSession, model: Any) -> Any:
+    """Return a dialect-specific INSERT construct supporting ON CONFLICT."""
+    if session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        return pg_insert(model)
+
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    return sqlite_insert(model)
+
+
 class ArtistRepository(IArtistRepository):
     """SQLAlchemy implementation of Artist repository."""
 
@@ -1029,6 +1069,130 @@ class TrackRepository(ITrackRepository):
                 model.file_path = str(track.file_path) if track.file_path else None
                 model.updated_at = track.updated_at
 
+    # Hey future me - this is the BULK INGEST path for scanners! One multi-row
+    # INSERT ... ON CONFLICT (key) DO UPDATE ... RETURNING id per chunk instead of session.add() +
+    # lookup per file. conflict_key must be a UNIQUE column (file_path, isrc, spotify_uri).
+    # GOTCHA: ON CONFLICT only handles the chosen key - a row that collides on ANOTHER unique column
+    # (e.g. same ISRC, new file_path) still raises IntegrityError. Rows are grouped by their key
+    # set (multi-row VALUES needs identical columns) and de-duplicated by conflict key (last row
+    # wins) because Postgres refuses to update the same row twice in one statement.
+    async def bulk_upsert(
+        self,
+        rows: list[dict[str, Any]],
+        conflict_key: str = "file_path",
+        update_columns: list[str] | None = None,
+    ) -> dict[str, str]:
+        """Insert or update many track rows in chunked multi-row statements.
+
+        Args:
+            rows: TrackModel column dicts (``id`` is generated when missing)
+            conflict_key: Unique column used for ON CONFLICT (file_path, isrc, spotify_uri)
+            update_columns: Columns overwritten on conflict (default: all given except
+                id/created_at and the key itself)
+
+        Returns:
+            Mapping of conflict key value -> track id (inserted or existing)
+
+        Raises:
+            ValidationException: If conflict_key is not a supported unique column
+        """
+        if conflict_key not in TRACK_UPSERT_KEYS:
+            raise ValidationException(
+                f"Unsupported conflict key '{conflict_key}', "
+                f"use one of {sorted(TRACK_UPSERT_KEYS)}"
+            )
+
+        now = datetime.now(UTC)
+        deduped: dict[Any, dict[str, Any]] = {}
+        for row in rows:
+            if row.get(conflict_key) is None:
+                raise ValidationException(f"Row without {conflict_key}: {row!r}")
+            deduped[row[conflict_key]] = {
+                "id": str(uuid.uuid4()),
+                "created_at": now,
+                "updated_at": now,
+                **row,
+            }
+
+        groups: dict[frozenset[str], list[dict[str, Any]]] = {}
+        for row in deduped.values():
+            groups.setdefault(frozenset(row), []).append(row)
+
+        key_column = getattr(TrackModel, conflict_key)
+        ids: dict[str, str] = {}
+        for columns, group in groups.items():
+            set_columns = update_columns or [
+                c for c in columns if c not in ("id", "created_at", conflict_key)
+            ]
+            for start in range(0, len(group), TRACK_UPSERT_CHUNK_SIZE):
+                stmt = _dialect_insert(self.session, TrackModel).values(
+                    group[start : start + TRACK_UPSERT_CHUNK_SIZE]
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[conflict_key],
+                    set_={c: stmt.excluded[c] for c in set_columns},
+                ).returning(TrackModel.id, key_column)
+                result = await self.session.execute(stmt)
+                ids.update({row[1]: row[0] for row in result.all()})
+        return ids
+
+    # Yo, companion to bulk_upsert for scans that only REFRESH existing tracks (library health scan).
+    # executemany UPDATE keyed on file_path - the driver sends the whole chunk in one go. Files without
+    # a matching track are silently skipped (same as the old select-then-update loop).
+    # Only the columns present in the rows are touched (all rows need the same keys).
+    # duration_ms is only filled in when the track has none yet (0), never overwritten.
+    async def bulk_update_file_info(self, rows: list[dict[str, Any]]) -> int:
+        """Update file/scan columns of existing tracks matched by file_path.
+
+        Args:
+            rows: Dicts with file_path plus any of file_size, file_hash,
+                file_hash_algorithm, is_broken, audio_bitrate, audio_format,
+                audio_sample_rate, duration_ms, last_scanned_at
+
+        Returns:
+            Number of rows submitted
+
+        Raises:
+            ValidationException: If rows contain other columns
+        """
+        if not rows:
+            return 0
+
+        columns = set(rows[0]) - {"file_path"}
+        unsupported = columns - TRACK_FILE_INFO_COLUMNS
+        if unsupported:
+            raise ValidationException(
+                f"Unsupported file info columns: {sorted(unsupported)}"
+            )
+
+        # Core Table, not the ORM model: an ORM update() with a parameter list switches to
+        # bulk-by-primary-key mode, but these rows are matched by file_path
+        table = cast(Table, TrackModel.__table__)
+        values: dict[str, Any] = {
+            c: bindparam(f"b_{c}") for c in columns if c != "duration_ms"
+        }
+        if "duration_ms" in columns:
+            values["duration_ms"] = case(
+                (
+                    (table.c.duration_ms == 0) & bindparam("b_duration_ms").isnot(None),
+                    bindparam("b_duration_ms"),
+                ),
+                else_=table.c.duration_ms,
+            )
+        values["updated_at"] = datetime.now(UTC)
+        stmt = (
+            update(table)
+            .where(table.c.file_path == bindparam("b_file_path"))
+            .values(values)
+        )
+
+        params = [{f"b_{key}": value for key, value in row.items()} for row in rows]
+        for start in range(0, len(params), TRACK_UPSERT_CHUNK_SIZE):
+            await self.session.execute(
+                stmt, params[start : start + TRACK_UPSERT_CHUNK_SIZE]
+            )
+        return len(rows)
+
     # Hey future me - ISRC lookup for auto-import track matching!
     # ISRC (International Standard Recording Code) is a globally unique identifier
     # for recordings. If we have ISRC in ID3 tags, this is the BEST way to match
@@ -3668,3 +3832,644 @@ class SpotifyTokenRepository:
 
         await self.session.delete(model)
         return True
+
+
+class LibraryFileIndexRepository:
+    """Repository for the library file fingerprint index.
+
+    Backs incremental library scans: discovery compares the filesystem against
+    these rows one directory at a time instead of loading every known track.
+    """
+
+    # Rows per INSERT statement - keeps us well below SQLite's bound-parameter limit
+    UPSERT_CHUNK_SIZE = 500
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with session."""
+        self.session = session
+
+    async def get(self, path: str) -> tuple[bool, int, int, int] | None:
+        """Get the stored fingerprint for a single path.
+
+        Returns:
+            Tuple of (is_directory, size, mtime_ns, inode) or None if not indexed
+        """
+        from .models import LibraryFileIndexModel
+
+        stmt = select(
+            LibraryFileIndexModel.is_directory,
+            LibraryFileIndexModel.size,
+            LibraryFileIndexModel.mtime_ns,
+            LibraryFileIndexModel.inode,
+        ).where(LibraryFileIndexModel.path == path)
+        result = await self.session.execute(stmt)
+        row = result.first()
+        return tuple(row) if row else None  # type: ignore[return-value]
+
+    async def get_directory(
+        self, directory: str
+    ) -> dict[str, tuple[bool, int, int, int]]:
+        """Get fingerprints of all direct children of a directory.
+
+        Args:
+            directory: Absolute directory path
+
+        Returns:
+            Dict mapping child path to (is_directory, size, mtime_ns, inode)
+        """
+        from .models import LibraryFileIndexModel
+
+        stmt = select(
+            LibraryFileIndexModel.path,
+            LibraryFileIndexModel.is_directory,
+            LibraryFileIndexModel.size,
+            LibraryFileIndexModel.mtime_ns,
+            LibraryFileIndexModel.inode,
+        ).where(LibraryFileIndexModel.directory == directory)
+        result = await self.session.execute(stmt)
+        return {row[0]: (row[1], row[2], row[3], row[4]) for row in result.all()}
+
+    async def upsert_many(self, entries: list[dict[str, Any]]) -> None:
+        """Insert or update fingerprints in multi-row statements.
+
+        Args:
+            entries: Dicts with path, directory, is_directory, size, mtime_ns, inode
+        """
+        from .models import LibraryFileIndexModel
+
+        now = datetime.now(UTC)
+        for start in range(0, len(entries), self.UPSERT_CHUNK_SIZE):
+            chunk = [
+                {**entry, "indexed_at": now}
+                for entry in entries[start : start + self.UPSERT_CHUNK_SIZE]
+            ]
+            stmt = _dialect_insert(self.session, LibraryFileIndexModel).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[LibraryFileIndexModel.path],
+                set_={
+                    "directory": stmt.excluded.directory,
+                    "is_directory": stmt.excluded.is_directory,
+                    "size": stmt.excluded.size,
+                    "mtime_ns": stmt.excluded.mtime_ns,
+                    "inode": stmt.excluded.inode,
+                    "indexed_at": stmt.excluded.indexed_at,
+                },
+            )
+            await self.session.execute(stmt)
+
+    async def delete_paths(self, paths: list[str]) -> int:
+        """Delete index rows for paths that vanished, including directory subtrees.
+
+        Args:
+            paths: Absolute file or directory paths
+
+        Returns:
+            Number of deleted rows
+        """
+        from .models import LibraryFileIndexModel
+
+        deleted = 0
+        for path in paths:
+            stmt = delete(LibraryFileIndexModel).where(
+                (LibraryFileIndexModel.path == path)
+                | LibraryFileIndexModel.path.startswith(path + os.sep, autoescape=True)
+            )
+            result = await self.session.execute(stmt)
+            deleted += result.rowcount or 0  # type: ignore[attr-defined]
+        return deleted
+
+    async def count_files(self) -> int:
+        """Count indexed audio files (excludes directories)."""
+        from .models import LibraryFileIndexModel
+
+        stmt = select(func.count()).where(
+            LibraryFileIndexModel.is_directory == False  # noqa: E712
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar() or 0
+
+
+class LibraryScanRepository:
+    """Repository for import scan records and their resume checkpoints.
+
+    Only rows with a non-NULL checkpoint belong to resumable import scans -
+    health scans (ScanLibraryUseCase) share the table but never set it.
+    """
+
+    # Statuses a checkpointed scan can be resumed from ("running" = process died mid-scan)
+    RESUMABLE_STATUSES = ("running", "failed")
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with session."""
+        self.session = session
+
+    async def create(self, scan_path: str, checkpoint: dict[str, Any]) -> str:
+        """Create a running scan record.
+
+        Args:
+            scan_path: Scanned library root
+            checkpoint: Initial checkpoint (cursor None)
+
+        Returns:
+            Scan ID
+        """
+        model = LibraryScanModel(
+            id=str(uuid.uuid4()),
+            status="running",
+            scan_path=scan_path,
+            checkpoint=checkpoint,
+            started_at=datetime.now(UTC),
+        )
+        self.session.add(model)
+        await self.session.flush()
+        return model.id
+
+    async def get(self, scan_id: str) -> LibraryScanModel | None:
+        """Get a scan record by ID."""
+        return await self.session.get(LibraryScanModel, scan_id)
+
+    async def get_resumable(
+        self, scan_path: str | None = None
+    ) -> LibraryScanModel | None:
+        """Get the most recent interrupted scan that still has a checkpoint.
+
+        Args:
+            scan_path: Only consider scans of this library root
+
+        Returns:
+            Scan record or None
+        """
+        stmt = select(LibraryScanModel).where(
+            LibraryScanModel.checkpoint.is_not(None),
+            LibraryScanModel.status.in_(self.RESUMABLE_STATUSES),
+        )
+        if scan_path is not None:
+            stmt = stmt.where(LibraryScanModel.scan_path == scan_path)
+        stmt = stmt.order_by(LibraryScanModel.started_at.desc()).limit(1)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def save_checkpoint(
+        self,
+        scan_id: str,
+        checkpoint: dict[str, Any],
+        total_files: int,
+        scanned_files: int,
+    ) -> None:
+        """Overwrite the checkpoint of a running scan (caller commits)."""
+        await self.session.execute(
+            update(LibraryScanModel)
+            .where(LibraryScanModel.id == scan_id)
+            .values(
+                checkpoint=checkpoint,
+                total_files=total_files,
+                scanned_files=scanned_files,
+                updated_at=datetime.now(UTC),
+            )
+        )
+
+    async def finish(
+        self,
+        scan_id: str,
+        status: str,
+        total_files: int = 0,
+        scanned_files: int = 0,
+        new_files: int = 0,
+        error_message: str | None = None,
+        keep_checkpoint: bool = False,
+    ) -> None:
+        """Mark a scan as finished (caller commits).
+
+        Args:
+            scan_id: Scan ID
+            status: Final status (completed, failed, cancelled)
+            total_files: Files seen
+            scanned_files: Files read or refreshed
+            new_files: Newly imported tracks
+            error_message: Error for failed scans
+            keep_checkpoint: Keep the checkpoint so the scan can be resumed
+        """
+        values: dict[str, Any] = {
+            "status": status,
+            "total_files": total_files,
+            "scanned_files": scanned_files,
+            "new_files": new_files,
+            "error_message": error_message,
+            "completed_at": datetime.now(UTC),
+        }
+        if not keep_checkpoint:
+            values["checkpoint"] = None
+        await self.session.execute(
+            update(LibraryScanModel)
+            .where(LibraryScanModel.id == scan_id)
+            .values(**values)
+        )
+
+
+class BackgroundJobRepository:
+    """Repository for persistent background jobs (durable JobQueue backend).
+
+    State changes of a claimed job are guarded by ``claimed_by`` so a job that
+    was cancelled or recovered meanwhile is never overwritten by a stale worker.
+    """
+
+    # Statuses a job can still be cancelled from
+    CANCELLABLE_STATUSES = ("pending", "running")
+    # Statuses subject to history retention
+    FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with session."""
+        self.session = session
+
+    async def add(self, values: dict[str, Any]) -> None:
+        """Insert a job row (caller commits).
+
+        Args:
+            values: Column values (id, job_type, payload, priority, max_retries, ...)
+        """
+        self.session.add(BackgroundJobModel(**values))
+        await self.session.flush()
+
+    async def get(self, job_id: str) -> BackgroundJobModel | None:
+        """Get a job by ID."""
+        return await self.session.get(BackgroundJobModel, job_id)
+
+    async def get_active_by_dedup_key(
+        self, dedup_key: str
+    ) -> BackgroundJobModel | None:
+        """Get the pending or running job with a dedup key."""
+        result = await self.session.execute(
+            select(BackgroundJobModel).where(
+                BackgroundJobModel.dedup_key == dedup_key,
+                BackgroundJobModel.status.in_(self.CANCELLABLE_STATUSES),
+            )
+        )
+        return result.scalars().first()
+
+    async def raise_priority(self, job_id: str, priority: int) -> bool:
+        """Raise the priority of a pending job (never lowers it, caller commits).
+
+        Returns:
+            True if the priority was raised
+        """
+        result = await self.session.execute(
+            update(BackgroundJobModel)
+            .where(
+                BackgroundJobModel.id == job_id,
+                BackgroundJobModel.status == "pending",
+                BackgroundJobModel.priority < priority,
+            )
+            .values(priority=priority)
+            .execution_options(synchronize_session=False)
+        )
+        return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def list_jobs(
+        self,
+        status: str | None = None,
+        job_type: str | None = None,
+        limit: int = 100,
+        job_types: Collection[str] | None = None,
+    ) -> list[BackgroundJobModel]:
+        """List jobs, newest first.
+
+        Args:
+            status: Filter by status
+            job_type: Filter by job type
+            limit: Maximum number of jobs
+            job_types: Only jobs of one of these types
+
+        Returns:
+            Job rows
+        """
+        stmt = select(BackgroundJobModel)
+        if status is not None:
+            stmt = stmt.where(BackgroundJobModel.status == status)
+        if job_type is not None:
+            stmt = stmt.where(BackgroundJobModel.job_type == job_type)
+        if job_types is not None:
+            stmt = stmt.where(BackgroundJobModel.job_type.in_(job_types))
+        stmt = stmt.order_by(BackgroundJobModel.created_at.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    # Hey future me - this is THE atomic claim. One UPDATE picks the best claimable row through a
+    # subquery and flips it to running in the same statement, RETURNING the row. SQLite runs the
+    # whole statement under its write lock, so two claimers can never both see the row as pending;
+    # on PostgreSQL the subquery's FOR UPDATE SKIP LOCKED makes concurrent claimers skip rows that
+    # another transaction is claiming right now (SQLite ignores the FOR UPDATE clause).
+    # The extra status == "pending" in the outer WHERE is belt and braces for READ COMMITTED.
+    # max_running makes a per-type limit hold across worker processes: the claim only matches
+    # while fewer rows of that type are running (in ANY process). On SQLite that's exact (same
+    # write lock); on PostgreSQL two claimers in the same instant can still both get through.
+    async def claim_next(
+        self,
+        worker_id: str,
+        now: datetime | None = None,
+        job_type: str | None = None,
+        max_running: int | None = None,
+    ) -> BackgroundJobModel | None:
+        """Atomically claim the next runnable job (caller commits).
+
+        Highest priority first, FIFO within a priority. Only pending jobs whose
+        run_after has passed are claimable.
+
+        Args:
+            worker_id: Identifier of the claiming queue instance
+            now: Claim time (default: current UTC time)
+            job_type: Only claim jobs of this type
+            max_running: Only claim while fewer jobs of job_type are running
+                (in any process); needs job_type
+
+        Returns:
+            The claimed job (status running) or None if nothing is runnable
+        """
+        claimed = await self.claim_batch(
+            worker_id, limit=1, now=now, job_type=job_type, max_running=max_running
+        )
+        return claimed[0] if claimed else None
+
+    async def claim_batch(
+        self,
+        worker_id: str,
+        limit: int,
+        now: datetime | None = None,
+        job_type: str | None = None,
+        max_running: int | None = None,
+    ) -> list[BackgroundJobModel]:
+        """Atomically claim up to limit runnable jobs in one statement (caller commits).
+
+        Args:
+            worker_id: Identifier of the claiming queue instance
+            limit: Maximum number of jobs to claim
+            now: Claim time (default: current UTC time)
+            job_type: Only claim jobs of this type
+            max_running: Claim nothing once this many jobs of job_type are
+                running (in any process); needs job_type
+
+        Returns:
+            Claimed jobs (status running), highest priority first
+        """
+        now = now or datetime.now(UTC)
+        conditions = [
+            BackgroundJobModel.status == "pending",
+            BackgroundJobModel.run_after <= now,
+        ]
+        if job_type is not None:
+            conditions.append(BackgroundJobModel.job_type == job_type)
+        next_ids = (
+            select(BackgroundJobModel.id)
+            .where(*conditions)
+            .order_by(BackgroundJobModel.priority.desc(), BackgroundJobModel.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claim_conditions = [
+            BackgroundJobModel.id.in_(next_ids),
+            BackgroundJobModel.status == "pending",
+        ]
+        if max_running is not None:
+            if job_type is None:
+                raise ValueError("max_running needs a job_type")
+            running = aliased(BackgroundJobModel)
+            claim_conditions.append(
+                select(func.count())
+                .select_from(running)
+                .where(running.status == "running", running.job_type == job_type)
+                .scalar_subquery()
+                < max_running
+            )
+        stmt = (
+            update(BackgroundJobModel)
+            .where(*claim_conditions)
+            .values(
+                status="running", started_at=now, heartbeat_at=now, claimed_by=worker_id
+            )
+            .returning(BackgroundJobModel)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        # RETURNING has no defined order
+        return sorted(
+            result.scalars().all(), key=lambda job: (-job.priority, job.created_at)
+        )
+
+    async def runnable_job_types(self, now: datetime | None = None) -> set[str]:
+        """Get the job types that have at least one claimable job.
+
+        Args:
+            now: Reference time for run_after (default: current UTC time)
+
+        Returns:
+            Set of job type values
+        """
+        now = now or datetime.now(UTC)
+        result = await self.session.execute(
+            select(BackgroundJobModel.job_type)
+            .where(
+                BackgroundJobModel.status == "pending",
+                BackgroundJobModel.run_after <= now,
+            )
+            .distinct()
+        )
+        return set(result.scalars().all())
+
+    async def next_run_after(self) -> datetime | None:
+        """Get the earliest run_after of all pending jobs (None if none are pending)."""
+        result = await self.session.execute(
+            select(func.min(BackgroundJobModel.run_after)).where(
+                BackgroundJobModel.status == "pending"
+            )
+        )
+        next_due: datetime | None = result.scalar_one_or_none()
+        return next_due
+
+    async def finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        result: Any = None,
+        error: str | None = None,
+        retries: int | None = None,
+    ) -> bool:
+        """Store the final state of a claimed job (caller commits).
+
+        Args:
+            job_id: Job ID
+            worker_id: Queue instance that claimed the job
+            status: Final status (completed or failed)
+            result: JSON-serializable handler result
+            error: Error message for failed jobs
+            retries: Retry counter after this attempt
+
+        Returns:
+            False if the job is no longer running for this worker (cancelled/recovered)
+        """
+        values: dict[str, Any] = {
+            "status": status,
+            "result": result,
+            "error": error,
+            "completed_at": datetime.now(UTC),
+        }
+        if retries is not None:
+            values["retries"] = retries
+        return await self._update_claimed(job_id, worker_id, values)
+
+    async def schedule_retry(
+        self,
+        job_id: str,
+        worker_id: str,
+        error: str,
+        retries: int,
+        run_after: datetime,
+    ) -> bool:
+        """Put a failed claimed job back to pending, runnable after run_after.
+
+        Returns:
+            False if the job is no longer running for this worker
+        """
+        return await self._update_claimed(
+            job_id,
+            worker_id,
+            {
+                "status": "pending",
+                "error": error,
+                "retries": retries,
+                "run_after": run_after,
+                "started_at": None,
+                "heartbeat_at": None,
+                "claimed_by": None,
+            },
+        )
+
+    async def _update_claimed(
+        self, job_id: str, worker_id: str, values: dict[str, Any]
+    ) -> bool:
+        result = await self.session.execute(
+            update(BackgroundJobModel)
+            .where(
+                BackgroundJobModel.id == job_id,
+                BackgroundJobModel.status == "running",
+                BackgroundJobModel.claimed_by == worker_id,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def update_pending_payload(self, job_id: str, payload: Any) -> bool:
+        """Replace the payload of a job that is still pending (caller commits).
+
+        Returns:
+            False if the job was claimed, finished or doesn't exist
+        """
+        result = await self.session.execute(
+            update(BackgroundJobModel)
+            .where(
+                BackgroundJobModel.id == job_id, BackgroundJobModel.status == "pending"
+            )
+            .values(payload=payload)
+            .execution_options(synchronize_session=False)
+        )
+        return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def cancel(self, job_id: str) -> bool:
+        """Cancel a pending or running job (caller commits).
+
+        Returns:
+            True if cancelled, False if not found or already finished
+        """
+        result = await self.session.execute(
+            update(BackgroundJobModel)
+            .where(
+                BackgroundJobModel.id == job_id,
+                BackgroundJobModel.status.in_(self.CANCELLABLE_STATUSES),
+            )
+            .values(status="cancelled", completed_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+        return bool(result.rowcount)  # type: ignore[attr-defined]
+
+    async def heartbeat(
+        self, worker_id: str, job_ids: list[str], now: datetime | None = None
+    ) -> int:
+        """Refresh the heartbeat of jobs this worker is running (caller commits).
+
+        Returns:
+            Number of jobs still running for this worker
+        """
+        if not job_ids:
+            return 0
+        result = await self.session.execute(
+            update(BackgroundJobModel)
+            .where(
+                BackgroundJobModel.id.in_(job_ids),
+                BackgroundJobModel.status == "running",
+                BackgroundJobModel.claimed_by == worker_id,
+            )
+            .values(heartbeat_at=now or datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0  # type: ignore[attr-defined]
+
+    async def requeue_running(self, stale_before: datetime | None = None) -> int:
+        """Reset jobs left running by a dead process to pending (caller commits).
+
+        Args:
+            stale_before: Only requeue jobs whose last heartbeat (or start, if they
+                never sent one) is older than this; None requeues every running job
+
+        Returns:
+            Number of recovered jobs
+        """
+        conditions = [BackgroundJobModel.status == "running"]
+        if stale_before is not None:
+            last_seen = func.coalesce(
+                BackgroundJobModel.heartbeat_at, BackgroundJobModel.started_at
+            )
+            conditions.append(or_(last_seen.is_(None), last_seen < stale_before))
+        result = await self.session.execute(
+            update(BackgroundJobModel)
+            .where(*conditions)
+            .values(
+                status="pending", started_at=None, heartbeat_at=None, claimed_by=None
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0  # type: ignore[attr-defined]
+
+    async def delete_finished_before(self, cutoff: datetime) -> int:
+        """Delete completed/failed/cancelled jobs finished before cutoff (caller commits).
+
+        Returns:
+            Number of deleted jobs
+        """
+        result = await self.session.execute(
+            delete(BackgroundJobModel)
+            .where(
+                BackgroundJobModel.status.in_(self.FINISHED_STATUSES),
+                BackgroundJobModel.completed_at < cutoff,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0  # type: ignore[attr-defined]
+
+    async def count_by_status(self) -> dict[str, int]:
+        """Count jobs per status."""
+        result = await self.session.execute(
+            select(BackgroundJobModel.status, func.count()).group_by(
+                BackgroundJobModel.status
+            )
+        )
+        return {row[0]: row[1] for row in result.all()}
+
+    async def count_pending_by_type(self) -> dict[str, int]:
+        """Count pending jobs per job type."""
+        result = await self.session.execute(
+            select(BackgroundJobModel.job_type, func.count())
+            .where(BackgroundJobModel.status == "pending")
+            .group_by(BackgroundJobModel.job_type)
+        )
+        return {row[0]: row[1] for row in result.all()}
@@ -142,6 +142,9 @@ def main() -> None:
         host=settings.api.host,
         port=settings.api.port,
         reload=settings.debug,
+        # Several web processes only make sense with DOWNLOAD__EMBEDDED_WORKERS=false
+        # (jobs then run in `python -m soulspot.worker`); reload mode is single-process
+        workers=None if settings.debug else settings.api.workers,
         log_level=settings.log_level.lower(),
     )
 
@@ -0,0 +1,85 @@
+"""Standalone background worker entry point.
+
+Runs the job handlers and background loops without the web server, against
+the shared database-backed job queue:
+
+    python -m soulspot.worker
+
+The web process is then started with DOWNLOAD__EMBEDDED_WORKERS=false and
+only enqueues jobs and reads their status.
+"""
+
+import asyncio
+import logging
+import signal
+from types import SimpleNamespace
+
+from soulspot.config import Settings, get_settings
+from soulspot.infrastructure.lifecycle import (
+    _validate_sqlite_path,
+    background_services,
+    load_runtime_settings,
+)
+from soulspot.infrastructure.observability import configure_logging
+from soulspot.infrastructure.persistence import Database
+
+logger = logging.getLogger(__name__)
+
+
+# Hey future me - this is the SAME background stack the embedded web process runs (see
+# lifecycle.background_services), just without HTTP. Web requests and heavy jobs (downloads,
+# scans, enrichment) now scale and restart independently: several uvicorn workers + one or more
+# of these. More than one worker process is fine - jobs are claimed atomically and a dead
+# worker's running jobs are requeued once its heartbeat lease expires.
+# SIGTERM/SIGINT stop it gracefully (Docker sends SIGTERM on `docker stop`).
+async def run_worker(settings: Settings, stop: asyncio.Event | None = None) -> None:
+    """Run job handlers and background workers until stop is set.
+
+    Args:
+        settings: Application settings (queue_backend must be "database")
+        stop: Event that ends the worker (default: set by SIGTERM/SIGINT)
+
+    Raises:
+        RuntimeError: If the job queue is not database-backed
+    """
+    if settings.download.queue_backend != "database":
+        raise RuntimeError(
+            "The worker process needs DOWNLOAD__QUEUE_BACKEND=database - "
+            "an in-memory queue can't be shared with the web process"
+        )
+
+    if stop is None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+
+    settings.ensure_directories()
+    _validate_sqlite_path(settings)
+    db = Database(settings)
+    try:
+        await load_runtime_settings(db, settings)
+        async with background_services(
+            settings, db, SimpleNamespace(), run_workers=True
+        ):
+            logger.info("Worker process started (worker mode, no web server)")
+            await stop.wait()
+            logger.info("Shutting down worker process")
+    finally:
+        await db.close()
+        logger.info("Database connection closed")
+
+
+def main() -> None:
+    """Run the standalone worker process."""
+    settings = get_settings()
+    configure_logging(
+        log_level=settings.log_level,
+        json_format=settings.observability.log_json_format,
+        app_name=f"{settings.app_name}-worker",
+    )
+    asyncio.run(run_worker(settings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Scan throughput benchmarks on synthetic libraries."""
@@ -0,0 +1,528 @@
+# Hey future me - this is the SCAN THROUGHPUT BENCHMARK. Run it before and after touching anything
+# on the scan path (discovery, scan engine, bulk upserts, fuzzy matching, duplicate detection) and
+# before every release:
+#
+#   PYTHONPATH=src python -m tests.benchmarks.scan_benchmark --files 5000 --output bench.json
+#   PYTHONPATH=src python -m tests.benchmarks.scan_benchmark --files 5000 --baseline bench.json
+#
+# What it does:
+# 1. Generates ONE synthetic library (tests/benchmarks/synthetic_library.py, seeded -> identical
+#    input every run) into a temp dir.
+# 2. Runs every case in its OWN subprocess with its own fresh SQLite file DB (schema via
+#    create_all). Separate processes are the only way to get an honest peak RSS per case - inside
+#    one process the first case's high-water mark would leak into all the others.
+# 3. Cases that need data (incremental scan, ScanLibraryUseCase, duplicate detector) first run an
+#    UNTIMED full scan to seed the DB. Only the timed phase is measured: wall time, files/sec, DB
+#    round trips (every cursor execute on any engine, counted via the SQLAlchemy event) and peak
+#    RSS (Linux: VmHWM reset after seeding, elsewhere ru_maxrss of the whole case process).
+# 4. Writes machine-readable JSON (schema_version'd) and, with --baseline, compares against an
+#    older result and exits 1 when a case got slower / fatter / chattier than --tolerance allows.
+# Only compare numbers from the same machine and the same --files/--seed - the JSON records both.
+"""Scan throughput benchmark (files/sec, peak RSS, DB round trips)."""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .synthetic_library import DEFAULT_FORMATS, generate_library
+
+SCHEMA_VERSION = 1
+
+CASES = (
+    "scan_library_full",
+    "scan_library_incremental",
+    "scan_library_use_case",
+    "duplicate_detector",
+)
+
+# Seed for the albums added before the incremental scan (must differ from the library seed range)
+ADDED_FILES_SEED = 1_000_003
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Metric -> direction that counts as a regression
+REGRESSION_METRICS = {
+    "files_per_sec": "lower",
+    "peak_rss_mb": "higher",
+    "db_round_trips": "higher",
+}
+
+
+class RoundTripCounter:
+    """Counts statements sent to the database by any engine in this process."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def _before_cursor_execute(self, *_args: Any) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "RoundTripCounter":
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        event.remove(Engine, "before_cursor_execute", self._before_cursor_execute)
+
+
+# =========================================================================
+# PEAK RSS
+# =========================================================================
+
+
+def reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS counter (Linux only).
+
+    Returns:
+        True if the counter was reset, False if unsupported
+    """
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+# =========================================================================
+# CASES (run inside the case subprocess)
+# =========================================================================
+
+
+def _settings(library_root: Path, workdir: Path, hash_mode: str) -> Any:
+    from soulspot.config.settings import Settings
+
+    return Settings(
+        database={"url": f"sqlite+aiosqlite:///{workdir / 'benchmark.db'}"},
+        storage={
+            "music_path": library_root,
+            "download_path": workdir / "downloads",
+            "artwork_path": workdir / "artwork",
+            "temp_path": workdir / "tmp",
+        },
+        library={"hash_mode": hash_mode},
+    )
+
+
+async def _full_scan(db: Any, settings: Any) -> dict[str, Any]:
+    from soulspot.application.services.library_scanner_service import (
+        LibraryScannerService,
+    )
+
+    async with db.session_scope() as session:
+        return await LibraryScannerService(session, settings).scan_library(
+            incremental=False, resume=False
+        )
+
+
+# Listen up - touching mtimes of existing files would NOT exercise the incremental path: rewriting
+# a file in place doesn't move its directory's mtime, and discovery skips unchanged directories
+# without stat'ing their files (see LibraryDiscovery). So the incremental case ADDS new albums
+# instead, like a real "downloads got imported" run, and removes them again afterwards.
+def _add_files(library_root: Path, ratio: float) -> tuple[Path, int]:
+    """Write new albums below the library so the incremental scan has work to do."""
+    existing = sum(1 for p in library_root.rglob("*") if p.is_file())
+    added_root = library_root / "zz-benchmark-added"
+    count = max(1, round(existing * ratio)) if ratio > 0 else 0
+    if count:
+        generate_library(added_root, count, seed=ADDED_FILES_SEED)
+    return added_root, count
+
+
+async def run_case(
+    case: str,
+    library_root: Path,
+    workdir: Path,
+    hash_mode: str = "quick",
+    change_ratio: float = 0.1,
+) -> dict[str, Any]:
+    """Seed (if needed) and measure one benchmark case.
+
+    Args:
+        case: One of CASES
+        library_root: Synthetic library to scan
+        workdir: Empty directory for the case's database
+        hash_mode: Library hash tier ("quick" or "full")
+        change_ratio: Library share of new files added before the incremental scan
+
+    Returns:
+        Result dict (files, seconds, files_per_sec, db_round_trips, peak_rss_mb, details)
+    """
+    from soulspot.infrastructure.persistence.database import Database
+
+    if case not in CASES:
+        raise ValueError(f"Unknown benchmark case: {case}")
+
+    settings = _settings(library_root, workdir, hash_mode)
+    db = Database(settings)
+    await db.create_tables()
+    details: dict[str, Any] = {}
+    added_root: Path | None = None
+    files = sum(1 for p in library_root.rglob("*") if p.is_file())
+
+    try:
+        if case != "scan_library_full":
+            await _full_scan(db, settings)
+        if case == "scan_library_incremental":
+            added_root, details["added_files"] = _add_files(library_root, change_ratio)
+
+        details["peak_rss_reset"] = reset_peak_rss()
+        with RoundTripCounter() as counter:
+            started = time.perf_counter()
+            if case in ("scan_library_full", "scan_library_incremental"):
+                details.update(await _measure_scan_library(db, settings, case))
+            elif case == "scan_library_use_case":
+                details.update(await _measure_use_case(db, settings))
+            else:
+                details.update(await _measure_duplicate_detector(db))
+                files = details["tracks_scanned"]
+            seconds = time.perf_counter() - started
+    finally:
+        await db.close()
+        if added_root is not None:
+            shutil.rmtree(added_root, ignore_errors=True)
+
+    return {
+        "files": files,
+        "seconds": round(seconds, 4),
+        "files_per_sec": round(files / seconds, 2) if seconds > 0 else None,
+        "db_round_trips": counter.count,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "details": details,
+    }
+
+
+async def _measure_scan_library(db: Any, settings: Any, case: str) -> dict[str, Any]:
+    from soulspot.application.services.library_scanner_service import (
+        LibraryScannerService,
+    )
+
+    async with db.session_scope() as session:
+        stats = await LibraryScannerService(session, settings).scan_library(
+            incremental=case == "scan_library_incremental", resume=False
+        )
+    keys = ("scanned", "imported", "skipped", "errors", "new_artists", "new_albums")
+    return {key: stats.get(key) for key in (*keys, "new_tracks", "matched_artists")}
+
+
+async def _measure_use_case(db: Any, settings: Any) -> dict[str, Any]:
+    from soulspot.application.use_cases.scan_library import ScanLibraryUseCase
+
+    async with db.session_scope() as session:
+        scan = await ScanLibraryUseCase(session, settings).execute(
+            str(settings.storage.music_path)
+        )
+    return {
+        "scanned": scan.scanned_files,
+        "broken": scan.broken_files,
+        "duplicate_groups": scan.duplicate_files,
+    }
+
+
+async def _measure_duplicate_detector(db: Any) -> dict[str, Any]:
+    from soulspot.application.services.app_settings_service import AppSettingsService
+    from soulspot.application.workers.duplicate_detector_worker import (
+        DuplicateDetectorWorker,
+    )
+    from soulspot.application.workers.job_queue import JobQueue
+
+    async with db.session_scope() as session:
+        worker = DuplicateDetectorWorker(
+            job_queue=JobQueue(),
+            settings_service=AppSettingsService(session),
+            session_scope=db.session_scope,
+        )
+        await worker._run_scan()
+    stats = worker.get_status()["stats"]
+    return {
+        "tracks_scanned": stats["tracks_scanned"],
+        "duplicates_found": stats["duplicates_found"],
+    }
+
+
+# =========================================================================
+# ORCHESTRATION
+# =========================================================================
+
+
+def _run_case_subprocess(
+    case: str, library_root: Path, hash_mode: str, change_ratio: float
+) -> dict[str, Any]:
+    """Run one case in a fresh interpreter and parse its JSON result."""
+    with tempfile.TemporaryDirectory(prefix=f"soulspot-bench-{case}-") as workdir:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(
+                None, [str(REPO_ROOT / "src"), str(REPO_ROOT), env.get("PYTHONPATH")]
+            )
+        )
+        completed = subprocess.run(  # nosec B603 - runs this module with sys.executable
+            [
+                sys.executable,
+                "-m",
+                "tests.benchmarks.scan_benchmark",
+                "--run-case",
+                case,
+                "--library",
+                str(library_root),
+                "--workdir",
+                workdir,
+                "--hash-mode",
+                hash_mode,
+                "--change-ratio",
+                str(change_ratio),
+            ],
+            cwd=REPO_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Benchmark case {case} failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _aggregate(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine repeated runs: median time, worst RSS / round trips."""
+    seconds = statistics.median(run["seconds"] for run in runs)
+    files = runs[0]["files"]
+    return {
+        "files": files,
+        "seconds": round(seconds, 4),
+        "files_per_sec": round(files / seconds, 2) if seconds > 0 else None,
+        "db_round_trips": max(run["db_round_trips"] for run in runs),
+        "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+        "runs": len(runs),
+        "details": runs[-1]["details"],
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        completed = subprocess.run(  # nosec B603 B607 - fixed git invocation
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_benchmarks(
+    files: int,
+    cases: Sequence[str] = CASES,
+    seed: int = 0,
+    formats: Sequence[str] = DEFAULT_FORMATS,
+    hash_mode: str = "quick",
+    change_ratio: float = 0.1,
+    repeat: int = 1,
+    library_dir: Path | None = None,
+) -> dict[str, Any]:
+    """Generate a library and run the selected cases.
+
+    Args:
+        files: Synthetic library size
+        cases: Cases to run (subset of CASES)
+        seed: Library generator seed
+        formats: Audio formats in the library
+        hash_mode: Library hash tier for all cases
+        change_ratio: Library share of new files added before the incremental scan
+        repeat: Runs per case (median time is reported)
+        library_dir: Keep the generated library here instead of a temp dir
+
+    Returns:
+        Benchmark report (see module comment)
+    """
+    from soulspot import __version__
+
+    with tempfile.TemporaryDirectory(prefix="soulspot-bench-library-") as tmp:
+        base = library_dir or Path(tmp)
+        started = time.perf_counter()
+        library = generate_library(
+            base / "music", files, formats=list(formats), seed=seed
+        )
+        generation_seconds = time.perf_counter() - started
+
+        results: dict[str, Any] = {}
+        for case in cases:
+            runs = [
+                # Each incremental run must see the same seeded DB + touched files, so every
+                # repetition starts over in a new process with a new DB
+                _run_case_subprocess(case, library.root, hash_mode, change_ratio)
+                for _ in range(repeat)
+            ]
+            results[case] = _aggregate(runs)
+            print(
+                f"{case}: {results[case]['files_per_sec']} files/s, "
+                f"{results[case]['db_round_trips']} DB round trips, "
+                f"{results[case]['peak_rss_mb']} MiB peak RSS",
+                file=sys.stderr,
+            )
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "generated_at": datetime.now(UTC).isoformat(),
+        "environment": {
+            "soulspot_version": __version__,
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "parameters": {
+            "files": files,
+            "seed": seed,
+            "formats": list(formats),
+            "hash_mode": hash_mode,
+            "change_ratio": change_ratio,
+            "repeat": repeat,
+        },
+        "library": {
+            **library.summary(),
+            "generation_seconds": round(generation_seconds, 2),
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.15
+) -> list[str]:
+    """List regressions of current vs baseline beyond the tolerance.
+
+    Args:
+        current: Report from run_benchmarks()
+        baseline: Older report
+        tolerance: Allowed relative change (0.15 = 15%)
+
+    Returns:
+        Human-readable regression descriptions (empty = no regressions)
+    """
+    regressions: list[str] = []
+    if current.get("parameters") != baseline.get("parameters"):
+        regressions.append(
+            "Benchmark parameters differ from the baseline - results are not comparable"
+        )
+        return regressions
+
+    for case, result in current["results"].items():
+        old = baseline.get("results", {}).get(case)
+        if old is None:
+            continue
+        for metric, worse in REGRESSION_METRICS.items():
+            new_value, old_value = result.get(metric), old.get(metric)
+            if not new_value or not old_value:
+                continue
+            change = (new_value - old_value) / old_value
+            if (worse == "lower" and change < -tolerance) or (
+                worse == "higher" and change > tolerance
+            ):
+                regressions.append(
+                    f"{case}.{metric}: {old_value} -> {new_value} ({change:+.1%})"
+                )
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point (returns the process exit code)."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000, help="Library size")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument(
+        "--cases", default=",".join(CASES), help="Comma-separated cases to run"
+    )
+    parser.add_argument(
+        "--formats", default=",".join(DEFAULT_FORMATS), help="mp3,flac,m4a"
+    )
+    parser.add_argument("--hash-mode", choices=("quick", "full"), default="quick")
+    parser.add_argument("--change-ratio", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per case")
+    parser.add_argument("--library-dir", type=Path, help="Keep the library here")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    # Internal: run a single case in this process (used by the orchestrator)
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--library", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        result = asyncio.run(
+            run_case(
+                args.run_case,
+                args.library,
+                args.workdir,
+                hash_mode=args.hash_mode,
+                change_ratio=args.change_ratio,
+            )
+        )
+        print(json.dumps(result))
+        return 0
+
+    cases = [case for case in args.cases.split(",") if case]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"Unknown cases: {', '.join(sorted(unknown))}")
+
+    report = run_benchmarks(
+        args.files,
+        cases=cases,
+        seed=args.seed,
+        formats=args.formats.split(","),
+        hash_mode=args.hash_mode,
+        change_ratio=args.change_ratio,
+        repeat=args.repeat,
+        library_dir=args.library_dir,
+    )
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare_results(
+            report, json.loads(args.baseline.read_text()), args.tolerance
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
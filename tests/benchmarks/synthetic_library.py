@@ -0,0 +1,422 @@
+# Hey future me - this builds FAKE music libraries for the scan benchmarks (and anything else that
+# needs thousands of real audio files without shipping them in the repo)!
+# Every file is a tiny but VALID audio file that mutagen parses like the real thing:
+# - MP3: raw MPEG-1 Layer III frames (128 kbps, 44.1 kHz, silent) + ID3v2.4 tags
+# - FLAC: fLaC marker + STREAMINFO + one dummy frame + Vorbis comments
+# - M4A: hand-built ftyp/moov/mdat atoms (mdhd for the length, mp4a sample entry) + iTunes atoms
+# Tags are written through mutagen itself, so what the scanner reads back is exactly what a tagger
+# would have written. The library is MESSY on purpose, because that's what the scanner's fuzzy
+# matching and the duplicate detector are slow on: the same artist spelled "The Beatles",
+# "Beatles, The", "the beatles", "The Beatels"; "Beyoncé" vs "Beyonce"; "&" vs "and"; compilations
+# with "Various Artists"; and byte-identical copies of tracks in "Best Of" folders.
+# Everything is driven by a seeded Random, so the same (files, seed) pair always produces the same
+# library - benchmark numbers are only comparable between runs on identical input.
+"""Synthetic music library generator (tiny valid MP3/FLAC/M4A files)."""
+
+import argparse
+import random
+import shutil
+import struct
+import unicodedata
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from mutagen.flac import FLAC
+from mutagen.id3 import ID3, TALB, TCMP, TCON, TDRC, TIT2, TPE1, TPE2, TPOS, TRCK
+from mutagen.mp4 import MP4
+
+AudioFormat = Literal["mp3", "flac", "m4a"]
+
+DEFAULT_FORMATS: tuple[AudioFormat, ...] = ("mp3", "flac", "m4a")
+
+SAMPLE_RATE = 44100
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding, joint stereo -> 417 byte frames
+MP3_FRAME_HEADER = b"\xff\xfb\x90\x64"
+MP3_FRAME_SIZE = 417
+MP3_SAMPLES_PER_FRAME = 1152
+
+_FIRST_NAMES = [
+    "Ana", "Björn", "Chloé", "Dmitri", "Elif", "Franz", "Greta", "Hiro", "Inés",
+    "Jonas", "Kofi", "Léa", "Marta", "Nils", "Oskar", "Paula", "Rosa", "Søren",
+]  # fmt: skip
+_LAST_NAMES = [
+    "Andersen", "Berger", "Costa", "Dvořák", "Eriksen", "Fontaine", "García",
+    "Hartmann", "Ivanova", "Jansen", "Kovač", "Lindqvist", "Moreau", "Novak",
+]  # fmt: skip
+_ADJECTIVES = [
+    "Black", "Silver", "Electric", "Velvet", "Hollow", "Golden", "Crimson",
+    "Quiet", "Neon", "Broken", "Wild", "Frozen", "Midnight", "Paper",
+]  # fmt: skip
+_NOUNS = [
+    "Keys", "Horses", "Machines", "Rivers", "Ghosts", "Tigers", "Saints",
+    "Lights", "Wolves", "Echoes", "Pilots", "Gardens", "Satellites", "Kings",
+]  # fmt: skip
+_TITLE_WORDS = [
+    "Love", "Night", "City", "Heart", "Summer", "Fire", "Dream", "Rain", "Road",
+    "Home", "Light", "Time", "Sky", "Ocean", "Ghost", "Window", "Morning", "Stone",
+]  # fmt: skip
+_GENRES = ["Rock", "Pop", "Electronic", "Jazz", "Hip-Hop", "Folk", "Classical", "Metal"]
+_TITLE_SUFFIXES = [" (Remastered)", " (Live)", " (feat. {guest})", " - Radio Edit"]
+
+VARIOUS_ARTISTS = "Various Artists"
+
+
+@dataclass
+class SyntheticLibrary:
+    """What generate_library() wrote."""
+
+    root: Path
+    files: list[Path] = field(default_factory=list)
+    formats: Counter[str] = field(default_factory=Counter)
+    total_bytes: int = 0
+    artists: int = 0
+    albums: int = 0
+    duplicates: int = 0
+    seed: int = 0
+
+    def summary(self) -> dict[str, object]:
+        """JSON-friendly description of the library."""
+        return {
+            "files": len(self.files),
+            "formats": dict(sorted(self.formats.items())),
+            "total_bytes": self.total_bytes,
+            "artists": self.artists,
+            "albums": self.albums,
+            "duplicates": self.duplicates,
+            "seed": self.seed,
+        }
+
+
+# =========================================================================
+# AUDIO PAYLOADS
+# =========================================================================
+
+
+def _atom(name: bytes, payload: bytes) -> bytes:
+    """One MP4 atom (32-bit size + name + payload)."""
+    return struct.pack(">I", 8 + len(payload)) + name + payload
+
+
+def mp3_payload(seconds: float) -> bytes:
+    """Silent MPEG-1 Layer III stream of roughly the given duration."""
+    frames = max(1, round(seconds * SAMPLE_RATE / MP3_SAMPLES_PER_FRAME))
+    frame = MP3_FRAME_HEADER + b"\x00" * (MP3_FRAME_SIZE - len(MP3_FRAME_HEADER))
+    return frame * frames
+
+
+def flac_payload(seconds: float) -> bytes:
+    """FLAC stream with a STREAMINFO block announcing the given duration."""
+    channels, bits_per_sample = 2, 16
+    total_samples = max(1, round(seconds * SAMPLE_RATE))
+    packed = (
+        (SAMPLE_RATE << 44)
+        | ((channels - 1) << 41)
+        | ((bits_per_sample - 1) << 36)
+        | total_samples
+    )
+    streaminfo = (
+        struct.pack(">HH", 4096, 4096)  # min/max block size
+        + b"\x00" * 6  # min/max frame size (unknown)
+        + packed.to_bytes(8, "big")
+        + b"\x00" * 16  # MD5 of the audio (unset)
+    )
+    # 0x80 = last-metadata-block flag + type 0 (STREAMINFO); mutagen inserts the comments
+    header = bytes([0x80]) + len(streaminfo).to_bytes(3, "big")
+    return b"fLaC" + header + streaminfo + b"\xff\xf8" + b"\x00" * 64
+
+
+def m4a_payload(seconds: float) -> bytes:
+    """Minimal AAC-in-MP4 container with the given duration."""
+    duration = max(1, round(seconds * SAMPLE_RATE))
+    times = struct.pack(">IIII", 0, 0, SAMPLE_RATE, duration)
+    mdhd = _atom(b"mdhd", b"\x00" * 4 + times + b"\x55\xc4\x00\x00")
+    hdlr = _atom(b"hdlr", b"\x00" * 8 + b"soun" + b"\x00" * 13)
+    mp4a = _atom(
+        b"mp4a",
+        b"\x00" * 6
+        + struct.pack(">H", 1)  # data_ref_index
+        + b"\x00" * 8
+        + struct.pack(">HHHHI", 2, 16, 0, 0, SAMPLE_RATE << 16)
+        # mutagen expects one child atom after the sample entry fields
+        + _atom(b"free", b""),
+    )
+    stsd = _atom(b"stsd", b"\x00" * 4 + struct.pack(">I", 1) + mp4a)
+    stco = _atom(b"stco", b"\x00" * 4 + struct.pack(">I", 0))
+    minf = _atom(b"minf", _atom(b"stbl", stsd + stco))
+    trak = _atom(b"trak", _atom(b"mdia", mdhd + hdlr + minf))
+    mvhd = _atom(b"mvhd", b"\x00" * 4 + times + b"\x00" * 80)
+    ftyp = _atom(b"ftyp", b"M4A " + struct.pack(">I", 0) + b"M4A isom")
+    return ftyp + _atom(b"moov", mvhd + trak) + _atom(b"mdat", b"\x00" * 128)
+
+
+# =========================================================================
+# TAGGING
+# =========================================================================
+
+
+@dataclass(frozen=True)
+class TrackTags:
+    """Tags written to one synthetic file."""
+
+    title: str
+    artist: str
+    album: str
+    album_artist: str
+    track_number: int
+    track_total: int
+    disc_number: int
+    year: int
+    genre: str
+    compilation: bool = False
+
+
+def _tag_mp3(path: Path, tags: TrackTags) -> None:
+    id3 = ID3()
+    id3.add(TIT2(encoding=3, text=tags.title))
+    id3.add(TPE1(encoding=3, text=tags.artist))
+    id3.add(TPE2(encoding=3, text=tags.album_artist))
+    id3.add(TALB(encoding=3, text=tags.album))
+    id3.add(TRCK(encoding=3, text=f"{tags.track_number}/{tags.track_total}"))
+    id3.add(TPOS(encoding=3, text=str(tags.disc_number)))
+    id3.add(TDRC(encoding=3, text=str(tags.year)))
+    id3.add(TCON(encoding=3, text=tags.genre))
+    if tags.compilation:
+        id3.add(TCMP(encoding=3, text="1"))
+    id3.save(path)
+
+
+def _tag_flac(path: Path, tags: TrackTags) -> None:
+    audio = FLAC(path)
+    audio["title"] = tags.title
+    audio["artist"] = tags.artist
+    audio["albumartist"] = tags.album_artist
+    audio["album"] = tags.album
+    audio["tracknumber"] = f"{tags.track_number}/{tags.track_total}"
+    audio["discnumber"] = str(tags.disc_number)
+    audio["date"] = str(tags.year)
+    audio["genre"] = tags.genre
+    if tags.compilation:
+        audio["compilation"] = "1"
+    audio.save()
+
+
+def _tag_m4a(path: Path, tags: TrackTags) -> None:
+    audio = MP4(path)
+    audio["\xa9nam"] = [tags.title]
+    audio["\xa9ART"] = [tags.artist]
+    audio["aART"] = [tags.album_artist]
+    audio["\xa9alb"] = [tags.album]
+    audio["trkn"] = [(tags.track_number, tags.track_total)]
+    audio["disk"] = [(tags.disc_number, 1)]
+    audio["\xa9day"] = [str(tags.year)]
+    audio["\xa9gen"] = [tags.genre]
+    if tags.compilation:
+        audio["cpil"] = True
+    audio.save()
+
+
+_PAYLOADS = {"mp3": mp3_payload, "flac": flac_payload, "m4a": m4a_payload}
+_TAGGERS = {"mp3": _tag_mp3, "flac": _tag_flac, "m4a": _tag_m4a}
+
+
+def write_audio_file(
+    path: Path, audio_format: str, tags: TrackTags, seconds: float = 1.0
+) -> None:
+    """Write one tiny, valid, tagged audio file.
+
+    Args:
+        path: Target file (parent directories are created)
+        audio_format: "mp3", "flac" or "m4a"
+        tags: Tags to write
+        seconds: Announced audio duration
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(_PAYLOADS[audio_format](seconds))
+    _TAGGERS[audio_format](path, tags)
+
+
+# =========================================================================
+# MESSY NAMES
+# =========================================================================
+
+
+def _strip_accents(name: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", name)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    """Swap two adjacent letters or drop one (keeps short names intact)."""
+    if len(name) < 5:
+        return name
+    i = rng.randrange(1, len(name) - 2)
+    if rng.random() < 0.5:
+        return name[:i] + name[i + 1] + name[i] + name[i + 2 :]
+    return name[:i] + name[i + 1 :]
+
+
+def spelling_variant(name: str, rng: random.Random) -> str:
+    """One of the ways taggers mangle an artist name."""
+    variants = [
+        name.lower(),
+        name.upper(),
+        name.replace(" ", "  ", 1) + " ",
+        _strip_accents(name),
+        _typo(name, rng),
+    ]
+    if name.startswith("The "):
+        variants += [f"{name[4:]}, The", name[4:]]
+    if " & " in name:
+        variants.append(name.replace(" & ", " and "))
+    return rng.choice(variants)
+
+
+def _artist_name(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.4:
+        return f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+    if roll < 0.75:
+        return f"The {rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)}"
+    if roll < 0.9:
+        return f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)}"
+    return f"{rng.choice(_LAST_NAMES)} & {rng.choice(_LAST_NAMES)}"
+
+
+def _title(rng: random.Random, guests: Sequence[str]) -> str:
+    title = " ".join(rng.sample(_TITLE_WORDS, rng.randint(1, 3)))
+    if rng.random() < 0.1:
+        title += rng.choice(_TITLE_SUFFIXES).format(guest=rng.choice(guests))
+    return title
+
+
+def _safe(name: str) -> str:
+    """Directory-safe version of a tag value."""
+    return "".join("_" if c in '/\\:*?"<>|' else c for c in name).strip() or "_"
+
+
+# =========================================================================
+# LIBRARY
+# =========================================================================
+
+
+# Listen up - the layout is Artist/Album (Year)/NN - Title.ext like a tagger-organized library,
+# but the ARTIST FOLDER uses the spelling of the album's tags, so messy spellings also produce
+# separate folders (that's what real libraries assembled from many sources look like).
+def generate_library(
+    root: Path,
+    files: int,
+    formats: Sequence[str] = DEFAULT_FORMATS,
+    seed: int = 0,
+    misspell_ratio: float = 0.2,
+    compilation_ratio: float = 0.1,
+    duplicate_ratio: float = 0.05,
+    tracks_per_album: int = 10,
+    albums_per_artist: int = 3,
+) -> SyntheticLibrary:
+    """Generate a synthetic library with realistic, messy tags.
+
+    Args:
+        root: Library root (created if missing)
+        files: Total number of audio files to write
+        formats: Formats to cycle through
+        seed: Random seed (same seed + files = same library)
+        misspell_ratio: Share of albums/tracks using a mangled artist spelling
+        compilation_ratio: Share of albums tagged as "Various Artists" compilations
+        duplicate_ratio: Share of files that are byte-identical copies in a "Best Of" album
+        tracks_per_album: Tracks per generated album
+        albums_per_artist: Albums per generated artist
+
+    Returns:
+        SyntheticLibrary describing the written files
+    """
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    library = SyntheticLibrary(root=root, seed=seed)
+
+    duplicates_wanted = int(files * duplicate_ratio)
+    originals_wanted = files - duplicates_wanted
+    artists_needed = max(
+        1, -(-originals_wanted // (tracks_per_album * albums_per_artist))
+    )
+    artists = list(dict.fromkeys(_artist_name(rng) for _ in range(artists_needed * 2)))
+    while len(artists) < artists_needed:
+        artists.append(f"{_artist_name(rng)} {len(artists)}")
+    artists = artists[:artists_needed]
+    library.artists = len(artists)
+
+    album_index = 0
+    while len(library.files) < originals_wanted:
+        album_index += 1
+        compilation = rng.random() < compilation_ratio
+        canonical = artists[album_index % len(artists)]
+        album_artist = VARIOUS_ARTISTS if compilation else canonical
+        if not compilation and rng.random() < misspell_ratio:
+            album_artist = spelling_variant(canonical, rng)
+        album = f"{rng.choice(_ADJECTIVES)} {rng.choice(_TITLE_WORDS)}"
+        year = rng.randint(1965, 2025)
+        genre = rng.choice(_GENRES)
+        audio_format = formats[album_index % len(formats)]
+        album_dir = root / _safe(album_artist) / _safe(f"{album} ({year})")
+        total = min(tracks_per_album, originals_wanted - len(library.files))
+        library.albums += 1
+
+        for number in range(1, total + 1):
+            artist = rng.choice(artists) if compilation else album_artist
+            if rng.random() < misspell_ratio:
+                artist = spelling_variant(artist, rng)
+            tags = TrackTags(
+                title=_title(rng, artists),
+                artist=artist,
+                album=album,
+                album_artist=album_artist,
+                track_number=number,
+                track_total=total,
+                disc_number=1,
+                year=year,
+                genre=genre,
+                compilation=compilation,
+            )
+            path = album_dir / f"{number:02d} - {_safe(tags.title)}.{audio_format}"
+            write_audio_file(path, audio_format, tags, seconds=rng.uniform(1.0, 3.0))
+            library.files.append(path)
+            library.formats[audio_format] += 1
+
+    for source in rng.sample(library.files, min(duplicates_wanted, len(library.files))):
+        copy = (
+            source.parent.parent / "Best Of" / f"{library.duplicates:04d} {source.name}"
+        )
+        copy.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, copy)
+        library.files.append(copy)
+        library.formats[copy.suffix.lstrip(".")] += 1
+        library.duplicates += 1
+
+    library.total_bytes = sum(path.stat().st_size for path in library.files)
+    return library
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """CLI: write a synthetic library to a directory."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("root", type=Path, help="Directory to write the library to")
+    parser.add_argument("--files", type=int, default=1000, help="Number of files")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--formats",
+        default=",".join(DEFAULT_FORMATS),
+        help="Comma-separated formats (mp3,flac,m4a)",
+    )
+    args = parser.parse_args(argv)
+
+    library = generate_library(
+        args.root, args.files, formats=args.formats.split(","), seed=args.seed
+    )
+    print(library.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Smoke tests for the synthetic library generator and the scan benchmark."""
+
+from pathlib import Path
+
+from soulspot.application.services.scan_engine import scan_audio_file
+
+from .scan_benchmark import compare_results, run_case
+from .synthetic_library import generate_library
+
+
+class TestSyntheticLibrary:
+    """Test generate_library()."""
+
+    def test_files_are_valid_tagged_audio(self, tmp_path: Path) -> None:
+        """Test every generated format parses with tags and a positive length."""
+        library = generate_library(tmp_path / "music", 30, seed=1)
+
+        assert len(library.files) == 30
+        assert set(library.formats) == {"mp3", "flac", "m4a"}
+        assert library.duplicates == 1
+        for path in library.files:
+            scanned = scan_audio_file(path)
+            assert scanned.is_valid, path
+            assert scanned.metadata is not None
+            assert scanned.metadata["title"]
+            assert scanned.metadata["artist"]
+            assert scanned.metadata["duration_ms"] > 0
+
+    def test_same_seed_same_library(self, tmp_path: Path) -> None:
+        """Test generation is deterministic for a seed."""
+        first = generate_library(tmp_path / "a", 20, seed=7)
+        second = generate_library(tmp_path / "b", 20, seed=7)
+
+        assert [p.relative_to(first.root) for p in first.files] == [
+            p.relative_to(second.root) for p in second.files
+        ]
+
+
+class TestScanBenchmark:
+    """Test the benchmark cases and baseline comparison."""
+
+    async def test_full_scan_case(self, tmp_path: Path) -> None:
+        """Test the full scan case imports the whole library and counts queries."""
+        library = generate_library(tmp_path / "music", 20, seed=2)
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+
+        result = await run_case("scan_library_full", library.root, workdir)
+
+        assert result["files"] == 20
+        assert result["details"]["imported"] == 20
+        assert result["details"]["errors"] == 0
+        assert result["db_round_trips"] > 0
+        assert result["peak_rss_mb"] > 0
+
+    def test_compare_results_flags_regressions(self) -> None:
+        """Test slower, fatter and chattier cases are reported."""
+        params = {"files": 100, "seed": 0}
+        baseline = {
+            "parameters": params,
+            "results": {
+                "scan_library_full": {
+                    "files_per_sec": 100.0,
+                    "peak_rss_mb": 100.0,
+                    "db_round_trips": 100,
+                }
+            },
+        }
+        current = {
+            "parameters": params,
+            "results": {
+                "scan_library_full": {
+                    "files_per_sec": 70.0,
+                    "peak_rss_mb": 105.0,
+                    "db_round_trips": 200,
+                }
+            },
+        }
+
+        regressions = compare_results(current, baseline, tolerance=0.15)
+
+        assert len(regressions) == 2
+        assert regressions[0].startswith("scan_library_full.files_per_sec")
+        assert regressions[1].startswith("scan_library_full.db_round_trips")
+
+    def test_compare_results_rejects_different_parameters(self) -> None:
+        """Test reports from different library sizes are not compared."""
+        current = {"parameters": {"files": 100}, "results": {}}
+        baseline = {"parameters": {"files": 200}, "results": {}}
+
+        assert compare_results(current, baseline) != []
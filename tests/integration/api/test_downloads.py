@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock
 import pytest
 from fastapi.testclient import TestClient
 
-from soulspot.application.workers.job_queue import JobQueue
+from soulspot.application.workers.job_queue import JobQueue, JobType
 from soulspot.config import Settings
 from soulspot.main import create_app
 
@@ -36,7 +36,8 @@ def mock_job_queue():
     """Create a mock job queue."""
     job_queue = AsyncMock(spec=JobQueue)
     job_queue.is_paused.return_value = False
-    job_queue.get_max_concurrent_jobs.return_value = 3
+    job_queue.get_max_concurrent_jobs.return_value = 5
+    job_queue.get_type_limit.return_value = 3
     job_queue.get_stats.return_value = {
         "total_jobs": 5,
         "pending": 2,
@@ -146,7 +147,7 @@ class TestDownloadQueueManagement:
         assert data["total_jobs"] == 5
 
         mock_job_queue.is_paused.assert_called_once()
-        mock_job_queue.get_max_concurrent_jobs.assert_called_once()
+        mock_job_queue.get_type_limit.assert_called_once_with(JobType.DOWNLOAD)
         mock_job_queue.get_stats.assert_called_once()
 
 
@@ -237,7 +238,7 @@ class TestDownloadQueueIntegration:
 
     def test_concurrent_downloads_configuration(self, client, mock_job_queue):
         """Test that max concurrent downloads is properly configured."""
-        mock_job_queue.get_max_concurrent_jobs.return_value = 2
+        mock_job_queue.get_type_limit.return_value = 2
 
         response = client.get("/api/downloads/status")
         assert response.status_code == 200
@@ -191,6 +191,11 @@ class TestLibraryEndpoints:
         response = await async_client.post("/api/library/scan")
         assert response.status_code != 404
 
+    async def test_resume_scan_without_checkpoint(self, async_client: AsyncClient):
+        """Verify resume reports 404 when no interrupted scan exists."""
+        response = await async_client.post("/api/library/scan/resume")
+        assert response.status_code == 404
+
     async def test_get_duplicates_endpoint_accessible(self, async_client: AsyncClient):
         """Verify get duplicates endpoint is accessible."""
         response = await async_client.get("/api/library/duplicates")
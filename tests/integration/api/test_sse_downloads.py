@@ -1,401 +1,367 @@
-"""Enhanced integration tests for SSE (Server-Sent Events) download updates.
+"""Integration tests for SSE (Server-Sent Events) download updates.
 
-This module extends the existing SSE tests with comprehensive coverage of
-download progress events, event structure validation, and error scenarios.
-Tests verify that SSE properly streams real-time download updates to clients.
+Downloads reach SSE clients through the app's EventBus: the DownloadBroadcastWorker
+publishes a retained "downloads_update" snapshot, producers publish deltas, and every
+stream reads its own subscription. These tests run that whole path and parse the
+SSE messages a browser would receive.
 """
 
-# AI-Model: Copilot
-# Hey future me - SSE tests are tricky because they test long-lived streaming connections!
-# Use async_client.stream() context manager and iterate over lines with aiter_lines().
-# Each SSE event ends with double newline (\n\n). Event format is text-based protocol:
-# "event: type\ndata: json\n\n". Parse carefully! Mock download repository to control what
-# events get sent. Test both successful scenarios and error handling (repo failures, client
-# disconnect, malformed data). Remember: SSE is unidirectional (server -> client only).
+# Hey future me - the /stream endpoint never ends on its own, and httpx's ASGITransport
+# buffers the WHOLE response body before returning, so streaming it through async_client
+# just hangs. We drive event_generator() directly with a request whose is_disconnected()
+# we control - same generator the endpoint wraps in a StreamingResponse. The DB side is the
+# broadcaster's DownloadRepository, patched to return the downloads each test needs.
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, patch
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from httpx import AsyncClient
+from fastapi import FastAPI
 
-from soulspot.domain.entities import Download, DownloadId, DownloadStatus, TrackId
+from soulspot.api.routers.sse import event_generator
+from soulspot.application.services.event_bus import EventBus
+from soulspot.application.workers.download_broadcast_worker import (
+    SNAPSHOT_LIMIT,
+    DownloadBroadcastWorker,
+)
+from soulspot.domain.entities import Download, DownloadStatus
+from soulspot.domain.value_objects import DownloadId, TrackId
 
 # Mark all tests in this module as slow
 pytestmark = pytest.mark.slow
 
 
-class TestSSEDownloadEvents:
-    """Test SSE download update events and data structure."""
+def _download(
+    status: DownloadStatus = DownloadStatus.DOWNLOADING, progress: float = 50.0
+) -> Download:
+    return Download(
+        id=DownloadId.generate(),
+        track_id=TrackId.generate(),
+        status=status,
+        progress_percent=progress,
+        priority=5,
+    )
 
-    async def test_download_update_event_structure(self, async_client: AsyncClient):
-        """Test that download update events have correct structure."""
-        # Create mock downloads
-        mock_downloads = [
-            Download(
-                id=DownloadId(1),
-                track_id=TrackId(1),
-                status=DownloadStatus.DOWNLOADING,
-                progress_percent=50,
-                priority=5,
-            ),
-        ]
 
-        with patch("soulspot.api.routers.sse.get_download_repository") as mock_get_repo:
-            mock_repo = AsyncMock()
-            mock_repo.list_active = AsyncMock(return_value=mock_downloads)
-            mock_get_repo.return_value = mock_repo
-
-            async with async_client.stream("GET", "/api/ui/sse/stream") as response:
-                assert response.status_code == 200
-
-                # Skip connected event and find downloads_update event
-                event_lines = []
-                async for line in response.aiter_lines():
-                    event_lines.append(line)
-                    if line == "":  # Event complete
-                        event_text = "\n".join(event_lines)
-                        if "downloads_update" in event_text:
-                            # Parse the data line
-                            for event_line in event_lines:
-                                if event_line.startswith("data: "):
-                                    data_json = event_line[6:]  # Remove "data: " prefix
-                                    data = json.loads(data_json)
-
-                                    # Validate structure
-                                    assert "downloads" in data
-                                    assert "total_count" in data
-                                    assert "timestamp" in data
-                                    assert isinstance(data["downloads"], list)
-
-                                    if data["downloads"]:
-                                        download = data["downloads"][0]
-                                        assert "id" in download
-                                        assert "track_id" in download
-                                        assert "status" in download
-                                        assert "progress_percent" in download
-                                        assert "priority" in download
-                                        assert "created_at" in download
-                                    break
-                            break
-                        event_lines = []
-
-    async def test_download_progress_updates(self, async_client: AsyncClient):
-        """Test that download progress changes are reflected in events."""
-        # Create downloads with different progress levels
-        mock_downloads_initial = [
-            Download(
-                id=DownloadId(1),
-                track_id=TrackId(1),
-                status=DownloadStatus.DOWNLOADING,
-                progress_percent=25,
-                priority=5,
-            ),
-        ]
+@asynccontextmanager
+async def _session_scope() -> AsyncGenerator[Any, None]:
+    yield None
 
-        mock_downloads_updated = [
-            Download(
-                id=DownloadId(1),
-                track_id=TrackId(1),
-                status=DownloadStatus.DOWNLOADING,
-                progress_percent=75,
-                priority=5,
-            ),
-        ]
 
-        with patch("soulspot.api.routers.sse.get_download_repository") as mock_get_repo:
-            mock_repo = AsyncMock()
-            # First call returns initial progress, second call returns updated
-            mock_repo.list_active = AsyncMock(
-                side_effect=[mock_downloads_initial, mock_downloads_updated]
-            )
-            mock_get_repo.return_value = mock_repo
-
-            async with async_client.stream("GET", "/api/ui/sse/stream") as response:
-                events_found = 0
-                async for line in response.aiter_lines():
-                    if line.startswith("data: ") and "progress_percent" in line:
-                        events_found += 1
-                        if events_found >= 2:  # Got at least 2 progress updates
-                            break
-
-                assert events_found >= 1, "Should receive download progress events"
-
-    async def test_download_status_transitions(self, async_client: AsyncClient):
-        """Test SSE events for download status transitions."""
+def _request() -> MagicMock:
+    """Request that stays connected until is_disconnected.return_value is set."""
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=False)
+    return request
+
+
+async def _next_event(stream: AsyncGenerator[str, None]) -> tuple[str, dict[str, Any]]:
+    """Read one SSE message and return its event type and JSON data."""
+    message = await asyncio.wait_for(anext(stream), timeout=2)
+    fields = dict(line.split(": ", 1) for line in message.strip().split("\n"))
+    return fields["event"], json.loads(fields["data"])
+
+
+@pytest.fixture
+def event_bus(app_with_db: FastAPI) -> EventBus:
+    """The app's event bus (the one /api/ui/sse/stream reads)."""
+    bus: EventBus = app_with_db.state.event_bus
+    return bus
+
+
+@pytest.fixture
+def list_active() -> Iterator[AsyncMock]:
+    """Patch the broadcaster's repository; set return_value/side_effect per test."""
+    with patch(
+        "soulspot.application.workers.download_broadcast_worker.DownloadRepository"
+    ) as repo_cls:
+        repo_cls.return_value.list_active = AsyncMock(return_value=[])
+        yield repo_cls.return_value.list_active
+
+
+@pytest.fixture
+def broadcaster(event_bus: EventBus) -> DownloadBroadcastWorker:
+    """Broadcast worker publishing to the app's event bus."""
+    return DownloadBroadcastWorker(
+        event_bus, _session_scope, min_interval=0.0, refresh_interval=60.0
+    )
+
+
+async def _connect(event_bus: EventBus) -> AsyncGenerator[str, None]:
+    """Open a stream and consume its "connected" event."""
+    stream = event_generator(_request(), event_bus, heartbeat_interval=5.0)
+    event_type, _ = await _next_event(stream)
+    assert event_type == "connected"
+    return stream
+
+
+class TestSSEDownloadEvents:
+    """Test SSE download update events and data structure."""
+
+    async def test_download_update_event_structure(
+        self,
+        event_bus: EventBus,
+        broadcaster: DownloadBroadcastWorker,
+        list_active: AsyncMock,
+    ) -> None:
+        """Test that download update events have correct structure."""
+        list_active.return_value = [_download()]
+        await broadcaster.publish_snapshot()
+
+        stream = await _connect(event_bus)
+        event_type, data = await _next_event(stream)
+
+        assert event_type == "downloads_update"
+        assert set(data) == {"downloads", "total_count", "timestamp"}
+        assert set(data["downloads"][0]) == {
+            "id",
+            "track_id",
+            "status",
+            "progress_percent",
+            "priority",
+            "created_at",
+        }
+        assert data["downloads"][0]["progress_percent"] == 50.0
+        await stream.aclose()
+
+    async def test_download_progress_updates(self, event_bus: EventBus) -> None:
+        """Test that download_progress deltas reach a connected client in order."""
+        stream = await _connect(event_bus)
+        # The generator subscribes once it is resumed after "connected"
+        pending = asyncio.ensure_future(_next_event(stream))
+        await asyncio.sleep(0.05)
+
+        event_bus.publish("download_progress", {"download_id": "d-1", "progress": 25})
+        event_bus.publish("download_progress", {"download_id": "d-1", "progress": 75})
+
+        first = await pending
+        second = await _next_event(stream)
+        assert [first[0], second[0]] == ["download_progress", "download_progress"]
+        assert [first[1]["progress"], second[1]["progress"]] == [25, 75]
+        await stream.aclose()
+
+    async def test_download_status_transitions(
+        self,
+        event_bus: EventBus,
+        broadcaster: DownloadBroadcastWorker,
+        list_active: AsyncMock,
+    ) -> None:
+        """Test each new snapshot carries the download's current status."""
         statuses = [
-            DownloadStatus.PENDING,
+            DownloadStatus.QUEUED,
             DownloadStatus.DOWNLOADING,
             DownloadStatus.COMPLETED,
         ]
-
-        for status in statuses:
-            mock_downloads = [
-                Download(
-                    id=DownloadId(1),
-                    track_id=TrackId(1),
-                    status=status,
-                    progress_percent=100 if status == DownloadStatus.COMPLETED else 50,
-                    priority=5,
-                ),
-            ]
-
-            with patch(
-                "soulspot.api.routers.sse.get_download_repository"
-            ) as mock_get_repo:
-                mock_repo = AsyncMock()
-                mock_repo.list_active = AsyncMock(return_value=mock_downloads)
-                mock_get_repo.return_value = mock_repo
-
-                async with async_client.stream("GET", "/api/ui/sse/stream") as response:
-                    # Find first downloads_update event
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: ") and "status" in line:
-                            data_json = line[6:]
-                            data = json.loads(data_json)
-                            if "downloads" in data and data["downloads"]:
-                                assert data["downloads"][0]["status"] == status.value
-                                break
-
-    async def test_multiple_downloads_in_event(self, async_client: AsyncClient):
+        list_active.side_effect = [[_download(status)] for status in statuses]
+        await broadcaster.publish_snapshot()
+        stream = await _connect(event_bus)
+
+        received = []
+        for _ in statuses:
+            event_type, data = await _next_event(stream)
+            assert event_type == "downloads_update"
+            received.append(data["downloads"][0]["status"])
+            if len(received) < len(statuses):
+                await broadcaster.publish_snapshot()
+
+        assert received == [status.value for status in statuses]
+        await stream.aclose()
+
+    async def test_multiple_downloads_in_event(
+        self,
+        event_bus: EventBus,
+        broadcaster: DownloadBroadcastWorker,
+        list_active: AsyncMock,
+    ) -> None:
         """Test SSE event with multiple concurrent downloads."""
-        mock_downloads = [
-            Download(
-                id=DownloadId(i),
-                track_id=TrackId(i),
-                status=DownloadStatus.DOWNLOADING,
-                progress_percent=i * 10,
-                priority=5,
-            )
-            for i in range(1, 6)  # 5 downloads
-        ]
-
-        with patch("soulspot.api.routers.sse.get_download_repository") as mock_get_repo:
-            mock_repo = AsyncMock()
-            mock_repo.list_active = AsyncMock(return_value=mock_downloads)
-            mock_get_repo.return_value = mock_repo
+        list_active.return_value = [_download(progress=i * 10.0) for i in range(1, 6)]
+        await broadcaster.publish_snapshot()
 
-            async with async_client.stream("GET", "/api/ui/sse/stream") as response:
-                async for line in response.aiter_lines():
-                    if line.startswith("data: ") and "downloads" in line:
-                        data_json = line[6:]
-                        data = json.loads(data_json)
+        stream = await _connect(event_bus)
+        _, data = await _next_event(stream)
 
-                        # Should include all downloads (limited to 10 most recent)
-                        assert len(data["downloads"]) == 5
-                        assert data["total_count"] == 5
-                        break
+        assert len(data["downloads"]) == 5
+        assert data["total_count"] == 5
+        await stream.aclose()
 
 
 class TestSSEDownloadLimit:
-    """Test that SSE respects the 10-download limit for events."""
-
-    async def test_download_limit_enforced(self, async_client: AsyncClient):
-        """Test that only 10 most recent downloads are sent in events."""
-        # Create 15 downloads
-        mock_downloads = [
-            Download(
-                id=DownloadId(i),
-                track_id=TrackId(i),
-                status=DownloadStatus.DOWNLOADING,
-                progress_percent=50,
-                priority=5,
-            )
-            for i in range(1, 16)  # 15 downloads
+    """Test that SSE respects the snapshot download limit."""
+
+    async def test_download_limit_enforced(
+        self,
+        event_bus: EventBus,
+        broadcaster: DownloadBroadcastWorker,
+        list_active: AsyncMock,
+    ) -> None:
+        """Test that only SNAPSHOT_LIMIT downloads are sent, with the real total."""
+        list_active.return_value = [_download() for _ in range(15)]
+        await broadcaster.publish_snapshot()
+
+        stream = await _connect(event_bus)
+        _, data = await _next_event(stream)
+
+        assert len(data["downloads"]) == SNAPSHOT_LIMIT
+        assert data["total_count"] == 15
+        await stream.aclose()
+
+
+class TestSSEBroadcast:
+    """Test that snapshots are shared instead of polled per client."""
+
+    async def test_snapshot_query_shared_by_all_clients(
+        self,
+        event_bus: EventBus,
+        broadcaster: DownloadBroadcastWorker,
+        list_active: AsyncMock,
+    ) -> None:
+        """Test several clients get the same snapshot from a single query."""
+        list_active.return_value = [_download()]
+        await broadcaster.start()
+        try:
+            streams = [await _connect(event_bus) for _ in range(3)]
+            snapshots = [await _next_event(stream) for stream in streams]
+        finally:
+            await broadcaster.stop()
+
+        assert all(event_type == "downloads_update" for event_type, _ in snapshots)
+        assert len({data["timestamp"] for _, data in snapshots}) == 1
+        assert list_active.await_count == 1
+        for stream in streams:
+            await stream.aclose()
+
+    async def test_download_job_update_triggers_new_snapshot(
+        self,
+        event_bus: EventBus,
+        broadcaster: DownloadBroadcastWorker,
+        list_active: AsyncMock,
+    ) -> None:
+        """Test a download job update refreshes the snapshot for connected clients."""
+        list_active.side_effect = [
+            [_download(progress=10.0)],
+            [_download(progress=90.0)],
         ]
+        await broadcaster.start()
+        try:
+            stream = await _connect(event_bus)
+            _, first = await _next_event(stream)
 
-        with patch("soulspot.api.routers.sse.get_download_repository") as mock_get_repo:
-            mock_repo = AsyncMock()
-            mock_repo.list_active = AsyncMock(return_value=mock_downloads)
-            mock_get_repo.return_value = mock_repo
-
-            async with async_client.stream("GET", "/api/ui/sse/stream") as response:
-                async for line in response.aiter_lines():
-                    if line.startswith("data: ") and "downloads" in line:
-                        data_json = line[6:]
-                        data = json.loads(data_json)
-
-                        # Should limit to 10 downloads in event
-                        assert len(data["downloads"]) == 10
-                        # But total_count should show actual total
-                        assert data["total_count"] == 15
-                        break
-
-
-class TestSSEEventTiming:
-    """Test SSE event timing and polling behavior."""
-
-    async def test_event_polling_interval(self, async_client: AsyncClient):
-        """Test that events are sent at regular intervals."""
-        mock_downloads = [
-            Download(
-                id=DownloadId(1),
-                track_id=TrackId(1),
-                status=DownloadStatus.DOWNLOADING,
-                progress_percent=50,
-                priority=5,
-            ),
-        ]
+            event_bus.publish("job_update", {"id": "j-1", "job_type": "download"})
+            event_type, _ = await _next_event(stream)
+            assert event_type == "job_update"
+            event_type, second = await _next_event(stream)
+        finally:
+            await broadcaster.stop()
 
-        with patch("soulspot.api.routers.sse.get_download_repository") as mock_get_repo:
-            mock_repo = AsyncMock()
-            mock_repo.list_active = AsyncMock(return_value=mock_downloads)
-            mock_get_repo.return_value = mock_repo
+        assert event_type == "downloads_update"
+        assert first["downloads"][0]["progress_percent"] == 10.0
+        assert second["downloads"][0]["progress_percent"] == 90.0
+        await stream.aclose()
 
-            async with async_client.stream("GET", "/api/ui/sse/stream") as response:
-                event_times = []
-                event_count = 0
 
-                async for line in response.aiter_lines():
-                    if "event: downloads_update" in line:
-                        import time
+class TestSSEConnectionManagement:
+    """Test SSE connection lifecycle and management."""
 
-                        event_times.append(time.time())
-                        event_count += 1
+    async def test_client_disconnect_detection(self, event_bus: EventBus) -> None:
+        """Test that a disconnected client ends its stream and unsubscribes."""
+        request = _request()
+        stream = event_generator(request, event_bus, heartbeat_interval=0.01)
+        await _next_event(stream)  # connected
+        event_type, _ = await _next_event(stream)
+        assert event_type == "heartbeat"
+        assert event_bus.subscriber_count == 1
 
-                        if event_count >= 3:  # Get 3 events to measure interval
-                            break
+        request.is_disconnected.return_value = True
 
-                # Should have received at least 2 events
-                if len(event_times) >= 2:
-                    # Calculate intervals (should be ~2 seconds with default poll_interval)
-                    intervals = [
-                        event_times[i + 1] - event_times[i]
-                        for i in range(len(event_times) - 1)
-                    ]
-                    # Allow some variance (1-3 seconds)
-                    for interval in intervals:
-                        assert (
-                            1.0 <= interval <= 4.0
-                        ), f"Event interval {interval}s outside expected range (1-4s)"
+        assert [message async for message in stream] == []
+        assert event_bus.subscriber_count == 0
 
+    async def test_multiple_concurrent_connections(self, event_bus: EventBus) -> None:
+        """Test that multiple clients receive the same live event."""
+        streams = [await _connect(event_bus) for _ in range(3)]
+        pending = [asyncio.ensure_future(_next_event(stream)) for stream in streams]
+        await asyncio.sleep(0.05)
 
-class TestSSEConnectionManagement:
-    """Test SSE connection lifecycle and management."""
+        event_bus.publish("job_update", {"id": "j-1", "status": "running"})
 
-    async def test_client_disconnect_detection(self, async_client: AsyncClient):
-        """Test that server detects client disconnect."""
-        mock_downloads = []
-
-        with patch("soulspot.api.routers.sse.get_download_repository") as mock_get_repo:
-            mock_repo = AsyncMock()
-            mock_repo.list_active = AsyncMock(return_value=mock_downloads)
-            mock_get_repo.return_value = mock_repo
-
-            async with async_client.stream("GET", "/api/ui/sse/stream") as response:
-                # Read connected event
-                async for line in response.aiter_lines():
-                    if "Connected to event stream" in line:
-                        break
-
-                # Connection should be active
-                assert response.status_code == 200
-
-            # After exiting context, connection is closed
-            # Server should have detected disconnect
-
-    async def test_multiple_concurrent_connections(self, async_client: AsyncClient):
-        """Test that multiple clients can connect simultaneously."""
-        mock_downloads = []
-
-        with patch("soulspot.api.routers.sse.get_download_repository") as mock_get_repo:
-            mock_repo = AsyncMock()
-            mock_repo.list_active = AsyncMock(return_value=mock_downloads)
-            mock_get_repo.return_value = mock_repo
-
-            # Open 3 concurrent SSE connections
-            async with (
-                async_client.stream("GET", "/api/ui/sse/stream") as response1,
-                async_client.stream("GET", "/api/ui/sse/stream") as response2,
-                async_client.stream("GET", "/api/ui/sse/stream") as response3,
-            ):
-                assert response1.status_code == 200
-                assert response2.status_code == 200
-                assert response3.status_code == 200
-
-                # All connections should receive connected event
-                for response in [response1, response2, response3]:
-                    async for line in response.aiter_lines():
-                        if "Connected to event stream" in line:
-                            break
+        for event_type, data in await asyncio.gather(*pending):
+            assert event_type == "job_update"
+            assert data["id"] == "j-1"
+        for stream in streams:
+            await stream.aclose()
+        assert event_bus.subscriber_count == 0
 
 
 class TestSSEErrorScenarios:
     """Test SSE error handling and edge cases."""
 
-    async def test_repository_error_sends_error_event(self, async_client: AsyncClient):
-        """Test that repository errors are sent as error events."""
-        with patch("soulspot.api.routers.sse.get_download_repository") as mock_get_repo:
-            mock_repo = AsyncMock()
-            mock_repo.list_active = AsyncMock(side_effect=Exception("Database error"))
-            mock_get_repo.return_value = mock_repo
-
-            async with async_client.stream("GET", "/api/ui/sse/stream") as response:
-                async for line in response.aiter_lines():
-                    if "event: error" in line:
-                        # Found error event
-                        # Next line should be data with error message
-                        async for data_line in response.aiter_lines():
-                            if data_line.startswith("data: "):
-                                data = json.loads(data_line[6:])
-                                assert "error" in data
-                                break
-                        break
-
-    async def test_empty_downloads_handled(self, async_client: AsyncClient):
+    async def test_repository_error_keeps_last_snapshot(
+        self,
+        event_bus: EventBus,
+        broadcaster: DownloadBroadcastWorker,
+        list_active: AsyncMock,
+    ) -> None:
+        """Test a failing snapshot query keeps the stream and last snapshot alive."""
+        list_active.return_value = [_download()]
+        await broadcaster.publish_snapshot()
+        list_active.side_effect = Exception("Database error")
+
+        with pytest.raises(Exception, match="Database error"):
+            await broadcaster.publish_snapshot()
+
+        stream = await _connect(event_bus)
+        event_type, data = await _next_event(stream)
+        assert event_type == "downloads_update"
+        assert data["total_count"] == 1
+        await stream.aclose()
+
+    async def test_empty_downloads_handled(
+        self,
+        event_bus: EventBus,
+        broadcaster: DownloadBroadcastWorker,
+        list_active: AsyncMock,
+    ) -> None:
         """Test SSE events when no downloads are active."""
-        mock_downloads = []
-
-        with patch("soulspot.api.routers.sse.get_download_repository") as mock_get_repo:
-            mock_repo = AsyncMock()
-            mock_repo.list_active = AsyncMock(return_value=mock_downloads)
-            mock_get_repo.return_value = mock_repo
+        await broadcaster.publish_snapshot()
 
-            async with async_client.stream("GET", "/api/ui/sse/stream") as response:
-                async for line in response.aiter_lines():
-                    if line.startswith("data: ") and "downloads" in line:
-                        data_json = line[6:]
-                        data = json.loads(data_json)
+        stream = await _connect(event_bus)
+        _, data = await _next_event(stream)
 
-                        # Should have empty downloads array
-                        assert data["downloads"] == []
-                        assert data["total_count"] == 0
-                        break
+        assert data["downloads"] == []
+        assert data["total_count"] == 0
+        await stream.aclose()
 
 
 class TestSSEPerformance:
     """Test SSE performance and resource usage."""
 
-    async def test_sse_handles_rapid_updates(self, async_client: AsyncClient):
-        """Test SSE with rapidly changing download data."""
-        # Simulate rapidly changing progress
-        call_count = [0]
-
-        def get_changing_downloads():
-            call_count[0] += 1
-            return [
-                Download(
-                    id=DownloadId(1),
-                    track_id=TrackId(1),
-                    status=DownloadStatus.DOWNLOADING,
-                    progress_percent=min(call_count[0] * 10, 100),
-                    priority=5,
-                )
-            ]
-
-        with patch("soulspot.api.routers.sse.get_download_repository") as mock_get_repo:
-            mock_repo = AsyncMock()
-            mock_repo.list_active = AsyncMock(
-                side_effect=lambda: get_changing_downloads()
-            )
-            mock_get_repo.return_value = mock_repo
-
-            async with async_client.stream("GET", "/api/ui/sse/stream") as response:
-                events_received = 0
-                async for line in response.aiter_lines():
-                    if "event: downloads_update" in line:
-                        events_received += 1
-                        if events_received >= 5:  # Receive 5 rapid updates
-                            break
-
-                assert events_received >= 3, "Should handle rapid updates"
+    async def test_sse_handles_rapid_updates(
+        self,
+        event_bus: EventBus,
+        broadcaster: DownloadBroadcastWorker,
+        list_active: AsyncMock,
+    ) -> None:
+        """Test a burst of snapshots is delivered in order to a connected client."""
+        list_active.side_effect = [
+            [_download(progress=progress * 10.0)] for progress in range(1, 6)
+        ]
+        stream = await _connect(event_bus)
+        pending = asyncio.ensure_future(_next_event(stream))
+        await asyncio.sleep(0.05)
+
+        for _ in range(5):
+            await broadcaster.publish_snapshot()
+
+        events = [await pending] + [await _next_event(stream) for _ in range(4)]
+        assert [data["downloads"][0]["progress_percent"] for _, data in events] == [
+            10.0,
+            20.0,
+            30.0,
+            40.0,
+            50.0,
+        ]
+        await stream.aclose()
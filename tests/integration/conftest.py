@@ -127,6 +127,7 @@ async def app_with_db(test_settings: Settings, db: Database):
     # Use MagicMock for synchronous methods
     mock_job_queue.is_paused = MagicMock(return_value=False)
     mock_job_queue.get_max_concurrent_jobs = MagicMock(return_value=3)
+    mock_job_queue.get_type_limit = MagicMock(return_value=3)
     mock_job_queue.get_stats = MagicMock(
         return_value={
             "running": 0,
@@ -139,6 +140,11 @@ async def app_with_db(test_settings: Settings, db: Database):
     )
     app.state.job_queue = mock_job_queue
 
+    # Live updates for the SSE stream (no broadcaster - tests publish directly)
+    from soulspot.application.services.event_bus import EventBus
+
+    app.state.event_bus = EventBus()
+
     # Include routes from main app
     from fastapi.staticfiles import StaticFiles
 
@@ -13,7 +13,13 @@ from uuid import uuid4
 
 import pytest
 
-from soulspot.application.workers.job_queue import Job, JobQueue, JobStatus, JobType
+from soulspot.application.workers.job_queue import (
+    Job,
+    JobQueue,
+    JobStatus,
+    JobType,
+    RetryPolicy,
+)
 from soulspot.domain.entities import Download, DownloadStatus
 from soulspot.domain.value_objects import DownloadId, TrackId
 
@@ -117,28 +123,16 @@ class TestPriorityBasedQueue:
 class TestRetryLogic:
     """Test retry logic with exponential backoff."""
 
-    async def test_retry_with_exponential_backoff(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    async def test_retry_with_exponential_backoff(self) -> None:
         """Test that jobs retry with exponential backoff (1s, 2s, 4s)."""
-        job_queue = JobQueue(max_concurrent_jobs=1)
+        retry_policy = RetryPolicy(base_delay=0.02, jitter=0)
+        job_queue = JobQueue(max_concurrent_jobs=1, retry_policy=retry_policy)
         attempt_times: list[float] = []
-        sleep_delays: list[float] = []
-
-        # Mock asyncio.sleep to track delays without waiting
-        original_sleep = asyncio.sleep
-
-        async def mock_sleep(delay: float) -> None:
-            sleep_delays.append(delay)
-            # Small delay to allow event loop processing
-            await original_sleep(0.01)
-
-        monkeypatch.setattr("asyncio.sleep", mock_sleep)
 
         async def failing_handler(job: Job) -> None:
             import time
 
-            attempt_times.append(time.time())
+            attempt_times.append(time.monotonic())
             raise ValueError("Intentional failure for testing")
 
         job_queue.register_handler(JobType.DOWNLOAD, failing_handler)
@@ -148,44 +142,26 @@ class TestRetryLogic:
             JobType.DOWNLOAD, {"track_id": "track-123"}, max_retries=3
         )
 
-        # Start workers
         await job_queue.start(num_workers=1)
-
-        # Wait for all retries (using real sleep for synchronization)
-        await original_sleep(0.5)
-
-        # Stop workers
+        job = await job_queue.wait_for_job(job_id, timeout=5)
         await job_queue.stop()
 
         # Check job failed after retries
-        job = await job_queue.get_job(job_id)
-        assert job is not None
         assert job.status == JobStatus.FAILED
         assert job.retries == 3
 
-        # Verify exponential backoff delays were calculated correctly
+        # Verify the delays between attempts grew exponentially
         assert len(attempt_times) == 3
-        backoff_delays = [d for d in sleep_delays if d in [1.0, 2.0, 4.0]]
-        assert len(backoff_delays) >= 2
-        assert 1.0 in backoff_delays
-        assert 2.0 in backoff_delays
+        assert attempt_times[1] - attempt_times[0] >= 0.02
+        assert attempt_times[2] - attempt_times[1] >= 0.04
+        default_policy = RetryPolicy(jitter=0)
+        assert [default_policy.delay(n) for n in (1, 2, 3)] == [1.0, 2.0, 4.0]
 
-    async def test_max_retries_configurable(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    async def test_max_retries_configurable(self) -> None:
         """Test that max retries is configurable."""
-        job_queue = JobQueue(max_concurrent_jobs=1)
-
-        original_sleep = asyncio.sleep
-
-        async def mock_sleep(delay: float) -> None:
-            # Speed up retry delays
-            if delay >= 1.0:
-                await original_sleep(0.01)
-            else:
-                await original_sleep(delay)
-
-        monkeypatch.setattr("asyncio.sleep", mock_sleep)
+        job_queue = JobQueue(
+            max_concurrent_jobs=1, retry_policy=RetryPolicy(base_delay=0.01, jitter=0)
+        )
 
         async def failing_handler(job: Job) -> None:
             raise ValueError("Test failure")
@@ -198,11 +174,9 @@ class TestRetryLogic:
         )
 
         await job_queue.start(num_workers=1)
-        await original_sleep(0.3)
+        job = await job_queue.wait_for_job(job_id, timeout=5)
         await job_queue.stop()
 
-        job = await job_queue.get_job(job_id)
-        assert job is not None
         assert job.max_retries == 2
         assert job.retries == 2
 
@@ -477,24 +451,13 @@ class TestIntegrationScenarios:
         assert len(processed_order) == 3
         assert 10 in processed_order
 
-    async def test_retry_after_failure_with_priority_maintained(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    async def test_retry_after_failure_with_priority_maintained(self) -> None:
         """Test that retries maintain original priority."""
-        job_queue = JobQueue(max_concurrent_jobs=1)
+        job_queue = JobQueue(
+            max_concurrent_jobs=1, retry_policy=RetryPolicy(base_delay=0.01, jitter=0)
+        )
         attempts = 0
 
-        original_sleep = asyncio.sleep
-
-        async def mock_sleep(delay: float) -> None:
-            # Speed up retry delays
-            if delay >= 1.0:
-                await original_sleep(0.01)
-            else:
-                await original_sleep(delay)
-
-        monkeypatch.setattr("asyncio.sleep", mock_sleep)
-
         async def handler_with_one_failure(job: Job) -> None:
             nonlocal attempts
             attempts += 1
@@ -510,11 +473,9 @@ class TestIntegrationScenarios:
         )
 
         await job_queue.start(num_workers=1)
-        await original_sleep(0.3)
+        job = await job_queue.wait_for_job(job_id, timeout=5)
         await job_queue.stop()
 
-        job = await job_queue.get_job(job_id)
-        assert job is not None
         assert job.priority == 5
         assert job.status == JobStatus.COMPLETED
         assert attempts == 2
@@ -0,0 +1,29 @@
+"""Tests for the SSE event stream generator."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from soulspot.api.routers.sse import event_generator
+from soulspot.application.services.event_bus import EventBus
+
+
+async def test_stream_forwards_bus_events_and_unsubscribes() -> None:
+    """Test the stream sends snapshot, deltas and heartbeats from the bus only."""
+    bus = EventBus()
+    bus.publish("downloads_update", {"downloads": [], "total_count": 0}, retain=True)
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=False)
+
+    stream = event_generator(request, bus, heartbeat_interval=0.01)
+    assert "event: connected" in await anext(stream)
+    assert "event: downloads_update" in await anext(stream)
+    assert bus.subscriber_count == 1
+
+    bus.publish("job_update", {"id": "abc", "status": "running"})
+    message = await anext(stream)
+    assert "event: job_update" in message
+    assert '"status": "running"' in message
+    assert "event: heartbeat" in await anext(stream)
+
+    request.is_disconnected.return_value = True
+    assert [message async for message in stream] == []
+    assert bus.subscriber_count == 0
@@ -0,0 +1,84 @@
+"""Tests for the job queue scheduling endpoints of the workers API."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from soulspot.api.routers import workers
+from soulspot.application.workers.job_queue import JobQueue, JobType
+from soulspot.config import Settings, get_settings
+
+
+def _client(job_queue: JobQueue, settings: Settings | None = None) -> TestClient:
+    app = FastAPI()
+    app.include_router(workers.router, prefix="/api/workers")
+    app.state.job_queue = job_queue
+    if settings is not None:
+        app.dependency_overrides[get_settings] = lambda: settings
+    return TestClient(app)
+
+
+class TestJobQueueSchedulingEndpoints:
+    """Test GET/PATCH /api/workers/job-queue/scheduling."""
+
+    def test_get_scheduling(self) -> None:
+        """Test limits and weights of every job type are listed."""
+        job_queue = JobQueue(max_concurrent_jobs=5, type_limits={JobType.DOWNLOAD: 3})
+
+        response = _client(job_queue).get("/api/workers/job-queue/scheduling")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["max_concurrent_jobs"] == 5
+        assert data["job_types"]["download"]["max_concurrent"] == 3
+        assert data["job_types"]["library_scan"]["max_concurrent"] is None
+        assert set(data["job_types"]) == {job_type.value for job_type in JobType}
+
+    def test_patch_updates_only_sent_fields(self) -> None:
+        """Test partial updates, including removing a per-type limit."""
+        job_queue = JobQueue(
+            max_concurrent_jobs=5,
+            type_limits={JobType.DOWNLOAD: 3, JobType.LIBRARY_SCAN: 1},
+        )
+
+        response = _client(job_queue).patch(
+            "/api/workers/job-queue/scheduling",
+            json={
+                "max_concurrent_jobs": 8,
+                "job_types": {
+                    "download": {"weight": 0.5},
+                    "library_scan": {"max_concurrent": None},
+                },
+            },
+        )
+
+        assert response.status_code == 200
+        assert job_queue.get_max_concurrent_jobs() == 8
+        assert job_queue.get_type_limit(JobType.DOWNLOAD) == 3
+        assert job_queue.get_type_weight(JobType.DOWNLOAD) == 0.5
+        assert job_queue.get_type_limit(JobType.LIBRARY_SCAN) is None
+
+    def test_patch_rejects_unknown_type_and_bad_values(self) -> None:
+        """Test validation of job types, limits and weights."""
+        client = _client(JobQueue())
+
+        for body in (
+            {"job_types": {"nope": {"weight": 1}}},
+            {"job_types": {"download": {"max_concurrent": -1}}},
+            {"job_types": {"download": {"weight": 0}}},
+            {"max_concurrent_jobs": 0},
+        ):
+            response = client.patch("/api/workers/job-queue/scheduling", json=body)
+            assert response.status_code == 422, body
+
+    def test_patch_conflicts_without_embedded_workers(self) -> None:
+        """Test a change the worker process would never see is refused."""
+        job_queue = JobQueue(max_concurrent_jobs=5)
+        settings = Settings()
+        settings.download.embedded_workers = False
+
+        response = _client(job_queue, settings).patch(
+            "/api/workers/job-queue/scheduling", json={"max_concurrent_jobs": 8}
+        )
+
+        assert response.status_code == 409
+        assert job_queue.get_max_concurrent_jobs() == 5
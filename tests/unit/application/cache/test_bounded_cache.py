@@ -0,0 +1,134 @@
+"""Tests for the byte-bounded cache."""
+
+import time
+
+import pytest
+
+from soulspot.application.cache.bounded_cache import BoundedCache, estimate_size
+
+
+class FakeClock:
+    """Controllable replacement for time.time()."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Patch time.time() with a controllable clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(time, "time", fake)
+    return fake
+
+
+def _sizer(value: str) -> int:
+    """Size = string length, so budgets in tests are easy to reason about."""
+    return len(value)
+
+
+class TestEstimateSize:
+    """Test estimate_size()."""
+
+    def test_nested_payload_grows_with_content(self) -> None:
+        """Test nested JSON-like data is measured by content, not entry count."""
+        track = {"id": "x" * 22, "name": "Song", "artists": [{"name": "Artist"}]}
+        playlist = {"id": "p", "tracks": [dict(track, id=str(i)) for i in range(500)]}
+
+        assert estimate_size(playlist) > 100 * estimate_size(track)
+
+    def test_shared_and_cyclic_references_are_counted_once(self) -> None:
+        """Test repeated/cyclic references don't inflate or hang the estimate."""
+        shared = ["a" * 1000]
+        cyclic: list[object] = [shared, shared]
+        cyclic.append(cyclic)
+
+        assert estimate_size(cyclic) < estimate_size(shared) + 200
+
+
+class TestBoundedCache:
+    """Test BoundedCache byte budget, TTL heap and metrics."""
+
+    async def test_evicts_least_recently_used_to_stay_under_budget(
+        self, clock: FakeClock
+    ) -> None:
+        """Test the byte budget evicts LRU entries, not the ones just read."""
+        cache: BoundedCache[str, str] = BoundedCache(max_bytes=3000, sizer=_sizer)
+        for key in ("a", "b", "c"):
+            await cache.set(key, "x" * 700)
+        assert await cache.get("a") is not None  # a is now most recently used
+
+        await cache.set("d", "x" * 700)
+
+        assert await cache.exists("a")
+        assert not await cache.exists("b")
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 3000
+        assert stats["metrics"]["evictions"] == 1
+
+    async def test_expired_entries_go_before_live_ones(self, clock: FakeClock) -> None:
+        """Test a full cache drops due entries before evicting live ones."""
+        cache: BoundedCache[str, str] = BoundedCache(max_bytes=3000, sizer=_sizer)
+        await cache.set("short", "x" * 700, ttl_seconds=10)
+        await cache.set("long1", "x" * 700, ttl_seconds=3600)
+        await cache.set("long2", "x" * 700, ttl_seconds=3600)
+        clock.now += 11
+
+        await cache.set("new", "x" * 700)
+
+        assert await cache.exists("long1")
+        assert await cache.exists("long2")
+        assert cache.get_metrics().evictions == 0
+        assert cache.get_metrics().expirations == 1
+
+    async def test_cleanup_expired_pops_only_due_entries(
+        self, clock: FakeClock
+    ) -> None:
+        """Test cleanup_expired() removes exactly the due entries via the heap."""
+        cache: BoundedCache[str, str] = BoundedCache()
+        for i in range(100):
+            await cache.set(f"k{i}", "v", ttl_seconds=10 if i % 2 else 3600)
+        await cache.set("k1", "v", ttl_seconds=3600)  # overwritten, old heap item stale
+        clock.now += 11
+
+        assert await cache.cleanup_expired() == 49
+        assert cache.get_stats()["total_entries"] == 51
+        assert await cache.get("k1") == "v"
+
+    async def test_oversized_value_is_not_cached(self, clock: FakeClock) -> None:
+        """Test a value above the whole budget is rejected and the old value dropped."""
+        cache: BoundedCache[str, str] = BoundedCache(max_bytes=1000, sizer=_sizer)
+        await cache.set("key", "small")
+        await cache.set("key", "x" * 5000)
+
+        assert await cache.get("key") is None
+        assert cache.get_stats()["metrics"]["rejected"] == 1
+        assert cache.get_stats()["bytes"] == 0
+
+    async def test_max_entries_limit(self, clock: FakeClock) -> None:
+        """Test the optional entry limit is enforced next to the byte budget."""
+        cache: BoundedCache[int, str] = BoundedCache(max_entries=2)
+        for i in range(3):
+            await cache.set(i, "v")
+
+        assert not await cache.exists(0)
+        assert cache.get_stats()["total_entries"] == 2
+
+    async def test_churn_does_not_grow_the_heap(self, clock: FakeClock) -> None:
+        """Test rewriting the same keys keeps the expiry heap compact."""
+        cache: BoundedCache[int, str] = BoundedCache()
+        for _ in range(50):
+            for i in range(10):
+                await cache.set(i, "v")
+
+        assert len(cache._expiry) <= 10 + 65
+
+    def test_invalid_budget(self) -> None:
+        """Test invalid budgets are rejected."""
+        with pytest.raises(ValueError):
+            BoundedCache(max_bytes=0)
+        with pytest.raises(ValueError):
+            BoundedCache(max_entries=0)
@@ -0,0 +1,220 @@
+"""Tests for the read-through caching client wrappers."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from soulspot.application.cache import (
+    CachedLastfmClient,
+    CachedMusicBrainzClient,
+    CachedSpotifyClient,
+    LastfmCache,
+    MusicBrainzCache,
+    SpotifyCache,
+)
+
+
+@pytest.fixture
+def spotify() -> AsyncMock:
+    """Create mock Spotify client."""
+    client = AsyncMock()
+    client.get_track = AsyncMock(return_value={"id": "t1", "name": "Song"})
+    client.get_albums = AsyncMock(
+        side_effect=lambda ids, token: [{"id": album_id} for album_id in ids]
+    )
+    client.get_artist_albums = AsyncMock(return_value=[{"id": "al1"}])
+    client.get_user_playlists = AsyncMock(return_value={"items": []})
+    return client
+
+
+class TestCachedSpotifyClient:
+    """Test CachedSpotifyClient read-through behavior."""
+
+    async def test_second_call_is_served_from_cache(self, spotify: AsyncMock) -> None:
+        """Test repeated lookups hit Spotify once, across wrapper instances."""
+        cache = SpotifyCache()
+
+        first = await CachedSpotifyClient(spotify, cache).get_track("t1", "token-a")
+        second = await CachedSpotifyClient(spotify, cache).get_track("t1", "token-b")
+
+        assert first == second == {"id": "t1", "name": "Song"}
+        assert spotify.get_track.await_count == 1
+        assert await cache.get_track("t1") == first  # typed helper shares the entry
+        endpoint = cache.get_stats()["endpoints"]["track"]
+        assert endpoint["hits"] == 2
+        assert endpoint["misses"] == 1
+
+    async def test_batch_fetches_only_missing_items(self, spotify: AsyncMock) -> None:
+        """Test get_albums asks Spotify only for uncached IDs and keeps order."""
+        client = CachedSpotifyClient(spotify, SpotifyCache())
+        await client.get_albums(["b"], "token")
+
+        albums = await client.get_albums(["a", "b", "c"], "token")
+
+        assert [album["id"] for album in albums] == ["a", "b", "c"]
+        spotify.get_albums.assert_awaited_with(["a", "c"], "token")
+
+    async def test_user_endpoints_and_errors_are_not_cached(
+        self, spotify: AsyncMock
+    ) -> None:
+        """Test user-specific calls and failures always go to Spotify."""
+        client = CachedSpotifyClient(spotify, SpotifyCache())
+        await client.get_user_playlists("token")
+        await client.get_user_playlists("token")
+        spotify.get_artist.side_effect = RuntimeError("boom")
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await client.get_artist("ar1", "token")
+
+        assert spotify.get_user_playlists.await_count == 2
+        assert spotify.get_artist.await_count == 2
+
+    async def test_invalidate_artist_drops_all_variants(
+        self, spotify: AsyncMock
+    ) -> None:
+        """Test the artist invalidation hook forces a refetch."""
+        cache = SpotifyCache()
+        client = CachedSpotifyClient(spotify, cache)
+        await client.get_artist_albums("ar1", "token", limit=10)
+        await client.get_artist_albums("ar1", "token", limit=50)
+
+        assert await cache.invalidate_artist("ar1") == 2
+        await client.get_artist_albums("ar1", "token", limit=10)
+        assert spotify.get_artist_albums.await_count == 3
+
+    async def test_stale_response_is_served_while_refreshed(
+        self, spotify: AsyncMock
+    ) -> None:
+        """Test a response past its TTL is returned at once and refreshed once."""
+        cache = SpotifyCache()
+        cache.ARTIST_ALBUMS_TTL = 0  # stale right away, hard TTL = STALE_TTL
+        client = CachedSpotifyClient(spotify, cache)
+        await client.get_artist_albums("ar1", "token")
+        spotify.get_artist_albums.return_value = [{"id": "al2"}]
+
+        stale = await asyncio.gather(
+            client.get_artist_albums("ar1", "token"),
+            client.get_artist_albums("ar1", "token"),
+        )
+        assert stale == [[{"id": "al1"}], [{"id": "al1"}]]
+        assert await cache.get_response("artist_albums", "ar1:50") is None
+        while cache.get_stats()["stale"]["refreshing"]:
+            await asyncio.sleep(0)
+
+        assert await client.get_artist_albums("ar1", "token") == [{"id": "al2"}]
+        assert spotify.get_artist_albums.await_count == 2  # initial fetch + ONE refresh
+        stats = cache.get_stats()["stale"]
+        assert stats["hits"] == 3
+        assert stats["refreshes"] == 2  # the new response is stale again right away
+
+    async def test_past_hard_ttl_blocks_on_fetch(self, spotify: AsyncMock) -> None:
+        """Test stale serving is off once the stale window is over (or zero)."""
+        cache = SpotifyCache(stale_ttl=0)
+        cache.ARTIST_ALBUMS_TTL = 0
+        client = CachedSpotifyClient(spotify, cache)
+
+        await client.get_artist_albums("ar1", "token")
+        await client.get_artist_albums("ar1", "token")
+
+        assert spotify.get_artist_albums.await_count == 2
+        assert cache.get_stats()["stale"]["hits"] == 0
+
+
+class TestCachedMusicBrainzClient:
+    """Test CachedMusicBrainzClient read-through behavior."""
+
+    async def test_found_and_not_found_are_cached(self) -> None:
+        """Test recordings and "not found" answers are both served from cache."""
+        musicbrainz = AsyncMock()
+        musicbrainz.lookup_recording_by_isrc = AsyncMock(
+            side_effect=lambda isrc: {"id": "rec"} if isrc == "GOOD" else None
+        )
+        cache = MusicBrainzCache()
+        client = CachedMusicBrainzClient(musicbrainz, cache)
+
+        for isrc in ("GOOD", "GOOD", "BAD", "BAD"):
+            await client.lookup_recording_by_isrc(isrc)
+        assert musicbrainz.lookup_recording_by_isrc.await_count == 2
+        assert await cache.get_recording_by_isrc("BAD") is None
+        negative = cache.get_stats()["negative"]
+        assert negative["hits"] == 2  # second BAD lookup + typed helper
+        assert negative["writes"] == 1
+
+        await cache.invalidate_recording("GOOD")
+        assert await client.lookup_recording_by_isrc("GOOD") == {"id": "rec"}
+        assert musicbrainz.lookup_recording_by_isrc.await_count == 3
+
+    async def test_not_found_uses_negative_ttl_and_errors_are_not_cached(
+        self,
+    ) -> None:
+        """Test "not found" expires with the negative TTL and failures always retry."""
+        musicbrainz = AsyncMock()
+        musicbrainz.lookup_release = AsyncMock(return_value=None)
+        musicbrainz.lookup_artist = AsyncMock(side_effect=RuntimeError("503"))
+        client = CachedMusicBrainzClient(musicbrainz, MusicBrainzCache(negative_ttl=0))
+
+        await client.lookup_release("rel-1")
+        await client.lookup_release("rel-1")
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await client.lookup_artist("ar-1")
+
+        assert musicbrainz.lookup_release.await_count == 2
+        assert musicbrainz.lookup_artist.await_count == 2
+
+    async def test_search_key_includes_limit(self) -> None:
+        """Test searches with different limits are cached separately."""
+        musicbrainz = AsyncMock()
+        musicbrainz.search_recording = AsyncMock(return_value=[{"id": "rec"}])
+        client = CachedMusicBrainzClient(musicbrainz, MusicBrainzCache())
+
+        await client.search_recording("Artist", "Title", limit=5)
+        await client.search_recording("Artist", "Title", limit=5)
+        await client.search_recording("Artist", "Title", limit=10)
+
+        assert musicbrainz.search_recording.await_count == 2
+
+    async def test_concurrent_lookups_are_coalesced(self) -> None:
+        """Test concurrent lookups of one release share a single request."""
+        release = asyncio.Event()
+
+        async def lookup_release(release_id: str) -> dict[str, str]:
+            await release.wait()
+            return {"id": release_id}
+
+        musicbrainz = AsyncMock()
+        musicbrainz.lookup_release = AsyncMock(side_effect=lookup_release)
+        cache = MusicBrainzCache()
+        client = CachedMusicBrainzClient(musicbrainz, cache)
+
+        lookups = [
+            asyncio.create_task(client.lookup_release("rel-1")) for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*lookups)
+
+        assert all(result == {"id": "rel-1"} for result in results)
+        assert musicbrainz.lookup_release.await_count == 1
+        stats = cache.get_stats()
+        assert stats["endpoints"]["release"]["coalesced"] == 9
+        assert stats["single_flight"]["coalesced"] == 9
+
+
+class TestCachedLastfmClient:
+    """Test CachedLastfmClient read-through behavior."""
+
+    async def test_artist_info_cached_per_mbid(self) -> None:
+        """Test lookups with and without MBID are separate entries."""
+        lastfm = AsyncMock()
+        lastfm.get_artist_info = AsyncMock(return_value={"name": "Artist"})
+        cache = LastfmCache()
+        client = CachedLastfmClient(lastfm, cache)
+
+        await client.get_artist_info("Artist")
+        await client.get_artist_info("Artist")
+        await client.get_artist_info("Artist", mbid="mb-1")
+        assert lastfm.get_artist_info.await_count == 2
+
+        assert await cache.invalidate_artist("Artist") == 2
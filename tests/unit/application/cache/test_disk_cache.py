@@ -0,0 +1,109 @@
+"""Tests for the persistent disk cache tier."""
+
+import secrets
+import time
+from pathlib import Path
+
+import pytest
+
+from soulspot.application.cache import DiskCache, MusicBrainzCache, SpotifyCache
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Path of the cache file (parent directory created by DiskCache)."""
+    return tmp_path / "cache" / "metadata_cache.db"
+
+
+class TestDiskCache:
+    """Test DiskCache storage, expiry and eviction."""
+
+    async def test_values_survive_reopen_and_are_shared(self, db_path: Path) -> None:
+        """Test a value written by one instance is read by another on the same file."""
+        writer = DiskCache(db_path)
+        await writer.set("spotify", "track:t1", {"id": "t1", "name": "Söng"}, 60)
+        await writer.close()
+
+        reader = DiskCache(db_path)
+        stored = await reader.get("spotify", "track:t1")
+
+        assert stored is not None
+        assert stored[0] == {"id": "t1", "name": "Söng"}
+        assert stored[1] > time.time()
+        assert await reader.get("musicbrainz", "track:t1") is None  # per namespace
+        await reader.close()
+
+    async def test_expired_values_are_dropped_on_read(self, db_path: Path) -> None:
+        """Test lazy expiry removes the row when it is read."""
+        cache = DiskCache(db_path)
+        await cache.set("spotify", "track:t1", {"id": "t1"}, 0)
+
+        assert await cache.get("spotify", "track:t1") is None
+        assert cache.get_stats()["expirations"] == 1
+        await cache.close()
+
+    async def test_size_cap_evicts_least_recently_accessed(self, db_path: Path) -> None:
+        """Test maintenance keeps the newest entries that fit the cap."""
+        cache = DiskCache(db_path, max_bytes=300)
+        cache.MAINTENANCE_INTERVAL = 1
+        for index in range(5):
+            # Random hex barely compresses: ~110 bytes per payload, so 2 fit the cap
+            await cache.set("lyrics", f"k{index}", secrets.token_hex(100), 60)
+
+        assert await cache.get("lyrics", "k4") is not None
+        assert await cache.get("lyrics", "k0") is None
+        assert cache.get_stats()["evictions"] >= 1
+        await cache.close()
+
+    async def test_unserializable_values_are_skipped(self, db_path: Path) -> None:
+        """Test non-JSON values don't raise and aren't stored."""
+        cache = DiskCache(db_path)
+        await cache.set("spotify", "key", object(), 60)
+
+        assert await cache.get("spotify", "key") is None
+        assert cache.get_stats()["writes"] == 0
+        await cache.close()
+
+
+class TestResponseCacheWithDisk:
+    """Test ResponseCache using DiskCache as second tier."""
+
+    async def test_memory_miss_falls_back_to_disk(self, db_path: Path) -> None:
+        """Test a fresh process serves responses cached before the restart."""
+        disk = DiskCache(db_path)
+        await SpotifyCache(disk=disk).cache_track("t1", {"id": "t1"})
+
+        restarted = SpotifyCache(disk=disk)
+        assert await restarted.get_track("t1") == {"id": "t1"}
+        stats = restarted.get_stats()
+        assert stats["endpoints"]["track"]["disk_hits"] == 1
+        assert stats["total_entries"] == 1  # promoted into memory
+        await disk.close()
+
+    async def test_warm_preloads_memory(self, db_path: Path) -> None:
+        """Test warm() loads the namespace's entries without touching others."""
+        disk = DiskCache(db_path)
+        spotify = SpotifyCache(disk=disk)
+        await spotify.cache_track("t1", {"id": "t1"})
+        await spotify.cache_track("t2", {"id": "t2"})
+        await MusicBrainzCache(disk=disk).cache_release("rel-1", {"id": "rel-1"})
+
+        restarted = SpotifyCache(disk=disk)
+        assert await restarted.warm() == 2
+        assert restarted.get_stats()["total_entries"] == 2
+        await disk.close()
+
+    async def test_invalidation_reaches_disk(self, db_path: Path) -> None:
+        """Test invalidated entries don't come back from disk."""
+        disk = DiskCache(db_path)
+        cache = MusicBrainzCache(disk=disk)
+        await cache.cache_release("rel-1", {"id": "rel-1"})
+        await cache.cache_artist("ar-1", {"id": "ar-1"})
+
+        await cache.invalidate_release("rel-1")
+        await cache.clear()
+
+        restarted = MusicBrainzCache(disk=disk)
+        assert await restarted.get_release("rel-1") is None
+        assert await restarted.get_artist("ar-1") is None
+        await disk.close()
@@ -0,0 +1,100 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from soulspot.application.cache.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test SingleFlight sharing of in-flight calls."""
+
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        """Test concurrent calls for one key run once and share the result."""
+        flights = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch() -> dict[str, str]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"id": "rel-1"}
+
+        waiters = [asyncio.create_task(flights.do("rel-1", fetch)) for _ in range(5)]
+        other = asyncio.create_task(flights.do("rel-2", fetch))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters, other)
+
+        assert calls == 2
+        assert all(result == {"id": "rel-1"} for result in results)
+        assert flights.get_stats() == {"calls": 2, "coalesced": 4, "in_flight": 0}
+
+    async def test_error_is_shared_and_not_remembered(self) -> None:
+        """Test all waiters get the error and the next call starts fresh."""
+        flights = SingleFlight()
+        attempts = 0
+
+        async def fetch() -> str:
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0)
+            if attempts == 1:
+                raise RuntimeError("rate limited")
+            return "ok"
+
+        results = await asyncio.gather(
+            flights.do("key", fetch), flights.do("key", fetch), return_exceptions=True
+        )
+        assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+        assert await flights.do("key", fetch) == "ok"
+        assert attempts == 2
+
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        """Test the shared call survives cancellation of the first caller."""
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flights.do("key", fetch))
+        second = asyncio.create_task(flights.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    async def test_batch_joins_in_flight_keys_and_fetches_the_rest(self) -> None:
+        """Test do_many fetches only keys nobody else is fetching."""
+        flights = SingleFlight()
+        release = asyncio.Event()
+        batches: list[list[str]] = []
+
+        async def fetch_one() -> str:
+            await release.wait()
+            return "artist-a"
+
+        async def fetch_many(keys: list[str]) -> dict[str, str]:
+            batches.append(keys)
+            await release.wait()
+            return {key: f"artist-{key}" for key in keys if key != "x"}
+
+        single = asyncio.create_task(flights.do("a", fetch_one))
+        await asyncio.sleep(0)
+        batch = asyncio.create_task(flights.do_many(["a", "b", "b", "x"], fetch_many))
+        late = asyncio.create_task(flights.do("b", fetch_one))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await batch == {"a": "artist-a", "b": "artist-b", "x": None}
+        assert await single == "artist-a"
+        assert await late == "artist-b"
+        assert batches == [["b", "x"]]
+        assert flights.get_stats() == {"calls": 2, "coalesced": 2, "in_flight": 0}
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from PIL import Image as PILImage
 
+from soulspot.application.cache import MusicBrainzCache
 from soulspot.application.services.postprocessing.artwork_service import ArtworkService
 from soulspot.config import Settings
 from soulspot.config.settings import PostProcessingSettings, StorageSettings
@@ -119,6 +120,30 @@ async def test_download_from_coverart_not_found(
         assert result is None
 
 
+@pytest.mark.asyncio
+async def test_download_from_coverart_remembers_not_found(
+    mock_settings: Settings,
+) -> None:
+    """Test a 404 is cached so the next lookup skips CoverArtArchive."""
+    cache = MusicBrainzCache()
+    artwork_service = ArtworkService(mock_settings, musicbrainz_cache=cache)
+    with patch("httpx.AsyncClient") as mock_client:
+        from httpx import HTTPStatusError, Response
+
+        get = AsyncMock(
+            side_effect=HTTPStatusError(
+                "Not found", request=Mock(), response=Response(404)
+            )
+        )
+        mock_client.return_value.__aenter__.return_value.get = get
+
+        assert await artwork_service._download_from_coverart("no-cover") is None
+        assert await artwork_service._download_from_coverart("no-cover") is None
+
+        assert get.await_count == 1
+        assert cache.get_stats()["negative"]["hits"] == 1
+
+
 def test_process_image_resize(artwork_service: ArtworkService) -> None:
     """Test image resizing when larger than max size."""
     # Create a large test image
@@ -0,0 +1,58 @@
+"""Tests for lyrics service caching."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from soulspot.application.cache import LyricsCache
+from soulspot.application.services.postprocessing.lyrics_service import LyricsService
+from soulspot.config import Settings
+from soulspot.domain.entities import Track
+from soulspot.domain.value_objects import ArtistId, TrackId
+
+
+@pytest.fixture
+def sample_track() -> Track:
+    """Create a sample track."""
+    return Track(
+        id=TrackId.generate(),
+        title="Test Track",
+        artist_id=ArtistId.generate(),
+        duration_ms=180000,
+    )
+
+
+@pytest.mark.asyncio
+async def test_found_and_not_found_lyrics_are_cached(sample_track: Track) -> None:
+    """Test both found lyrics and "no lyrics anywhere" skip LRClib next time."""
+    service = LyricsService(Settings(), cache=LyricsCache())
+    lrclib = AsyncMock(
+        side_effect=lambda artist, *_: (
+            ("[00:01.00] la", True) if artist == "Known" else (None, False)
+        )
+    )
+    service._fetch_from_lrclib = lrclib  # type: ignore[method-assign]
+
+    for artist in ("Known", "Known", "Obscure", "Obscure"):
+        await service.fetch_lyrics(sample_track, artist)
+
+    assert await service.fetch_lyrics(sample_track, "Known") == ("[00:01.00] la", True)
+    assert await service.fetch_lyrics(sample_track, "Obscure") == (None, False)
+    assert lrclib.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_source_errors_are_not_cached(sample_track: Track) -> None:
+    """Test a failed lookup is retried instead of remembered as not found."""
+    service = LyricsService(Settings(), cache=LyricsCache())
+
+    async def failing_lrclib(*_: object) -> tuple[None, bool]:
+        service._source_errors += 1
+        return None, False
+
+    lrclib = AsyncMock(side_effect=failing_lrclib)
+    service._fetch_from_lrclib = lrclib  # type: ignore[method-assign]
+
+    assert await service.fetch_lyrics(sample_track, "Artist") == (None, False)
+    assert await service.fetch_lyrics(sample_track, "Artist") == (None, False)
+    assert lrclib.await_count == 2
@@ -211,3 +211,50 @@ def test_cleanup_empty_dirs_with_files(
     auto_import_service._cleanup_empty_dirs(test_dir)
 
     assert test_dir.exists()
+
+
+async def test_resolve_artist_name_fuzzy(
+    auto_import_service: AutoImportService,
+) -> None:
+    """Test artist tags resolve to the closest known artist name."""
+    artist = Mock()
+    artist.name = "The Beatles"
+    auto_import_service._artist_repository.list_all = AsyncMock(return_value=[artist])
+
+    assert await auto_import_service._resolve_artist_name("The Beatle") == "The Beatles"
+    assert await auto_import_service._resolve_artist_name("Portishead") is None
+    # Index is built once per poll cycle
+    auto_import_service._artist_repository.list_all.assert_awaited_once()
+
+
+async def test_handle_changes_imports_complete_files_only(
+    auto_import_service: AutoImportService, mock_settings: Settings
+) -> None:
+    """Test watcher batches queue files and only settled ones are imported."""
+    from soulspot.application.services.file_watcher import ChangeBatch
+
+    downloads = mock_settings.storage.download_path
+    done = downloads / "album" / "done.mp3"
+    done.parent.mkdir()
+    done.write_text("done")
+    writing = downloads / "writing.mp3"
+    writing.write_text("partial")
+
+    await auto_import_service.handle_changes(
+        ChangeBatch(
+            root=downloads,
+            changes={done.parent: "added", writing: "added"},
+        )
+    )
+    assert auto_import_service._pending_files == {done, writing}
+
+    auto_import_service._find_track_for_file = AsyncMock(return_value=None)  # type: ignore[method-assign]
+    with patch.object(
+        auto_import_service,
+        "_is_file_complete",
+        side_effect=lambda p: p == done,
+    ):
+        await auto_import_service._process_pending_files()
+
+    assert (mock_settings.storage.music_path / "album" / "done.mp3").exists()
+    assert auto_import_service._pending_files == {writing}
@@ -0,0 +1,132 @@
+"""Tests for the in-process event bus and the SSE broadcaster feeding it."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from soulspot.application.services.event_bus import EventBus
+from soulspot.application.workers.download_broadcast_worker import (
+    DownloadBroadcastWorker,
+)
+from soulspot.domain.entities import Download, DownloadStatus
+from soulspot.domain.value_objects import DownloadId, TrackId
+
+
+class TestEventBus:
+    """Test EventBus fan-out and bounded subscriber buffers."""
+
+    async def test_publish_fans_out_to_every_subscriber(self) -> None:
+        """Test every subscriber receives each event once, in order."""
+        bus = EventBus()
+        first, second = bus.subscribe(), bus.subscribe()
+
+        bus.publish("job_update", {"id": "a"})
+        bus.publish("job_update", {"id": "b"})
+
+        for subscription in (first, second):
+            events = [
+                await subscription.get(timeout=1),
+                await subscription.get(timeout=1),
+            ]
+            assert [event.data["id"] for event in events] == ["a", "b"]
+        assert await first.get(timeout=0.01) is None
+
+    async def test_retained_snapshot_goes_to_new_subscribers(self) -> None:
+        """Test a late subscriber gets the latest retained snapshot only."""
+        bus = EventBus()
+        bus.publish("downloads_update", {"total_count": 1}, retain=True)
+        bus.publish("downloads_update", {"total_count": 2}, retain=True)
+        bus.publish("job_update", {"id": "a"})
+
+        with bus.subscribe() as subscription:
+            event = await subscription.get(timeout=1)
+            assert event is not None
+            assert event.data == {"total_count": 2}
+            assert await subscription.get(timeout=0.01) is None
+            assert bus.subscriber_count == 1
+        assert bus.subscriber_count == 0
+
+    async def test_slow_subscriber_drops_oldest_and_resyncs(self) -> None:
+        """Test a full buffer drops old deltas and replays the snapshot first."""
+        bus = EventBus(max_buffer=3)
+        bus.publish("downloads_update", {"total_count": 0}, retain=True)
+        fast, slow = bus.subscribe(max_buffer=100), bus.subscribe()
+
+        for i in range(5):
+            bus.publish("download_progress", {"progress_percent": i})
+
+        assert slow.dropped == 3
+        events = [await slow.get(timeout=1) for _ in range(4)]
+        assert [event.type for event in events] == [
+            "downloads_update",
+            "download_progress",
+            "download_progress",
+            "download_progress",
+        ]
+        assert [event.data["progress_percent"] for event in events[1:]] == [2, 3, 4]
+        assert fast.dropped == 0
+        assert bus.get_stats()["dropped"] == 3
+
+    async def test_listener_sees_every_event(self) -> None:
+        """Test listeners run on publish even without subscribers."""
+        bus = EventBus()
+        seen: list[str] = []
+        bus.add_listener(lambda event: seen.append(event.type))
+        bus.add_listener(lambda event: 1 / 0)
+
+        bus.publish("scan_progress", {"progress": 50.0})
+
+        assert seen == ["scan_progress"]
+
+
+def _download(progress: float) -> Download:
+    return Download(
+        id=DownloadId.generate(),
+        track_id=TrackId.generate(),
+        status=DownloadStatus.DOWNLOADING,
+        progress_percent=progress,
+    )
+
+
+class TestDownloadBroadcastWorker:
+    """Test DownloadBroadcastWorker snapshot publishing."""
+
+    @asynccontextmanager
+    async def _session_scope(self) -> Any:
+        yield None
+
+    async def test_one_query_for_many_clients_and_refresh_on_change(self) -> None:
+        """Test DB reads don't scale with clients and follow download events."""
+        bus = EventBus()
+        list_active = AsyncMock(side_effect=[[_download(10.0)], [_download(60.0)]])
+        worker = DownloadBroadcastWorker(
+            bus, self._session_scope, min_interval=0.0, refresh_interval=60.0
+        )
+
+        with patch(
+            "soulspot.application.workers.download_broadcast_worker.DownloadRepository"
+        ) as repo_cls:
+            repo_cls.return_value.list_active = list_active
+            await worker.start()
+            try:
+                await asyncio.sleep(0.05)
+                assert list_active.await_count == 0  # nobody listening
+
+                clients = [bus.subscribe() for _ in range(10)]
+                snapshots = [await client.get(timeout=1) for client in clients]
+                assert all(s and s.type == "downloads_update" for s in snapshots)
+                assert list_active.await_count == 1
+
+                # Other job types don't touch the snapshot, downloads do
+                bus.publish("job_update", {"id": "x", "job_type": "library_scan"})
+                bus.publish("job_update", {"id": "y", "job_type": "download"})
+                await asyncio.sleep(0.05)
+                assert list_active.await_count == 2
+
+                events = [await clients[0].get(timeout=1) for _ in range(3)]
+                assert events[-1] is not None
+                assert events[-1].type == "downloads_update"
+                assert events[-1].data["downloads"][0]["progress_percent"] == 60.0
+            finally:
+                await worker.stop()
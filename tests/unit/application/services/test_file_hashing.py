@@ -0,0 +1,61 @@
+"""Unit tests for tiered file hashing."""
+
+import hashlib
+from pathlib import Path
+
+from soulspot.application.services.file_hashing import (
+    QUICK_HASH_ALGORITHM,
+    compute_full_hash,
+    compute_hash,
+    compute_quick_hash,
+)
+
+
+def test_full_hash_matches_hashlib(tmp_path: Path) -> None:
+    """Test the full tier is a plain hash of every byte."""
+    test_file = tmp_path / "a.flac"
+    test_file.write_bytes(b"x" * 300_000)
+
+    assert compute_full_hash(test_file) == hashlib.sha256(b"x" * 300_000).hexdigest()
+
+
+def test_quick_hash_ignores_unsampled_bytes(tmp_path: Path) -> None:
+    """Test the quick tier only samples head/middle/tail blocks."""
+    data = bytearray(1000)
+    file1 = tmp_path / "a.flac"
+    file2 = tmp_path / "b.flac"
+    file1.write_bytes(bytes(data))
+    data[150] = 1  # between the head and middle samples
+    file2.write_bytes(bytes(data))
+
+    assert compute_quick_hash(file1, block_size=100) == compute_quick_hash(
+        file2, block_size=100
+    )
+    assert compute_full_hash(file1) != compute_full_hash(file2)
+
+
+def test_quick_hash_detects_sampled_and_size_changes(tmp_path: Path) -> None:
+    """Test edits in a sampled block or a different size change the fingerprint."""
+    file1 = tmp_path / "a.flac"
+    file2 = tmp_path / "b.flac"
+    file3 = tmp_path / "c.flac"
+    file1.write_bytes(bytes(1000))
+    file2.write_bytes(bytes(999) + b"\x01")  # tail block
+    file3.write_bytes(bytes(1001))
+
+    quick = compute_quick_hash(file1, block_size=100)
+    assert compute_quick_hash(file2, block_size=100) != quick
+    assert compute_quick_hash(file3, block_size=100) != quick
+
+
+def test_compute_hash_reports_tier(tmp_path: Path) -> None:
+    """Test compute_hash returns the algorithm to store alongside the value."""
+    test_file = tmp_path / "a.mp3"
+    test_file.write_bytes(b"audio")
+
+    _, quick_algorithm = compute_hash(test_file, "quick")
+    full_hash, full_algorithm = compute_hash(test_file, "full")
+
+    assert quick_algorithm == QUICK_HASH_ALGORITHM
+    assert full_algorithm == "sha256"
+    assert full_hash == hashlib.sha256(b"audio").hexdigest()
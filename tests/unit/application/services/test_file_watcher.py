@@ -0,0 +1,122 @@
+"""Unit tests for the debounced filesystem watcher."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+from watchfiles import Change
+
+from soulspot.application.services import file_watcher as file_watcher_module
+from soulspot.application.services.file_watcher import (
+    ChangeBatch,
+    FilesystemWatcher,
+    coalesce_changes,
+)
+
+EXTENSIONS = {".mp3", ".flac"}
+
+
+def test_coalesce_changes_uses_disk_state(tmp_path: Path) -> None:
+    """Test events collapse to one kind per path based on what exists now."""
+    kept = tmp_path / "song.mp3"
+    kept.write_bytes(b"x")
+    album = tmp_path / "album"
+    album.mkdir()
+    (tmp_path / "cover.jpg").write_bytes(b"x")
+
+    changes = coalesce_changes(
+        [
+            (Change.added, str(kept)),
+            (Change.modified, str(kept)),
+            (Change.added, str(tmp_path / "gone.mp3")),
+            (Change.deleted, str(tmp_path / "gone.mp3")),
+            (Change.added, str(album)),
+            (Change.modified, str(tmp_path / "cover.jpg")),
+        ],
+        EXTENSIONS,
+    )
+
+    assert changes == {
+        kept: "added",
+        tmp_path / "gone.mp3": "deleted",
+        album: "added",
+    }
+
+
+def test_change_batch_split() -> None:
+    """Test updated/deleted views of a batch."""
+    batch = ChangeBatch(
+        root=Path("/music"),
+        changes={
+            Path("/music/b.mp3"): "modified",
+            Path("/music/a.mp3"): "added",
+            Path("/music/c.mp3"): "deleted",
+        },
+    )
+
+    assert batch.updated == [Path("/music/a.mp3"), Path("/music/b.mp3")]
+    assert batch.deleted == [Path("/music/c.mp3")]
+
+
+async def _next_batch(
+    watcher: FilesystemWatcher, root: Path, action: Any
+) -> ChangeBatch:
+    """Start the watcher, run action and return the first batch for root."""
+    batches: asyncio.Queue[ChangeBatch] = asyncio.Queue()
+
+    async def on_changes(batch: ChangeBatch) -> None:
+        await batches.put(batch)
+
+    watcher.subscribe(root, on_changes)
+    await watcher.start()
+    try:
+        await asyncio.sleep(0.3)  # let the backend set up its watches
+        action()
+        return await asyncio.wait_for(batches.get(), timeout=10)
+    finally:
+        await watcher.stop()
+
+
+@pytest.mark.parametrize("mode", ["polling", "auto"])
+async def test_watcher_delivers_batches(tmp_path: Path, mode: str) -> None:
+    """Test new audio files arrive as one debounced batch."""
+    watcher = FilesystemWatcher(
+        mode=mode,  # type: ignore[arg-type]
+        debounce_ms=200,
+        poll_interval_ms=100,
+        extensions=EXTENSIONS,
+    )
+
+    def write_files() -> None:
+        (tmp_path / "one.mp3").write_bytes(b"1")
+        (tmp_path / "notes.txt").write_bytes(b"x")
+
+    batch = await _next_batch(watcher, tmp_path, write_files)
+
+    assert batch.root == tmp_path
+    assert batch.updated == [tmp_path / "one.mp3"]
+    assert not watcher.is_running
+
+
+async def test_auto_mode_falls_back_to_polling(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a failing native watcher is replaced by the polling backend."""
+    calls: list[bool] = []
+    song = tmp_path / "song.mp3"
+
+    async def fake_awatch(*_paths: Path, force_polling: bool, **_kwargs: Any):  # type: ignore[no-untyped-def]
+        calls.append(force_polling)
+        if not force_polling:
+            raise OSError("OS file watch limit reached")
+        await asyncio.sleep(0.5)
+        yield {(Change.added, str(song))}
+
+    monkeypatch.setattr(file_watcher_module, "awatch", fake_awatch)
+    watcher = FilesystemWatcher(mode="auto")
+
+    batch = await _next_batch(watcher, tmp_path, lambda: song.write_bytes(b"x"))
+
+    assert calls[:2] == [False, True]
+    assert batch.updated == [song]
@@ -0,0 +1,105 @@
+"""Unit tests for the indexed fuzzy name resolver."""
+
+import random
+import string
+
+from rapidfuzz import fuzz
+
+from soulspot.application.services.fuzzy_resolver import (
+    FuzzyNameResolver,
+    normalize_name,
+    score_names,
+)
+
+
+class TestFuzzyNameResolver:
+    """Test FuzzyNameResolver lookups."""
+
+    def test_exact_match_is_normalized(self) -> None:
+        """Test exact lookups ignore case and extra whitespace."""
+        resolver = FuzzyNameResolver[int]()
+        resolver.add("Pink Floyd", 1)
+
+        match = resolver.resolve("  pink   FLOYD ")
+
+        assert match is not None
+        assert match.key == 1
+        assert match.exact is True
+
+    def test_fuzzy_match_above_threshold(self) -> None:
+        """Test typos resolve to the closest entry."""
+        resolver = FuzzyNameResolver[int](threshold=85)
+        resolver.add_many([("Massive Attack", 1), ("Portishead", 2)])
+
+        match = resolver.resolve("Massive Atack")
+
+        assert match is not None
+        assert match.key == 1
+        assert match.exact is False
+        assert match.score >= 85
+
+    def test_no_match_below_threshold(self) -> None:
+        """Test unrelated names are not matched."""
+        resolver = FuzzyNameResolver[int](threshold=85)
+        resolver.add("Portishead", 1)
+
+        assert resolver.resolve("Massive Attack") is None
+
+    def test_scopes_are_isolated(self) -> None:
+        """Test entries only match within their scope."""
+        resolver = FuzzyNameResolver[str]()
+        resolver.add("Dummy", "album-a", scope="artist-1")
+
+        assert resolver.resolve("Dummy", scope="artist-2") is None
+        assert resolver.resolve("Dummy", scope="artist-1").key == "album-a"
+
+    def test_incremental_add(self) -> None:
+        """Test names added after lookups are found immediately."""
+        resolver = FuzzyNameResolver[int]()
+        assert resolver.resolve("Björk") is None
+
+        resolver.add("Björk", 7)
+
+        assert resolver.resolve("Björk").key == 7
+        assert len(resolver) == 1
+
+    def test_blocking_matches_brute_force(self) -> None:
+        """Test candidate blocking never drops a match a full scan would find."""
+        rng = random.Random(42)
+        alphabet = string.ascii_lowercase + " "
+        names = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(2, 20)))
+            for _ in range(500)
+        ]
+        resolver = FuzzyNameResolver[int](threshold=80)
+        for i, name in enumerate(names):
+            resolver.add(name, i)
+
+        for _ in range(300):
+            query = list(rng.choice(names))
+            for _ in range(rng.randint(0, 3)):
+                query.insert(rng.randint(0, len(query)), rng.choice(alphabet))
+                if len(query) > 2:
+                    query.pop(rng.randint(0, len(query) - 1))
+            normalized = normalize_name("".join(query))
+            if not normalized:
+                continue
+
+            best = max(fuzz.ratio(normalized, normalize_name(n)) for n in names)
+            match = resolver.resolve(normalized)
+
+            if best >= 80:
+                assert match is not None
+                assert match.score == best
+            else:
+                assert match is None
+
+
+def test_score_names_keeps_order() -> None:
+    """Test batched scoring returns one score per choice in input order."""
+    scores = score_names("Pink Floyd", ["PINK FLOYD", "zzz", "Pink Floy"])
+
+    assert scores[0] == 100.0
+    assert scores[1] == 0.0
+    assert 90 < scores[2] < 100
+    assert score_names("x", []) == []
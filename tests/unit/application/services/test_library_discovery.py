@@ -0,0 +1,170 @@
+"""Unit tests for streaming library discovery."""
+
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from soulspot.application.services.library_discovery import (
+    LibraryDiscovery,
+    list_directory,
+)
+from soulspot.infrastructure.persistence.models import Base
+from soulspot.infrastructure.persistence.repositories import (
+    LibraryFileIndexRepository,
+)
+
+EXTENSIONS = {".mp3", ".flac"}
+
+
+@pytest.fixture
+async def async_session():
+    """Create an async in-memory database session."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_maker = sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with async_session_maker() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def library(tmp_path: Path) -> Path:
+    """Create a small directory tree with audio and non-audio files."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "one.mp3").write_bytes(b"1")
+    (tmp_path / "a" / "b" / "two.FLAC").write_bytes(b"22")
+    (tmp_path / "a" / "cover.jpg").write_bytes(b"x")
+    (tmp_path / "three.mp3").write_bytes(b"333")
+    return tmp_path
+
+
+async def _discover(
+    repo: LibraryFileIndexRepository, root: Path, incremental: bool = True
+) -> tuple[LibraryDiscovery, list[str]]:
+    """Run discovery and persist every fingerprint (like the scanner writer does)."""
+    discovery = LibraryDiscovery(repo, EXTENSIONS)
+    changed: list[str] = []
+    async for found in discovery.iter_directories(root, incremental=incremental):
+        changed.extend(f.path for f in found.changed_files)
+        await repo.upsert_many(
+            [f.as_row() for f in found.changed_files] + [found.fingerprint.as_row()]
+        )
+    return discovery, changed
+
+
+def test_list_directory_filters_extensions(library: Path) -> None:
+    """Test only audio files are listed and subdirectories are returned."""
+    listing = list_directory(str(library / "a"), EXTENSIONS)
+
+    assert [os.path.basename(p) for p, _ in listing.files] == ["one.mp3"]
+    assert [os.path.basename(p) for p, _ in listing.subdirs] == ["b"]
+
+
+async def test_first_run_reports_everything(
+    async_session: AsyncSession, library: Path
+) -> None:
+    """Test an empty index reports every audio file as changed."""
+    repo = LibraryFileIndexRepository(async_session)
+
+    discovery, changed = await _discover(repo, library)
+
+    assert len(changed) == 3
+    assert discovery.total_files == 3
+    assert await repo.count_files() == 3
+
+
+async def test_second_run_skips_unchanged_directories(
+    async_session: AsyncSession, library: Path
+) -> None:
+    """Test unchanged directories are skipped without per-file stat."""
+    repo = LibraryFileIndexRepository(async_session)
+    await _discover(repo, library)
+
+    discovery, changed = await _discover(repo, library)
+
+    assert changed == []
+    assert discovery.unchanged_files == 3
+    assert discovery.skipped_directories == 3
+
+
+async def test_modified_and_removed_files(
+    async_session: AsyncSession, library: Path
+) -> None:
+    """Test modified files are reported and vanished ones pruned from the index."""
+    repo = LibraryFileIndexRepository(async_session)
+    await _discover(repo, library)
+
+    # Taggers usually write a temp file and rename it over the original
+    (library / "three.tmp").write_bytes(b"changed content")
+    os.replace(library / "three.tmp", library / "three.mp3")
+    (library / "a" / "one.mp3").unlink()
+
+    discovery, changed = await _discover(repo, library)
+
+    assert changed == [str(library / "three.mp3")]
+    assert discovery.removed_entries == 1
+    assert await repo.get(str(library / "a" / "one.mp3")) is None
+    assert await repo.count_files() == 2
+
+
+async def test_iter_paths_only_looks_at_given_paths(
+    async_session: AsyncSession, library: Path
+) -> None:
+    """Test watcher-driven discovery handles new, deleted and moved-in paths."""
+    repo = LibraryFileIndexRepository(async_session)
+    await _discover(repo, library)
+
+    (library / "a" / "new.mp3").write_bytes(b"new")
+    (library / "three.mp3").unlink()
+    (library / "moved" / "cd1").mkdir(parents=True)
+    (library / "moved" / "cd1" / "t.flac").write_bytes(b"t")
+
+    discovery = LibraryDiscovery(repo, EXTENSIONS)
+    changed: list[str] = []
+    fingerprints = []
+    async for found in discovery.iter_paths(
+        [
+            library / "a" / "new.mp3",
+            library / "a" / "one.mp3",
+            library / "three.mp3",
+            library / "moved",
+        ]
+    ):
+        changed.extend(os.path.basename(f.path) for f in found.changed_files)
+        fingerprints.append(found.fingerprint)
+
+    assert sorted(changed) == ["new.mp3", "t.flac"]
+    assert discovery.unchanged_files == 1  # one.mp3
+    assert discovery.removed_entries == 1  # three.mp3
+    assert await repo.get(str(library / "three.mp3")) is None
+    # Parents of individually reported files are not marked clean
+    assert None in fingerprints
+
+
+async def test_resume_after_skips_committed_directories(
+    async_session: AsyncSession, library: Path
+) -> None:
+    """Test a resumed walk continues after the checkpoint directory."""
+    repo = LibraryFileIndexRepository(async_session)
+    discovery = LibraryDiscovery(repo, EXTENSIONS)
+
+    changed: list[str] = []
+    visited: list[str] = []
+    async for found in discovery.iter_directories(
+        library, incremental=False, resume_after=str(library / "a")
+    ):
+        visited.append(found.fingerprint.path)
+        changed.extend(os.path.basename(f.path) for f in found.changed_files)
+
+    # root and a/ were committed before the restart - only a/b is left
+    assert visited == [str(library / "a" / "b")]
+    assert changed == ["two.FLAC"]
+    assert discovery.resumed_directories == 2
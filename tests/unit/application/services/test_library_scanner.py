@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from soulspot.application.services.file_hashing import QUICK_HASH_ALGORITHM
 from soulspot.application.services.library_scanner import (
     FileInfo,
     LibraryScannerService,
@@ -282,3 +283,42 @@ class TestLibraryScannerService:
         assert len(result) == 1
         assert result[0].path == Path("/path/file2.mp3")
         assert result[0].is_valid is False
+
+    def test_scan_file_stores_quick_tier(
+        self, scanner_service: LibraryScannerService, tmp_path: Path
+    ) -> None:
+        """Test scan_file records the quick hash tier by default."""
+        test_file = tmp_path / "test.mp3"
+        test_file.write_bytes(b"fake audio")
+
+        file_info = scanner_service.scan_file(test_file)
+
+        assert file_info.hash_algorithm == QUICK_HASH_ALGORITHM
+        assert file_info.hash_value
+
+    def test_detect_duplicates_confirms_quick_collisions(
+        self, scanner_service: LibraryScannerService, tmp_path: Path
+    ) -> None:
+        """Test quick collisions are resolved with a lazily computed full hash."""
+        same1 = tmp_path / "same1.mp3"
+        same2 = tmp_path / "same2.mp3"
+        other = tmp_path / "other.mp3"
+        same1.write_bytes(b"identical")
+        same2.write_bytes(b"identical")
+        other.write_bytes(b"differs!!")
+        infos = [
+            FileInfo(
+                path=path,
+                size=9,
+                hash_value="quickcollision",
+                hash_algorithm=QUICK_HASH_ALGORITHM,
+            )
+            for path in (same1, same2, other)
+        ]
+
+        result = scanner_service.detect_duplicates(infos)
+
+        full_hash = scanner_service.calculate_file_hash(same1)
+        assert list(result) == [full_hash]
+        assert {f.path for f in result[full_hash]} == {same1, same2}
+        assert all(f.hash_algorithm == "sha256" for f in infos)
@@ -0,0 +1,296 @@
+"""Unit tests for the library import scanner (staged scan pipeline)."""
+
+import hashlib
+import wave
+from pathlib import Path
+
+import pytest
+from mutagen.id3 import TALB, TIT2, TPE1
+from mutagen.wave import WAVE
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from soulspot.application.services.file_hashing import QUICK_HASH_ALGORITHM
+from soulspot.application.services.library_scanner_service import (
+    LibraryScannerService,
+    read_audio_file,
+)
+from soulspot.config import Settings
+from soulspot.infrastructure.persistence.models import (
+    ArtistModel,
+    Base,
+    LibraryScanModel,
+    TrackModel,
+)
+from soulspot.infrastructure.persistence.repositories import LibraryScanRepository
+
+
+def _write_wav(path: Path, title: str, artist: str, album: str) -> None:
+    """Write a tiny valid WAV file with ID3 tags."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(8000)
+        w.writeframes(b"\x00\x00" * 800)
+    audio = WAVE(path)
+    audio.add_tags()
+    audio.tags.add(TIT2(encoding=3, text=title))
+    audio.tags.add(TPE1(encoding=3, text=artist))
+    audio.tags.add(TALB(encoding=3, text=album))
+    audio.save()
+
+
+@pytest.fixture
+async def async_session():
+    """Create an async in-memory database session."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_maker = sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with async_session_maker() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def music_dir(tmp_path: Path) -> Path:
+    """Create a small music library."""
+    music = tmp_path / "music"
+    for i in range(5):
+        _write_wav(
+            music / "Portishead" / f"{i:02d}.wav", f"Song {i}", "Portishead", "One"
+        )
+    for i in range(3):
+        _write_wav(
+            music / "Massive Attack" / f"{i:02d}.wav",
+            f"Tune {i}",
+            "Massive Attack",
+            "Two",
+        )
+    (music / "Massive Attack" / "broken.mp3").write_bytes(b"not audio")
+    return music
+
+
+def _settings(music_dir: Path, **library: object) -> Settings:
+    return Settings(
+        storage={"music_path": music_dir},
+        library={
+            "scan_workers": 2,
+            "scan_queue_size": 2,
+            "scan_batch_size": 3,
+            **library,
+        },
+    )
+
+
+class TestReadAudioFile:
+    """Test the pool-side read stage."""
+
+    def test_reads_tags_and_hash(self, music_dir: Path) -> None:
+        """Test metadata and hash are produced in one call."""
+        scanned = read_audio_file(music_dir / "Portishead" / "00.wav")
+
+        assert scanned.error is None
+        assert scanned.metadata is not None
+        assert scanned.metadata["artist"] == "Portishead"
+        assert scanned.file_hash is not None
+        assert scanned.hash_algorithm == QUICK_HASH_ALGORITHM
+        assert scanned.size > 0
+
+    def test_full_hash_mode(self, music_dir: Path) -> None:
+        """Test the full tier hashes every byte with SHA256."""
+        path = music_dir / "Portishead" / "00.wav"
+        scanned = read_audio_file(path, hash_mode="full")
+
+        assert scanned.hash_algorithm == "sha256"
+        assert scanned.file_hash == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_returns_error_instead_of_raising(self, music_dir: Path) -> None:
+        """Test unreadable files produce an error result."""
+        scanned = read_audio_file(music_dir / "Massive Attack" / "broken.mp3")
+
+        assert scanned.error is not None
+        assert scanned.metadata is None
+
+
+class TestScanPipeline:
+    """Test LibraryScannerService.scan_library pipeline."""
+
+    async def test_full_scan_imports_all_files(
+        self, async_session: AsyncSession, music_dir: Path
+    ) -> None:
+        """Test full scan imports every readable file and reports errors."""
+        service = LibraryScannerService(async_session, _settings(music_dir))
+        progress: list[float] = []
+
+        async def on_progress(value: float, _stats: dict) -> None:
+            progress.append(value)
+
+        stats = await service.scan_library(
+            incremental=False, progress_callback=on_progress
+        )
+
+        assert stats["total_files"] == 9
+        assert stats["new_tracks"] == 8
+        assert stats["new_artists"] == 2
+        assert stats["new_albums"] == 2
+        assert stats["errors"] == 1
+        assert progress[-1] == pytest.approx(100.0)
+
+        track_count = await async_session.scalar(select(func.count(TrackModel.id)))
+        artist_count = await async_session.scalar(select(func.count(ArtistModel.id)))
+        assert track_count == 8
+        assert artist_count == 2
+
+    async def test_rescan_touches_known_files(
+        self, async_session: AsyncSession, music_dir: Path
+    ) -> None:
+        """Test a second full scan does not re-import existing tracks."""
+        service = LibraryScannerService(async_session, _settings(music_dir))
+        await service.scan_library(incremental=False)
+
+        stats = await LibraryScannerService(
+            async_session, _settings(music_dir)
+        ).scan_library(incremental=False)
+
+        assert stats["new_tracks"] == 0
+        assert stats["imported"] == 8
+        track_count = await async_session.scalar(select(func.count(TrackModel.id)))
+        assert track_count == 8
+
+    async def test_process_executor(
+        self, async_session: AsyncSession, music_dir: Path
+    ) -> None:
+        """Test the read stage also works in a process pool."""
+        service = LibraryScannerService(
+            async_session, _settings(music_dir, scan_executor="process")
+        )
+
+        stats = await service.scan_library(incremental=False)
+
+        assert stats["new_tracks"] == 8
+
+    async def test_incremental_rescan_skips_unchanged(
+        self, async_session: AsyncSession, music_dir: Path
+    ) -> None:
+        """Test an unchanged library is skipped via the fingerprint index."""
+        await LibraryScannerService(async_session, _settings(music_dir)).scan_library()
+
+        stats = await LibraryScannerService(
+            async_session, _settings(music_dir)
+        ).scan_library()
+
+        # broken.mp3 never gets a fingerprint, so it is retried every scan
+        assert stats["total_files"] == 9
+        assert stats["skipped"] == 8
+        assert stats["scanned"] == 0
+        assert stats["errors"] == 1
+
+    async def test_incremental_rescan_picks_up_new_files(
+        self, async_session: AsyncSession, music_dir: Path
+    ) -> None:
+        """Test new files in a known directory are imported on rescan."""
+        await LibraryScannerService(async_session, _settings(music_dir)).scan_library()
+        _write_wav(music_dir / "Portishead" / "05.wav", "Song 5", "Portishead", "One")
+
+        stats = await LibraryScannerService(
+            async_session, _settings(music_dir)
+        ).scan_library()
+
+        assert stats["new_tracks"] == 1
+        assert stats["skipped"] == 8
+        track_count = await async_session.scalar(select(func.count(TrackModel.id)))
+        assert track_count == 9
+
+    async def test_scan_paths_indexes_only_changed_files(
+        self, async_session: AsyncSession, music_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test watcher batches import just the reported paths."""
+        await LibraryScannerService(async_session, _settings(music_dir)).scan_library()
+        new_file = music_dir / "Portishead" / "05.wav"
+        _write_wav(new_file, "Song 5", "Portishead", "One")
+        outside = tmp_path / "elsewhere.wav"
+        _write_wav(outside, "Nope", "Nobody", "None")
+
+        stats = await LibraryScannerService(
+            async_session, _settings(music_dir)
+        ).scan_paths([new_file, outside])
+
+        assert stats["new_tracks"] == 1
+        assert stats["total_files"] == 1
+        track_count = await async_session.scalar(select(func.count(TrackModel.id)))
+        assert track_count == 9
+
+
+class TestResumableScan:
+    """Test checkpointed scans in library_scans."""
+
+    async def test_failed_scan_resumes_from_checkpoint(
+        self,
+        async_session: AsyncSession,
+        music_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a crashed scan keeps its checkpoint and the next scan continues."""
+        from soulspot.application.services import library_scanner_service
+
+        real_read = library_scanner_service.read_audio_file
+
+        def crashing_read(path: Path, *args: object) -> object:
+            if path.parent.name == "Portishead" and path.name == "03.wav":
+                raise OSError("disk went away")
+            return real_read(path, *args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(library_scanner_service, "read_audio_file", crashing_read)
+        failed = await LibraryScannerService(
+            async_session, _settings(music_dir, scan_workers=1)
+        ).scan_library(incremental=False)
+
+        assert "error" in failed
+        scan = await async_session.get(LibraryScanModel, failed["scan_id"])
+        assert scan is not None
+        await async_session.refresh(scan)
+        assert scan.status == "failed"
+        assert scan.checkpoint["cursor"] == str(music_dir / "Massive Attack")
+
+        monkeypatch.setattr(library_scanner_service, "read_audio_file", real_read)
+        stats = await LibraryScannerService(
+            async_session, _settings(music_dir)
+        ).scan_library(incremental=False)
+
+        assert stats["scan_id"] == failed["scan_id"]
+        assert stats["resumed_from"] == str(music_dir / "Massive Attack")
+        assert stats["new_tracks"] == 8
+        track_count = await async_session.scalar(select(func.count(TrackModel.id)))
+        assert track_count == 8
+        await async_session.refresh(scan)
+        assert scan.status == "completed"
+        assert scan.checkpoint is None
+
+    async def test_resume_disabled_starts_fresh(
+        self, async_session: AsyncSession, music_dir: Path
+    ) -> None:
+        """Test resume=False cancels the stale checkpoint."""
+        repo = LibraryScanRepository(async_session)
+        stale_id = await repo.create(
+            str(music_dir),
+            {"cursor": str(music_dir / "Portishead"), "incremental": True, "stats": {}},
+        )
+        await async_session.commit()
+
+        stats = await LibraryScannerService(
+            async_session, _settings(music_dir)
+        ).scan_library(resume=False)
+
+        assert stats["scan_id"] != stale_id
+        assert stats["new_tracks"] == 8
+        stale = await repo.get(stale_id)
+        assert stale is not None
+        await async_session.refresh(stale)
+        assert stale.status == "cancelled"
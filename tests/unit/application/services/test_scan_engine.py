@@ -0,0 +1,145 @@
+"""Unit tests for the single-pass scan engine."""
+
+import builtins
+import hashlib
+import struct
+import wave
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from mutagen.flac import FLAC
+from mutagen.id3 import TALB, TIT2, TPE1, TPE2, TRCK
+from mutagen.wave import WAVE
+
+from soulspot.application.services.file_hashing import (
+    QUICK_HASH_ALGORITHM,
+    compute_quick_hash,
+)
+from soulspot.application.services.scan_engine import scan_audio_file
+
+
+def _write_wav(path: Path, frames: int = 800) -> None:
+    """Write a tiny valid WAV file with ID3 tags."""
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(8000)
+        w.writeframes(b"\x00\x00" * frames)
+    audio = WAVE(path)
+    audio.add_tags()
+    audio.tags.add(TIT2(encoding=3, text="Roads"))
+    audio.tags.add(TPE1(encoding=3, text="Portishead"))
+    audio.tags.add(TPE2(encoding=3, text="Various Artists"))
+    audio.tags.add(TALB(encoding=3, text="Dummy"))
+    audio.tags.add(TRCK(encoding=3, text="3/11"))
+    audio.save()
+
+
+def _write_flac(path: Path) -> None:
+    """Write a minimal FLAC stream (STREAMINFO only) with Vorbis comments."""
+    # 44.1 kHz, stereo, 16 bit, 44100 samples -> 1 second
+    packed = (44100 << 44) | (1 << 41) | (15 << 36) | 44100
+    streaminfo = struct.pack(">HH", 4096, 4096) + b"\x00" * 6
+    streaminfo += packed.to_bytes(8, "big") + b"\x00" * 16
+    path.write_bytes(b"fLaC\x80" + len(streaminfo).to_bytes(3, "big") + streaminfo)
+    audio = FLAC(path)
+    audio["title"] = "Glory Box"
+    audio["albumartist"] = "Portishead"
+    audio["tracknumber"] = "11"
+    audio.save()
+
+
+@pytest.fixture
+def wav_file(tmp_path: Path) -> Path:
+    path = tmp_path / "roads.wav"
+    _write_wav(path)
+    return path
+
+
+class TestScanAudioFile:
+    """Test scan_audio_file()."""
+
+    def test_tags_hash_and_verdict(self, wav_file: Path) -> None:
+        """Test one call yields metadata, quick hash and a valid verdict."""
+        scanned = scan_audio_file(wav_file)
+
+        assert scanned.error is None
+        assert scanned.is_valid
+        assert scanned.size == wav_file.stat().st_size
+        assert scanned.metadata is not None
+        assert scanned.metadata["format"] == "wav"
+        assert scanned.metadata["title"] == "Roads"
+        assert scanned.metadata["album_artist"] == "Various Artists"
+        assert scanned.metadata["track_number"] == 3
+        assert scanned.metadata["duration_ms"] == 100
+        assert scanned.hash_algorithm == QUICK_HASH_ALGORITHM
+        assert scanned.file_hash == compute_quick_hash(wav_file)
+
+    def test_full_hash_mode(self, wav_file: Path) -> None:
+        """Test the full tier hashes every byte after mutagen read the handle."""
+        scanned = scan_audio_file(wav_file, hash_mode="full")
+
+        assert scanned.hash_algorithm == "sha256"
+        assert scanned.file_hash == hashlib.sha256(wav_file.read_bytes()).hexdigest()
+
+    def test_opens_file_once(self, wav_file: Path) -> None:
+        """Test tags, hash and verdict come from a single open()."""
+        real_open = builtins.open
+        opened: list[str] = []
+
+        def counting_open(file, *args, **kwargs):  # type: ignore[no-untyped-def]
+            if str(file) == str(wav_file):
+                opened.append(str(file))
+            return real_open(file, *args, **kwargs)
+
+        with patch("builtins.open", counting_open):
+            scanned = scan_audio_file(wav_file, hash_mode="full")
+
+        assert scanned.is_valid
+        assert len(opened) == 1
+
+    def test_flac_vorbis_comments(self, tmp_path: Path) -> None:
+        """Test Vorbis comments are read (MP4-style keys must not abort extraction)."""
+        path = tmp_path / "glory_box.flac"
+        _write_flac(path)
+
+        scanned = scan_audio_file(path)
+
+        assert scanned.error is None
+        assert scanned.is_valid
+        assert scanned.metadata is not None
+        assert scanned.metadata["title"] == "Glory Box"
+        assert scanned.metadata["album_artist"] == "Portishead"
+        assert scanned.metadata["track_number"] == 11
+
+    def test_unsupported_file_is_broken_but_hashed(self, tmp_path: Path) -> None:
+        """Test non-audio files get a broken verdict and still a hash."""
+        path = tmp_path / "broken.mp3"
+        path.write_bytes(b"not audio")
+
+        scanned = scan_audio_file(path)
+
+        assert not scanned.is_valid
+        assert scanned.metadata is None
+        assert scanned.error is not None
+        assert scanned.file_hash == compute_quick_hash(path)
+
+    def test_zero_length_audio_is_broken(self, tmp_path: Path) -> None:
+        """Test zero-duration audio keeps its metadata but is flagged broken."""
+        path = tmp_path / "empty.wav"
+        _write_wav(path, frames=0)
+
+        scanned = scan_audio_file(path)
+
+        assert scanned.error is None
+        assert scanned.metadata is not None
+        assert scanned.integrity_error == "Invalid audio length"
+
+    def test_missing_file_returns_error(self, tmp_path: Path) -> None:
+        """Test I/O errors are returned instead of raised."""
+        scanned = scan_audio_file(tmp_path / "gone.flac")
+
+        assert scanned.error is not None
+        assert not scanned.is_valid
+        assert scanned.file_hash is None
@@ -0,0 +1,43 @@
+"""Tests for VerifyFileHashesUseCase."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from soulspot.application.services.file_hashing import QUICK_HASH_ALGORITHM
+from soulspot.application.use_cases.scan_library import VerifyFileHashesUseCase
+
+
+def _track(track_id: str, file_path: str | None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=track_id,
+        file_path=file_path,
+        file_hash="quick",
+        file_hash_algorithm=QUICK_HASH_ALGORITHM,
+        last_scanned_at=None,
+    )
+
+
+async def test_tracks_without_file_are_missing(tmp_path: Path) -> None:
+    """Test a track whose file path was cleared is reported missing, not hashed."""
+    audio = tmp_path / "a.flac"
+    audio.write_bytes(b"audio")
+    tracks = [_track("t-1", str(audio)), _track("t-2", None)]
+    session = MagicMock()
+    session.execute = AsyncMock(
+        return_value=MagicMock(
+            scalars=MagicMock(
+                return_value=MagicMock(all=MagicMock(return_value=tracks))
+            )
+        )
+    )
+    session.commit = AsyncMock()
+    scanner = MagicMock(hash_algorithm="sha256")
+    scanner.calculate_file_hash = MagicMock(return_value="full")
+
+    stats = await VerifyFileHashesUseCase(session, scanner).execute(["t-1", "t-2"])
+
+    assert stats["upgraded"] == 1
+    assert stats["missing"] == ["t-2"]
+    scanner.calculate_file_hash.assert_called_once_with(audio)
+    assert tracks[0].file_hash_algorithm == "sha256"
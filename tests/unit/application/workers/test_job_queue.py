@@ -2,11 +2,23 @@
 
 import asyncio
 import contextlib
+import time
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
 
-from soulspot.application.workers.job_queue import Job, JobQueue, JobStatus, JobType
+from soulspot.application.services.event_bus import EventBus
+from soulspot.application.workers.job_queue import (
+    Job,
+    JobQueue,
+    JobStatus,
+    JobStore,
+    JobType,
+    JobTypeScheduler,
+    RetryPolicy,
+    make_dedup_key,
+)
 
 
 class TestJob:
@@ -508,27 +520,15 @@ class TestJobQueue:
         # All jobs should be processed
         assert processed_count == 3
 
-    async def test_exponential_backoff_retry(
-        self, job_queue: JobQueue, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test exponential backoff retry logic."""
+    async def test_exponential_backoff_retry(self) -> None:
+        """Test failed jobs are retried with exponentially growing delays."""
+        job_queue = JobQueue(
+            max_concurrent_jobs=3, retry_policy=RetryPolicy(base_delay=0.05, jitter=0)
+        )
         attempt_times: list[float] = []
-        sleep_delays: list[float] = []
-
-        # Track sleep calls but don't actually wait
-        original_sleep = asyncio.sleep
-
-        async def mock_sleep(delay: float) -> None:
-            sleep_delays.append(delay)
-            # Small actual delay to allow event loop to process
-            await original_sleep(0.01)
-
-        monkeypatch.setattr("asyncio.sleep", mock_sleep)
 
         async def failing_handler(job: Job) -> None:
-            import time
-
-            attempt_times.append(time.time())
+            attempt_times.append(time.monotonic())
             raise ValueError("Intentional failure")
 
         job_queue.register_handler(JobType.DOWNLOAD, failing_handler)
@@ -538,28 +538,66 @@ class TestJobQueue:
             JobType.DOWNLOAD, {"track_id": "track-123"}, max_retries=3
         )
 
-        # Start workers
         await job_queue.start(num_workers=1)
-
-        # Wait for all retries (using real sleep for test synchronization)
-        await original_sleep(0.5)
-
-        # Stop workers
+        job = await job_queue.wait_for_job(job_id, timeout=5)
         await job_queue.stop()
 
-        # Check job failed after retries
-        job = await job_queue.get_job(job_id)
-        assert job is not None
         assert job.status == JobStatus.FAILED
         assert job.retries == 3
-
-        # Verify exponential backoff delays were calculated correctly
         assert len(attempt_times) == 3
-        # Check that the backoff delays were 1s, 2s (for first two retries)
-        backoff_delays = [d for d in sleep_delays if d in [1.0, 2.0, 4.0]]
-        assert len(backoff_delays) >= 2
-        assert 1.0 in backoff_delays
-        assert 2.0 in backoff_delays
+        # 0.05s before the first retry, 0.1s before the second
+        assert attempt_times[1] - attempt_times[0] >= 0.05
+        assert attempt_times[2] - attempt_times[1] >= 0.1
+
+    async def test_backoff_does_not_block_worker(self) -> None:
+        """Test a job waiting for its retry leaves the worker to other jobs."""
+        job_queue = JobQueue(
+            max_concurrent_jobs=1, retry_policy=RetryPolicy(base_delay=60, jitter=0)
+        )
+
+        async def handler(job: Job) -> str:
+            if job.payload["fail"]:
+                raise ValueError("slskd timeout")
+            return "ok"
+
+        job_queue.register_handler(JobType.DOWNLOAD, handler)
+        failing_id = await job_queue.enqueue(
+            JobType.DOWNLOAD, {"fail": True}, priority=5
+        )
+        ok_id = await job_queue.enqueue(JobType.DOWNLOAD, {"fail": False})
+
+        await job_queue.start(num_workers=1)
+        ok_job = await job_queue.wait_for_job(ok_id, timeout=2)
+        await job_queue.stop()
+
+        failing_job = await job_queue.get_job(failing_id)
+        assert ok_job.status == JobStatus.COMPLETED
+        assert failing_job is not None
+        assert failing_job.status == JobStatus.PENDING
+        assert failing_job.retries == 1
+        assert failing_job.run_after is not None
+        assert job_queue.get_stats()["delayed"] == 1
+
+    async def test_cancel_delayed_job(self) -> None:
+        """Test a job cancelled during its backoff is never run again."""
+        job_queue = JobQueue(retry_policy=RetryPolicy(base_delay=0.05, jitter=0))
+        attempts = 0
+
+        async def handler(job: Job) -> None:
+            nonlocal attempts
+            attempts += 1
+            raise ValueError("boom")
+
+        job_queue.register_handler(JobType.DOWNLOAD, handler)
+        job_id = await job_queue.enqueue(JobType.DOWNLOAD, {})
+        await job_queue.start(num_workers=1)
+        while attempts == 0:
+            await asyncio.sleep(0.01)
+        assert await job_queue.cancel_job(job_id) is True
+        await asyncio.sleep(0.3)
+        await job_queue.stop()
+
+        assert attempts == 1
 
     async def test_set_max_concurrent_jobs(self, job_queue: JobQueue) -> None:
         """Test setting maximum concurrent jobs."""
@@ -627,3 +665,540 @@ class TestJobQueue:
 
         # Verify max concurrent was respected
         assert max_concurrent <= 2
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy."""
+
+    def test_delay_doubles_and_is_capped(self) -> None:
+        """Test 1s, 2s, 4s ... up to max_delay without jitter."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0)
+
+        assert [policy.delay(n) for n in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_stays_in_bounds(self) -> None:
+        """Test jitter spreads delays within +/- the configured fraction."""
+        policy = RetryPolicy(base_delay=10.0, jitter=0.2)
+
+        delays = {policy.delay(1) for _ in range(50)}
+
+        assert all(8.0 <= d <= 12.0 for d in delays)
+        assert len(delays) > 1
+
+    def test_type_cap_limits_retries(self) -> None:
+        """Test a per-type cap overrides a larger job max_retries."""
+        policy = RetryPolicy(max_retries={JobType.LIBRARY_SCAN: 1})
+        scan = Job(id="1", job_type=JobType.LIBRARY_SCAN, payload={}, max_retries=3)
+        download = Job(id="2", job_type=JobType.DOWNLOAD, payload={}, max_retries=3)
+        scan.mark_failed("boom")
+        download.mark_failed("boom")
+
+        assert policy.should_retry(scan) is False
+        assert policy.should_retry(download) is True
+
+
+class TestJobTypeScheduler:
+    """Test per-type limits and weighted fair selection."""
+
+    def test_weights_split_dispatches(self) -> None:
+        """Test a weight-2 type is picked twice as often as a weight-1 type."""
+        scheduler = JobTypeScheduler(weights={JobType.METADATA_ENRICHMENT: 2.0})
+        candidates = [JobType.DOWNLOAD, JobType.METADATA_ENRICHMENT]
+
+        picks = []
+        for _ in range(30):
+            job_type = scheduler.reserve(candidates)
+            assert job_type is not None
+            picks.append(job_type)
+            scheduler.release(job_type)
+
+        assert picks.count(JobType.METADATA_ENRICHMENT) == 20
+        assert picks.count(JobType.DOWNLOAD) == 10
+
+    def test_limit_blocks_type(self) -> None:
+        """Test a type at its limit is skipped and freed by release()."""
+        scheduler = JobTypeScheduler(limits={JobType.LIBRARY_SCAN: 1})
+
+        assert scheduler.reserve([JobType.LIBRARY_SCAN]) == JobType.LIBRARY_SCAN
+        assert scheduler.reserve([JobType.LIBRARY_SCAN]) is None
+        assert scheduler.reserve([JobType.LIBRARY_SCAN, JobType.DOWNLOAD]) == (
+            JobType.DOWNLOAD
+        )
+
+        scheduler.release(JobType.LIBRARY_SCAN)
+        assert scheduler.has_capacity(JobType.LIBRARY_SCAN)
+        assert scheduler.total_running() == 1
+
+    def test_zero_limit_holds_and_none_removes(self) -> None:
+        """Test limit 0 holds a type and None lifts the per-type limit."""
+        scheduler = JobTypeScheduler(limits={JobType.CLEANUP: 0})
+        assert scheduler.reserve([JobType.CLEANUP]) is None
+
+        scheduler.set_limit(JobType.CLEANUP, None)
+        assert scheduler.reserve([JobType.CLEANUP]) == JobType.CLEANUP
+        assert scheduler.get_limit(JobType.CLEANUP) is None
+
+    def test_idle_type_does_not_bank_credit(self) -> None:
+        """Test a type joining late gets its fair share, not a burst."""
+        scheduler = JobTypeScheduler()
+        for _ in range(10):
+            assert scheduler.reserve([JobType.DOWNLOAD]) == JobType.DOWNLOAD
+            scheduler.release(JobType.DOWNLOAD)
+
+        picks = []
+        for _ in range(4):
+            job_type = scheduler.reserve([JobType.DOWNLOAD, JobType.PLAYLIST_SYNC])
+            assert job_type is not None
+            picks.append(job_type)
+            scheduler.release(job_type)
+
+        assert picks.count(JobType.PLAYLIST_SYNC) == 2
+
+    def test_invalid_values_rejected(self) -> None:
+        """Test negative limits and non-positive weights raise ValueError."""
+        scheduler = JobTypeScheduler()
+        with pytest.raises(ValueError):
+            scheduler.set_limit(JobType.DOWNLOAD, -1)
+        with pytest.raises(ValueError):
+            scheduler.set_weight(JobType.DOWNLOAD, 0)
+
+
+class TestJobQueueFairScheduling:
+    """Test per-type concurrency and fairness in the worker loop."""
+
+    async def test_type_limit_respected(self) -> None:
+        """Test a type never runs more jobs than its limit."""
+        job_queue = JobQueue(max_concurrent_jobs=4, type_limits={JobType.DOWNLOAD: 2})
+        running = 0
+        peak = 0
+
+        async def handler(job: Job) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+
+        job_queue.register_handler(JobType.DOWNLOAD, handler)
+        job_ids = [await job_queue.enqueue(JobType.DOWNLOAD, {}) for _ in range(6)]
+
+        await job_queue.start(num_workers=4)
+        for job_id in job_ids:
+            await job_queue.wait_for_job(job_id, timeout=5)
+        await job_queue.stop()
+
+        assert peak == 2
+
+    async def test_short_jobs_flow_during_long_jobs(self) -> None:
+        """Test enrichment runs while a scan and a download flood hold slots."""
+        job_queue = JobQueue(
+            max_concurrent_jobs=3,
+            type_limits={JobType.LIBRARY_SCAN: 1, JobType.DOWNLOAD: 1},
+        )
+        release = asyncio.Event()
+
+        async def blocking(job: Job) -> None:
+            await release.wait()
+
+        async def quick(job: Job) -> str:
+            return "done"
+
+        job_queue.register_handler(JobType.LIBRARY_SCAN, blocking)
+        job_queue.register_handler(JobType.DOWNLOAD, blocking)
+        job_queue.register_handler(JobType.METADATA_ENRICHMENT, quick)
+
+        await job_queue.enqueue(JobType.LIBRARY_SCAN, {})
+        for _ in range(20):
+            await job_queue.enqueue(JobType.DOWNLOAD, {}, priority=10)
+        enrichment_ids = [
+            await job_queue.enqueue(JobType.METADATA_ENRICHMENT, {}) for _ in range(3)
+        ]
+
+        await job_queue.start(num_workers=3)
+        try:
+            for job_id in enrichment_ids:
+                job = await job_queue.wait_for_job(job_id, timeout=5)
+                assert job.status == JobStatus.COMPLETED
+        finally:
+            release.set()
+            await job_queue.stop()
+
+    async def test_runtime_limit_change(self) -> None:
+        """Test set_type_limit() applies to the next dispatch."""
+        job_queue = JobQueue(max_concurrent_jobs=2)
+        job_queue.set_type_limit(JobType.CLEANUP, 0)
+
+        async def handler(job: Job) -> None:
+            return None
+
+        job_queue.register_handler(JobType.CLEANUP, handler)
+        job_id = await job_queue.enqueue(JobType.CLEANUP, {})
+        await job_queue.start(num_workers=1)
+        await asyncio.sleep(0.2)
+        job = await job_queue.get_job(job_id)
+        assert job is not None
+        assert job.status == JobStatus.PENDING
+
+        job_queue.set_type_limit(JobType.CLEANUP, 1)
+        job = await job_queue.wait_for_job(job_id, timeout=5)
+        await job_queue.stop()
+
+        assert job.status == JobStatus.COMPLETED
+        stats = job_queue.get_scheduling_stats()
+        assert stats["job_types"]["cleanup"]["max_concurrent"] == 1
+        assert stats["job_types"]["cleanup"]["pending"] == 0
+
+
+def _job(job_id: str, job_type: JobType = JobType.DOWNLOAD) -> Job:
+    return Job(id=job_id, job_type=job_type, payload={})
+
+
+class TestJobStore:
+    """Test JobStore indexes and bounded history."""
+
+    def test_query_uses_current_status_newest_first(self) -> None:
+        """Test status changes move jobs between indexes, order stays by creation."""
+        store = JobStore()
+        jobs = [_job(f"d{i}") for i in range(4)] + [_job("s0", JobType.LIBRARY_SCAN)]
+        for job in jobs:
+            store.add(job)
+
+        for job in (jobs[0], jobs[2], jobs[4]):
+            job.mark_running()
+            store.update(job)
+
+        running = store.query(status=JobStatus.RUNNING)
+        assert [j.id for j in running] == ["s0", "d2", "d0"]
+        running_downloads = store.query(
+            status=JobStatus.RUNNING, job_type=JobType.DOWNLOAD, limit=1
+        )
+        assert [j.id for j in running_downloads] == ["d2"]
+        assert [j.id for j in store.query(status=JobStatus.PENDING)] == ["d3", "d1"]
+        assert store.count(JobStatus.RUNNING) == 3
+        assert len(store.query(limit=2)) == 2
+
+    def test_history_size_evicts_oldest_finished(self) -> None:
+        """Test only history_size finished jobs are kept, active jobs never evicted."""
+        store = JobStore(history_size=2)
+        active = _job("active")
+        store.add(active)
+        for i in range(4):
+            job = _job(f"done{i}")
+            store.add(job)
+            job.mark_completed()
+            store.update(job)
+
+        assert len(store) == 3
+        assert "active" in store
+        assert store.get("done0") is None
+        assert [j.id for j in store.query(status=JobStatus.COMPLETED)] == [
+            "done3",
+            "done2",
+        ]
+        assert [j.id for j in store.query(job_type=JobType.DOWNLOAD)] == [
+            "done3",
+            "done2",
+            "active",
+        ]
+
+    def test_history_retention_evicts_old_jobs(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test finished jobs older than the retention window are evicted."""
+        clock = [100.0]
+        monkeypatch.setattr(
+            "soulspot.application.workers.job_queue.time.monotonic", lambda: clock[0]
+        )
+        store = JobStore(history_retention=60)
+        old, new = _job("old"), _job("new")
+        for job in (old, new):
+            store.add(job)
+        old.mark_failed("boom")
+        store.update(old)
+
+        clock[0] = 200.0
+        new.mark_completed()
+        store.update(new)
+
+        assert store.get("old") is None
+        assert store.get("new") is new
+        assert store.count(JobStatus.FAILED) == 0
+
+
+class TestJobDeduplication:
+    """Test enqueue() coalescing by dedup_key."""
+
+    async def test_same_key_returns_active_job(self) -> None:
+        """Test a second enqueue with the same key creates no new job."""
+        job_queue = JobQueue()
+        key = make_dedup_key(JobType.DOWNLOAD, "track-1")
+
+        first = await job_queue.enqueue(JobType.DOWNLOAD, {}, dedup_key=key)
+        second = await job_queue.enqueue(JobType.DOWNLOAD, {}, dedup_key=key)
+        other = await job_queue.enqueue(
+            JobType.DOWNLOAD, {}, dedup_key=make_dedup_key(JobType.DOWNLOAD, "t-2")
+        )
+
+        assert key == "download:track-1"
+        assert second == first
+        assert other != first
+        assert job_queue.get_stats()["total_jobs"] == 2
+
+    async def test_coalesced_enqueue_raises_priority(self) -> None:
+        """Test a higher-priority duplicate moves the waiting job ahead."""
+        job_queue = JobQueue(max_concurrent_jobs=1)
+        processed: list[str] = []
+
+        async def handler(job: Job) -> None:
+            processed.append(job.id)
+
+        job_queue.register_handler(JobType.DOWNLOAD, handler)
+        first = await job_queue.enqueue(JobType.DOWNLOAD, {}, priority=5)
+        automated = await job_queue.enqueue(JobType.DOWNLOAD, {}, dedup_key="dl:x")
+        assert (
+            await job_queue.enqueue(JobType.DOWNLOAD, {}, priority=10, dedup_key="dl:x")
+            == automated
+        )
+        assert (
+            await job_queue.enqueue(JobType.DOWNLOAD, {}, priority=1, dedup_key="dl:x")
+            == automated
+        )
+
+        await job_queue.start(num_workers=1)
+        await job_queue.wait_for_job(first, timeout=5)
+        await job_queue.stop()
+
+        job = await job_queue.get_job(automated)
+        assert job is not None
+        assert job.priority == 10
+        assert processed == [automated, first]
+
+    async def test_key_reusable_after_finish_or_cancel(self) -> None:
+        """Test a finished or cancelled job no longer blocks its key."""
+        job_queue = JobQueue()
+
+        async def handler(job: Job) -> None:
+            return None
+
+        job_queue.register_handler(JobType.PLAYLIST_SYNC, handler)
+        first = await job_queue.enqueue(JobType.PLAYLIST_SYNC, {}, dedup_key="p")
+        await job_queue.start(num_workers=1)
+        await job_queue.wait_for_job(first, timeout=5)
+        await job_queue.stop()
+
+        second = await job_queue.enqueue(JobType.PLAYLIST_SYNC, {}, dedup_key="p")
+        assert second != first
+        await job_queue.cancel_job(second)
+        third = await job_queue.enqueue(JobType.PLAYLIST_SYNC, {}, dedup_key="p")
+        assert third not in (first, second)
+
+
+class TestBatchHandlers:
+    """Test register_batch_handler() dispatch."""
+
+    async def test_batch_gets_ready_jobs_and_per_job_results(self) -> None:
+        """Test one call drains the ready jobs; an Exception result fails one job."""
+        job_queue = JobQueue()
+        calls: list[list[str]] = []
+
+        async def handler(jobs: list[Job]) -> list[Any]:
+            calls.append([job.payload["n"] for job in jobs])
+            return [
+                ValueError("bad") if job.payload["n"] == "b" else job.payload["n"]
+                for job in jobs
+            ]
+
+        job_queue.register_batch_handler(
+            JobType.METADATA_ENRICHMENT, handler, max_batch_size=2
+        )
+        ids = [
+            await job_queue.enqueue(
+                JobType.METADATA_ENRICHMENT, {"n": n}, max_retries=1
+            )
+            for n in ("a", "b", "c")
+        ]
+
+        await job_queue.start(num_workers=1)
+        jobs = [await job_queue.wait_for_job(job_id, timeout=5) for job_id in ids]
+        await job_queue.stop()
+
+        assert calls == [["a", "b"], ["c"]]
+        assert [job.status for job in jobs] == [
+            JobStatus.COMPLETED,
+            JobStatus.FAILED,
+            JobStatus.COMPLETED,
+        ]
+        assert jobs[0].result == "a"
+        assert jobs[1].error == "bad"
+
+    async def test_linger_collects_late_jobs(self) -> None:
+        """Test max_wait lets jobs enqueued shortly after join the batch."""
+        job_queue = JobQueue()
+        sizes: list[int] = []
+
+        async def handler(jobs: list[Job]) -> list[Any]:
+            sizes.append(len(jobs))
+            return [None] * len(jobs)
+
+        job_queue.register_batch_handler(
+            JobType.PLAYLIST_SYNC, handler, max_batch_size=10, max_wait=0.3
+        )
+        await job_queue.start(num_workers=1)
+        first = await job_queue.enqueue(JobType.PLAYLIST_SYNC, {})
+        await asyncio.sleep(0.15)
+        second = await job_queue.enqueue(JobType.PLAYLIST_SYNC, {})
+        await job_queue.wait_for_job(first, timeout=5)
+        await job_queue.wait_for_job(second, timeout=5)
+        await job_queue.stop()
+
+        assert sizes == [2]
+
+    async def test_handler_error_fails_whole_batch(self) -> None:
+        """Test a raising handler or a short result list fails every job."""
+        job_queue = JobQueue()
+
+        async def handler(jobs: list[Job]) -> list[Any]:
+            return []
+
+        job_queue.register_batch_handler(JobType.PLAYLIST_SYNC, handler)
+        ids = [
+            await job_queue.enqueue(JobType.PLAYLIST_SYNC, {}, max_retries=1)
+            for _ in range(2)
+        ]
+
+        await job_queue.start(num_workers=1)
+        jobs = [await job_queue.wait_for_job(job_id, timeout=5) for job_id in ids]
+        await job_queue.stop()
+
+        assert all(job.status == JobStatus.FAILED for job in jobs)
+        assert "returned 0 results for 2 jobs" in (jobs[0].error or "")
+
+    def test_register_validates_arguments(self) -> None:
+        """Test invalid batch sizes and linger windows are rejected."""
+        job_queue = JobQueue()
+
+        async def handler(jobs: list[Job]) -> list[Any]:
+            return []
+
+        with pytest.raises(ValueError):
+            job_queue.register_batch_handler(
+                JobType.PLAYLIST_SYNC, handler, max_batch_size=0
+            )
+        with pytest.raises(ValueError):
+            job_queue.register_batch_handler(
+                JobType.PLAYLIST_SYNC, handler, max_wait=-1
+            )
+
+
+class TestEventDrivenDispatch:
+    """Test wakeup-driven worker dispatch and the latency metric."""
+
+    async def test_idle_workers_do_not_poll(self) -> None:
+        """Test idle workers wait instead of checking the queue repeatedly."""
+        job_queue = JobQueue()
+        calls = 0
+        next_job = job_queue._next_job
+
+        def counting_next_job() -> Job | None:
+            nonlocal calls
+            calls += 1
+            return next_job()
+
+        job_queue._next_job = counting_next_job  # type: ignore[method-assign]
+        await job_queue.start(num_workers=2)
+        await asyncio.sleep(0.3)
+        await job_queue.stop()
+
+        assert calls == 2
+
+    async def test_enqueue_starts_job_immediately(self) -> None:
+        """Test a job enqueued on an idle queue starts without polling delay."""
+        job_queue = JobQueue()
+        started = asyncio.Event()
+
+        async def handler(job: Job) -> None:
+            started.set()
+
+        job_queue.register_handler(JobType.DOWNLOAD, handler)
+        await job_queue.start(num_workers=1)
+        await asyncio.sleep(0.01)
+
+        await job_queue.enqueue(JobType.DOWNLOAD, {})
+        await asyncio.wait_for(started.wait(), timeout=0.05)
+        await job_queue.stop()
+
+        latency = job_queue.get_scheduling_stats()["dispatch_latency"]
+        assert latency["count"] == 1
+        assert latency["max_ms"] < 50
+
+    async def test_pause_and_resume_take_effect_immediately(self) -> None:
+        """Test nothing starts while paused and resume wakes the workers."""
+        job_queue = JobQueue()
+        started = asyncio.Event()
+
+        async def handler(job: Job) -> None:
+            started.set()
+
+        job_queue.register_handler(JobType.DOWNLOAD, handler)
+        await job_queue.pause()
+        await job_queue.start(num_workers=1)
+        await job_queue.enqueue(JobType.DOWNLOAD, {})
+        await asyncio.sleep(0.05)
+        assert not started.is_set()
+
+        await job_queue.resume()
+        await asyncio.wait_for(started.wait(), timeout=0.05)
+        await job_queue.stop()
+
+    async def test_freed_slot_wakes_waiting_worker(self) -> None:
+        """Test a worker blocked on the global limit starts as soon as a slot frees."""
+        job_queue = JobQueue(max_concurrent_jobs=1)
+        release = asyncio.Event()
+        second_started = asyncio.Event()
+
+        async def handler(job: Job) -> None:
+            if job.payload["n"] == 1:
+                await release.wait()
+            else:
+                second_started.set()
+
+        job_queue.register_handler(JobType.DOWNLOAD, handler)
+        await job_queue.start(num_workers=2)
+        await job_queue.enqueue(JobType.DOWNLOAD, {"n": 1})
+        await job_queue.enqueue(JobType.DOWNLOAD, {"n": 2})
+        await asyncio.sleep(0.05)
+        assert not second_started.is_set()
+
+        release.set()
+        await asyncio.wait_for(second_started.wait(), timeout=0.05)
+        await job_queue.stop()
+
+    async def test_state_changes_are_published(self) -> None:
+        """Test every job transition reaches the event bus, retries included."""
+        bus = EventBus()
+        job_queue = JobQueue(
+            event_bus=bus, retry_policy=RetryPolicy(base_delay=60, jitter=0)
+        )
+        subscription = bus.subscribe()
+
+        async def handler(job: Job) -> None:
+            raise RuntimeError("slskd down")
+
+        job_queue.register_handler(JobType.DOWNLOAD, handler)
+        await job_queue.start(num_workers=1)
+        job_id = await job_queue.enqueue(JobType.DOWNLOAD, {}, max_retries=2)
+        other_id = await job_queue.enqueue(JobType.LIBRARY_SCAN, {})
+        await job_queue.cancel_job(other_id)
+        await asyncio.sleep(0.05)
+        await job_queue.stop()
+
+        updates = []
+        while (event := await subscription.get(timeout=0.01)) is not None:
+            updates.append((event.data["id"], event.data["status"]))
+        assert updates == [
+            (job_id, "pending"),
+            (other_id, "pending"),
+            (other_id, "cancelled"),
+            (job_id, "running"),
+            (job_id, "pending"),  # failed, retry scheduled
+        ]
@@ -0,0 +1,150 @@
+"""Tests for LibraryScanWorker startup resume and watcher batches."""
+
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from soulspot.application.services.file_watcher import ChangeBatch
+from soulspot.application.workers.job_queue import JobQueue, JobStatus, JobType
+from soulspot.application.workers.library_scan_worker import LibraryScanWorker
+from soulspot.application.workers.persistent_job_queue import PersistentJobQueue
+from soulspot.config.settings import Settings
+from soulspot.infrastructure.persistence.models import Base, LibraryScanModel
+from soulspot.infrastructure.persistence.repositories import BackgroundJobRepository
+
+
+@pytest.fixture
+async def db(tmp_path: Path) -> AsyncGenerator[Any, None]:
+    """File-backed SQLite database exposing session_scope() like Database."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'scans.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def scope() -> AsyncGenerator[AsyncSession, None]:
+        async with factory() as session:
+            yield session
+            await session.commit()
+
+    yield SimpleNamespace(session_scope=scope)
+    await engine.dispose()
+
+
+@pytest.fixture
+def settings() -> Settings:
+    """Create settings for testing."""
+    return Settings()
+
+
+async def _add_running_scan(db: Any, settings: Settings, age: timedelta) -> str:
+    """Store a "running" scan whose last checkpoint is `age` old."""
+    written = datetime.now(UTC) - age
+    async with db.session_scope() as session:
+        session.add(
+            LibraryScanModel(
+                id="scan-1",
+                status="running",
+                scan_path=str(settings.storage.music_path),
+                checkpoint={"incremental": True, "cursor": "A", "stats": {}},
+                started_at=written,
+                updated_at=written,
+            )
+        )
+    return "scan-1"
+
+
+class TestResumeInterruptedScan:
+    """Test LibraryScanWorker.resume_interrupted_scan()."""
+
+    async def test_stale_scan_is_queued_once(self, db: Any, settings: Settings) -> None:
+        """Test an abandoned scan is resumed and repeated calls don't queue twice."""
+        scan_id = await _add_running_scan(db, settings, timedelta(hours=1))
+        queue = JobQueue()
+        worker = LibraryScanWorker(job_queue=queue, db=db, settings=settings)
+
+        first = await worker.resume_interrupted_scan()
+        second = await worker.resume_interrupted_scan()
+
+        assert first is not None
+        assert second == first
+        job = await queue.get_job(first)
+        assert job is not None
+        assert job.payload["scan_id"] == scan_id
+        assert job.payload["resume"] is True
+
+    async def test_recent_checkpoint_is_resumed(
+        self, db: Any, settings: Settings
+    ) -> None:
+        """Test a scan that checkpointed just before the restart is resumed."""
+        scan_id = await _add_running_scan(db, settings, timedelta(seconds=1))
+        queue = JobQueue()
+        worker = LibraryScanWorker(job_queue=queue, db=db, settings=settings)
+
+        job_id = await worker.resume_interrupted_scan()
+
+        assert job_id is not None
+        job = await queue.get_job(job_id)
+        assert job is not None
+        assert job.payload["scan_id"] == scan_id
+
+    async def test_persistent_queue_relies_on_lease_recovery(
+        self, db: Any, settings: Settings
+    ) -> None:
+        """Test nothing is queued when the job row survives in background_jobs."""
+        await _add_running_scan(db, settings, timedelta(hours=1))
+        queue = PersistentJobQueue(db.session_scope)
+        worker = LibraryScanWorker(job_queue=queue, db=db, settings=settings)
+
+        assert await worker.resume_interrupted_scan() is None
+
+
+def _batch(root: Path, *names: str) -> ChangeBatch:
+    return ChangeBatch(root=root, changes={root / name: "added" for name in names})
+
+
+class TestHandleChanges:
+    """Test LibraryScanWorker.handle_changes()."""
+
+    @pytest.mark.parametrize("backend", ["memory", "database"])
+    async def test_batches_merge_into_queued_job(
+        self, db: Any, settings: Settings, tmp_path: Path, backend: str
+    ) -> None:
+        """Test batches arriving while the watcher job waits extend its paths."""
+        queue = (
+            JobQueue() if backend == "memory" else PersistentJobQueue(db.session_scope)
+        )
+        worker = LibraryScanWorker(job_queue=queue, db=db, settings=settings)
+
+        await worker.handle_changes(_batch(tmp_path, "a.flac"))
+        await worker.handle_changes(_batch(tmp_path, "b.flac", "a.flac"))
+
+        jobs = await queue.list_jobs(job_type=JobType.LIBRARY_SCAN)
+        assert len(jobs) == 1
+        assert jobs[0].payload["paths"] == [
+            str(tmp_path / "a.flac"),
+            str(tmp_path / "b.flac"),
+        ]
+
+    async def test_started_job_gets_a_new_one(
+        self, db: Any, settings: Settings, tmp_path: Path
+    ) -> None:
+        """Test changes after the watcher job started are queued separately."""
+        queue = PersistentJobQueue(db.session_scope)
+        worker = LibraryScanWorker(job_queue=queue, db=db, settings=settings)
+        await worker.handle_changes(_batch(tmp_path, "a.flac"))
+        async with db.session_scope() as session:
+            assert await BackgroundJobRepository(session).claim_next("w") is not None
+
+        await worker.handle_changes(_batch(tmp_path, "b.flac"))
+
+        pending = await queue.list_jobs(
+            status=JobStatus.PENDING, job_type=JobType.LIBRARY_SCAN
+        )
+        assert [job.payload["paths"] for job in pending] == [[str(tmp_path / "b.flac")]]
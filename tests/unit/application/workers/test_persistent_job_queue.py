@@ -0,0 +1,548 @@
+"""Tests for the persistent (database-backed) job queue."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from soulspot.application.workers.job_queue import Job, JobStatus, JobType
+from soulspot.application.workers.persistent_job_queue import PersistentJobQueue
+from soulspot.infrastructure.persistence.models import BackgroundJobModel, Base
+from soulspot.infrastructure.persistence.repositories import BackgroundJobRepository
+
+
+@pytest.fixture
+async def session_scope(tmp_path: Path) -> AsyncGenerator[Any, None]:
+    """File-backed SQLite session scope (shared by several queue instances)."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def scope() -> AsyncGenerator[AsyncSession, None]:
+        async with factory() as session:
+            yield session
+            await session.commit()
+
+    yield scope
+    await engine.dispose()
+
+
+def _queue(session_scope: Any) -> PersistentJobQueue:
+    return PersistentJobQueue(session_scope, max_concurrent_jobs=2, poll_interval=0.05)
+
+
+class TestPersistentJobQueue:
+    """Test PersistentJobQueue."""
+
+    async def test_jobs_survive_restart(self, session_scope: Any) -> None:
+        """Test a job enqueued by one instance is visible to a new instance."""
+        job_id = await _queue(session_scope).enqueue(
+            JobType.DOWNLOAD, {"track_id": "t-1"}, priority=5
+        )
+
+        job = await _queue(session_scope).get_job(job_id)
+
+        assert job is not None
+        assert job.status == JobStatus.PENDING
+        assert job.payload == {"track_id": "t-1"}
+        assert job.priority == 5
+        assert job.created_at.tzinfo is not None
+
+    async def test_process_job_success(self, session_scope: Any) -> None:
+        """Test a handled job is completed and its result stored."""
+        queue = _queue(session_scope)
+
+        async def handler(job: Job) -> dict[str, Any]:
+            return {"track_id": job.payload["track_id"], "at": datetime(2025, 1, 1)}
+
+        queue.register_handler(JobType.DOWNLOAD, handler)
+        job_id = await queue.enqueue(JobType.DOWNLOAD, {"track_id": "t-1"})
+
+        await queue.start(num_workers=1)
+        job = await queue.wait_for_job(job_id, timeout=5)
+        await queue.stop()
+
+        assert job.status == JobStatus.COMPLETED
+        assert job.result == {"track_id": "t-1", "at": "2025-01-01 00:00:00"}
+        assert queue.get_stats()["completed"] == 1
+
+    async def test_failed_job_is_retried_after_backoff(
+        self, session_scope: Any
+    ) -> None:
+        """Test retries go back to pending and run again once due."""
+        queue = _queue(session_scope)
+        attempts = 0
+
+        async def flaky(job: Job) -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("slskd timeout")
+            return "ok"
+
+        queue.register_handler(JobType.DOWNLOAD, flaky)
+        job_id = await queue.enqueue(JobType.DOWNLOAD, {}, max_retries=2)
+
+        await queue.start(num_workers=1)
+        job = await queue.wait_for_job(job_id, timeout=5)
+        await queue.stop()
+
+        assert job.status == JobStatus.COMPLETED
+        assert job.retries == 1
+        assert attempts == 2
+
+    async def test_job_fails_when_retries_exhausted(self, session_scope: Any) -> None:
+        """Test the final failure is stored with its error."""
+        queue = _queue(session_scope)
+
+        async def broken(job: Job) -> None:
+            raise ValueError("bad payload")
+
+        queue.register_handler(JobType.DOWNLOAD, broken)
+        job_id = await queue.enqueue(JobType.DOWNLOAD, {}, max_retries=1)
+
+        await queue.start(num_workers=1)
+        job = await queue.wait_for_job(job_id, timeout=5)
+        await queue.stop()
+
+        assert job.status == JobStatus.FAILED
+        assert job.error == "bad payload"
+        assert job.retries == 1
+
+    async def test_start_recovers_running_jobs(self, session_scope: Any) -> None:
+        """Test jobs left running by a dead process are run again."""
+        job_id = await _queue(session_scope).enqueue(JobType.LIBRARY_SCAN, {})
+        async with session_scope() as session:
+            claimed = await BackgroundJobRepository(session).claim_next("dead-worker")
+            assert claimed is not None
+            # Its last heartbeat is long past the lease timeout
+            await session.execute(
+                update(BackgroundJobModel)
+                .where(BackgroundJobModel.id == job_id)
+                .values(heartbeat_at=datetime.now(UTC) - timedelta(minutes=5))
+            )
+
+        queue = _queue(session_scope)
+        handled: list[str] = []
+
+        async def handler(job: Job) -> None:
+            handled.append(job.id)
+
+        queue.register_handler(JobType.LIBRARY_SCAN, handler)
+        await queue.start(num_workers=1)
+        job = await queue.wait_for_job(job_id, timeout=5)
+        await queue.stop()
+
+        assert job.status == JobStatus.COMPLETED
+        assert handled == [job_id]
+
+    async def test_cancelled_job_is_not_processed(self, session_scope: Any) -> None:
+        """Test cancelling a pending job keeps workers away from it."""
+        queue = _queue(session_scope)
+        handled: list[str] = []
+
+        async def handler(job: Job) -> None:
+            handled.append(job.id)
+
+        queue.register_handler(JobType.DOWNLOAD, handler)
+        job_id = await queue.enqueue(JobType.DOWNLOAD, {})
+
+        assert await queue.cancel_job(job_id) is True
+        assert await queue.cancel_job(job_id) is False
+
+        await queue.start(num_workers=1)
+        await asyncio.sleep(0.2)
+        await queue.stop()
+
+        assert handled == []
+        jobs = await queue.list_jobs(status=JobStatus.CANCELLED)
+        assert [job.id for job in jobs] == [job_id]
+
+    async def test_type_limit_and_fair_claims(self, session_scope: Any) -> None:
+        """Test per-type limits hold across claims and other types still run."""
+        queue = PersistentJobQueue(
+            session_scope,
+            max_concurrent_jobs=3,
+            poll_interval=0.05,
+            type_limits={JobType.LIBRARY_SCAN: 1},
+        )
+        release = asyncio.Event()
+        running_scans = 0
+        peak_scans = 0
+
+        async def scan(job: Job) -> None:
+            nonlocal running_scans, peak_scans
+            running_scans += 1
+            peak_scans = max(peak_scans, running_scans)
+            await release.wait()
+            running_scans -= 1
+
+        async def enrich(job: Job) -> str:
+            return "ok"
+
+        queue.register_handler(JobType.LIBRARY_SCAN, scan)
+        queue.register_handler(JobType.METADATA_ENRICHMENT, enrich)
+        for _ in range(3):
+            await queue.enqueue(JobType.LIBRARY_SCAN, {}, priority=10)
+        enrich_id = await queue.enqueue(JobType.METADATA_ENRICHMENT, {})
+
+        await queue.start(num_workers=3)
+        try:
+            job = await queue.wait_for_job(enrich_id, timeout=5)
+            assert job.status == JobStatus.COMPLETED
+            assert peak_scans == 1
+        finally:
+            release.set()
+            await queue.stop()
+
+    async def test_start_prunes_finished_jobs_past_retention(
+        self, session_scope: Any
+    ) -> None:
+        """Test finished rows older than history_retention are deleted."""
+        queue = PersistentJobQueue(
+            session_scope, poll_interval=0.05, history_retention=3600
+        )
+        old_id = await queue.enqueue(JobType.DOWNLOAD, {})
+        recent_id = await queue.enqueue(JobType.DOWNLOAD, {})
+        pending_id = await queue.enqueue(JobType.DOWNLOAD, {})
+        async with session_scope() as session:
+            repo = BackgroundJobRepository(session)
+            for job_id in (old_id, recent_id):
+                assert await repo.claim_next("w") is not None
+                await repo.finish(job_id, "w", JobStatus.COMPLETED.value)
+            await session.execute(
+                update(BackgroundJobModel)
+                .where(BackgroundJobModel.id == old_id)
+                .values(completed_at=datetime.now(UTC) - timedelta(hours=2))
+            )
+
+        await queue.start(num_workers=1)
+        await queue.stop()
+
+        assert await queue.get_job(old_id) is None
+        assert await queue.get_job(recent_id) is not None
+        assert await queue.get_job(pending_id) is not None
+
+    async def test_unknown_job_types_are_skipped(self, session_scope: Any) -> None:
+        """Test rows of a job type this version doesn't know don't break reads."""
+        queue = _queue(session_scope)
+        known_id = await queue.enqueue(JobType.DOWNLOAD, {})
+        async with session_scope() as session:
+            await BackgroundJobRepository(session).add(
+                {
+                    "id": "from-newer-version",
+                    "job_type": "not_a_job_type",
+                    "status": JobStatus.PENDING.value,
+                    "payload": {},
+                    "run_after": datetime.now(UTC),
+                    "created_at": datetime.now(UTC),
+                }
+            )
+
+        jobs = await queue.list_jobs()
+
+        assert [job.id for job in jobs] == [known_id]
+        assert await queue.get_job("from-newer-version") is None
+
+    async def test_dedup_key_coalesces_active_jobs(self, session_scope: Any) -> None:
+        """Test duplicate keys return the active job and raise its priority."""
+        queue = _queue(session_scope)
+        first = await queue.enqueue(JobType.DOWNLOAD, {}, dedup_key="download:t-1")
+        again = await queue.enqueue(
+            JobType.DOWNLOAD, {}, priority=7, dedup_key="download:t-1"
+        )
+
+        assert again == first
+        job = await queue.get_job(first)
+        assert job is not None
+        assert job.priority == 7
+        assert job.dedup_key == "download:t-1"
+
+        await queue.cancel_job(first)
+        fresh = await queue.enqueue(JobType.DOWNLOAD, {}, dedup_key="download:t-1")
+        assert fresh != first
+
+    async def test_dedup_index_rejects_second_active_row(
+        self, session_scope: Any
+    ) -> None:
+        """Test the partial unique index blocks a racing duplicate insert."""
+        job_id = await _queue(session_scope).enqueue(
+            JobType.DOWNLOAD, {}, dedup_key="k"
+        )
+
+        with pytest.raises(IntegrityError):
+            async with session_scope() as session:
+                await BackgroundJobRepository(session).add(
+                    {
+                        "id": "racer",
+                        "job_type": "download",
+                        "payload": {},
+                        "dedup_key": "k",
+                    }
+                )
+
+        async with session_scope() as session:
+            existing = await BackgroundJobRepository(session).get_active_by_dedup_key(
+                "k"
+            )
+        assert existing is not None
+        assert existing.id == job_id
+
+    async def test_batch_handler_claims_and_stores_each_outcome(
+        self, session_scope: Any
+    ) -> None:
+        """Test a batch is claimed together and every job gets its own outcome."""
+        queue = _queue(session_scope)
+        sizes: list[int] = []
+
+        async def handler(jobs: list[Job]) -> list[Any]:
+            sizes.append(len(jobs))
+            return [
+                RuntimeError("nope") if job.payload["fail"] else {"ok": True}
+                for job in jobs
+            ]
+
+        queue.register_batch_handler(JobType.METADATA_ENRICHMENT, handler)
+        ids = [
+            await queue.enqueue(
+                JobType.METADATA_ENRICHMENT, {"fail": fail}, max_retries=1
+            )
+            for fail in (False, True, False)
+        ]
+
+        await queue.start(num_workers=1)
+        jobs = [await queue.wait_for_job(job_id, timeout=5) for job_id in ids]
+        await queue.stop()
+
+        assert sizes == [3]
+        assert [job.status for job in jobs] == [
+            JobStatus.COMPLETED,
+            JobStatus.FAILED,
+            JobStatus.COMPLETED,
+        ]
+        assert jobs[0].result == {"ok": True}
+        assert jobs[1].error == "nope"
+
+    async def test_local_enqueue_wakes_idle_worker(self, session_scope: Any) -> None:
+        """Test an enqueue starts the job without waiting for the poll interval."""
+        queue = PersistentJobQueue(session_scope, poll_interval=30)
+        started = asyncio.Event()
+
+        async def handler(job: Job) -> None:
+            started.set()
+
+        queue.register_handler(JobType.DOWNLOAD, handler)
+        await queue.start(num_workers=1)
+        await asyncio.sleep(0.05)
+
+        await queue.enqueue(JobType.DOWNLOAD, {})
+        await asyncio.wait_for(started.wait(), timeout=2)
+        await queue.stop()
+
+        assert queue.get_scheduling_stats()["dispatch_latency"]["count"] == 1
+
+    async def test_idle_workers_do_not_poll(self, session_scope: Any) -> None:
+        """Test idle worker tasks wait on the shared poller instead of querying."""
+        queue = PersistentJobQueue(
+            session_scope, poll_interval=0.05, idle_poll_interval=30
+        )
+        queue.register_handler(JobType.DOWNLOAD, AsyncMock())
+        await queue.start(num_workers=5)
+        await asyncio.sleep(0.05)
+
+        with patch.object(
+            BackgroundJobRepository, "runnable_job_types", autospec=True
+        ) as runnable:
+            await asyncio.sleep(0.3)
+        await queue.stop()
+
+        assert runnable.await_count == 0
+
+    async def test_poller_picks_up_jobs_of_other_processes(
+        self, session_scope: Any
+    ) -> None:
+        """Test a job enqueued by another instance starts within the idle interval."""
+        consumer = PersistentJobQueue(
+            session_scope, poll_interval=0.01, idle_poll_interval=0.05
+        )
+        started = asyncio.Event()
+
+        async def handler(job: Job) -> None:
+            started.set()
+
+        consumer.register_handler(JobType.DOWNLOAD, handler)
+        await consumer.start(num_workers=2)
+        await asyncio.sleep(0.05)
+
+        await _queue(session_scope).enqueue(JobType.DOWNLOAD, {})
+        await asyncio.wait_for(started.wait(), timeout=2)
+        await consumer.stop()
+
+    async def test_live_workers_jobs_are_not_recovered(
+        self, session_scope: Any
+    ) -> None:
+        """Test start() leaves jobs with a fresh heartbeat to their worker."""
+        job_id = await _queue(session_scope).enqueue(JobType.LIBRARY_SCAN, {})
+        async with session_scope() as session:
+            assert await BackgroundJobRepository(session).claim_next("other-worker")
+
+        queue = _queue(session_scope)
+        assert await queue.recover() == 0
+
+        async with session_scope() as session:
+            repo = BackgroundJobRepository(session)
+            later = datetime.now(UTC) + timedelta(minutes=5)
+            assert await repo.heartbeat("other-worker", [job_id], now=later) == 1
+            assert await repo.heartbeat("someone-else", [job_id]) == 0
+            stale = await repo.requeue_running(stale_before=later)
+        assert stale == 0
+
+        job = await queue.get_job(job_id)
+        assert job is not None
+        assert job.status == JobStatus.RUNNING
+
+    async def test_enqueue_only_mode_runs_nothing(self, session_scope: Any) -> None:
+        """Test start(num_workers=0) serves enqueue/status but never claims jobs."""
+        producer = _queue(session_scope)
+        handled: list[str] = []
+
+        async def handler(job: Job) -> None:
+            handled.append(job.id)
+
+        producer.register_handler(JobType.DOWNLOAD, handler)
+        await producer.start(num_workers=0)
+        job_id = await producer.enqueue(JobType.DOWNLOAD, {})
+        await asyncio.sleep(0.2)
+        await producer.stop()
+
+        assert handled == []
+        assert producer.get_stats()["pending"] == 1
+
+        consumer = _queue(session_scope)
+        consumer.register_handler(JobType.DOWNLOAD, handler)
+        await consumer.start(num_workers=1)
+        job = await consumer.wait_for_job(job_id, timeout=5)
+        await consumer.stop()
+        assert job.status == JobStatus.COMPLETED
+        assert handled == [job_id]
+
+
+class TestBackgroundJobRepository:
+    """Test claim semantics of BackgroundJobRepository."""
+
+    async def test_claim_order_priority_then_fifo(self, session_scope: Any) -> None:
+        """Test higher priority first, FIFO within the same priority."""
+        queue = _queue(session_scope)
+        low = await queue.enqueue(JobType.DOWNLOAD, {}, priority=0)
+        high_1 = await queue.enqueue(JobType.DOWNLOAD, {}, priority=10)
+        high_2 = await queue.enqueue(JobType.DOWNLOAD, {}, priority=10)
+
+        claimed = []
+        for _ in range(4):
+            async with session_scope() as session:
+                job = await BackgroundJobRepository(session).claim_next("w")
+                claimed.append(job.id if job else None)
+
+        assert claimed == [high_1, high_2, low, None]
+
+    async def test_claim_filtered_by_type(self, session_scope: Any) -> None:
+        """Test claim_next(job_type=...) only returns jobs of that type."""
+        queue = _queue(session_scope)
+        await queue.enqueue(JobType.DOWNLOAD, {}, priority=10)
+        scan_id = await queue.enqueue(JobType.LIBRARY_SCAN, {})
+
+        async with session_scope() as session:
+            repo = BackgroundJobRepository(session)
+            assert await repo.runnable_job_types() == {"download", "library_scan"}
+            job = await repo.claim_next("w", job_type="library_scan")
+
+        assert job is not None
+        assert job.id == scan_id
+
+    async def test_claim_respects_type_limit_across_workers(
+        self, session_scope: Any
+    ) -> None:
+        """Test max_running counts running jobs of every worker, not just ours."""
+        queue = _queue(session_scope)
+        await queue.enqueue(JobType.LIBRARY_SCAN, {})
+        await queue.enqueue(JobType.LIBRARY_SCAN, {})
+
+        async with session_scope() as session:
+            repo = BackgroundJobRepository(session)
+            first = await repo.claim_next(
+                "worker-a", job_type="library_scan", max_running=1
+            )
+            second = await repo.claim_next(
+                "worker-b", job_type="library_scan", max_running=1
+            )
+
+        assert first is not None
+        assert second is None
+
+    async def test_concurrent_claims_never_share_a_job(
+        self, session_scope: Any
+    ) -> None:
+        """Test parallel claimers get distinct jobs."""
+        queue = _queue(session_scope)
+        job_ids = {await queue.enqueue(JobType.DOWNLOAD, {}) for _ in range(5)}
+
+        async def claim(worker: str) -> str | None:
+            async with session_scope() as session:
+                job = await BackgroundJobRepository(session).claim_next(worker)
+                return job.id if job else None
+
+        results = await asyncio.gather(*(claim(f"w{i}") for i in range(8)))
+
+        claimed = [job_id for job_id in results if job_id]
+        assert sorted(claimed) == sorted(job_ids)
+
+    async def test_delayed_job_not_claimable_before_run_after(
+        self, session_scope: Any
+    ) -> None:
+        """Test run_after in the future hides a pending job from claims."""
+        job_id = await _queue(session_scope).enqueue(JobType.DOWNLOAD, {})
+        async with session_scope() as session:
+            repo = BackgroundJobRepository(session)
+            assert await repo.claim_next("w") is not None
+            await repo.schedule_retry(
+                job_id,
+                "w",
+                error="boom",
+                retries=1,
+                run_after=datetime.now(UTC) + timedelta(minutes=5),
+            )
+
+        async with session_scope() as session:
+            repo = BackgroundJobRepository(session)
+            assert await repo.claim_next("w") is None
+            later = datetime.now(UTC) + timedelta(minutes=6)
+            job = await repo.claim_next("w", now=later)
+
+        assert job is not None
+        assert job.id == job_id
+
+    async def test_claim_batch(self, session_scope: Any) -> None:
+        """Test claim_batch takes up to limit jobs of a type, best first."""
+        queue = _queue(session_scope)
+        low = await queue.enqueue(JobType.PLAYLIST_SYNC, {}, priority=1)
+        high = await queue.enqueue(JobType.PLAYLIST_SYNC, {}, priority=9)
+        await queue.enqueue(JobType.PLAYLIST_SYNC, {}, priority=0)
+        await queue.enqueue(JobType.DOWNLOAD, {}, priority=10)
+
+        async with session_scope() as session:
+            claimed = await BackgroundJobRepository(session).claim_batch(
+                "w", limit=2, job_type=JobType.PLAYLIST_SYNC.value
+            )
+
+        assert [model.id for model in claimed] == [high, low]
+        assert all(model.status == "running" for model in claimed)
@@ -0,0 +1,140 @@
+"""Tests for the shared HTTP client registry."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from soulspot.config.settings import HttpSettings
+from soulspot.infrastructure.integrations.http_clients import (
+    MAX_RETIRED_CLIENTS,
+    HttpClientRegistry,
+    http_client,
+)
+
+
+def _transport() -> httpx.MockTransport:
+    """Create a transport that answers every request with 200."""
+    return httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+
+
+@pytest.fixture
+async def registry() -> HttpClientRegistry:
+    """Create a registry and close it after the test."""
+    registry = HttpClientRegistry(HttpSettings())
+    yield registry
+    await registry.close()
+
+
+class TestHttpClientRegistry:
+    """Test HttpClientRegistry."""
+
+    async def test_same_options_reuse_client(
+        self, registry: HttpClientRegistry
+    ) -> None:
+        """Test the same upstream and options return the same client."""
+        first = registry.get("musicbrainz", base_url="https://mb.test", timeout=30.0)
+        second = registry.get("musicbrainz", base_url="https://mb.test", timeout=30.0)
+
+        assert first is second
+        assert not first.is_closed
+
+    async def test_upstreams_get_separate_clients(
+        self, registry: HttpClientRegistry
+    ) -> None:
+        """Test each upstream name has its own client."""
+        assert registry.get("spotify", timeout=30.0) is not registry.get(
+            "lastfm", timeout=30.0
+        )
+
+    async def test_changed_options_replace_client(
+        self, registry: HttpClientRegistry
+    ) -> None:
+        """Test changed options open a new client and keep the old one usable."""
+        old = registry.get("slskd", base_url="http://old:5030")
+        new = registry.get("slskd", base_url="http://new:5030")
+
+        assert new is not old
+        assert not old.is_closed
+        assert registry.get("slskd", base_url="http://new:5030") is new
+
+    async def test_close_closes_all_clients(self) -> None:
+        """Test close() closes current and replaced clients."""
+        registry = HttpClientRegistry()
+        old = registry.get("slskd", base_url="http://old:5030")
+        new = registry.get("slskd", base_url="http://new:5030")
+
+        await registry.close()
+
+        assert old.is_closed
+        assert new.is_closed
+        with pytest.raises(RuntimeError):
+            registry.get("slskd", base_url="http://new:5030")
+
+    async def test_replaced_client_closed_after_grace(self) -> None:
+        """Test a replaced client is closed once its grace period is over."""
+        registry = HttpClientRegistry(retire_grace=0.01)
+        old = registry.get("slskd", base_url="http://old:5030")
+        registry.get("slskd", base_url="http://new:5030")
+
+        await asyncio.sleep(0.05)
+
+        assert old.is_closed
+        await registry.close()
+
+    async def test_retired_clients_capped(self) -> None:
+        """Test the oldest retired client is closed early once the cap is hit."""
+        registry = HttpClientRegistry(retire_grace=60.0)
+        clients = [
+            registry.get("slskd", base_url=f"http://host{i}:5030")
+            for i in range(MAX_RETIRED_CLIENTS + 2)
+        ]
+
+        await asyncio.sleep(0)
+
+        assert clients[0].is_closed
+        assert not any(client.is_closed for client in clients[1:])
+        await registry.close()
+        assert all(client.is_closed for client in clients)
+
+    async def test_limits_applied_from_settings(self) -> None:
+        """Test pool limits come from HttpSettings."""
+        registry = HttpClientRegistry(
+            HttpSettings(max_connections=5, max_keepalive_connections=2)
+        )
+
+        stats = registry.get_stats()
+
+        assert stats["max_connections"] == 5
+        assert stats["max_keepalive_connections"] == 2
+        assert stats["upstreams"] == {}
+        await registry.close()
+
+    async def test_stats_count_requests(self, registry: HttpClientRegistry) -> None:
+        """Test requests are counted per upstream."""
+        client = registry.get("lrclib", transport=_transport())
+
+        await client.get("https://lrclib.test/api/get")
+        await client.get("https://lrclib.test/api/get")
+
+        stats = registry.get_stats()["upstreams"]["lrclib"]
+        assert stats["requests"] == 2
+        assert stats["open_connections"] == 0
+
+
+class TestHttpClientHelper:
+    """Test the http_client() context manager."""
+
+    async def test_borrows_pooled_client(self, registry: HttpClientRegistry) -> None:
+        """Test the pooled client is yielded and stays open."""
+        async with http_client(registry, "coverartarchive", timeout=30.0) as client:
+            assert client is registry.get("coverartarchive", timeout=30.0)
+
+        assert not client.is_closed
+
+    async def test_without_registry_uses_temporary_client(self) -> None:
+        """Test a one-off client is used and closed without a registry."""
+        async with http_client(None, "coverartarchive", timeout=30.0) as client:
+            assert not client.is_closed
+
+        assert client.is_closed
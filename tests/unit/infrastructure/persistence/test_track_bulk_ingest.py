@@ -0,0 +1,146 @@
+"""Unit tests for TrackRepository bulk ingest (upsert / file info update)."""
+
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from soulspot.domain.exceptions import ValidationException
+from soulspot.infrastructure.persistence.models import (
+    ArtistModel,
+    Base,
+    TrackModel,
+)
+from soulspot.infrastructure.persistence.repositories import TrackRepository
+
+
+@pytest.fixture
+async def async_session():
+    """Create an async in-memory database session."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async_session_maker = sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with async_session_maker() as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def artist_id(async_session: AsyncSession) -> str:
+    """Create an artist for track rows."""
+    artist_id = str(uuid.uuid4())
+    async_session.add(ArtistModel(id=artist_id, name="Portishead"))
+    await async_session.commit()
+    return artist_id
+
+
+def _row(artist_id: str, n: int, **extra: object) -> dict:
+    return {
+        "title": f"Song {n}",
+        "artist_id": artist_id,
+        "file_path": f"/music/{n:04d}.flac",
+        **extra,
+    }
+
+
+class TestBulkUpsert:
+    """Test TrackRepository.bulk_upsert."""
+
+    async def test_inserts_many_rows_and_returns_ids(
+        self, async_session: AsyncSession, artist_id: str
+    ) -> None:
+        """Test rows beyond one chunk are inserted and ids returned per key."""
+        repo = TrackRepository(async_session)
+
+        ids = await repo.bulk_upsert([_row(artist_id, n) for n in range(1200)])
+        await async_session.commit()
+
+        assert len(ids) == 1200
+        count = await async_session.scalar(select(func.count(TrackModel.id)))
+        assert count == 1200
+        track = await async_session.get(TrackModel, ids["/music/0007.flac"])
+        assert track.title == "Song 7"
+
+    async def test_conflict_updates_existing_row(
+        self, async_session: AsyncSession, artist_id: str
+    ) -> None:
+        """Test a second upsert keeps the id and updates columns."""
+        repo = TrackRepository(async_session)
+        first = await repo.bulk_upsert([_row(artist_id, 1)])
+
+        second = await repo.bulk_upsert(
+            [_row(artist_id, 1, title="Renamed"), _row(artist_id, 2)]
+        )
+        await async_session.commit()
+
+        assert second["/music/0001.flac"] == first["/music/0001.flac"]
+        title = await async_session.scalar(
+            select(TrackModel.title).where(TrackModel.file_path == "/music/0001.flac")
+        )
+        assert title == "Renamed"
+        count = await async_session.scalar(select(func.count(TrackModel.id)))
+        assert count == 2
+
+    async def test_isrc_conflict_key(
+        self, async_session: AsyncSession, artist_id: str
+    ) -> None:
+        """Test ISRC can be used as the conflict key."""
+        repo = TrackRepository(async_session)
+        await repo.bulk_upsert([_row(artist_id, 1, isrc="GBAAA0000001")], "isrc")
+
+        ids = await repo.bulk_upsert(
+            [{"title": "Other", "artist_id": artist_id, "isrc": "GBAAA0000001"}],
+            conflict_key="isrc",
+        )
+
+        assert list(ids) == ["GBAAA0000001"]
+        count = await async_session.scalar(select(func.count(TrackModel.id)))
+        assert count == 1
+
+    async def test_rejects_unknown_conflict_key(
+        self, async_session: AsyncSession
+    ) -> None:
+        """Test only unique columns are accepted as conflict key."""
+        with pytest.raises(ValidationException):
+            await TrackRepository(async_session).bulk_upsert([], conflict_key="title")
+
+
+class TestBulkUpdateFileInfo:
+    """Test TrackRepository.bulk_update_file_info."""
+
+    async def test_updates_only_given_columns(
+        self, async_session: AsyncSession, artist_id: str
+    ) -> None:
+        """Test file info is applied by path and duration only fills zeros."""
+        repo = TrackRepository(async_session)
+        await repo.bulk_upsert(
+            [_row(artist_id, 1, duration_ms=0), _row(artist_id, 2, duration_ms=5000)]
+        )
+
+        await repo.bulk_update_file_info(
+            [
+                {"file_path": "/music/0001.flac", "file_size": 10, "duration_ms": 1000},
+                {"file_path": "/music/0002.flac", "file_size": 20, "duration_ms": 1000},
+                {"file_path": "/music/missing.flac", "file_size": 30, "duration_ms": 1},
+            ]
+        )
+        await async_session.commit()
+
+        rows = (
+            await async_session.execute(
+                select(
+                    TrackModel.file_path, TrackModel.file_size, TrackModel.duration_ms
+                ).order_by(TrackModel.file_path)
+            )
+        ).all()
+        assert [tuple(r) for r in rows] == [
+            ("/music/0001.flac", 10, 1000),
+            ("/music/0002.flac", 20, 5000),
+        ]
@@ -0,0 +1,75 @@
+"""Tests for the background service wiring shared by web and worker processes."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from soulspot.application.workers.job_queue import JobQueue, JobType
+from soulspot.application.workers.persistent_job_queue import PersistentJobQueue
+from soulspot.config import Settings
+from soulspot.domain.value_objects import TrackId
+from soulspot.infrastructure.lifecycle import background_services, create_job_queue
+from soulspot.infrastructure.persistence import Database
+from soulspot.worker import run_worker
+
+
+def _settings(tmp_path: Path, **download: object) -> Settings:
+    return Settings(
+        database={"url": f"sqlite+aiosqlite:///{tmp_path / 'soulspot.db'}"},
+        cache={"disk_path": tmp_path / "metadata_cache.db"},
+        download=download,
+    )
+
+
+class TestCreateJobQueue:
+    """Test create_job_queue()."""
+
+    def test_backend_and_limits_from_settings(self, tmp_path: Path) -> None:
+        """Test the backend is chosen and download limit applied from settings."""
+        memory = _settings(tmp_path, max_concurrent_downloads=2)
+        database = _settings(tmp_path, queue_backend="database")
+        db = Database(memory)
+
+        memory_queue = create_job_queue(memory, db)
+        database_queue = create_job_queue(database, db)
+
+        assert type(memory_queue) is JobQueue
+        assert memory_queue.get_type_limit(JobType.DOWNLOAD) == 2
+        assert isinstance(database_queue, PersistentJobQueue)
+
+
+class TestBackgroundServices:
+    """Test background_services() in enqueue-only and worker mode."""
+
+    async def test_enqueue_only_mode_starts_no_workers(self, tmp_path: Path) -> None:
+        """Test run_workers=False wires the queue but runs no handlers or loops."""
+        settings = _settings(tmp_path, queue_backend="database")
+        db = Database(settings)
+        await db.create_tables()
+        state = SimpleNamespace()
+
+        try:
+            async with background_services(settings, db, state, run_workers=False):
+                assert isinstance(state.job_queue, PersistentJobQueue)
+                assert state.download_worker is not None
+                assert state.db_token_manager is not None
+                assert not hasattr(state, "download_monitor_worker")
+                assert not hasattr(state, "token_refresh_worker")
+                assert state.job_queue._handlers == {}
+
+                job_id = await state.download_worker.enqueue_download(
+                    TrackId.generate()
+                )
+                await asyncio.sleep(0.1)
+                job = await state.job_queue.get_job(job_id)
+                assert job is not None
+                assert job.status.value == "pending"
+        finally:
+            await db.close()
+
+    async def test_worker_requires_database_queue(self, tmp_path: Path) -> None:
+        """Test the worker process refuses an in-memory queue."""
+        with pytest.raises(RuntimeError, match="QUEUE_BACKEND=database"):
+            await run_worker(_settings(tmp_path), stop=asyncio.Event())